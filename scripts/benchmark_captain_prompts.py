@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark captain prompt construction over a fleet battle.
+
+Advances a fleet battle checkpoint by checkpoint with scripted captain
+decisions (so decision, message and shot histories grow as they would in a
+real battle) and measures, per checkpoint:
+
+- Prompt build time (all captains)
+- Prompt size in estimated tokens (~4 characters per token)
+- Stable prefix: tokens identical to the same captain's previous prompt,
+  which is what provider-side prompt caching can reuse
+
+No LLM calls are made.
+
+Usage:
+    python scripts/benchmark_captain_prompts.py --ships-per-side 6 --checkpoints 20
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.llm.client import CaptainClient, ToolCall
+from src.llm.battle_runner import LLMBattleRunner, BattleConfig, load_fleet_data
+from src.llm.fleet_config import BattleFleetConfig
+from src.llm.communication import CaptainMessage
+
+CHARS_PER_TOKEN = 4
+
+
+def build_runner(ships_per_side: int) -> LLMBattleRunner:
+    """Fleet battle with Admirals (orders appear in captain prompts)."""
+    def fleet() -> dict:
+        return {
+            "ships": [{"ship_type": "destroyer"} for _ in range(ships_per_side)],
+            "admiral": "bench/admiral",
+        }
+
+    fleet_config = BattleFleetConfig.from_dict({
+        "battle_name": "Prompt Benchmark",
+        "initial_distance_km": 400,
+        "alpha_fleet": fleet(),
+        "beta_fleet": fleet(),
+    })
+    runner = LLMBattleRunner(
+        config=BattleConfig(verbose=False, personality_selection=False, record_battle=False, seed=3),
+        alpha_config=None,
+        beta_config=None,
+        client=CaptainClient(api_key="unused"),
+        fleet_config=fleet_config,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner.setup_fleet_battle(load_fleet_data())
+    return runner
+
+
+def scripted_tool_calls(checkpoint: int, target_name: str):
+    """A plausible, slowly varying set of captain orders."""
+    maneuver = ("INTERCEPT", "PADLOCK", "EVADE")[checkpoint % 3]
+    return [
+        ToolCall(id="1", name="set_primary_target", arguments={"target": target_name}),
+        ToolCall(id="2", name="set_maneuver", arguments={"maneuver_type": maneuver, "throttle": 0.8}),
+        ToolCall(id="3", name="set_weapons_order", arguments={
+            "spinal_mode": "FIRE_WHEN_OPTIMAL", "turret_mode": "FIRE_IMMEDIATE",
+        }),
+    ]
+
+
+def common_prefix_len(a: str, b: str) -> int:
+    """Length of the common prefix of two strings."""
+    limit = min(len(a), len(b))
+    lo, hi = 0, limit
+    while lo < hi:  # Binary search on slice equality (fast for long strings)
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark captain prompt construction")
+    parser.add_argument("--ships-per-side", type=int, default=6)
+    parser.add_argument("--checkpoints", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed builds per checkpoint")
+    args = parser.parse_args()
+
+    runner = build_runner(args.ships_per_side)
+    sim = runner.simulation
+    captains = {**runner.alpha_captains, **runner.beta_captains}
+    for captain in captains.values():
+        captain.fleet_directive = "Concentrate fire on the enemy flagship; keep formation."
+    previous = {}
+    rows = []
+
+    for checkpoint in range(1, args.checkpoints + 1):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(30):
+                sim.step()
+        # One shared tactical picture per checkpoint, as the battle runner does
+        runner._share_tactical_picture()
+
+        # Time repeated builds; the first one consumes received messages,
+        # so its prompts are the ones measured
+        build_s = []
+        prompts = {}
+        for repeat in range(args.repeat):
+            start = time.perf_counter()
+            for ship_id, captain in captains.items():
+                messages, _tools = captain._prepare_decision(ship_id, sim)
+                if repeat == 0:
+                    prompts[ship_id] = "".join(m["content"] for m in messages)
+            build_s.append(time.perf_counter() - start)
+
+        tokens = sum(len(p) for p in prompts.values()) / CHARS_PER_TOKEN
+        stable = sum(
+            common_prefix_len(prompts[s], previous[s]) for s in prompts if s in previous
+        ) / CHARS_PER_TOKEN
+        rows.append((checkpoint, min(build_s), tokens, stable))
+        previous = prompts
+
+        # Scripted decisions so histories grow like a real battle
+        for ship_id, captain in captains.items():
+            enemies = sim.get_enemy_ships(ship_id)
+            target = enemies[0].name if enemies else "none"
+            with contextlib.redirect_stdout(io.StringIO()):
+                captain._apply_tool_calls(scripted_tool_calls(checkpoint, target), sim, ship_id)
+            for i in range(3):
+                captain.record_shot(
+                    weapon="spinal" if i == 0 else "turret",
+                    distance_km=400 - checkpoint * 10 + i,
+                    rel_velocity_kps=-2.0,
+                    result="HIT" if (checkpoint + i) % 3 == 0 else "MISS",
+                    damage_gj=4.3,
+                )
+            captain._record_sent_message(f"Checkpoint {checkpoint}: hold the line.", sim.current_time)
+            captain.receive_messages([CaptainMessage(
+                sender_id="enemy", sender_name="Enemy", ship_name="Enemy Ship",
+                content=f"Surrender now ({checkpoint})", timestamp=sim.current_time,
+            )])
+
+    print(f"{'CP':>3} {'build ms':>9} {'tokens':>8} {'stable':>8}")
+    for checkpoint, build_s, tokens, stable in rows:
+        print(f"{checkpoint:>3} {build_s * 1000:>9.2f} {tokens:>8.0f} {stable:>8.0f}")
+
+    later = rows[1:]
+    print(f"\nCaptains: {len(captains)}")
+    print(f"Mean build time per checkpoint: {statistics.mean(r[1] for r in rows) * 1000:.2f} ms")
+    print(f"Mean prompt tokens per checkpoint: {statistics.mean(r[2] for r in rows):.0f}")
+    if later:
+        stable_frac = sum(r[3] for r in later) / sum(r[2] for r in later)
+        print(f"Stable prefix (cacheable): {stable_frac * 100:.0f}% of prompt tokens")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
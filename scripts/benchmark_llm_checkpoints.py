@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark fleet checkpoint throughput against a local mock LLM provider.
+
+Runs a fleet battle in which every Admiral and captain call goes to a
+MockLLMProvider with a realistic latency distribution, then reports wall
+time per checkpoint versus the summed provider latency (what a fully
+sequential runner would have waited).
+
+Usage:
+    python scripts/benchmark_llm_checkpoints.py --ships-per-side 6 --checkpoints 5
+    python scripts/benchmark_llm_checkpoints.py --latency-median 2.0 --error-rate 0.05
+    python scripts/benchmark_llm_checkpoints.py --speculative   # async runner, speculative sim
+    python scripts/benchmark_llm_checkpoints.py --stream --per-token 0.02   # streamed tool calls
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.llm.client import CaptainClient
+from src.llm.battle_runner import LLMBattleRunner, BattleConfig, load_fleet_data
+from src.llm.fleet_config import BattleFleetConfig
+from src.llm.mock_provider import MockLLMProvider, MockProviderConfig
+from src.llm.request_pool import RetryPolicy
+
+
+def build_fleet_config(ships_per_side: int, admirals: bool) -> BattleFleetConfig:
+    """Symmetric destroyer fleets, all pointed at mock models."""
+    def fleet(provider: str) -> dict:
+        data = {
+            "ships": [
+                {"ship_type": "destroyer", "model": f"{provider}/captain"}
+                for _ in range(ships_per_side)
+            ]
+        }
+        if admirals:
+            data["admiral"] = f"{provider}/admiral"
+        return data
+
+    return BattleFleetConfig.from_dict({
+        "battle_name": "Checkpoint Benchmark",
+        "initial_distance_km": 500,
+        "alpha_fleet": fleet("mock-alpha"),
+        "beta_fleet": fleet("mock-beta"),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM checkpoint throughput")
+    parser.add_argument("--ships-per-side", type=int, default=6)
+    parser.add_argument("--checkpoints", type=int, default=3)
+    parser.add_argument("--no-admirals", action="store_true", help="Captains only")
+    parser.add_argument("--latency-median", type=float, default=1.0, help="Median latency (s)")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="Lognormal sigma")
+    parser.add_argument("--per-token", type=float, default=0.0, help="Generation time per output token (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected error probability")
+    parser.add_argument("--concurrency", type=int, default=8, help="In-flight requests per provider")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--speculative", action="store_true",
+                        help="Use the async runner with speculative simulation")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream captain responses and execute tool calls as they complete")
+    parser.add_argument("--show-sim-output", action="store_true", help="Don't silence simulation logs")
+    args = parser.parse_args()
+
+    provider_config = MockProviderConfig(
+        latency_median_s=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        latency_per_output_token_s=args.per_token,
+        error_rate=args.error_rate,
+        retry_after_s=0.1,
+        seed=args.seed,
+    )
+    fleet_config = build_fleet_config(args.ships_per_side, not args.no_admirals)
+    fleet_data = load_fleet_data()
+
+    with MockLLMProvider(provider_config) as provider:
+        client = CaptainClient(
+            api_key="mock",
+            base_url=provider.url,
+            max_concurrent_per_provider=args.concurrency,
+            retry_policy=RetryPolicy(base_delay_s=0.1, max_delay_s=1.0),
+        )
+        runner = LLMBattleRunner(
+            config=BattleConfig(
+                verbose=False,
+                personality_selection=False,
+                record_battle=False,
+                max_checkpoints=args.checkpoints,
+                seed=args.seed,
+                speculative_simulation=args.speculative,
+                stream_tool_calls=args.stream,
+            ),
+            alpha_config=None,
+            beta_config=None,
+            client=client,
+            fleet_config=fleet_config,
+        )
+
+        sink = contextlib.nullcontext() if args.show_sim_output else contextlib.redirect_stdout(io.StringIO())
+        start = time.perf_counter()
+        with sink:
+            if args.speculative:
+                result = asyncio.run(runner.run_fleet_battle_async(fleet_data))
+            else:
+                result = runner.run_battle(fleet_data)
+        wall_s = time.perf_counter() - start
+
+    stats = provider.stats
+    checkpoints = max(1, result.checkpoints_used)
+    print(f"Fleet: {args.ships_per_side}v{args.ships_per_side}"
+          f"{'' if args.no_admirals else ' with Admirals'}")
+    print(f"Checkpoints: {result.checkpoints_used} ({result.outcome.value})")
+    print(f"LLM requests: {stats.requests} ({stats.errors} injected errors)")
+    print(f"Tokens: {stats.prompt_tokens} prompt, {stats.completion_tokens} completion")
+    print(f"Wall time: {wall_s:.2f}s ({wall_s / checkpoints:.2f}s per checkpoint)")
+    print(f"Summed provider latency: {stats.total_latency_s:.2f}s "
+          f"({stats.total_latency_s / checkpoints:.2f}s per checkpoint)")
+    if wall_s > 0:
+        print(f"Overlap factor: {stats.total_latency_s / wall_s:.1f}x")
+    usage = client.usage
+    if usage.streamed_calls:
+        print(f"Streamed calls: {usage.streamed_calls}, mean time to first tool call "
+              f"{usage.first_tool_call_s / usage.streamed_calls:.2f}s "
+              f"(mean latency {usage.latency_s / max(1, usage.calls):.2f}s)")
+    if args.speculative:
+        print(f"Speculative intervals: {runner.speculative_commits} committed, "
+              f"{runner.speculative_rollbacks} rolled back")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
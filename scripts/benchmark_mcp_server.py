@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Load-test the MCP HTTP server with scripted clients, fully offline.
+
+Hosts several simulated MCP-vs-MCP fleet battles on one MCPHttpServer (in a
+child process) and drives them with async clients that read state, send
+command batches and signal ready every checkpoint. Reports throughput,
+p50/p99 latency per endpoint and server CPU.
+
+Usage:
+    python scripts/benchmark_mcp_server.py --battles 16 --checkpoints 5
+    python scripts/benchmark_mcp_server.py --decision-interval 2 --observers 4   # rapid checkpoints
+    python scripts/benchmark_mcp_server.py --json results/mcp_load.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.llm.mcp_load_test import LoadTestConfig, run_load_test
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the MCP HTTP server")
+    parser.add_argument("--battles", type=int, default=8)
+    parser.add_argument("--checkpoints", type=int, default=5)
+    parser.add_argument("--ships-per-side", type=int, default=3)
+    parser.add_argument("--decision-interval", type=float, default=10.0,
+                        help="Simulated seconds between checkpoints")
+    parser.add_argument("--state-reads", type=int, default=2, help="State reads per commander per checkpoint")
+    parser.add_argument("--commands", type=int, default=4, help="Commands per batch")
+    parser.add_argument("--observers", type=int, default=0, help="Extra state readers per battle")
+    parser.add_argument("--poll-interval", type=float, default=0.02)
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    report = run_load_test(LoadTestConfig(
+        battles=args.battles,
+        checkpoints=args.checkpoints,
+        ships_per_side=args.ships_per_side,
+        decision_interval_s=args.decision_interval,
+        state_reads_per_turn=args.state_reads,
+        commands_per_turn=args.commands,
+        observers_per_battle=args.observers,
+        poll_interval_s=args.poll_interval,
+    ))
+    print(report.format())
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report.to_dict(), indent=2))
+        print(f"\nReport written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP battle state encodings over a fleet battle.
+
+Advances a fleet battle with an MCP-controlled alpha fleet checkpoint by
+checkpoint (ships fire at each other, so projectiles come and go) and
+measures, per checkpoint, the bytes sent to one MCP client and the time to
+serialize them for:
+
+- legacy:     json.dumps of the full state (what the server used to send)
+- full:       compact JSON of the full state
+- full+gzip:  compact JSON, gzip-compressed
+- delta:      ops since the previous checkpoint's version
+- delta+gzip: delta, gzip-compressed
+
+Revalidating an unchanged state costs a 304 with no body and is not shown.
+
+Usage:
+    python scripts/benchmark_mcp_state.py --ships-per-side 6 --checkpoints 20
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.llm.client import CaptainClient
+from src.llm.battle_runner import LLMBattleRunner, BattleConfig, load_fleet_data
+from src.llm.fleet_config import BattleFleetConfig
+from src.llm.mcp_state_codec import diff_state, encode_json
+
+ENCODINGS = ("legacy", "full", "full+gzip", "delta", "delta+gzip")
+
+
+def build_runner(ships_per_side: int) -> LLMBattleRunner:
+    """Fleet battle with an MCP-controlled alpha fleet."""
+    def ships() -> list:
+        return [{"ship_type": "destroyer"} for _ in range(ships_per_side)]
+
+    fleet_config = BattleFleetConfig.from_dict({
+        "battle_name": "MCP State Benchmark",
+        "initial_distance_km": 400,
+        "alpha_fleet": {"ships": ships(), "mcp": {"enabled": True}},
+        "beta_fleet": {"ships": ships(), "admiral": "bench/admiral"},
+    })
+    runner = LLMBattleRunner(
+        config=BattleConfig(verbose=False, personality_selection=False, record_battle=False, seed=3),
+        alpha_config=None,
+        beta_config=None,
+        client=CaptainClient(api_key="unused"),
+        fleet_config=fleet_config,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner.setup_fleet_battle(load_fleet_data())
+    return runner
+
+
+def fire_volley(sim) -> None:
+    """Every ship fires its first weapon at the closest enemy."""
+    for ship_id in list(sim.ships):
+        enemies = sim.get_enemy_ships(ship_id)
+        if enemies:
+            sim.inject_command(ship_id, {"type": "fire_at", "weapon_slot": "weapon_0", "target_id": enemies[0].ship_id})
+
+
+def timed(encode, repeat: int):
+    """(result, best time in seconds) of repeated calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = encode()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCP battle state encodings")
+    parser.add_argument("--ships-per-side", type=int, default=6)
+    parser.add_argument("--checkpoints", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed encodings per checkpoint")
+    args = parser.parse_args()
+
+    runner = build_runner(args.ships_per_side)
+    sim = runner.simulation
+    controller = runner.alpha_mcp
+    captains = list(runner.alpha_captains.values())
+    previous = None
+    rows = []
+
+    for checkpoint in range(1, args.checkpoints + 1):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fire_volley(sim)
+            for _ in range(30):
+                sim.step()
+
+        state = controller.build_state_for_mcp(sim, captains).to_dict()
+        base = previous or {}
+
+        def delta() -> bytes:
+            return encode_json({"base_version": checkpoint - 1, "version": checkpoint, "ops": diff_state(base, state)})
+
+        encoders = {
+            "legacy": lambda: json.dumps(state).encode(),
+            "full": lambda: encode_json(state),
+            "full+gzip": lambda: gzip.compress(encode_json(state)),
+            "delta": delta,
+            "delta+gzip": lambda: gzip.compress(delta()),
+        }
+        row = {}
+        for name in ENCODINGS:
+            body, seconds = timed(encoders[name], args.repeat)
+            row[name] = (len(body), seconds)
+        rows.append(row)
+        previous = state
+
+    print(f"{'CP':>3} " + " ".join(f"{name + ' B':>13} {'ms':>6}" for name in ENCODINGS))
+    for checkpoint, row in enumerate(rows, start=1):
+        print(f"{checkpoint:>3} " + " ".join(f"{row[n][0]:>13} {row[n][1] * 1000:>6.2f}" for n in ENCODINGS))
+
+    # The first checkpoint's delta is against an empty state
+    later = rows[1:] or rows
+    legacy_bytes = statistics.mean(r["legacy"][0] for r in later)
+    print(f"\nShips: {len(sim.ships)}, per-checkpoint means after checkpoint 1:")
+    for name in ENCODINGS:
+        size = statistics.mean(r[name][0] for r in later)
+        ms = statistics.mean(r[name][1] for r in later) * 1000
+        print(f"  {name:<11} {size:>9.0f} B ({size / legacy_bytes * 100:5.1f}% of legacy)  {ms:6.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
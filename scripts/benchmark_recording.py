@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark battle recording formats on an existing recording.
+
+Replays a JSON recording's sim trace into a BattleRecorder in each format
+and measures the file size, the time recording the frames takes and the
+time save() takes, then checks that each file loads back to the same
+recording. The stream format writes during recording, so its save() only
+finishes the log. The "json+traj" row is JSON with the sim trace encoded
+as trajectory keyframes plus deltas (lossy: reports the largest position
+error instead).
+
+Usage:
+    python scripts/benchmark_recording.py data/recordings/battle_mcp_vs_grok_20260116_165007.json
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add project root to path for proper imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.llm.battle_recorder import BattleEvent, BattleRecorder, BattleRecording
+from src.llm.recording_codec import RECORDING_EXTENSIONS, RECORDING_FORMATS, load_recording
+from src.llm.trajectory_codec import TrajectoryCodec
+
+
+def replay(
+    recording: dict,
+    recording_format: str,
+    recording_dir: str,
+    trajectory_codec: Optional[TrajectoryCodec] = None,
+) -> BattleRecorder:
+    """Recorder holding the recording, its sim trace recorded frame by frame."""
+    recorder = BattleRecorder(recording_format, recording_dir, trajectory_codec=trajectory_codec)
+    recorder.recording = BattleRecording(**{
+        k: v for k, v in recording.items() if k not in ("events", "sim_trace")
+    })
+    recorder._is_recording = True
+    recorder._start_trace()
+    recorder._open_log()
+    for event in recording["events"]:
+        recorder._record_event(BattleEvent(**event))
+    for frame in recording["sim_trace"]:
+        ships = {
+            ship_id: {
+                "position": s["pos"], "velocity": s["vel"], "forward": s["fwd"], "thrust": s["thrust"],
+                "maneuver": s["maneuver"], "is_destroyed": s["destroyed"], "hull_pct": s["hull"],
+                "armor": s["armor"],
+            }
+            for ship_id, s in frame["ships"].items()
+        }
+        projectiles = [
+            {
+                "id": p["id"], "position": p["pos"], "velocity": p["vel"], "mass_kg": p["mass_kg"],
+                "source_ship_id": p["source"], "target_ship_id": p["target"],
+                "pd_engaged": p["pd_engaged"], "pd_ablation_kg": p["pd_damage_kg"],
+            }
+            for p in frame["projectiles"]
+        ]
+        torpedoes = [
+            {
+                "id": t["id"], "position": t["pos"], "velocity": t["vel"], "source_ship_id": t["source"],
+                "target_ship_id": t["target"], "dv_remaining_kps": t["dv_remaining"],
+                "heat_absorbed_j": t["pd_heat_j"], "is_disabled": t["disabled"],
+            }
+            for t in frame["torpedoes"]
+        ]
+        recorder.record_sim_frame(frame["t"], ships, projectiles, torpedoes)
+    recorder.recording.events = [event.to_dict() for event in recorder.events]
+    return recorder
+
+
+def max_position_error(frames: list, decoded: list) -> float:
+    """Largest position error of any entity in any frame."""
+    error = 0.0
+    for frame, other in zip(frames, decoded):
+        entities = list(frame["ships"].values()) + frame["projectiles"] + frame["torpedoes"]
+        decoded_entities = list(other["ships"].values()) + other["projectiles"] + other["torpedoes"]
+        for entity, decoded_entity in zip(entities, decoded_entities):
+            error = max([error] + [abs(a - b) for a, b in zip(entity["pos"], decoded_entity["pos"])])
+    return error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark battle recording formats")
+    parser.add_argument("recording", help="JSON recording with a sim trace")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed saves per format")
+    parser.add_argument("--trajectory-error", type=float, default=1.0, help="Position error bound of json+traj (m)")
+    args = parser.parse_args()
+
+    recording = load_recording(args.recording)
+    print(f"{len(recording['sim_trace'])} frames, {len(recording['events'])} events")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [(f, f, None) for f in RECORDING_FORMATS]
+        variants.append(("json+traj", "json", TrajectoryCodec(position_error_m=args.trajectory_error)))
+        for name, recording_format, codec in variants:
+            start = time.perf_counter()
+            recorder = replay(recording, recording_format, tmp, codec)
+            record_seconds = time.perf_counter() - start
+
+            path = Path(tmp) / f"{name}{RECORDING_EXTENSIONS[recording_format]}"
+            best = float("inf")
+            for _ in range(1 if recording_format == "stream" else args.repeat):
+                start = time.perf_counter()
+                recorder.save(str(path))
+                best = min(best, time.perf_counter() - start)
+            loaded = load_recording(str(path))
+            if codec is None:
+                same = loaded["sim_trace"] == recording["sim_trace"] and loaded["events"] == recording["events"]
+                check = f"loads back identically: {same}"
+            else:
+                error = max_position_error(recording["sim_trace"], loaded["sim_trace"])
+                check = f"largest position error: {error:.2f} m"
+            results[name] = (path.stat().st_size, record_seconds, best, check)
+
+        json_size, _, json_seconds, _ = results["json"]
+        for name, (size, record_seconds, seconds, check) in results.items():
+            print(f"  {name:<9} {size:>10} B ({json_size / size:5.1f}x smaller)  "
+                  f"record {record_seconds * 1000:6.1f} ms  "
+                  f"save {seconds * 1000:7.1f} ms ({json_seconds / seconds:6.1f}x faster)  "
+                  f"{check}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,25 +13,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-import json
-import copy
-from dataclasses import dataclass
 from src.combat import (
-    Weapon, ShipArmor, HitLocation, CombatResolver,
-    load_fleet_data, create_weapon_from_fleet_data, create_ship_armor_from_fleet_data
+    Weapon, HitLocation,
+    load_fleet_data, create_weapon_from_fleet_data,
 )
-from src.modules import ModuleLayout
-
-
-@dataclass
-class SimulationResult:
-    """Result of a shots-to-kill simulation."""
-    ship_type: str
-    weapon_type: str
-    location: str
-    shots_to_penetrate: int
-    shots_to_kill: int
-    kill_reason: str  # "reactor", "bridge", or "hull"
+from src.modules import build_shots_to_kill_table
 
 
 def create_torpedo_weapon(impact_velocity_kps: float = 5.0) -> Weapon:
@@ -58,111 +44,6 @@ def create_torpedo_weapon(impact_velocity_kps: float = 5.0) -> Weapon:
     )
 
 
-def simulate_shots_to_kill(
-    weapon: Weapon,
-    ship_type: str,
-    location: HitLocation,
-    fleet_data: dict,
-    max_shots: int = 500
-) -> SimulationResult:
-    """
-    Simulate combat until ship is destroyed using energy-based damage.
-
-    Returns the number of shots needed to:
-    1. Penetrate armor (first penetrating hit)
-    2. Kill the ship (reactor/bridge destroyed or hull critical)
-    """
-    from src.combat import Armor, HitResult
-
-    # Create fresh armor and module layout
-    ship_armor = create_ship_armor_from_fleet_data(fleet_data, ship_type)
-    module_layout = ModuleLayout.from_ship_type(ship_type, fleet_data)
-
-    # Get ship structural integrity
-    ship_data = fleet_data["ships"][ship_type]
-    structural_integrity = ship_data["hull"]["structural_integrity"]
-
-    shots_fired = 0
-    shots_to_penetrate = 0
-    first_penetration = False
-    kill_reason = ""
-
-    armor_section = ship_armor.get_section(location)
-    if armor_section is None:
-        # No armor - immediate penetration
-        return SimulationResult(
-            ship_type=ship_type,
-            weapon_type=weapon.weapon_type,
-            location=location.value,
-            shots_to_penetrate=1,
-            shots_to_kill=1,
-            kill_reason="no_armor"
-        )
-
-    while shots_fired < max_shots:
-        shots_fired += 1
-
-        # Apply energy-based damage to armor
-        ablation_cm, energy_to_hull_gj, chipping = armor_section.apply_energy_damage(
-            energy_gj=weapon.kinetic_energy_gj,
-            flat_chipping=weapon.flat_chipping,
-            impact_area_m2=0.01  # Standard 10cm x 10cm impact
-        )
-
-        # Check if armor is penetrated
-        penetrated = armor_section.is_penetrated()
-
-        # Track first penetration
-        if penetrated and not first_penetration:
-            shots_to_penetrate = shots_fired
-            first_penetration = True
-
-        # If penetrated, apply damage to internal modules
-        if penetrated:
-            # Calculate remaining damage (90% of weapon energy after armor breach)
-            remaining_damage_gj = weapon.kinetic_energy_gj * 0.9
-
-            # Create a hit result for module damage
-            hit_result = HitResult(
-                hit=True,
-                location=location,
-                penetrated=True,
-                remaining_damage_gj=remaining_damage_gj
-            )
-
-            damage_results = module_layout.apply_penetrating_damage(
-                hit_result,
-                spread_angle_deg=15.0
-            )
-
-        # Check for kill conditions
-        # 1. Critical module destroyed (reactor or bridge)
-        if module_layout.has_critical_damage:
-            for module in module_layout.get_critical_modules():
-                if module.is_destroyed:
-                    kill_reason = module.module_type.value
-                    break
-            break
-
-        # 2. Hull integrity critical (below 25%)
-        if module_layout.ship_integrity_percent < 25.0:
-            kill_reason = "hull"
-            break
-
-    # If we never penetrated, set penetration to max
-    if not first_penetration:
-        shots_to_penetrate = shots_fired
-
-    return SimulationResult(
-        ship_type=ship_type,
-        weapon_type=weapon.weapon_type,
-        location=location.value,
-        shots_to_penetrate=shots_to_penetrate,
-        shots_to_kill=shots_fired if kill_reason else max_shots,
-        kill_reason=kill_reason or "survived"
-    )
-
-
 def main():
     # Load fleet data
     data_path = Path(__file__).parent.parent / "data" / "fleet_ships.json"
@@ -191,26 +72,20 @@ def main():
     # Hit locations
     locations = [HitLocation.NOSE, HitLocation.LATERAL, HitLocation.TAIL]
 
-    # Run simulations - store results by (ship, weapon_key, location)
-    results = {}
-
+    # Build the shots-to-kill table - keyed by (weapon_key, ship, location)
     print("Running shots-to-kill simulations...")
     print("=" * 80)
 
+    table = build_shots_to_kill_table(weapons, ship_types, fleet_data, locations)
+    results = {
+        (ship_type, weapon_key, location): result
+        for (weapon_key, ship_type, location), result in table.items()
+    }
+
     for ship_type in ship_types:
         print(f"\n{ship_type.upper()}")
         print("-" * 40)
 
-        for weapon_key, weapon in weapons.items():
-            for location in locations:
-                result = simulate_shots_to_kill(
-                    weapon=weapon,
-                    ship_type=ship_type,
-                    location=location,
-                    fleet_data=fleet_data
-                )
-                results[(ship_type, weapon_key, location.value)] = result
-
         # Print table for this ship
         print(f"\n{'Weapon':<25} {'Nose':>8} {'Lateral':>8} {'Tail':>8}")
         print("-" * 55)
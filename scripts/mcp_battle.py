@@ -84,6 +84,8 @@ async def run_mcp_battle(
         verbose=verbose,
         record_battle=fleet_config.record_battle,
         record_sim_trace=fleet_config.record_sim_trace,
+        recording_format=fleet_config.recording_format,
+        trajectory_error_m=fleet_config.trajectory_error_m,
         personality_selection=fleet_config.personality_selection,
     )
 
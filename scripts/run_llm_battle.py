@@ -6,6 +6,8 @@ Usage:
     python scripts/run_llm_battle.py --verbose
     python scripts/run_llm_battle.py --alpha-model openai/gpt-4 --beta-model anthropic/claude-3.5-sonnet
     python scripts/run_llm_battle.py --fleet-config data/fleet_config.json
+    python scripts/run_llm_battle.py --seed 7 --llm-cache data/llm_cache            # record
+    python scripts/run_llm_battle.py --seed 7 --llm-cache data/llm_cache --replay   # offline replay
 """
 
 import argparse
@@ -16,6 +18,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.llm.client import CaptainClient
+from src.llm.response_cache import CacheMode, ResponseCache
 from src.llm.captain import LLMCaptainConfig
 from src.llm.prompts import CaptainPersonality
 from src.llm.battle_runner import LLMBattleRunner, BattleConfig, load_fleet_data
@@ -136,12 +139,44 @@ Examples:
         action="store_true",
         help="Record detailed sim trace (position/velocity of all objects every step). WARNING: Large files!",
     )
+    parser.add_argument(
+        "--recording-format",
+        choices=["json", "columnar", "stream"],
+        default="json",
+        help="Recording file format: json (visualizer), columnar (compressed, much smaller with --trace) "
+             "or stream (written during the battle, survives crashes)",
+    )
+    parser.add_argument(
+        "--trajectory-error",
+        type=float,
+        default=None,
+        metavar="M",
+        help="Store the --trace of a json recording as keyframes plus deviations from ballistic "
+             "prediction, accurate to M meters (~4x smaller trace)",
+    )
     parser.add_argument(
         "--no-personality-selection",
         action="store_true",
         help="Skip personality selection phase (use preset personalities from --alpha/beta-personality)",
     )
 
+    # Determinism / offline replay
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Simulation RNG seed (required for reproducible replays)",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        help="Directory for the content-addressed LLM response cache",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Strict replay: serve every LLM call from --llm-cache, fail on a miss",
+    )
+
     # Output
     parser.add_argument(
         "--verbose", "-v",
@@ -153,9 +188,17 @@ Examples:
         action="store_true",
         help="Quiet mode (only show result)",
     )
+    parser.add_argument(
+        "--telemetry",
+        type=str,
+        help="Write an LLM latency/token/error summary (JSON) to this file",
+    )
 
     args = parser.parse_args()
 
+    if args.replay and not args.llm_cache:
+        parser.error("--replay requires --llm-cache")
+
     # Map personality strings to enums
     personality_map = {
         "aggressive": CaptainPersonality.AGGRESSIVE,
@@ -186,7 +229,14 @@ Examples:
         else:
             client_model = args.alpha_model
 
-        client = CaptainClient(model=client_model)
+        cache = None
+        if args.llm_cache:
+            cache = ResponseCache(
+                args.llm_cache,
+                mode=CacheMode.REPLAY if args.replay else CacheMode.READ_WRITE,
+            )
+
+        client = CaptainClient(model=client_model, cache=cache)
 
         # Extract short model names for display
         def get_short_model_name(model: str) -> str:
@@ -237,10 +287,14 @@ Examples:
             unlimited_mode=args.unlimited,
             verbose=not args.quiet,
             record_sim_trace=args.trace,
+            recording_format=args.recording_format,
+            trajectory_error_m=args.trajectory_error,
             personality_selection=not args.no_personality_selection,
             alpha_ship_type=args.alpha_ship_type,
             beta_ship_type=args.beta_ship_type,
             fleet_config_path=args.fleet_config,
+            seed=args.seed,
+            telemetry_path=args.telemetry,
         )
 
         if args.unlimited and not args.quiet:
@@ -266,6 +320,9 @@ Examples:
             print(f"Reason: {result.reason}")
             print(f"Duration: {result.duration_s:.0f}s ({result.checkpoints_used} checkpoints)")
 
+        if cache is not None and not args.quiet:
+            print(f"LLM cache: {cache.hits} hits, {cache.misses} misses")
+
         # Print messages if verbose
         if args.verbose and result.messages:
             print("\n--- All Communications ---")
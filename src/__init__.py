@@ -2,6 +2,7 @@
 
 from .combat import (
     Armor,
+    BatchHitResult,
     CombatResolver,
     HitLocation,
     HitResult,
@@ -54,6 +55,7 @@ from .modules import (
 __all__ = [
     # Combat module
     "Armor",
+    "BatchHitResult",
     "CombatResolver",
     "HitLocation",
     "HitResult",
@@ -10,11 +10,14 @@ Based on Terra Invicta game mechanics with baryonic projectile physics.
 from __future__ import annotations
 
 import json
+import math
 import random
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Protocol, runtime_checkable
+from typing import Optional, Protocol, Sequence, Union, runtime_checkable
+
+import numpy as np
 
 
 # Radiator vulnerability constants
@@ -22,6 +25,10 @@ RADIATOR_HIT_CHANCE_RETRACTED = 0.05  # 5% chance to hit retracted radiators
 RADIATOR_HIT_CHANCE_EXTENDED = 0.20   # 20% chance to hit extended radiators
 RADIATOR_ARMOR_RATING = 0.1           # Very fragile, only 10% damage reduction
 
+# Batch armor resolution constants
+BATCH_ABLATION_CHUNK = 64  # Shots per closed-form chunk (keeps cumulative products well-conditioned)
+MIN_ANGLE_EFFICIENCY = 0.1736  # cos(80°) - floor on energy transfer for oblique hits
+
 
 class HitLocation(Enum):
     """Ship hit locations with associated targeting probabilities."""
@@ -505,6 +512,98 @@ class Armor:
 
         return actual_ablation, energy_to_hull_gj, chipping_added
 
+    def apply_energy_damage_batch(
+        self,
+        energies_gj: Sequence[float] | np.ndarray,
+        flat_chipping: float | np.ndarray = 0.3,
+        impact_area_m2: float | np.ndarray = 0.01,
+        crit_rolls: Optional[np.ndarray] = None,
+    ) -> BatchHitResult:
+        """
+        Apply a sequence of kinetic hits to this section in one vectorized pass.
+
+        Produces the same armor state and per-hit outcomes as calling
+        apply_energy_damage() once per hit in order. Chipping ablation is
+        proportional to remaining thickness, so thickness follows the linear
+        recurrence t[k+1] = t[k] * (1 - c[k]) - b[k], which is solved with
+        cumulative products instead of a Python loop.
+
+        Args:
+            energies_gj: Kinetic energy of each hit in gigajoules, in impact order.
+            flat_chipping: Chipping factor, scalar or per hit.
+            impact_area_m2: Impact area in square meters, scalar or per hit.
+            crit_rolls: Optional uniform [0, 1) draws, one per hit, compared
+                against the chipping fraction *before* each hit (as
+                roll_critical_through_chipping() would be).
+
+        Returns:
+            BatchHitResult with one entry per hit.
+        """
+        energies = np.asarray(energies_gj, dtype=float).ravel()
+        n = energies.size
+        chipping = np.broadcast_to(np.asarray(flat_chipping, dtype=float), (n,))
+        areas = np.broadcast_to(np.asarray(impact_area_m2, dtype=float), (n,))
+
+        # Energy-based ablation does not depend on armor state
+        effective_damage = energies * 0.5 * (1.0 - self.kinetics_resist)
+        if self.heat_of_vaporization_mj_kg <= 0:
+            base_ablation = np.zeros(n)
+        else:
+            heat_j_kg = self.heat_of_vaporization_mj_kg * 1e6
+            with np.errstate(divide="ignore", invalid="ignore"):
+                base_ablation = np.where(
+                    areas > 0,
+                    effective_damage * 1e9 / (self.density * areas * heat_j_kg) * 100,
+                    0.0,
+                )
+
+        # Fraction of thickness surviving the chipping component of each hit
+        retained = 1.0 - chipping * (1.0 - self.chip_resist) * 0.1
+
+        thickness = _solve_ablation_sequence(self.thickness_cm, retained, base_ablation)
+        before = thickness[:-1]
+        after = thickness[1:]
+
+        total_ablation = base_ablation + before * (1.0 - retained)
+        actual_ablation = np.minimum(total_ablation, before)
+
+        if self.baryonic_half_cm > 0:
+            protection = np.where(after > 0, 1.0 - 0.5 ** (after / self.baryonic_half_cm), 0.0)
+        else:
+            protection = np.zeros(n)
+        energy_to_hull = effective_damage * (1.0 - protection)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chipping_added = np.where(
+                after > 0, actual_ablation / (after + actual_ablation) * 0.1, 0.5
+            )
+        running = np.cumsum(chipping_added)
+        chipping_before = np.minimum(
+            1.0, self.chipping_fraction + np.concatenate(([0.0], running[:-1]))
+        )
+
+        if crit_rolls is not None:
+            critical_through_chip = np.asarray(crit_rolls, dtype=float).ravel() < chipping_before
+        else:
+            critical_through_chip = np.zeros(n, dtype=bool)
+        penetrated = (after <= 0) | critical_through_chip
+
+        self.thickness_cm = float(thickness[-1])
+        if n:
+            self.chipping_fraction = min(1.0, self.chipping_fraction + float(running[-1]))
+
+        return BatchHitResult(
+            ablation_cm=actual_ablation,
+            energy_to_hull_gj=energy_to_hull,
+            chipping_added=chipping_added,
+            armor_remaining_cm=after.copy(),
+            penetrated=penetrated,
+            critical_through_chip=critical_through_chip,
+            critical_hit=np.zeros(n, dtype=bool),
+            remaining_damage_gj=np.where(penetrated, energies - energy_to_hull, 0.0),
+            locations=[self.location] * n,
+        )
+
     def roll_critical_through_chipping(self, rng: random.Random = None) -> bool:
         """
         Roll for a critical hit through chipped armor.
@@ -585,6 +684,111 @@ class HitResult:
         return result
 
 
+@dataclass
+class BatchHitResult:
+    """
+    Vectorized outcome of resolving many hits at once.
+
+    All arrays share the order of the input shots.
+
+    Attributes:
+        ablation_cm: Armor thickness removed by each hit.
+        energy_to_hull_gj: Energy reaching the hull through remaining armor.
+        chipping_added: Chipping fraction added by each hit.
+        armor_remaining_cm: Section thickness after each hit.
+        penetrated: Whether each hit penetrated (breach or chip critical).
+        critical_through_chip: Whether each hit bypassed armor through a chip.
+        critical_hit: Whether each hit caused a critical hit.
+        remaining_damage_gj: Energy passed to internal modules (0 if not penetrated).
+        locations: Hit location of each shot.
+    """
+    ablation_cm: np.ndarray
+    energy_to_hull_gj: np.ndarray
+    chipping_added: np.ndarray
+    armor_remaining_cm: np.ndarray
+    penetrated: np.ndarray
+    critical_through_chip: np.ndarray
+    critical_hit: np.ndarray
+    remaining_damage_gj: np.ndarray
+    locations: list[HitLocation] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return int(self.ablation_cm.size)
+
+    @property
+    def first_penetration_index(self) -> Optional[int]:
+        """Index of the first penetrating hit, or None if none penetrated."""
+        hits = np.flatnonzero(self.penetrated)
+        return int(hits[0]) if hits.size else None
+
+    def to_hit_results(self) -> list[HitResult]:
+        """
+        Convert to per-shot HitResult objects.
+
+        Returns:
+            List of HitResult in shot order.
+        """
+        return [
+            HitResult(
+                hit=True,
+                location=self.locations[i] if i < len(self.locations) else None,
+                damage_absorbed=float(self.energy_to_hull_gj[i]),
+                armor_ablation_cm=float(self.ablation_cm[i]),
+                penetrated=bool(self.penetrated[i]),
+                remaining_damage_gj=float(self.remaining_damage_gj[i]),
+                critical_hit=bool(self.critical_hit[i]),
+            )
+            for i in range(len(self))
+        ]
+
+
+def _solve_ablation_sequence(
+    thickness_cm: float,
+    retained: np.ndarray,
+    base_ablation: np.ndarray,
+) -> np.ndarray:
+    """
+    Solve t[k+1] = max(0, t[k] * retained[k] - base_ablation[k]) for all k.
+
+    Within a chunk the unclamped recurrence has the closed form
+    t[k] = P[k] * (t[0] - sum_{j<k} b[j] / P[j+1]) with P the running product
+    of retained fractions. Thickness only decreases, so once it reaches zero
+    it stays there.
+
+    Args:
+        thickness_cm: Initial thickness.
+        retained: Per-hit fraction of thickness surviving chipping.
+        base_ablation: Per-hit energy ablation in cm.
+
+    Returns:
+        Array of length n + 1: thickness before each hit, then final thickness.
+    """
+    n = retained.size
+    out = np.zeros(n + 1)
+    out[0] = max(0.0, thickness_cm)
+    pos = 0
+    while pos < n:
+        t = out[pos]
+        if t <= 0:
+            break
+        end = min(n, pos + BATCH_ABLATION_CHUNK)
+        m = retained[pos:end]
+        b = base_ablation[pos:end]
+        if np.any(m <= 0):
+            # Degenerate chipping (>=100%): step exactly
+            out[pos + 1] = max(0.0, t * m[0] - b[0])
+            pos += 1
+            continue
+        products = np.cumprod(m)
+        unclamped = products * (t - np.cumsum(b / products))
+        depleted = np.flatnonzero(unclamped <= 0)
+        if depleted.size:
+            unclamped[depleted[0]:] = 0.0
+        out[pos + 1:end + 1] = unclamped
+        pos = end
+    return out
+
+
 @dataclass
 class ShipArmor:
     """
@@ -987,6 +1191,114 @@ class CombatResolver:
             thermal_system=thermal_system
         )
 
+    def resolve_hits_batch(
+        self,
+        weapons: Union[Weapon, Sequence[Weapon]],
+        target_armor: ShipArmor,
+        energies_gj: Optional[Sequence[float] | np.ndarray] = None,
+        impact_angles_deg: Optional[Sequence[float] | np.ndarray] = None,
+        locations: Optional[Sequence[HitLocation]] = None,
+        impact_area_m2: float | np.ndarray = 0.01,
+    ) -> BatchHitResult:
+        """
+        Resolve many confirmed hits against one ship in a single pass.
+
+        Uses the energy-based Terra Invicta model from Armor.apply_energy_damage():
+        oblique hits transfer cos(angle) of their energy, each section resolves
+        its hits in shot order, chip criticals are rolled against the chipping
+        fraction before each hit, and penetrating hits crit 50% of the time.
+
+        Args:
+            weapons: One weapon for every shot, or one weapon per shot.
+            target_armor: The target ship's armor (modified in place).
+            energies_gj: Impact energy per shot (defaults to weapon energy).
+            impact_angles_deg: Angle from surface normal per shot (default 0°).
+            locations: Hit location per shot (random if None).
+            impact_area_m2: Impact area in square meters, scalar or per shot.
+
+        Returns:
+            BatchHitResult in shot order.
+        """
+        if isinstance(weapons, Weapon):
+            n = next(
+                (len(arr) for arr in (energies_gj, impact_angles_deg, locations) if arr is not None),
+                1,
+            )
+            weapon_list = [weapons] * n
+        else:
+            weapon_list = list(weapons)
+            n = len(weapon_list)
+
+        if energies_gj is None:
+            energies = np.array([w.kinetic_energy_gj for w in weapon_list], dtype=float)
+        else:
+            energies = np.asarray(energies_gj, dtype=float).ravel()
+        chipping = np.array([w.flat_chipping for w in weapon_list], dtype=float)
+
+        if impact_angles_deg is None:
+            angle_efficiency = np.ones(n)
+        else:
+            angles = np.clip(np.abs(np.asarray(impact_angles_deg, dtype=float)), 0.0, 89.0)
+            angle_efficiency = np.maximum(MIN_ANGLE_EFFICIENCY, np.cos(np.radians(angles)))
+        angled_energies = energies * angle_efficiency
+
+        if locations is None:
+            locations = self.rng.choices(
+                list(HIT_LOCATION_WEIGHTS.keys()),
+                weights=list(HIT_LOCATION_WEIGHTS.values()),
+                k=n,
+            )
+        locations = list(locations)
+        areas = np.broadcast_to(np.asarray(impact_area_m2, dtype=float), (n,))
+
+        # One seeded generator per batch keeps results reproducible with self.rng
+        np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        chip_rolls = np_rng.random(n)
+        crit_rolls = np_rng.random(n)
+
+        result = BatchHitResult(
+            ablation_cm=np.zeros(n),
+            energy_to_hull_gj=np.zeros(n),
+            chipping_added=np.zeros(n),
+            armor_remaining_cm=np.zeros(n),
+            penetrated=np.zeros(n, dtype=bool),
+            critical_through_chip=np.zeros(n, dtype=bool),
+            critical_hit=np.zeros(n, dtype=bool),
+            remaining_damage_gj=np.zeros(n),
+            locations=locations,
+        )
+        location_array = np.array([loc.value for loc in locations])
+
+        for location in HitLocation:
+            idx = np.flatnonzero(location_array == location.value)
+            if idx.size == 0:
+                continue
+            armor = target_armor.get_section(location)
+            if armor is None:
+                # No armor at this location - full penetration
+                result.penetrated[idx] = True
+                result.critical_hit[idx] = True
+                result.energy_to_hull_gj[idx] = angled_energies[idx]
+                result.remaining_damage_gj[idx] = angled_energies[idx]
+                continue
+
+            section = armor.apply_energy_damage_batch(
+                angled_energies[idx],
+                flat_chipping=chipping[idx],
+                impact_area_m2=areas[idx],
+                crit_rolls=chip_rolls[idx],
+            )
+            result.ablation_cm[idx] = section.ablation_cm
+            result.energy_to_hull_gj[idx] = section.energy_to_hull_gj
+            result.chipping_added[idx] = section.chipping_added
+            result.armor_remaining_cm[idx] = section.armor_remaining_cm
+            result.penetrated[idx] = section.penetrated
+            result.critical_through_chip[idx] = section.critical_through_chip
+            result.remaining_damage_gj[idx] = section.remaining_damage_gj
+            result.critical_hit[idx] = section.penetrated & (crit_rolls[idx] < 0.5)
+
+        return result
+
 
 def load_fleet_data(filepath: str | Path) -> dict:
     """
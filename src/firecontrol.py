@@ -10,10 +10,15 @@ This module implements:
 
 from __future__ import annotations
 
+import copy
 import math
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
+
+import numpy as np
 
 try:
     from .physics import Vector3D
@@ -200,28 +205,30 @@ def calculate_hit_probability(
     # Clamp to valid range
     prob = max(0.01, min(0.99, prob))
 
-    # Generate recommendation
-    if prob >= 0.7:
-        recommendation = "EXCELLENT SHOT - FIRE AT WILL"
-    elif prob >= 0.5:
-        recommendation = "GOOD SHOT - RECOMMEND FIRE"
-    elif prob >= 0.3:
-        recommendation = "MARGINAL - FIRE IF AMMO AVAILABLE"
-    elif prob >= 0.1:
-        recommendation = "POOR - CLOSE RANGE OR WAIT"
-    else:
-        recommendation = "VERY POOR - HOLD FIRE"
-
     return FiringSolution(
         can_fire=True,
         hit_probability=prob,
         time_of_flight_s=time_of_flight_s,
         predicted_range_km=predicted_range_km,
         target_aspect=target_aspect,
-        recommendation=recommendation
+        recommendation=_recommendation_for(prob)
     )
 
 
+def _recommendation_for(prob: float) -> str:
+    """Human-readable firing recommendation for a hit probability."""
+    if prob >= 0.7:
+        return "EXCELLENT SHOT - FIRE AT WILL"
+    elif prob >= 0.5:
+        return "GOOD SHOT - RECOMMEND FIRE"
+    elif prob >= 0.3:
+        return "MARGINAL - FIRE IF AMMO AVAILABLE"
+    elif prob >= 0.1:
+        return "POOR - CLOSE RANGE OR WAIT"
+    else:
+        return "VERY POOR - HOLD FIRE"
+
+
 def calculate_engagement_envelope(
     weapon_range_km: float,
     muzzle_velocity_kps: float,
@@ -230,7 +237,8 @@ def calculate_engagement_envelope(
     """
     Calculate engagement envelope for a weapon.
 
-    Returns range brackets with expected hit probabilities.
+    Returns range brackets with expected hit probabilities. Results are
+    memoized per argument set; callers get their own copy.
 
     Args:
         weapon_range_km: Maximum weapon range in km.
@@ -240,6 +248,18 @@ def calculate_engagement_envelope(
     Returns:
         Dictionary with range brackets and probabilities.
     """
+    return copy.deepcopy(
+        _engagement_envelope(weapon_range_km, muzzle_velocity_kps, target_size_m)
+    )
+
+
+@lru_cache(maxsize=256)
+def _engagement_envelope(
+    weapon_range_km: float,
+    muzzle_velocity_kps: float,
+    target_size_m: float
+) -> dict:
+    """Uncopied, memoized body of calculate_engagement_envelope()."""
     envelope = {
         'optimal_range_km': 0.0,
         'good_range_km': 0.0,
@@ -271,6 +291,409 @@ def calculate_engagement_envelope(
     return envelope
 
 
+# =============================================================================
+# PRECOMPUTED ENGAGEMENT GRIDS
+# =============================================================================
+
+# Grid resolution (range points are log-spaced, speeds linear)
+GRID_RANGE_POINTS = 64
+GRID_SPEED_POINTS = 25
+GRID_MAX_RANGE_KM = 3000.0
+GRID_MAX_SPEED_KPS = 20.0
+# Closing speeds this close to -muzzle velocity have near-infinite flight
+# times; queries there fall back to the exact calculation
+GRID_MIN_CLOSING_FRACTION = 0.9
+
+
+def _unclamped_hit_probability(
+    distance_m: np.ndarray,
+    closing_mps: np.ndarray,
+    lateral_mps: np.ndarray,
+    cross_section_m2: float,
+    muzzle_velocity_mps: float,
+    weapon_base_accuracy: float,
+) -> np.ndarray:
+    """
+    Vectorized hit probability before evasion and clamping.
+
+    Same model as calculate_hit_probability(), expressed in terms of range,
+    closing speed and lateral (crossing) speed along the line of sight.
+    """
+    effective_speed = muzzle_velocity_mps + closing_mps
+    tof = distance_m / effective_speed
+    # Relative position at impact: along-LOS shrinks by closing, lateral grows
+    predicted = np.hypot(distance_m - closing_mps * tof, lateral_mps * tof)
+
+    radius = math.sqrt(cross_section_m2 / math.pi)
+    with np.errstate(divide="ignore"):
+        angular_size = np.where(predicted > 0, radius / predicted, 1.0)
+    prob = (1.0 - np.exp(-10000 * angular_size)) * weapon_base_accuracy
+    prob *= np.maximum(0.5, 1.0 - tof / 100)
+
+    lateral_angle = np.arctan2(lateral_mps * tof, predicted)
+    crossing = np.maximum(0.3, 1.0 - (lateral_angle / math.pi) * 2)
+    return np.where(predicted > 0, prob * crossing, prob)
+
+
+@dataclass
+class EngagementGrid:
+    """
+    Precomputed hit probabilities for one weapon against one target aspect.
+
+    Covers range x closing speed x lateral speed. Values are stored before
+    the evasion penalty and clamping so one grid serves evading and
+    non-evading targets alike. Queries interpolate trilinearly (range in
+    log space).
+
+    Attributes:
+        muzzle_velocity_kps: Weapon muzzle velocity.
+        cross_section_m2: Exposed target cross-section.
+        weapon_base_accuracy: Weapon base accuracy factor.
+        log_range: Log of range axis values (meters).
+        closing_mps: Closing speed axis values.
+        lateral_mps: Lateral speed axis values.
+        values: Probability grid, shape (range, closing, lateral).
+    """
+    muzzle_velocity_kps: float
+    cross_section_m2: float
+    weapon_base_accuracy: float
+    log_range: np.ndarray
+    closing_mps: np.ndarray
+    lateral_mps: np.ndarray
+    values: np.ndarray
+
+    def __post_init__(self):
+        # Plain-list mirrors for the scalar lookup path
+        self._log_range = self.log_range.tolist()
+        self._closing = self.closing_mps.tolist()
+        self._lateral = self.lateral_mps.tolist()
+        self._rows = self.values.tolist()
+        self._max_range_m = math.exp(self._log_range[-1])
+
+    @classmethod
+    def build(
+        cls,
+        muzzle_velocity_kps: float,
+        cross_section_m2: float,
+        weapon_base_accuracy: float = 0.9,
+    ) -> EngagementGrid:
+        """
+        Evaluate the hit probability model over the full grid in one pass.
+
+        Args:
+            muzzle_velocity_kps: Weapon muzzle velocity.
+            cross_section_m2: Exposed target cross-section.
+            weapon_base_accuracy: Weapon base accuracy factor.
+
+        Returns:
+            Populated EngagementGrid.
+        """
+        muzzle_mps = muzzle_velocity_kps * 1000
+        ranges = np.geomspace(1.0, GRID_MAX_RANGE_KM * 1000, GRID_RANGE_POINTS)
+        closing = np.linspace(
+            -GRID_MIN_CLOSING_FRACTION * muzzle_mps,
+            GRID_MAX_SPEED_KPS * 1000,
+            GRID_SPEED_POINTS,
+        )
+        lateral = np.linspace(0.0, GRID_MAX_SPEED_KPS * 1000, GRID_SPEED_POINTS)
+
+        d, c, l = np.meshgrid(ranges, closing, lateral, indexing="ij")
+        values = _unclamped_hit_probability(
+            d, c, l, cross_section_m2, muzzle_mps, weapon_base_accuracy
+        )
+        return cls(
+            muzzle_velocity_kps=muzzle_velocity_kps,
+            cross_section_m2=cross_section_m2,
+            weapon_base_accuracy=weapon_base_accuracy,
+            log_range=np.log(ranges),
+            closing_mps=closing,
+            lateral_mps=lateral,
+            values=values,
+        )
+
+    def contains(self, distance_m: float, closing_mps: float, lateral_mps: float) -> bool:
+        """Check whether a query lies inside the precomputed domain."""
+        return (
+            1.0 <= distance_m <= self._max_range_m
+            and self.closing_mps[0] <= closing_mps <= self.closing_mps[-1]
+            and lateral_mps <= self.lateral_mps[-1]
+        )
+
+    def probability(self, distance_m: float, closing_mps: float, lateral_mps: float) -> float:
+        """
+        Scalar fast path of probabilities() for in-grid queries.
+
+        Avoids numpy per-call overhead, which dominates for single lookups.
+        """
+        i, fi = _axis_cell(self._log_range, math.log(distance_m))
+        j, fj = _axis_cell(self._closing, closing_mps)
+        k, fk = _axis_cell(self._lateral, lateral_mps)
+        v0, v1 = self._rows[i], self._rows[i + 1]
+        a, b = v0[j], v1[j]
+        c, d = v0[j + 1], v1[j + 1]
+        c00 = a[k] + (b[k] - a[k]) * fi
+        c01 = a[k + 1] + (b[k + 1] - a[k + 1]) * fi
+        c10 = c[k] + (d[k] - c[k]) * fi
+        c11 = c[k + 1] + (d[k + 1] - c[k + 1]) * fi
+        c0 = c00 + (c10 - c00) * fj
+        c1 = c01 + (c11 - c01) * fj
+        return c0 + (c1 - c0) * fk
+
+    def probabilities(
+        self,
+        distance_m: np.ndarray,
+        closing_mps: np.ndarray,
+        lateral_mps: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Interpolate unclamped, pre-evasion hit probabilities.
+
+        Inputs outside the grid are clipped to its edges; use contains() to
+        decide when the exact model is needed instead.
+
+        Args:
+            distance_m: Range to target in meters.
+            closing_mps: Closing speed in m/s (positive = closing).
+            lateral_mps: Crossing speed perpendicular to line of sight.
+
+        Returns:
+            Interpolated probabilities with the broadcast input shape.
+        """
+        coords = []
+        for axis, value in (
+            (self.log_range, np.log(np.maximum(distance_m, 1.0))),
+            (self.closing_mps, np.asarray(closing_mps, dtype=float)),
+            (self.lateral_mps, np.asarray(lateral_mps, dtype=float)),
+        ):
+            value = np.clip(value, axis[0], axis[-1])
+            idx = np.clip(np.searchsorted(axis, value, side="right") - 1, 0, axis.size - 2)
+            frac = (value - axis[idx]) / (axis[idx + 1] - axis[idx])
+            coords.append((idx, frac))
+
+        (i, fi), (j, fj), (k, fk) = coords
+        v = self.values
+        c00 = v[i, j, k] * (1 - fi) + v[i + 1, j, k] * fi
+        c01 = v[i, j, k + 1] * (1 - fi) + v[i + 1, j, k + 1] * fi
+        c10 = v[i, j + 1, k] * (1 - fi) + v[i + 1, j + 1, k] * fi
+        c11 = v[i, j + 1, k + 1] * (1 - fi) + v[i + 1, j + 1, k + 1] * fi
+        c0 = c00 * (1 - fj) + c10 * fj
+        c1 = c01 * (1 - fj) + c11 * fj
+        return c0 * (1 - fk) + c1 * fk
+
+
+def _axis_cell(axis: List[float], value: float) -> Tuple[int, float]:
+    """Lower cell index and fractional offset of value on a sorted axis."""
+    idx = min(max(bisect_right(axis, value) - 1, 0), len(axis) - 2)
+    return idx, (value - axis[idx]) / (axis[idx + 1] - axis[idx])
+
+
+# Grids shared across weapons officers and battles
+_ENGAGEMENT_GRID_CACHE: Dict[Tuple[float, float, float], EngagementGrid] = {}
+
+
+def get_engagement_grid(
+    muzzle_velocity_kps: float,
+    cross_section_m2: float,
+    weapon_base_accuracy: float = 0.9,
+) -> EngagementGrid:
+    """
+    Get the engagement grid for a weapon and target aspect, building it lazily.
+
+    Args:
+        muzzle_velocity_kps: Weapon muzzle velocity.
+        cross_section_m2: Exposed target cross-section (from ShipGeometry).
+        weapon_base_accuracy: Weapon base accuracy factor.
+
+    Returns:
+        Cached EngagementGrid.
+    """
+    key = (muzzle_velocity_kps, cross_section_m2, weapon_base_accuracy)
+    grid = _ENGAGEMENT_GRID_CACHE.get(key)
+    if grid is None:
+        grid = EngagementGrid.build(muzzle_velocity_kps, cross_section_m2, weapon_base_accuracy)
+        _ENGAGEMENT_GRID_CACHE[key] = grid
+    return grid
+
+
+def clear_engagement_grids() -> None:
+    """Drop all cached engagement grids and envelopes."""
+    _ENGAGEMENT_GRID_CACHE.clear()
+    _engagement_envelope.cache_clear()
+
+
+@dataclass
+class EngagementGeometry:
+    """
+    Shooter-to-target geometry shared by every weapon on the shooter.
+
+    Computed once per target per tick; only the weapon-specific terms
+    (muzzle velocity, accuracy) vary between slots.
+
+    Attributes:
+        distance_m: Current range.
+        closing_rate_mps: Closing speed along line of sight (positive = closing).
+        lateral_speed_mps: Crossing speed perpendicular to line of sight.
+        target_aspect: Target face exposed to the shooter.
+        cross_section_m2: Cross-section of the exposed face.
+    """
+    distance_m: float
+    closing_rate_mps: float
+    lateral_speed_mps: float
+    target_aspect: HitLocation
+    cross_section_m2: float
+
+
+def calculate_engagement_geometry(
+    shooter_position: Vector3D,
+    shooter_velocity: Vector3D,
+    target_position: Vector3D,
+    target_velocity: Vector3D,
+    target_geometry: ShipGeometry,
+    target_forward: Vector3D,
+) -> EngagementGeometry:
+    """
+    Reduce shooter and target state to range, closing/lateral speed and aspect.
+
+    Uses the same aspect rules as calculate_hit_probability().
+
+    Returns:
+        EngagementGeometry for the pair.
+    """
+    rel_pos = target_position - shooter_position
+    rel_vel = target_velocity - shooter_velocity
+    distance_m = rel_pos.magnitude
+
+    if distance_m < 1.0:
+        return EngagementGeometry(
+            distance_m=distance_m,
+            closing_rate_mps=0.0,
+            lateral_speed_mps=0.0,
+            target_aspect=HitLocation.LATERAL,
+            cross_section_m2=target_geometry.lateral_cross_section_m2,
+        )
+
+    direction_to_target = rel_pos.normalized()
+    closing_rate_mps = -rel_vel.dot(direction_to_target)
+    lateral_speed = (rel_vel + direction_to_target * closing_rate_mps).magnitude
+
+    approach_angle = math.degrees(target_forward.angle_to(-direction_to_target))
+    if approach_angle < 30:
+        target_aspect = HitLocation.NOSE
+        cross_section_m2 = target_geometry.nose_cross_section_m2
+    elif approach_angle > 150:
+        target_aspect = HitLocation.TAIL
+        cross_section_m2 = target_geometry.tail_cross_section_m2
+    else:
+        target_aspect = HitLocation.LATERAL
+        cross_section_m2 = target_geometry.lateral_cross_section_m2
+
+    return EngagementGeometry(
+        distance_m=distance_m,
+        closing_rate_mps=closing_rate_mps,
+        lateral_speed_mps=lateral_speed,
+        target_aspect=target_aspect,
+        cross_section_m2=cross_section_m2,
+    )
+
+
+def lookup_hit_probability(
+    shooter_position: Vector3D,
+    shooter_velocity: Vector3D,
+    target_position: Vector3D,
+    target_velocity: Vector3D,
+    target_geometry: ShipGeometry,
+    target_forward: Vector3D,
+    muzzle_velocity_kps: float,
+    weapon_base_accuracy: float = 0.9,
+    target_is_evading: bool = False
+) -> FiringSolution:
+    """
+    Table-lookup version of calculate_hit_probability().
+
+    Geometry (range, aspect, time of flight) is computed exactly; the hit
+    probability comes from the cached EngagementGrid for this weapon and
+    the exposed target face. Queries outside the grid, point-blank shots
+    and targets outrunning the projectile use the exact calculation.
+
+    Args:
+        Same as calculate_hit_probability().
+
+    Returns:
+        FiringSolution with interpolated hit probability.
+    """
+    geometry = calculate_engagement_geometry(
+        shooter_position, shooter_velocity, target_position, target_velocity,
+        target_geometry, target_forward,
+    )
+    solution = solve_from_engagement_geometry(
+        geometry, muzzle_velocity_kps, weapon_base_accuracy, target_is_evading
+    )
+    if solution is None:
+        solution = calculate_hit_probability(
+            shooter_position, shooter_velocity, target_position, target_velocity,
+            target_geometry, target_forward, muzzle_velocity_kps,
+            weapon_base_accuracy, target_is_evading,
+        )
+    return solution
+
+
+def solve_from_engagement_geometry(
+    geometry: EngagementGeometry,
+    muzzle_velocity_kps: float,
+    weapon_base_accuracy: float = 0.9,
+    target_is_evading: bool = False
+) -> Optional[FiringSolution]:
+    """
+    Firing solution for one weapon from precomputed geometry and grids.
+
+    Args:
+        geometry: Shooter-to-target geometry.
+        muzzle_velocity_kps: Weapon muzzle velocity.
+        weapon_base_accuracy: Weapon base accuracy factor.
+        target_is_evading: Apply the evasion penalty.
+
+    Returns:
+        FiringSolution, or None when the query falls outside the grid (the
+        caller should use calculate_hit_probability() instead).
+    """
+    muzzle_velocity_mps = muzzle_velocity_kps * 1000
+    if geometry.distance_m < 1.0 or muzzle_velocity_mps <= 0:
+        return None
+    effective_projectile_speed = muzzle_velocity_mps + geometry.closing_rate_mps
+    if effective_projectile_speed <= 0:
+        return None
+
+    grid = get_engagement_grid(
+        muzzle_velocity_kps, geometry.cross_section_m2, weapon_base_accuracy
+    )
+    if not grid.contains(
+        geometry.distance_m, geometry.closing_rate_mps, geometry.lateral_speed_mps
+    ):
+        return None
+
+    prob = grid.probability(
+        geometry.distance_m, geometry.closing_rate_mps, geometry.lateral_speed_mps
+    )
+    if target_is_evading:
+        prob *= 0.6
+    prob = max(0.01, min(0.99, prob))
+
+    time_of_flight_s = geometry.distance_m / effective_projectile_speed
+    predicted_range_m = math.hypot(
+        geometry.distance_m - geometry.closing_rate_mps * time_of_flight_s,
+        geometry.lateral_speed_mps * time_of_flight_s,
+    )
+
+    return FiringSolution(
+        can_fire=True,
+        hit_probability=prob,
+        time_of_flight_s=time_of_flight_s,
+        predicted_range_km=predicted_range_m / 1000,
+        target_aspect=geometry.target_aspect,
+        recommendation=_recommendation_for(prob)
+    )
+
+
 # =============================================================================
 # COMMAND SCHEMA
 # =============================================================================
@@ -394,7 +817,8 @@ class WeaponsOfficer:
         self,
         min_probability_threshold: float = 0.3,
         conserve_ammo_threshold: float = 0.5,
-        max_ammo_reserve_percent: float = 0.2
+        max_ammo_reserve_percent: float = 0.2,
+        use_engagement_grids: bool = True
     ):
         """
         Initialize weapons officer.
@@ -403,10 +827,14 @@ class WeaponsOfficer:
             min_probability_threshold: Don't fire below this probability.
             conserve_ammo_threshold: When ammo below this %, be more selective.
             max_ammo_reserve_percent: Keep this much ammo in reserve.
+            use_engagement_grids: Share per-target geometry across weapon slots and
+                read hit probabilities from cached engagement grids instead of
+                evaluating calculate_hit_probability for every slot/target pair.
         """
         self.min_probability = min_probability_threshold
         self.conserve_threshold = conserve_ammo_threshold
         self.ammo_reserve = max_ammo_reserve_percent
+        self.use_engagement_grids = use_engagement_grids
 
         # Current orders per weapon slot
         self.orders: dict[str, WeaponsOrder] = {}
@@ -530,6 +958,9 @@ class WeaponsOfficer:
             )
         )
 
+        # Geometry is shared by every weapon slot firing at the same target
+        geometries = {}
+
         for slot, weapon_state in weapons.items():
             if not weapon_state.can_fire():
                 continue
@@ -556,19 +987,37 @@ class WeaponsOfficer:
                     continue
 
                 # Calculate firing solution
-                solution = calculate_hit_probability(
-                    shooter_position=ship_position,
-                    shooter_velocity=ship_velocity,
-                    target_position=target.position,
-                    target_velocity=target.velocity,
-                    target_geometry=target.geometry if target.geometry else ShipGeometry(
-                        length_m=100, beam_m=20, height_m=15
-                    ),
-                    target_forward=target.forward,
-                    muzzle_velocity_kps=weapon_state.weapon.muzzle_velocity_kps,
-                    weapon_base_accuracy=0.9,
-                    target_is_evading=getattr(target, 'is_evading', False)
+                target_geometry = target.geometry if target.geometry else ShipGeometry(
+                    length_m=100, beam_m=20, height_m=15
                 )
+                target_is_evading = getattr(target, 'is_evading', False)
+                solution = None
+                if self.use_engagement_grids:
+                    geometry = geometries.get(target.ship_id)
+                    if geometry is None:
+                        geometry = calculate_engagement_geometry(
+                            ship_position, ship_velocity, target.position,
+                            target.velocity, target_geometry, target.forward,
+                        )
+                        geometries[target.ship_id] = geometry
+                    solution = solve_from_engagement_geometry(
+                        geometry,
+                        weapon_state.weapon.muzzle_velocity_kps,
+                        weapon_base_accuracy=0.9,
+                        target_is_evading=target_is_evading,
+                    )
+                if solution is None:
+                    solution = calculate_hit_probability(
+                        shooter_position=ship_position,
+                        shooter_velocity=ship_velocity,
+                        target_position=target.position,
+                        target_velocity=target.velocity,
+                        target_geometry=target_geometry,
+                        target_forward=target.forward,
+                        muzzle_velocity_kps=weapon_state.weapon.muzzle_velocity_kps,
+                        weapon_base_accuracy=0.9,
+                        target_is_evading=target_is_evading
+                    )
 
                 # Store solution
                 if target.ship_id not in self.solutions:
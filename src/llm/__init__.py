@@ -5,19 +5,38 @@ Provides LLM-controlled captains that make tactical decisions
 during space combat simulations using OpenRouter/LiteLLM.
 """
 
-from .client import CaptainClient, LLMResponse
+from .client import CaptainClient, LLMResponse, ToolCallStream, UsageStats
+from .request_pool import AsyncRequestPool, RetryPolicy, HedgePolicy
+from .response_cache import ResponseCache, CacheMode, CacheMissError
+from .mock_provider import MockLLMProvider, MockProviderConfig
+from .telemetry import LLMTelemetry, CallRecord, DecisionRecord
 from .captain import LLMCaptain, LLMCaptainConfig, CaptainPersonality
 from .communication import CommunicationChannel, CaptainMessage, MessageType
 from .victory import VictoryEvaluator, BattleOutcome
-from .battle_runner import LLMBattleRunner, BattleConfig, BattleResult
+from .battle_runner import LLMBattleRunner, BattleConfig, BattleResult, CheckpointMetrics
 from .tools import CAPTAIN_TOOLS
 from .prompts import build_captain_prompt
 from .battle_recorder import BattleRecorder, BattleRecording, BattleEvent, EventType, create_battle_filename
+from .recording_codec import load_recording
+from .trajectory_codec import TrajectoryCodec
 
 __all__ = [
     # Client
     "CaptainClient",
     "LLMResponse",
+    "ToolCallStream",
+    "UsageStats",
+    "AsyncRequestPool",
+    "RetryPolicy",
+    "HedgePolicy",
+    "ResponseCache",
+    "CacheMode",
+    "CacheMissError",
+    "MockLLMProvider",
+    "MockProviderConfig",
+    "LLMTelemetry",
+    "CallRecord",
+    "DecisionRecord",
     # Captain
     "LLMCaptain",
     "LLMCaptainConfig",
@@ -33,6 +52,7 @@ __all__ = [
     "LLMBattleRunner",
     "BattleConfig",
     "BattleResult",
+    "CheckpointMetrics",
     # Tools
     "CAPTAIN_TOOLS",
     # Prompts
@@ -43,4 +63,6 @@ __all__ = [
     "BattleEvent",
     "EventType",
     "create_battle_filename",
+    "load_recording",
+    "TrajectoryCodec",
 ]
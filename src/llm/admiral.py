@@ -15,9 +15,12 @@ from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from .fleet_config import AdmiralConfig
 from .admiral_tools import get_admiral_tools
 from .communication import CaptainMessage
+from .tactical_picture import TacticalPicture
+from .telemetry import instrumented
 
 if TYPE_CHECKING:
     from .client import CaptainClient
+    from .token_budget import BudgetReport
     from .captain import LLMCaptain
 
 
@@ -179,6 +182,14 @@ class LLMAdmiral:
         # Ship name to ID mapping (set during setup)
         self._ship_name_to_id: Dict[str, str] = {}
 
+        # Checkpoint-wide geometry and threats, shared by the battle runner
+        self.tactical_picture: Optional[TacticalPicture] = None
+
+        # Token budget for the directive prompt (None = no limit) and the
+        # accounting for the most recent one
+        self.prompt_token_budget: Optional[int] = None
+        self.last_prompt_report: Optional['BudgetReport'] = None
+
     @property
     def name(self) -> str:
         """Get Admiral's name (from config or derived from model)."""
@@ -188,10 +199,15 @@ class LLMAdmiral:
         from .fleet_config import _get_short_model_name
         return f"Admiral {_get_short_model_name(self.config.model)}"
 
+    def _telemetry_labels(self, **extra: Any) -> Dict[str, Any]:
+        """Telemetry span labels for this Admiral's decisions."""
+        return {"faction": self.faction, "model": self.config.model, **extra}
+
     def set_ship_mapping(self, name_to_id: Dict[str, str]) -> None:
         """Set the mapping from ship names to IDs."""
         self._ship_name_to_id = name_to_id
 
+    @instrumented("personality", lambda admiral, *args, **kwargs: admiral._telemetry_labels(role="admiral"))
     def select_personality(self, num_ships: int, verbose: bool = False) -> Dict[str, Any]:
         """
         Let the Admiral define their command personality before battle.
@@ -256,7 +272,8 @@ Be authentic to how you would command a fleet as {model_name}."""
         self,
         simulation: Any,
         captains: List['LLMCaptain'],
-    ) -> None:
+        store: bool = True,
+    ) -> AdmiralSnapshot:
         """
         Capture T-15s snapshot for comparison.
 
@@ -265,9 +282,22 @@ Be authentic to how you would command a fleet as {model_name}."""
         Args:
             simulation: Combat simulation instance
             captains: List of friendly captains
+            store: If False, only build the snapshot (used by speculative
+                simulation, which stores it later via set_pre_snapshot)
+
+        Returns:
+            The captured snapshot
         """
-        self._snapshot_t_minus_15 = self._build_snapshot(simulation, captains)
+        snapshot = self._build_snapshot(simulation, captains)
+        if store:
+            self._snapshot_t_minus_15 = snapshot
+        return snapshot
 
+    def set_pre_snapshot(self, snapshot: AdmiralSnapshot) -> None:
+        """Store a T-15s snapshot captured earlier with store=False."""
+        self._snapshot_t_minus_15 = snapshot
+
+    @instrumented("admiral", lambda admiral, *args, **kwargs: admiral._telemetry_labels())
     def decide(
         self,
         simulation: Any,
@@ -290,7 +320,7 @@ Be authentic to how you would command a fleet as {model_name}."""
         Returns:
             AdmiralDecision with orders for captains
         """
-        from .prompts import build_admiral_prompt, build_admiral_ship_order_prompt
+        from .prompts import build_admiral_prompt_with_report, build_admiral_ship_order_prompt
 
         # Build current snapshot
         snapshot_t0 = self._build_snapshot(simulation, captains)
@@ -313,7 +343,7 @@ Be authentic to how you would command a fleet as {model_name}."""
                     })
 
         # PHASE 1: Get fleet directive (overall strategy)
-        prompt = build_admiral_prompt(
+        prompt, self.last_prompt_report = build_admiral_prompt_with_report(
             admiral_name=self.config.name,
             faction=self.faction,
             snapshot_t_minus_15=self._snapshot_t_minus_15,
@@ -325,6 +355,7 @@ Be authentic to how you would command a fleet as {model_name}."""
             received_messages=self._received_enemy_messages,
             communications_log=self._communications_log,
             phase="directive",  # Signal that we only want the directive
+            token_budget=self.prompt_token_budget,
         )
 
         messages = [
@@ -438,6 +469,7 @@ Be authentic to how you would command a fleet as {model_name}."""
             suggested_target=None,
         )
 
+    @instrumented("discussion", lambda admiral, *args, **kwargs: admiral._telemetry_labels())
     def respond_to_captain(
         self,
         captain_ship_name: str,
@@ -455,6 +487,40 @@ Be authentic to how you would command a fleet as {model_name}."""
         Returns:
             Admiral's response text
         """
+        messages = self._build_response_messages(captain_ship_name, question)
+
+        # Get response (no tools, just text)
+        response = self.client.complete(messages)
+        return response.content
+
+    @instrumented("discussion", lambda admiral, *args, **kwargs: admiral._telemetry_labels())
+    async def respond_to_captain_async(
+        self,
+        captain_ship_name: str,
+        question: str,
+        simulation: Any,
+    ) -> str:
+        """
+        Async version of respond_to_captain().
+
+        Args:
+            captain_ship_name: Name of the captain's ship
+            question: Captain's question
+            simulation: Current simulation state
+
+        Returns:
+            Admiral's response text
+        """
+        messages = self._build_response_messages(captain_ship_name, question)
+        response = await self.client.complete_async(messages)
+        return response.content
+
+    def _build_response_messages(
+        self,
+        captain_ship_name: str,
+        question: str,
+    ) -> List[Dict[str, str]]:
+        """Build LLM messages for answering a captain's question."""
         from .prompts import build_admiral_response_prompt
 
         # Get recent decisions for context (up to last 3)
@@ -473,10 +539,7 @@ Be authentic to how you would command a fleet as {model_name}."""
             {"role": "system", "content": prompt},
             {"role": "user", "content": f"Captain of {captain_ship_name} asks: {question}"},
         ]
-
-        # Get response (no tools, just text)
-        response = self.client.complete(messages)
-        return response.content
+        return messages
 
     def receive_enemy_admiral_message(self, message: str) -> None:
         """Receive a message from enemy Admiral."""
@@ -502,6 +565,8 @@ Be authentic to how you would command a fleet as {model_name}."""
         captains: List['LLMCaptain'],
     ) -> AdmiralSnapshot:
         """Build a complete snapshot of current battle state."""
+        picture = TacticalPicture.current(self.tactical_picture, simulation)
+
         # Get friendly ships
         friendly_snapshots = []
         for captain in captains:
@@ -512,7 +577,7 @@ Be authentic to how you would command a fleet as {model_name}."""
             ship = simulation.get_ship(ship_id)
             if ship and not ship.is_destroyed:
                 friendly_snapshots.append(
-                    self._build_friendly_snapshot(ship, captain, simulation)
+                    self._build_friendly_snapshot(ship, captain, simulation, picture)
                 )
 
         # Get enemy ships
@@ -525,11 +590,11 @@ Be authentic to how you would command a fleet as {model_name}."""
             for enemy in simulation.get_enemy_ships(first_ship_id):
                 if not enemy.is_destroyed:
                     enemy_snapshots.append(
-                        self._build_enemy_snapshot(enemy, friendly_snapshots, simulation)
+                        self._build_enemy_snapshot(enemy, friendly_snapshots, picture)
                     )
 
         # Get projectiles
-        projectile_snapshots = self._build_projectile_snapshots(simulation)
+        projectile_snapshots = self._build_projectile_snapshots(picture)
 
         # Build fleet summary
         ship_types = [s.ship_type for s in friendly_snapshots]
@@ -552,6 +617,7 @@ Be authentic to how you would command a fleet as {model_name}."""
         ship: Any,
         captain: 'LLMCaptain',
         simulation: Any,
+        picture: TacticalPicture,
     ) -> FriendlyShipSnapshot:
         """Build full snapshot for a friendly ship."""
         # Get ship capabilities from fleet data
@@ -595,7 +661,7 @@ Be authentic to how you would command a fleet as {model_name}."""
         # Velocity
         vel = ship.velocity
         vel_vector = {"x": vel.x / 1000, "y": vel.y / 1000, "z": vel.z / 1000}
-        vel_kps = vel.magnitude / 1000
+        vel_kps = picture.ship_speed_kps(ship.ship_id)
 
         return FriendlyShipSnapshot(
             ship_id=ship.ship_id,
@@ -624,7 +690,7 @@ Be authentic to how you would command a fleet as {model_name}."""
         self,
         ship: Any,
         friendly_ships: List[FriendlyShipSnapshot],
-        simulation: Any,
+        picture: TacticalPicture,
     ) -> EnemyShipSnapshot:
         """Build observable snapshot for an enemy ship."""
         pos = ship.position
@@ -632,62 +698,41 @@ Be authentic to how you would command a fleet as {model_name}."""
 
         vel = ship.velocity
         vel_vector = {"x": vel.x / 1000, "y": vel.y / 1000, "z": vel.z / 1000}
-        vel_kps = vel.magnitude / 1000
 
-        # Find closest friendly and closing rate
+        # Closest friendly and closing rate (positive = closing)
         min_dist = float('inf')
         closing_rate = 0.0
-        for friendly in friendly_ships:
-            # Calculate distance
-            dx = pos_km["x"] - friendly.position_km["x"]
-            dy = pos_km["y"] - friendly.position_km["y"]
-            dz = pos_km["z"] - friendly.position_km["z"]
-            dist = (dx*dx + dy*dy + dz*dz) ** 0.5
-
-            if dist < min_dist:
-                min_dist = dist
-                # Calculate closing rate (positive = closing)
-                dvx = vel_vector["x"] - friendly.velocity_vector["x"]
-                dvy = vel_vector["y"] - friendly.velocity_vector["y"]
-                dvz = vel_vector["z"] - friendly.velocity_vector["z"]
-                # Dot product of relative velocity with direction vector
-                if dist > 0:
-                    closing_rate = -(dx*dvx + dy*dvy + dz*dvz) / dist
+        closest_id = picture.closest(ship.ship_id, [f.ship_id for f in friendly_ships])
+        if closest_id:
+            geometry = picture.pair(closest_id, ship.ship_id)
+            min_dist = geometry.distance_km
+            closing_rate = geometry.closing_rate_kps
 
         return EnemyShipSnapshot(
             ship_id=ship.ship_id,
             ship_name=ship.ship_name if hasattr(ship, 'ship_name') else ship.ship_id,
             ship_type=ship.ship_type if hasattr(ship, 'ship_type') else "unknown",
             position_km=pos_km,
-            velocity_kps=vel_kps,
+            velocity_kps=picture.ship_speed_kps(ship.ship_id),
             velocity_vector=vel_vector,
             distance_from_closest_friendly_km=min_dist,
             closing_rate_kps=closing_rate,
         )
 
-    def _build_projectile_snapshots(self, simulation: Any) -> List[ProjectileSnapshot]:
+    def _build_projectile_snapshots(self, picture: TacticalPicture) -> List[ProjectileSnapshot]:
         """Build snapshots of projectiles in flight."""
-        snapshots = []
-
-        for proj in simulation.projectiles:
-            # Calculate ETA based on distance and velocity
-            if hasattr(proj, 'target_ship_id') and proj.target_ship_id:
-                target = simulation.get_ship(proj.target_ship_id)
-                if target:
-                    dist = proj.projectile.distance_to(target.position) / 1000  # km
-                    rel_vel = proj.projectile.velocity.magnitude / 1000  # km/s
-                    eta = dist / rel_vel if rel_vel > 0 else 999
-
-                    snapshots.append(ProjectileSnapshot(
-                        source_ship=proj.source_ship_id,
-                        target_ship=proj.target_ship_id,
-                        weapon_type="Coilgun",  # Could be more specific
-                        distance_km=dist,
-                        eta_seconds=eta,
-                        damage_gj=proj.projectile.kinetic_energy_gj,
-                    ))
-
-        return snapshots
+        return [
+            ProjectileSnapshot(
+                source_ship=threat.source_ship_id,
+                target_ship=threat.target_ship_id,
+                weapon_type="Coilgun",  # Could be more specific
+                distance_km=threat.distance_km,
+                # Range over projectile speed
+                eta_seconds=threat.distance_km / threat.speed_kps if threat.speed_kps > 0 else 999,
+                damage_gj=threat.damage_gj,
+            )
+            for threat in picture.projectiles
+        ]
 
     def _build_weapons_summary(self, ship_spec: Dict[str, Any]) -> str:
         """Build a human-readable weapons summary from ship spec."""
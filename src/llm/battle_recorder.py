@@ -11,12 +11,17 @@ Captures:
 """
 
 import json
-from dataclasses import dataclass, field, asdict
+import os
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+from .recording_codec import RECORDING_EXTENSIONS, RECORDING_FORMATS, SimTraceColumns, encode_recording
+from .recording_log import RecordingLogWriter
+from .trajectory_codec import TrajectoryCodec, TrajectoryEncoder
+
 
 class EventType(str, Enum):
     """Types of battle events."""
@@ -115,10 +120,17 @@ class BattleRecording:
     # Events (checkpoints, commands, hits, etc.)
     events: List[Dict[str, Any]] = field(default_factory=list)
 
+    # LLM call and decision telemetry (see LLMTelemetry.to_dict)
+    llm_telemetry: Dict[str, Any] = field(default_factory=dict)
+
     # Simulation trace - per-step tracking of all objects
     # Each frame: {"t": float, "ships": {...}, "projectiles": [...], "torpedoes": [...]}
     sim_trace: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Settings of the trajectory encoding of sim_trace (TrajectoryCodec.to_dict),
+    # empty if frames hold full states
+    trajectory_codec: Dict[str, Any] = field(default_factory=dict)
+
     # Result
     winner: Optional[str] = None
     result_reason: str = ""
@@ -130,6 +142,12 @@ class BattleRecording:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_metadata_dict(self) -> Dict[str, Any]:
+        """Shallow dict of all fields except the sim trace (left empty)."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["sim_trace"] = []
+        return data
+
     def to_json(self, indent: int = 2) -> str:
         return json.dumps(self.to_dict(), indent=indent)
 
@@ -150,12 +168,46 @@ class BattleRecorder:
         # After battle:
         recorder.end_recording(result)
         recorder.save("battle_2024_01_10.json")
+
+    With recording_format="columnar" the sim trace is kept as typed
+    columns and saved in the compressed columnar format (see
+    recording_codec). With recording_format="stream" events and frames
+    are not kept at all: they are appended to a recording log in
+    recording_dir while the battle runs (named *.partial until save()
+    or the next start_recording() renames it), see recording_log. Read any format back with
+    load_recording().
+
+    A JSON recording's sim trace can be stored as keyframes plus
+    deviations from ballistic prediction (trajectory_codec, see
+    trajectory_codec), which load_recording() and the visualizer decode.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        recording_format: str = "json",
+        recording_dir: str = "data/recordings",
+        trajectory_codec: Optional[TrajectoryCodec] = None,
+    ):
+        """
+        Args:
+            recording_format: "json", "columnar" or "stream"
+            recording_dir: Directory of in-progress recording logs ("stream")
+            trajectory_codec: Error bounds of the sim trace encoding ("json"
+                only; None records full states)
+        """
+        if recording_format not in RECORDING_FORMATS:
+            raise ValueError(f"Unknown recording format: {recording_format}")
+        if trajectory_codec is not None and recording_format != "json":
+            raise ValueError("Trajectory encoding is only supported for json recordings")
+        self.recording_format = recording_format
+        self.recording_dir = recording_dir
+        self.trajectory_codec = trajectory_codec
+        self._trajectory_encoder: Optional[TrajectoryEncoder] = None
         self.recording = BattleRecording()
         self.events: List[BattleEvent] = []
         self._is_recording = False
+        self._trace_columns: Optional[SimTraceColumns] = None
+        self._log: Optional[RecordingLogWriter] = None
 
     def start_recording(
         self,
@@ -166,8 +218,10 @@ class BattleRecorder:
         beta_ship: Any = None,
     ) -> None:
         """Start recording a new battle."""
+        self._close_log()
         self._is_recording = True
         self.events = []
+        self._start_trace()
 
         self.recording = BattleRecording(
             recorded_at=datetime.now().isoformat(),
@@ -191,6 +245,8 @@ class BattleRecorder:
         if beta_ship:
             self.recording.beta_specs = self._extract_ship_specs(beta_ship)
 
+        self._open_log()
+
         self._record_event(BattleEvent(
             timestamp=0.0,
             event_type=EventType.BATTLE_START,
@@ -211,8 +267,10 @@ class BattleRecorder:
         beta_admiral: Any = None,
     ) -> None:
         """Start recording a fleet battle."""
+        self._close_log()
         self._is_recording = True
         self.events = []
+        self._start_trace()
 
         self.recording = BattleRecording(
             recorded_at=datetime.now().isoformat(),
@@ -274,6 +332,8 @@ class BattleRecorder:
         elif beta_fleet_data["ships"]:
             self.recording.beta_model = fleet_config.beta_fleet.ships[0].model
 
+        self._open_log()
+
         self._record_event(BattleEvent(
             timestamp=0.0,
             event_type=EventType.BATTLE_START,
@@ -288,6 +348,37 @@ class BattleRecorder:
             }
         ))
 
+    def _start_trace(self) -> None:
+        """Reset the columnar sim trace and the trajectory encoder."""
+        self._trace_columns = SimTraceColumns() if self.recording_format == "columnar" else None
+        if self.trajectory_codec is not None:
+            self._trajectory_encoder = TrajectoryEncoder(self.trajectory_codec)
+
+    def _close_log(self) -> None:
+        """
+        Finish the previous battle's recording log before a new battle.
+
+        Must run while self.recording is still the previous battle's. A log
+        that was never saved is renamed from *.partial to its final name.
+        """
+        if self._log is None:
+            return
+        log, self._log = self._log, None
+        log.close(self.recording.to_metadata_dict())
+        if log.path.suffix == ".partial":
+            path = log.path.with_suffix("")
+            os.replace(log.path, path)
+            log.path = path
+
+    def _open_log(self) -> None:
+        """Start the recording log of a new battle ("stream" format only)."""
+        if self.recording_format == "stream":
+            filename = create_battle_filename(
+                self.recording.alpha_model, self.recording.beta_model, recording_format="stream",
+            )
+            path = Path(self.recording_dir) / f"{filename}.partial"
+            self._log = RecordingLogWriter(str(path), self.recording.to_metadata_dict())
+
     def _extract_ship_specs(self, ship: Any) -> Dict[str, Any]:
         """Extract ship specifications for replay."""
         specs = {
@@ -325,7 +416,10 @@ class BattleRecorder:
     def _record_event(self, event: BattleEvent) -> None:
         """Record a single event."""
         if self._is_recording:
-            self.events.append(event)
+            if self._log is not None:
+                self._log.add_event(event.to_dict())
+            else:
+                self.events.append(event)
 
     def record_checkpoint(
         self,
@@ -929,7 +1023,20 @@ class BattleRecorder:
                 "disabled": torp.get("is_disabled", False),
             })
 
-        self.recording.sim_trace.append(frame)
+        if self._log is not None:
+            self._log.add_frame(frame)
+        elif self._trace_columns is not None:
+            self._trace_columns.add_frame(frame)
+        elif self._trajectory_encoder is not None:
+            self.recording.sim_trace.append(self._trajectory_encoder.encode_frame(frame))
+            if not self.recording.trajectory_codec:
+                self.recording.trajectory_codec = self.trajectory_codec.to_dict()
+        else:
+            self.recording.sim_trace.append(frame)
+
+    def record_llm_telemetry(self, telemetry: Dict[str, Any]) -> None:
+        """Store the battle's LLM telemetry (summary and per-call records)."""
+        self.recording.llm_telemetry = telemetry
 
     def end_recording(
         self,
@@ -954,14 +1061,28 @@ class BattleRecorder:
         self.recording.events = [e.to_dict() for e in self.events]
 
         self._is_recording = False
+        if self._log is not None:
+            self._log.close(self.recording.to_metadata_dict())
 
     def save(self, filepath: str) -> str:
-        """Save recording to JSON file."""
+        """Save recording to a JSON, columnar or log file (per recording_format)."""
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w') as f:
-            f.write(self.recording.to_json())
+        if self._log is not None:
+            # Already on disk: finish the log and give it its final name
+            self._log.close(self.recording.to_metadata_dict())
+            os.replace(self._log.path, path)
+            self._log.path = path
+        elif self.recording_format == "stream":
+            # Never started: a log with metadata only
+            metadata = self.recording.to_metadata_dict()
+            RecordingLogWriter(str(path), metadata).close(metadata)
+        elif self.recording_format == "columnar":
+            path.write_bytes(encode_recording(self.recording.to_metadata_dict(), self._trace_columns))
+        else:
+            with open(path, 'w') as f:
+                f.write(self.recording.to_json())
 
         return str(path)
 
@@ -974,6 +1095,7 @@ def create_battle_filename(
     alpha_model: str,
     beta_model: str,
     timestamp: Optional[datetime] = None,
+    recording_format: str = "json",
 ) -> str:
     """Generate a filename for a battle recording."""
     if timestamp is None:
@@ -989,4 +1111,4 @@ def create_battle_filename(
     beta_clean = clean_name(beta_model)
     date_str = timestamp.strftime("%Y%m%d_%H%M%S")
 
-    return f"battle_{alpha_clean}_vs_{beta_clean}_{date_str}.json"
+    return f"battle_{alpha_clean}_vs_{beta_clean}_{date_str}{RECORDING_EXTENSIONS[recording_format]}"
@@ -8,12 +8,14 @@ Also supports MCP-controlled fleets for external control (e.g., Claude Code).
 
 import asyncio
 import json
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from .client import CaptainClient
+from .client import CaptainClient, UsageStats
 from .captain import LLMCaptain, LLMCaptainConfig
 from .communication import CommunicationChannel, FleetCommunicationChannel, MessageType
 from .victory import VictoryEvaluator, BattleOutcome
@@ -23,6 +25,10 @@ from .fleet_config import BattleFleetConfig, FleetDefinition, ShipConfig, Admira
 from .admiral import LLMAdmiral, AdmiralOrder
 from .mcp_controller import MCPController, MCPControllerConfig, apply_mcp_commands_to_simulation
 from .mcp_chat import AdmiralChat
+from .mcp_state import DEFAULT_BATTLE_ID
+from .tactical_picture import TacticalPicture
+from .telemetry import LLMTelemetry, instrumented
+from .trajectory_codec import TrajectoryCodec
 
 
 @dataclass
@@ -57,6 +63,45 @@ class BattleConfig:
     # WARNING: Generates large files (~1MB per 10 minutes of battle)
     record_sim_trace: bool = False
 
+    # Recording file format: "json" (readable by the visualizer),
+    # "columnar" (compressed typed arrays, ~40x smaller with a sim trace) or
+    # "stream" (columnar segments appended to disk during the battle:
+    # constant memory, survives crashes). Read with load_recording().
+    recording_format: str = "json"
+
+    # Encode the sim trace of JSON recordings as keyframes plus deviations
+    # from ballistic prediction, with this position error bound in meters
+    # (~4x smaller trace, see trajectory_codec). None records full states.
+    trajectory_error_m: Optional[float] = None
+
+    # Simulation RNG seed. Fix it (together with an LLM response cache) to
+    # replay a battle deterministically; None seeds from system entropy.
+    seed: Optional[int] = None
+
+    # Speculative simulation (async fleet runner): while checkpoint decisions
+    # are in flight, a fork of the simulation keeps stepping under the
+    # previous orders. The fork is committed if the checkpoint left the
+    # simulation state untouched, otherwise it is discarded and the
+    # interval is re-simulated from the checkpoint.
+    speculative_simulation: bool = False
+
+    # Prompt token budgets (estimated tokens, None = no limit). Over budget,
+    # older history and low-priority context are compacted into summaries.
+    captain_token_budget: Optional[int] = None
+    admiral_token_budget: Optional[int] = None
+
+    # Stream captain responses and execute each tool call as soon as it is
+    # complete, while the model is still generating the rest
+    stream_tool_calls: bool = False
+
+    # Write the LLM telemetry summary (per model, per call kind and per
+    # decision kind) to this JSON file when the battle ends
+    telemetry_path: Optional[str] = None
+
+    # Battle ID of the MCP controllers, so one MCP HTTP server can host
+    # several battles at once
+    mcp_battle_id: str = DEFAULT_BATTLE_ID
+
     # Fleet configuration (for multi-ship battles with Admirals)
     # If provided, overrides alpha/beta ship types and enables fleet mode
     fleet_config_path: Optional[str] = None
@@ -90,6 +135,137 @@ class BattleResult:
     # Fleet mode flag
     is_fleet_battle: bool = False
 
+    # LLM tokens and latency per checkpoint
+    checkpoint_metrics: List['CheckpointMetrics'] = field(default_factory=list)
+
+    # LLM telemetry summary for the whole battle (see LLMTelemetry.summary)
+    llm_telemetry: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CheckpointMetrics:
+    """
+    LLM cost and latency of one checkpoint.
+
+    Attributes:
+        checkpoint: Checkpoint number.
+        sim_time: Simulation time of the checkpoint (s).
+        wall_time_s: Wall time from checkpoint start until orders were applied.
+        llm_calls: Live LLM requests (Admirals, captains and discussions).
+        cache_hits: Requests served from the response cache.
+        prompt_tokens: Provider-reported prompt tokens.
+        completion_tokens: Provider-reported completion tokens.
+        llm_latency_s: Summed request latency (exceeds wall time when concurrent).
+        streamed_calls: Live requests whose response was streamed.
+        first_tool_call_s: Summed time to the first complete tool call of
+            streamed requests.
+        estimated_prompt_tokens: Locally estimated decision prompt tokens by role.
+        compacted_prompts: Decision prompts compacted to fit their token budget.
+    """
+    checkpoint: int
+    sim_time: float
+    wall_time_s: float = 0.0
+    llm_calls: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_latency_s: float = 0.0
+    streamed_calls: int = 0
+    first_tool_call_s: float = 0.0
+    estimated_prompt_tokens: Dict[str, int] = field(default_factory=dict)
+    compacted_prompts: int = 0
+
+
+@dataclass
+class CaptainDecision:
+    """
+    One captain's checkpoint decision, buffered for ordered replay.
+
+    Attributes:
+        ship_id: Captain's ship.
+        commands: Tactical commands to inject.
+        log_lines: Verbose console output produced while deciding.
+        discussions: Captain-Admiral discussion records (recorder kwargs).
+    """
+    ship_id: str
+    commands: List[Any]
+    log_lines: List[str] = field(default_factory=list)
+    discussions: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class SpeculativeRun:
+    """
+    A fork of the simulation advanced under the previous orders.
+
+    Attributes:
+        simulation: The forked simulation (stepped on a worker thread).
+        base_digest: State digest of the real simulation at the fork.
+        steps_run: Steps the fork has completed.
+        frames: Buffered sim-trace frames (recorder kwargs).
+        pre_snapshots: Admiral T-15s snapshots taken on the fork, by faction.
+        cancelled: Set to stop the fork at the next step.
+    """
+    simulation: Any
+    base_digest: str
+    steps_run: int = 0
+    frames: List[Dict[str, Any]] = field(default_factory=list)
+    pre_snapshots: Dict[str, Any] = field(default_factory=dict)
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+
+def _is_tactical_command(cmd: Any) -> bool:
+    """True for maneuvers/fire orders, False for discussion bookkeeping dicts."""
+    # Dict commands - check if not a discussion/response type
+    if isinstance(cmd, dict):
+        cmd_type = cmd.get('type', '')
+        return cmd_type not in ('discuss_with_admiral', 'discussion_limit_reached', 'respond_to_orders')
+    # Maneuver objects and other dataclasses are tactical commands
+    return True
+
+
+def _captain_turn_labels(runner: Any, ship_id: str, captain: Any, faction: str) -> Dict[str, Any]:
+    """Telemetry span labels for a captain's turn (decision plus discussion)."""
+    config = getattr(captain, "config", None)
+    return {"ship_id": ship_id, "faction": faction, "model": getattr(config, "model", None)}
+
+
+def _find_discussion_request(commands: List[Any]) -> Optional[Dict[str, Any]]:
+    """First discuss_with_admiral request (only one is processed per checkpoint)."""
+    for cmd in commands:
+        if isinstance(cmd, dict) and cmd.get('type') == 'discuss_with_admiral':
+            return cmd
+    return None
+
+
+def _strip_discussion_markers(commands: List[Any]) -> List[Any]:
+    return [
+        c for c in commands
+        if not (isinstance(c, dict) and c.get('type') in ('discuss_with_admiral', 'discussion_limit_reached'))
+    ]
+
+
+def _clarification_order(ship_id: str, captain: Any, response: str) -> AdmiralOrder:
+    """Admiral's discussion answer, injected into the captain's orders."""
+    return AdmiralOrder(
+        target_ship_id=ship_id,
+        target_ship_name=captain.ship_name,
+        order_text=f"[CLARIFICATION] {response}",
+        priority="NORMAL",
+        suggested_target=None,
+    )
+
+
+def _force_tactical_order(ship_id: str, captain: Any) -> AdmiralOrder:
+    """Forceful reminder for captains that answered with words only."""
+    return AdmiralOrder(
+        target_ship_id=ship_id,
+        target_ship_name=captain.ship_name,
+        order_text="[CRITICAL] You MUST call set_maneuver, set_primary_target, and set_weapons_order NOW. Responding with words only will cause your ship to DRIFT and DIE. CALL THE TOOLS!",
+        priority="CRITICAL",
+        suggested_target=None,
+    )
+
 
 class LLMBattleRunner:
     """
@@ -152,6 +328,20 @@ class LLMBattleRunner:
         # Pre-checkpoint snapshot time offset for Admirals (seconds before checkpoint)
         self.admiral_pre_snapshot_offset = 15.0
 
+        # Speculative simulation outcomes (see BattleConfig.speculative_simulation)
+        self.speculative_commits = 0
+        self.speculative_rollbacks = 0
+
+        # Per-checkpoint LLM metrics; the open checkpoint's start state
+        self.checkpoint_metrics: List[CheckpointMetrics] = []
+        self._metrics_start: Optional[tuple] = None
+
+        # Per-call and per-decision LLM telemetry for this battle, recorded
+        # by the client and by instrumented captain/Admiral methods
+        self.telemetry = LLMTelemetry()
+        if client is not None:
+            client.telemetry = self.telemetry
+
     def setup_battle(self, fleet_data: Dict[str, Any]) -> None:
         """
         Initialize simulation and captains.
@@ -166,6 +356,7 @@ class LLMBattleRunner:
         self.simulation = CombatSimulation(
             time_step=1.0,
             decision_interval=self.config.decision_interval_s,
+            seed=self.config.seed,
         )
 
         # Calculate positions
@@ -204,6 +395,12 @@ class LLMBattleRunner:
         self.beta_config.ship_type = self.config.beta_ship_type
         self.alpha_config.fleet_data = fleet_data
         self.beta_config.fleet_data = fleet_data
+        if self.config.captain_token_budget is not None:
+            self.alpha_config.prompt_token_budget = self.config.captain_token_budget
+            self.beta_config.prompt_token_budget = self.config.captain_token_budget
+        if self.config.stream_tool_calls:
+            self.alpha_config.stream_tool_calls = True
+            self.beta_config.stream_tool_calls = True
 
         # Create captains
         self.alpha_captain = LLMCaptain(self.alpha_config, self.client)
@@ -222,7 +419,11 @@ class LLMBattleRunner:
 
         # Initialize battle recorder
         if self.config.record_battle:
-            self.recorder = BattleRecorder()
+            self.recorder = BattleRecorder(
+                self.config.recording_format,
+                self.config.recording_dir,
+                trajectory_codec=self._trajectory_codec(),
+            )
             self.recorder.start_recording(
                 battle_config=self.config,
                 alpha_config=self.alpha_config,
@@ -282,6 +483,7 @@ class LLMBattleRunner:
         self.simulation = CombatSimulation(
             time_step=1.0,
             decision_interval=self.fleet_config.decision_interval_s,
+            seed=self.config.seed,
         )
 
         # Calculate base positions
@@ -336,6 +538,8 @@ class LLMBattleRunner:
                 ship_type=ship_config.ship_type,
                 fleet_data=fleet_data,
                 temperature=ship_config.temperature,
+                prompt_token_budget=self.config.captain_token_budget,
+                stream_tool_calls=self.config.stream_tool_calls,
             )
             captain = LLMCaptain(captain_config, self.client)
             captain.ship_id = ship_config.ship_id
@@ -393,6 +597,8 @@ class LLMBattleRunner:
                 ship_type=ship_config.ship_type,
                 fleet_data=fleet_data,
                 temperature=ship_config.temperature,
+                prompt_token_budget=self.config.captain_token_budget,
+                stream_tool_calls=self.config.stream_tool_calls,
             )
             captain = LLMCaptain(captain_config, self.client)
             captain.ship_id = ship_config.ship_id
@@ -415,6 +621,7 @@ class LLMBattleRunner:
                 faction="alpha",
                 name=self.fleet_config.alpha_fleet.mcp.name,
                 command_timeout=self.fleet_config.alpha_fleet.mcp.command_timeout,
+                battle_id=self.config.mcp_battle_id,
             )
             self.alpha_mcp = MCPController(
                 config=mcp_config,
@@ -429,12 +636,14 @@ class LLMBattleRunner:
                 client=self.client,
                 fleet_data=fleet_data,
             )
+            self.alpha_admiral.prompt_token_budget = self.config.admiral_token_budget
 
         if self.fleet_config.beta_fleet.mcp and self.fleet_config.beta_fleet.mcp.enabled:
             mcp_config = MCPControllerConfig(
                 faction="beta",
                 name=self.fleet_config.beta_fleet.mcp.name,
                 command_timeout=self.fleet_config.beta_fleet.mcp.command_timeout,
+                battle_id=self.config.mcp_battle_id,
             )
             self.beta_mcp = MCPController(
                 config=mcp_config,
@@ -449,6 +658,7 @@ class LLMBattleRunner:
                 client=self.client,
                 fleet_data=fleet_data,
             )
+            self.beta_admiral.prompt_token_budget = self.config.admiral_token_budget
 
         # Create fleet communication channel and register ships
         self.fleet_communication = FleetCommunicationChannel()
@@ -498,7 +708,11 @@ class LLMBattleRunner:
 
         # Initialize fleet battle recorder
         if self.config.record_battle:
-            self.recorder = BattleRecorder()
+            self.recorder = BattleRecorder(
+                self.config.recording_format,
+                self.config.recording_dir,
+                trajectory_codec=self._trajectory_codec(),
+            )
             self.recorder.start_fleet_recording(
                 fleet_config=self.fleet_config,
                 battle_config=self.config,
@@ -605,6 +819,8 @@ class LLMBattleRunner:
 
             # === CHECKPOINT ===
             self.checkpoint_count += 1
+            self._begin_checkpoint_metrics()
+            self._share_tactical_picture()
 
             if self.config.verbose:
                 print(f"\n=== CHECKPOINT {self.checkpoint_count} at T+{self.simulation.current_time:.0f}s ===")
@@ -778,6 +994,7 @@ class LLMBattleRunner:
 
             # Log decision
             self._log_decision(alpha_commands, beta_commands)
+            self._end_checkpoint_metrics()
 
             # Phase 6: Check checkpoint limit (skip in unlimited mode)
             if not self.config.unlimited_mode:
@@ -885,6 +1102,8 @@ class LLMBattleRunner:
 
             # === CHECKPOINT ===
             self.checkpoint_count += 1
+            self._begin_checkpoint_metrics()
+            self._share_tactical_picture()
             next_checkpoint_time = self.simulation.current_time + decision_interval
 
             if self.config.verbose:
@@ -1016,48 +1235,12 @@ class LLMBattleRunner:
             if self.config.verbose:
                 print("\n--- CAPTAIN DECISIONS ---")
 
-            # Process all captains
-            all_captains = [
-                (ship_id, captain, "alpha")
-                for ship_id, captain in self.alpha_captains.items()
-            ] + [
-                (ship_id, captain, "beta")
-                for ship_id, captain in self.beta_captains.items()
-            ]
-
-            for ship_id, captain, faction in all_captains:
-                # Skip destroyed or surrendered ships
-                ship = self.simulation.get_ship(ship_id)
-                if not ship or ship.is_destroyed or getattr(ship, 'is_surrendered', False):
-                    continue
-
-                # Clear previous Admiral context and deliver new orders
-                captain.clear_admiral_context()
-                if ship_id in admiral_orders:
-                    orders = admiral_orders[ship_id]
-                    # Also include fleet directive if Admiral exists
-                    admiral = self.alpha_admiral if faction == "alpha" else self.beta_admiral
-                    if admiral and hasattr(admiral, 'last_directive'):
-                        directive = admiral.last_directive
-                    else:
-                        directive = None
-                    captain.receive_admiral_orders(orders, directive)
-
-                if self.config.verbose:
-                    print(f"  [{captain.ship_name}] {captain.name} deciding...")
-
-                # Get decision (may include discuss_with_admiral request)
-                commands = self._get_captain_decision_with_discussion(
-                    ship_id, captain, faction
-                )
-                all_commands[ship_id] = commands
-
-                if self.config.verbose:
-                    print(f"    -> {self._get_ship_status_line(ship_id, commands)}")
-
-                # Record captain decision
-                if self.recorder:
-                    self._record_captain_decision(ship_id, captain, commands)
+            # Fan out all captains at once; apply in fleet order afterwards
+            jobs = self._prepare_captain_jobs(admiral_orders)
+            decisions = asyncio.run(
+                self._decide_captains_concurrently(jobs, close_client=True)
+            )
+            self._apply_captain_decisions(jobs, decisions, all_commands)
 
             # Phase 4: Handle immediate messaging (captain to captain)
             # Process any pending broadcast or enemy messages
@@ -1081,6 +1264,7 @@ class LLMBattleRunner:
 
             # Log decision
             self._log_fleet_decision(all_commands)
+            self._end_checkpoint_metrics()
 
             # Phase 7: Check limits
             if not self.config.unlimited_mode:
@@ -1178,9 +1362,13 @@ class LLMBattleRunner:
         if self.mcp_chat:
             self.mcp_chat.new_turn()
 
+        speculation = None  # (SpeculativeRun, worker task) while decisions are in flight
+        steps_done = 0      # Steps of the next interval already run by a committed fork
+
         while not self._is_fleet_battle_over():
             # === SIMULATION PHASE ===
-            steps = int(decision_interval)
+            steps = int(decision_interval) - steps_done
+            steps_done = 0
             for step_i in range(steps):
                 current_time = self.simulation.current_time
 
@@ -1202,12 +1390,18 @@ class LLMBattleRunner:
 
             # === CHECKPOINT ===
             self.checkpoint_count += 1
+            self._begin_checkpoint_metrics()
+            self._share_tactical_picture()
             next_checkpoint_time = self.simulation.current_time + decision_interval
 
             if self.config.verbose:
                 print(f"\n=== CHECKPOINT {self.checkpoint_count} at T+{self.simulation.current_time:.0f}s ===")
                 self._print_fleet_status()
 
+            # Keep simulating under the previous orders while decisions are in flight
+            if self._should_speculate():
+                speculation = self._start_speculation(int(decision_interval), next_checkpoint_time)
+
             # Advance chat turn
             if self.mcp_chat:
                 self.mcp_chat.new_turn()
@@ -1236,7 +1430,8 @@ class LLMBattleRunner:
                     mcp_commands, self.simulation, "alpha"
                 )
 
-                if self.config.verbose and results.get("applied"):
+                if self.config.verbose:
+                    print(f"  Applied batch in {results['apply_ms']:.2f} ms ({results['superseded']} superseded)")
                     for cmd_result in results["applied"]:
                         print(f"    Applied: {cmd_result}")
 
@@ -1291,7 +1486,8 @@ class LLMBattleRunner:
                     mcp_commands, self.simulation, "beta"
                 )
 
-                if self.config.verbose and results.get("applied"):
+                if self.config.verbose:
+                    print(f"  Applied batch in {results['apply_ms']:.2f} ms ({results['superseded']} superseded)")
                     for cmd_result in results["applied"]:
                         print(f"    Applied: {cmd_result}")
 
@@ -1360,45 +1556,14 @@ class LLMBattleRunner:
             if self.config.verbose and (not self.alpha_mcp or not self.beta_mcp):
                 print("\n--- CAPTAIN DECISIONS ---")
 
-            all_captains = [
-                (ship_id, captain, "alpha")
-                for ship_id, captain in self.alpha_captains.items()
-            ] + [
-                (ship_id, captain, "beta")
-                for ship_id, captain in self.beta_captains.items()
-            ]
-
-            for ship_id, captain, faction in all_captains:
-                # Skip if this fleet is MCP-controlled
-                if (faction == "alpha" and self.alpha_mcp) or (faction == "beta" and self.beta_mcp):
-                    continue
-
-                # Skip destroyed or surrendered ships
-                ship = self.simulation.get_ship(ship_id)
-                if not ship or ship.is_destroyed or getattr(ship, 'is_surrendered', False):
-                    continue
-
-                # Clear previous Admiral context and deliver new orders
-                captain.clear_admiral_context()
-                if ship_id in admiral_orders:
-                    orders = admiral_orders[ship_id]
-                    admiral = self.alpha_admiral if faction == "alpha" else self.beta_admiral
-                    if admiral and hasattr(admiral, 'last_directive'):
-                        directive = admiral.last_directive
-                    else:
-                        directive = None
-                    captain.receive_admiral_orders(orders, directive)
-
-                if self.config.verbose:
-                    print(f"  [{captain.ship_name}] {captain.name} deciding...")
-
-                commands = self._get_captain_decision_with_discussion(
-                    ship_id, captain, faction
-                )
-                all_commands[ship_id] = commands
-
-                if self.config.verbose:
-                    print(f"    -> {self._get_ship_status_line(ship_id, commands)}")
+            # Skip MCP-controlled fleets; fan out the rest concurrently
+            skip_factions = tuple(
+                faction for faction, mcp in (("alpha", self.alpha_mcp), ("beta", self.beta_mcp))
+                if mcp
+            )
+            jobs = self._prepare_captain_jobs(admiral_orders, skip_factions)
+            decisions = await self._decide_captains_concurrently(jobs)
+            self._apply_captain_decisions(jobs, decisions, all_commands, record_decisions=False)
 
             # Handle immediate messaging
             self._handle_immediate_messaging()
@@ -1451,6 +1616,7 @@ class LLMBattleRunner:
 
             # Log decision
             self._log_fleet_decision(all_commands)
+            self._end_checkpoint_metrics()
 
             # Check limits
             if not self.config.unlimited_mode:
@@ -1460,20 +1626,136 @@ class LLMBattleRunner:
                         print(f"\n=== CHECKPOINT LIMIT REACHED ===")
                     break
 
+            # Commit the speculative interval, or fall back to re-simulating it
+            if speculation:
+                steps_done = await self._resolve_speculation(*speculation)
+                speculation = None
+
+        # The battle ended at a checkpoint; the fork is no longer needed
+        if speculation:
+            speculation[0].cancelled.set()
+            await speculation[1]
+
+        await self.client.aclose()
         return self._evaluate_fleet_result()
 
-    def _capture_admiral_pre_snapshots(self) -> None:
-        """Capture pre-checkpoint snapshots for Admirals at T-15s."""
+    def _should_speculate(self) -> bool:
+        """Whether this checkpoint's interval is worth simulating speculatively."""
+        if not self.config.speculative_simulation:
+            return False
+        if self.config.unlimited_mode:
+            return True
+        max_checkpoints = self.fleet_config.max_checkpoints if self.fleet_config and hasattr(self.fleet_config, 'max_checkpoints') else self.config.max_checkpoints
+        return self.checkpoint_count < max_checkpoints
+
+    def _start_speculation(self, steps: int, next_checkpoint_time: float) -> tuple:
+        """
+        Fork the simulation and step the fork on a worker thread.
+
+        Args:
+            steps: Steps in the coming interval.
+            next_checkpoint_time: Time of the checkpoint after this one.
+
+        Returns:
+            (SpeculativeRun, asyncio task running the fork).
+        """
+        fork, digest = self.simulation.fork()
+        spec = SpeculativeRun(simulation=fork, base_digest=digest)
+        task = asyncio.ensure_future(
+            asyncio.to_thread(self._run_speculation, spec, steps, next_checkpoint_time)
+        )
+        return spec, task
+
+    def _run_speculation(self, spec: SpeculativeRun, steps: int, next_checkpoint_time: float) -> None:
+        """Step a fork exactly as the simulation phase would (worker thread)."""
+        sim = spec.simulation
+        for _ in range(steps):
+            if spec.cancelled.is_set():
+                return
+
+            if sim.current_time == next_checkpoint_time - self.admiral_pre_snapshot_offset:
+                spec.pre_snapshots = self._capture_admiral_pre_snapshots(sim, store=False)
+
+            sim.step()
+            spec.steps_run += 1
+
+            if self.recorder and self.config.record_sim_trace:
+                spec.frames.append(self._build_sim_frame(sim))
+
+            if self._is_fleet_battle_over(sim):
+                return
+
+    async def _resolve_speculation(self, spec: SpeculativeRun, task: Any) -> int:
+        """
+        Commit a speculative interval if the checkpoint changed nothing.
+
+        Commands usually alter ship state, in which case the fork no longer
+        matches what the simulation would do and is discarded.
+
+        Returns:
+            Number of steps committed (0 after a rollback).
+        """
+        if self.simulation.state_digest() != spec.base_digest:
+            spec.cancelled.set()
+            await task
+            self.speculative_rollbacks += 1
+            if self.config.verbose:
+                print("  [SPECULATION] Orders changed the battle state; re-simulating interval")
+            return 0
+
+        await task
+        self._commit_speculation(spec)
+        self.speculative_commits += 1
+        if self.config.verbose:
+            print(f"  [SPECULATION] Committed {spec.steps_run} pre-simulated steps")
+        return spec.steps_run
+
+    def _commit_speculation(self, spec: SpeculativeRun) -> None:
+        """Make a speculative fork the live simulation."""
+        fork = spec.simulation
+        fork.adopt_observers(self.simulation)
+        self.simulation = fork
+        self.alpha_ships = {ship_id: fork.ships[ship_id] for ship_id in self.alpha_ships}
+        self.beta_ships = {ship_id: fork.ships[ship_id] for ship_id in self.beta_ships}
+
+        admirals = {"alpha": self.alpha_admiral, "beta": self.beta_admiral}
+        for faction, snapshot in spec.pre_snapshots.items():
+            admirals[faction].set_pre_snapshot(snapshot)
+
+        if self.recorder:
+            for frame in spec.frames:
+                self.recorder.record_sim_frame(**frame)
+
+    def _capture_admiral_pre_snapshots(
+        self,
+        simulation: Any = None,
+        store: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Capture pre-checkpoint snapshots for Admirals at T-15s.
+
+        Args:
+            simulation: Simulation to snapshot (defaults to the live one).
+            store: Store the snapshots on the Admirals (False for forks).
+
+        Returns:
+            Snapshots by faction.
+        """
+        simulation = simulation or self.simulation
+        snapshots = {}
         if self.alpha_admiral:
-            self.alpha_admiral.capture_pre_snapshot(
-                self.simulation,
-                list(self.alpha_captains.values())
+            snapshots["alpha"] = self.alpha_admiral.capture_pre_snapshot(
+                simulation,
+                list(self.alpha_captains.values()),
+                store=store,
             )
         if self.beta_admiral:
-            self.beta_admiral.capture_pre_snapshot(
-                self.simulation,
-                list(self.beta_captains.values())
+            snapshots["beta"] = self.beta_admiral.capture_pre_snapshot(
+                simulation,
+                list(self.beta_captains.values()),
+                store=store,
             )
+        return snapshots
 
     def _get_admiral_decision(
         self,
@@ -1496,6 +1778,7 @@ class LLMBattleRunner:
                 return ship_id
         return None
 
+    @instrumented("captain_turn", _captain_turn_labels)
     def _get_captain_decision_with_discussion(
         self,
         ship_id: str,
@@ -1512,123 +1795,245 @@ class LLMBattleRunner:
 
         # Get initial decision
         commands = captain.decide(ship_id, self.simulation)
+        initial_tactical_commands = [c for c in commands if _is_tactical_command(c)]
 
-        # Separate tactical commands from discussion requests
-        # Tactical commands are things like maneuvers, fire commands, etc.
-        from ..simulation import Maneuver
+        # Check if captain requested Admiral discussion
+        request = _find_discussion_request(commands) if admiral else None
+        if request:
+            question = request.get('question', '')
+            decision = CaptainDecision(ship_id=ship_id, commands=[])
+            self._log_discussion_question(decision, captain, question)
+
+            # Get Admiral's response
+            response = admiral.respond_to_captain(
+                captain_ship_name=captain.ship_name,
+                question=question,
+                simulation=self.simulation,
+            )
+            self._log_discussion_response(
+                decision, ship_id, captain, admiral, question, response,
+                request.get('exchange_number', 1),
+            )
+            self._replay_discussion_output(decision)
+
+            # After discussion, captain should make a new decision with the Admiral's response
+            captain.admiral_orders.append(_clarification_order(ship_id, captain, response))
+            new_commands = captain.decide(ship_id, self.simulation)
+            new_tactical_commands = [c for c in new_commands if _is_tactical_command(c)]
+
+            # Use new tactical commands if any, otherwise fall back to initial tactical commands
+            if new_tactical_commands:
+                commands = new_tactical_commands
+            elif initial_tactical_commands:
+                # Captain only acknowledged but didn't issue new commands
+                commands = initial_tactical_commands
+            else:
+                # No commands at all - force captain to decide again with explicit reminder
+                if self.config.verbose:
+                    print(f"    [RETRY] {captain.name} must issue tactical commands...")
+                captain.admiral_orders.append(_force_tactical_order(ship_id, captain))
 
-        def is_tactical_command(cmd):
-            # Maneuver objects are tactical commands
-            if isinstance(cmd, Maneuver):
-                return True
-            # Dict commands - check if not a discussion/response type
-            if isinstance(cmd, dict):
-                cmd_type = cmd.get('type', '')
-                return cmd_type not in ('discuss_with_admiral', 'discussion_limit_reached', 'respond_to_orders')
-            # Other object types (e.g., dataclasses) are tactical commands
-            return True
+                retry_commands = captain.decide(ship_id, self.simulation)
+                commands = [c for c in retry_commands if _is_tactical_command(c)]
+                if not commands and self.config.verbose:
+                    # Still nothing - warn and continue with empty commands (will drift)
+                    print(f"    [WARNING] {captain.name} still issued no tactical commands after retry")
 
-        initial_tactical_commands = [c for c in commands if is_tactical_command(c)]
+        return _strip_discussion_markers(commands)
 
-        # Check if captain requested Admiral discussion
-        for cmd in commands:
-            if isinstance(cmd, dict) and cmd.get('type') == 'discuss_with_admiral':
-                if not admiral:
-                    continue
+    @instrumented("captain_turn", _captain_turn_labels)
+    async def _get_captain_decision_with_discussion_async(
+        self,
+        ship_id: str,
+        captain: LLMCaptain,
+        faction: str,
+    ) -> 'CaptainDecision':
+        """
+        Async version of _get_captain_decision_with_discussion().
 
-                question = cmd.get('question', '')
-                exchange = cmd.get('exchange_number', 1)
+        Console output and discussion records are buffered on the returned
+        CaptainDecision so concurrent captains can be replayed in fleet order.
+        """
+        admiral = self.alpha_admiral if faction == "alpha" else self.beta_admiral
+        decision = CaptainDecision(ship_id=ship_id, commands=[])
 
-                if self.config.verbose:
-                    print(f"    [DISCUSS] {captain.name} asks Admiral:")
-                    # Print full question with indentation
-                    for line in question.split('\n'):
-                        print(f"      {line}")
-
-                # Get Admiral's response
-                response = admiral.respond_to_captain(
-                    captain_ship_name=captain.ship_name,
-                    question=question,
-                    simulation=self.simulation,
-                )
+        commands = await captain.decide_async(ship_id, self.simulation)
+        initial_tactical_commands = [c for c in commands if _is_tactical_command(c)]
 
-                if self.config.verbose:
-                    print(f"    [ADMIRAL] {admiral.name} responds:")
-                    # Print full response with indentation
-                    for line in response.split('\n'):
-                        print(f"      {line}")
+        request = _find_discussion_request(commands) if admiral else None
+        if request:
+            question = request.get('question', '')
+            self._log_discussion_question(decision, captain, question)
 
-                # Record the discussion
-                if self.recorder:
-                    self.recorder.record_captain_admiral_discussion(
-                        timestamp=self.simulation.current_time,
-                        ship_id=ship_id,
-                        captain_name=captain.name,
-                        admiral_name=admiral.name,
-                        captain_question=question,
-                        admiral_response=response,
-                        exchange_number=exchange,
+            response = await admiral.respond_to_captain_async(
+                captain_ship_name=captain.ship_name,
+                question=question,
+                simulation=self.simulation,
+            )
+            self._log_discussion_response(
+                decision, ship_id, captain, admiral, question, response,
+                request.get('exchange_number', 1),
+            )
+
+            captain.admiral_orders.append(_clarification_order(ship_id, captain, response))
+            new_commands = await captain.decide_async(ship_id, self.simulation)
+            new_tactical_commands = [c for c in new_commands if _is_tactical_command(c)]
+
+            if new_tactical_commands:
+                commands = new_tactical_commands
+            elif initial_tactical_commands:
+                commands = initial_tactical_commands
+            else:
+                if self.config.verbose:
+                    decision.log_lines.append(f"    [RETRY] {captain.name} must issue tactical commands...")
+                captain.admiral_orders.append(_force_tactical_order(ship_id, captain))
+
+                retry_commands = await captain.decide_async(ship_id, self.simulation)
+                commands = [c for c in retry_commands if _is_tactical_command(c)]
+                if not commands and self.config.verbose:
+                    decision.log_lines.append(
+                        f"    [WARNING] {captain.name} still issued no tactical commands after retry"
                     )
 
-                # After discussion, captain should make a new decision with the Admiral's response
-                # Inject the response into captain's context
-                from .admiral import AdmiralOrder
-                clarification_order = AdmiralOrder(
-                    target_ship_id=ship_id,
-                    target_ship_name=captain.ship_name,
-                    order_text=f"[CLARIFICATION] {response}",
-                    priority="NORMAL",
-                    suggested_target=None,
-                )
-                captain.admiral_orders.append(clarification_order)
+        decision.commands = _strip_discussion_markers(commands)
+        return decision
 
-                # Get a new decision from the captain with the clarification
-                new_commands = captain.decide(ship_id, self.simulation)
+    def _log_discussion_question(
+        self,
+        decision: 'CaptainDecision',
+        captain: LLMCaptain,
+        question: str,
+    ) -> None:
+        if self.config.verbose:
+            decision.log_lines.append(f"    [DISCUSS] {captain.name} asks Admiral:")
+            decision.log_lines.extend(f"      {line}" for line in question.split('\n'))
+
+    def _log_discussion_response(
+        self,
+        decision: 'CaptainDecision',
+        ship_id: str,
+        captain: LLMCaptain,
+        admiral: LLMAdmiral,
+        question: str,
+        response: str,
+        exchange: int,
+    ) -> None:
+        if self.config.verbose:
+            decision.log_lines.append(f"    [ADMIRAL] {admiral.name} responds:")
+            decision.log_lines.extend(f"      {line}" for line in response.split('\n'))
+        decision.discussions.append(dict(
+            timestamp=self.simulation.current_time,
+            ship_id=ship_id,
+            captain_name=captain.name,
+            admiral_name=admiral.name,
+            captain_question=question,
+            admiral_response=response,
+            exchange_number=exchange,
+        ))
+
+    def _replay_discussion_output(self, decision: 'CaptainDecision') -> None:
+        """Print buffered output and record discussions for one captain."""
+        for line in decision.log_lines:
+            print(line)
+        if self.recorder:
+            for discussion in decision.discussions:
+                self.recorder.record_captain_admiral_discussion(**discussion)
 
-                # Filter out discussion requests from new commands
-                new_tactical_commands = [c for c in new_commands if is_tactical_command(c)]
+    def _prepare_captain_jobs(
+        self,
+        admiral_orders: Dict[str, List[AdmiralOrder]],
+        skip_factions: tuple = (),
+    ) -> List[tuple]:
+        """
+        Deliver Admiral orders and list the captains that decide this checkpoint.
 
-                # Use new tactical commands if any, otherwise fall back to initial tactical commands
-                if new_tactical_commands:
-                    commands = new_tactical_commands
-                elif initial_tactical_commands:
-                    # Captain only acknowledged but didn't issue new commands
-                    # Use their initial tactical commands
-                    commands = initial_tactical_commands
+        Returns:
+            (ship_id, captain, faction) tuples in fleet order (alpha, then beta).
+        """
+        all_captains = [
+            (ship_id, captain, "alpha")
+            for ship_id, captain in self.alpha_captains.items()
+        ] + [
+            (ship_id, captain, "beta")
+            for ship_id, captain in self.beta_captains.items()
+        ]
+
+        jobs = []
+        for ship_id, captain, faction in all_captains:
+            if faction in skip_factions:
+                continue
+
+            # Skip destroyed or surrendered ships
+            ship = self.simulation.get_ship(ship_id)
+            if not ship or ship.is_destroyed or getattr(ship, 'is_surrendered', False):
+                continue
+
+            # Clear previous Admiral context and deliver new orders
+            captain.clear_admiral_context()
+            if ship_id in admiral_orders:
+                orders = admiral_orders[ship_id]
+                # Also include fleet directive if Admiral exists
+                admiral = self.alpha_admiral if faction == "alpha" else self.beta_admiral
+                if admiral and hasattr(admiral, 'last_directive'):
+                    directive = admiral.last_directive
                 else:
-                    # No commands at all - force captain to decide again with explicit reminder
-                    if self.config.verbose:
-                        print(f"    [RETRY] {captain.name} must issue tactical commands...")
-
-                    # Add a forceful reminder to the captain's orders
-                    from .admiral import AdmiralOrder
-                    force_order = AdmiralOrder(
-                        target_ship_id=ship_id,
-                        target_ship_name=captain.ship_name,
-                        order_text="[CRITICAL] You MUST call set_maneuver, set_primary_target, and set_weapons_order NOW. Responding with words only will cause your ship to DRIFT and DIE. CALL THE TOOLS!",
-                        priority="CRITICAL",
-                        suggested_target=None,
-                    )
-                    captain.admiral_orders.append(force_order)
+                    directive = None
+                captain.receive_admiral_orders(orders, directive)
 
-                    # Try one more time
-                    retry_commands = captain.decide(ship_id, self.simulation)
-                    retry_tactical = [c for c in retry_commands if is_tactical_command(c)]
+            if self.config.verbose:
+                print(f"  [{captain.ship_name}] {captain.name} deciding...")
 
-                    if retry_tactical:
-                        commands = retry_tactical
-                    else:
-                        # Still nothing - warn and continue with empty commands (will drift)
-                        if self.config.verbose:
-                            print(f"    [WARNING] {captain.name} still issued no tactical commands after retry")
-                        commands = []
+            jobs.append((ship_id, captain, faction))
+        return jobs
 
-                break  # Only process one discussion per checkpoint
+    async def _decide_captains_concurrently(
+        self,
+        jobs: List[tuple],
+        close_client: bool = False,
+    ) -> List['CaptainDecision']:
+        """
+        Run all captain decisions (and Admiral discussions) concurrently.
 
-        # Filter out any remaining discussion dicts
-        commands = [c for c in commands if not (isinstance(c, dict) and c.get('type') in ('discuss_with_admiral', 'discussion_limit_reached'))]
+        The simulation is not stepped while decisions are in flight, and
+        results come back in job order, so command application stays
+        deterministic regardless of which LLM call finishes first.
+        Concurrency per provider is bounded by the client.
 
-        return commands
+        Args:
+            jobs: (ship_id, captain, faction) tuples from _prepare_captain_jobs().
+            close_client: Close the async HTTP client afterwards (for callers
+                that run each checkpoint in a fresh event loop).
+
+        Returns:
+            CaptainDecision per job, in job order.
+        """
+        try:
+            return list(await asyncio.gather(*(
+                self._get_captain_decision_with_discussion_async(ship_id, captain, faction)
+                for ship_id, captain, faction in jobs
+            )))
+        finally:
+            if close_client:
+                await self.client.aclose()
+
+    def _apply_captain_decisions(
+        self,
+        jobs: List[tuple],
+        decisions: List['CaptainDecision'],
+        all_commands: Dict[str, List[Any]],
+        record_decisions: bool = True,
+    ) -> None:
+        """Replay buffered captain output and collect commands in fleet order."""
+        for (ship_id, captain, _faction), decision in zip(jobs, decisions):
+            self._replay_discussion_output(decision)
+            all_commands[ship_id] = decision.commands
+
+            if self.config.verbose:
+                print(f"    [{captain.ship_name}] -> {self._get_ship_status_line(ship_id, decision.commands)}")
+
+            # Record captain decision
+            if record_decisions and self.recorder:
+                self._record_captain_decision(ship_id, captain, decision.commands)
 
     def _handle_immediate_messaging(self) -> None:
         """Handle immediate captain-to-captain messaging within checkpoint."""
@@ -1874,6 +2279,86 @@ class LLMBattleRunner:
             acknowledgment=acknowledgment,
         )
 
+    def _client_usage(self) -> UsageStats:
+        """Snapshot of the client's cumulative usage (zero for stand-in clients)."""
+        usage = getattr(self.client, "usage", None)
+        return usage.copy() if isinstance(usage, UsageStats) else UsageStats()
+
+    def _prompt_reporters(self) -> List[Any]:
+        """Captains and Admirals whose decision prompts are accounted."""
+        reporters: List[Any] = [self.alpha_captain, self.beta_captain, self.alpha_admiral, self.beta_admiral]
+        reporters.extend(self.alpha_captains.values())
+        reporters.extend(self.beta_captains.values())
+        return [r for r in reporters if r is not None]
+
+    def _share_tactical_picture(self) -> None:
+        """
+        Build this checkpoint's tactical picture once and hand it to every
+        captain, Admiral and MCP controller.
+        """
+        picture = TacticalPicture(self.simulation)
+        holders: List[Any] = [
+            self.alpha_captain, self.beta_captain,
+            self.alpha_admiral, self.beta_admiral,
+            self.alpha_mcp, self.beta_mcp,
+        ]
+        holders.extend(self.alpha_captains.values())
+        holders.extend(self.beta_captains.values())
+        for holder in holders:
+            if holder is not None:
+                holder.tactical_picture = picture
+
+    def _begin_checkpoint_metrics(self) -> None:
+        """Start accounting LLM usage for the current checkpoint."""
+        self.telemetry.set_checkpoint(self.checkpoint_count)
+        for reporter in self._prompt_reporters():
+            reporter.last_prompt_report = None
+        self._metrics_start = (
+            self.checkpoint_count,
+            self.simulation.current_time,
+            time.perf_counter(),
+            self._client_usage(),
+        )
+
+    def _finish_telemetry(self) -> Dict[str, Any]:
+        """Battle-wide telemetry summary, also written to telemetry_path if set."""
+        if self.config.telemetry_path:
+            path = self.telemetry.write_summary(self.config.telemetry_path)
+            if self.config.verbose:
+                print(f"LLM telemetry saved to: {path}")
+        return self.telemetry.summary()
+
+    def _end_checkpoint_metrics(self) -> None:
+        """Close the open checkpoint's accounting into checkpoint_metrics."""
+        if self._metrics_start is None:
+            return
+        checkpoint, sim_time, started, usage_before = self._metrics_start
+        self._metrics_start = None
+
+        usage = self._client_usage() - usage_before
+        metrics = CheckpointMetrics(
+            checkpoint=checkpoint,
+            sim_time=sim_time,
+            wall_time_s=time.perf_counter() - started,
+            llm_calls=usage.calls,
+            cache_hits=usage.cache_hits,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            llm_latency_s=usage.latency_s,
+            streamed_calls=usage.streamed_calls,
+            first_tool_call_s=usage.first_tool_call_s,
+        )
+        for reporter in self._prompt_reporters():
+            report = reporter.last_prompt_report
+            if report is None:
+                continue
+            metrics.estimated_prompt_tokens[report.role] = (
+                metrics.estimated_prompt_tokens.get(report.role, 0) + report.tokens_after
+            )
+            if report.compactions:
+                metrics.compacted_prompts += 1
+        self.checkpoint_metrics.append(metrics)
+
     def _log_fleet_decision(self, all_commands: Dict[str, List[Any]]) -> None:
         """Log fleet decision point."""
         log_entry = {
@@ -1893,19 +2378,25 @@ class LLMBattleRunner:
 
         self.decision_log.append(log_entry)
 
-    def _is_fleet_battle_over(self) -> bool:
-        """Check if fleet battle should end."""
-        if self.simulation is None:
-            return True
+    def _is_fleet_battle_over(self, simulation: Any = None) -> bool:
+        """Check if fleet battle should end (on a fork, if one is given)."""
+        if simulation is None:
+            if self.simulation is None:
+                return True
+            simulation = self.simulation
+            alpha_ships, beta_ships = self.alpha_ships.values(), self.beta_ships.values()
+        else:
+            alpha_ships = [simulation.ships[ship_id] for ship_id in self.alpha_ships]
+            beta_ships = [simulation.ships[ship_id] for ship_id in self.beta_ships]
 
         # Check if all ships on one side are destroyed/surrendered
         alpha_active = any(
             not ship.is_destroyed and not getattr(ship, 'is_surrendered', False)
-            for ship in self.alpha_ships.values()
+            for ship in alpha_ships
         )
         beta_active = any(
             not ship.is_destroyed and not getattr(ship, 'is_surrendered', False)
-            for ship in self.beta_ships.values()
+            for ship in beta_ships
         )
 
         if not alpha_active or not beta_active:
@@ -1924,13 +2415,15 @@ class LLMBattleRunner:
 
         # Time limit
         time_limit = self.fleet_config.time_limit_s if self.fleet_config else self.config.time_limit_s
-        if self.simulation.current_time >= time_limit:
+        if simulation.current_time >= time_limit:
             return True
 
         return False
 
     def _evaluate_fleet_result(self) -> BattleResult:
         """Evaluate final fleet battle result."""
+        self._end_checkpoint_metrics()
+
         # Count active ships
         alpha_active = sum(
             1 for ship in self.alpha_ships.values()
@@ -2007,12 +2500,14 @@ class LLMBattleRunner:
             self.recorder.recording.alpha_ships_remaining = alpha_active
             self.recorder.recording.beta_ships_remaining = beta_active
 
+            self.recorder.record_llm_telemetry(self.telemetry.to_dict())
             self.recorder.end_recording(rec_result, self.simulation.current_time)
 
             # Save to file
             filename = create_battle_filename(
                 self.recorder.recording.alpha_model,
                 self.recorder.recording.beta_model,
+                recording_format=self.config.recording_format,
             )
             filepath = Path(self.config.recording_dir) / filename
             self.recording_file = self.recorder.save(str(filepath))
@@ -2048,6 +2543,8 @@ class LLMBattleRunner:
             messages=self.fleet_communication.get_all_messages_formatted() if self.fleet_communication else [],
             is_fleet_battle=True,
             recording_file=self.recording_file,
+            checkpoint_metrics=self.checkpoint_metrics,
+            llm_telemetry=self._finish_telemetry(),
         )
 
     def _is_battle_over(self) -> bool:
@@ -2082,14 +2579,24 @@ class LLMBattleRunner:
 
         return False
 
+    def _trajectory_codec(self) -> Optional[TrajectoryCodec]:
+        """Sim trace encoding of the recorder (None: full states)."""
+        if self.config.trajectory_error_m is None:
+            return None
+        return TrajectoryCodec(position_error_m=self.config.trajectory_error_m)
+
     def _record_sim_frame(self) -> None:
         """Record current simulation state for detailed analysis."""
         if not self.recorder or not self.simulation:
             return
 
+        self.recorder.record_sim_frame(**self._build_sim_frame(self.simulation))
+
+    def _build_sim_frame(self, simulation: Any) -> Dict[str, Any]:
+        """Build record_sim_frame() kwargs for a simulation's current state."""
         # Build ship states - iterate over ALL ships in simulation (including destroyed)
         ships = {}
-        for ship_id, ship in self.simulation.ships.items():
+        for ship_id, ship in simulation.ships.items():
             if ship:
                 # Get current maneuver type
                 maneuver_str = "MAINTAIN"
@@ -2125,7 +2632,7 @@ class LLMBattleRunner:
 
         # Build projectile states
         projectiles = []
-        for proj_flight in self.simulation.projectiles:
+        for proj_flight in simulation.projectiles:
             proj = proj_flight.projectile
             # Check if any PD is engaging this projectile
             pd_engaged = hasattr(proj, '_pd_ablation') and proj._pd_ablation > 0
@@ -2143,7 +2650,7 @@ class LLMBattleRunner:
 
         # Build torpedo states
         torpedoes = []
-        for torp_flight in self.simulation.torpedoes:
+        for torp_flight in simulation.torpedoes:
             torp = torp_flight.torpedo
             torpedoes.append({
                 "id": torp_flight.torpedo_id,
@@ -2156,12 +2663,12 @@ class LLMBattleRunner:
                 "is_disabled": torp_flight.is_disabled,
             })
 
-        self.recorder.record_sim_frame(
-            timestamp=self.simulation.current_time,
-            ships=ships,
-            projectiles=projectiles,
-            torpedoes=torpedoes,
-        )
+        return {
+            "timestamp": simulation.current_time,
+            "ships": ships,
+            "projectiles": projectiles,
+            "torpedoes": torpedoes,
+        }
 
     def _print_status(self) -> None:
         """Print current battle status."""
@@ -2381,6 +2888,8 @@ class LLMBattleRunner:
 
     def _evaluate_result(self) -> BattleResult:
         """Evaluate final battle result."""
+        self._end_checkpoint_metrics()
+
         alpha = self.simulation.get_ship("alpha")
         beta = self.simulation.get_ship("beta")
 
@@ -2419,12 +2928,14 @@ class LLMBattleRunner:
             rec_result.duration_s = self.simulation.current_time
             rec_result.checkpoints_used = self.checkpoint_count
 
+            self.recorder.record_llm_telemetry(self.telemetry.to_dict())
             self.recorder.end_recording(rec_result, self.simulation.current_time)
 
             # Save to file
             filename = create_battle_filename(
                 self.alpha_config.model,
                 self.beta_config.model,
+                recording_format=self.config.recording_format,
             )
             filepath = Path(self.config.recording_dir) / filename
             self.recording_file = self.recorder.save(str(filepath))
@@ -2453,6 +2964,8 @@ class LLMBattleRunner:
             decision_log=self.decision_log,
             messages=self.communication.get_all_messages_formatted() if self.communication else [],
             recording_file=self.recording_file,
+            checkpoint_metrics=self.checkpoint_metrics,
+            llm_telemetry=self._finish_telemetry(),
         )
 
     def _collect_stats(self, ship: Any) -> Dict[str, Any]:
@@ -5,13 +5,15 @@ Makes strategic decisions via tool/function calling.
 """
 
 import json
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from .client import CaptainClient, ToolCall
 from .tools import get_captain_tools, get_weapon_groups_for_ship, PERSONALITY_SELECTION_TOOLS, RESPOND_TO_ORDERS_TOOL
 from .prompts import (
-    build_captain_prompt,
+    build_captain_system_prompt,
+    build_captain_situation_prompt,
     build_personality_selection_prompt,
     format_admiral_orders_for_captain,
     CaptainPersonality,
@@ -19,6 +21,9 @@ from .prompts import (
 )
 from .communication import CaptainMessage, MessageType
 from .admiral_tools import DISCUSS_WITH_ADMIRAL_TOOL
+from .token_budget import BudgetReport, PromptSection, estimate_tokens, fit_to_budget
+from .tactical_picture import MunitionThreat, TacticalPicture
+from .telemetry import instrumented
 
 
 @dataclass
@@ -33,6 +38,114 @@ class LLMCaptainConfig:
     has_torpedoes: bool = False
     ship_type: str = "destroyer"
     fleet_data: Optional[Dict[str, Any]] = None
+    prompt_token_budget: Optional[int] = None  # Compact history beyond this (None = no limit)
+    stream_tool_calls: bool = False  # Execute each tool call as soon as it has streamed in
+
+
+class _FormattedLog:
+    """
+    Formatted lines for an append-only history list.
+
+    Entries are formatted once, when first seen, instead of re-formatting
+    the whole history at every checkpoint. If the history is replaced or
+    truncated, the lines are rebuilt.
+    """
+
+    def __init__(self, formatter):
+        self._formatter = formatter
+        self._source: Optional[List[Any]] = None
+        self._lines: List[str] = []
+
+    def lines(self, history: List[Any]) -> List[str]:
+        """Formatted line per history entry."""
+        if history is not self._source or len(self._lines) > len(history):
+            self._source = history
+            self._lines = []
+        for entry in history[len(self._lines):]:
+            self._lines.append(self._formatter(entry))
+        return self._lines
+
+
+class _RollingTally:
+    """
+    Running counts over the oldest entries of an append-only history.
+
+    Used to summarize entries that have scrolled out of the prompt window.
+    Moving the boundary only counts (or uncounts) the entries crossed, so
+    the summary costs O(new entries) per checkpoint.
+    """
+
+    def __init__(self, keys_of):
+        self._keys_of = keys_of
+        self._source: Optional[List[Any]] = None
+        self._upto = 0
+        self._counts: Counter = Counter()
+
+    def counts(self, history: List[Any], upto: int) -> List[Tuple[str, int]]:
+        """(key, count) pairs over history[:upto], most frequent first."""
+        if history is not self._source or self._upto > len(history):
+            self._source = history
+            self._upto = 0
+            self._counts = Counter()
+        while self._upto < upto:
+            self._counts.update(self._keys_of(history[self._upto]))
+            self._upto += 1
+        while self._upto > upto:
+            self._upto -= 1
+            self._counts.subtract(self._keys_of(history[self._upto]))
+        return sorted(
+            ((key, n) for key, n in self._counts.items() if n > 0),
+            key=lambda item: (-item[1], item[0]),
+        )
+
+
+def _decision_labels(captain: "LLMCaptain", ship_id: str, *args, **kwargs) -> Dict[str, Any]:
+    """Telemetry span labels for a captain decision."""
+    return {"ship_id": ship_id, "model": captain.config.model}
+
+
+def _personality_labels(captain: "LLMCaptain", *args, **kwargs) -> Dict[str, Any]:
+    """Telemetry span labels for a captain personality selection."""
+    return {"ship_id": getattr(captain, "ship_id", None), "role": "captain", "model": captain.config.model}
+
+
+class _ToolCallExecutor:
+    """
+    Executes one decision's tool calls as they arrive.
+
+    With streaming, calls are executed while the model is still generating
+    the rest of the response; the complete list is passed through again
+    afterwards and calls already executed are skipped. Only the first
+    maneuver of a decision takes effect.
+    """
+
+    MANEUVER_TOOLS = {"set_maneuver", "set_heading"}
+
+    def __init__(self, captain: "LLMCaptain", simulation: Any, ship_id: str):
+        self._captain = captain
+        self._simulation = simulation
+        self._ship_id = ship_id
+        self._seen: List[ToolCall] = []
+        self._maneuver_issued = False
+        self.executed: List[ToolCall] = []
+        self.commands: List[Any] = []
+
+    def execute(self, tc: ToolCall) -> None:
+        """Execute a tool call unless it was already seen."""
+        if any(tc is seen for seen in self._seen):
+            return
+        self._seen.append(tc)
+
+        # Skip duplicate maneuver commands (only first one takes effect)
+        if tc.name in self.MANEUVER_TOOLS:
+            if self._maneuver_issued:
+                return
+            self._maneuver_issued = True
+
+        cmd = self._captain._execute_tool(tc, self._simulation, self._ship_id)
+        self.executed.append(tc)
+        if cmd is not None:
+            self.commands.append(cmd)
 
 
 class LLMCaptain:
@@ -84,6 +197,24 @@ class LLMCaptain:
         # Each entry: {distance_km, rel_velocity_kps, weapon, result: "HIT"/"MISS", damage_gj}
         self.shot_history: List[Dict[str, Any]] = []
 
+        # Incrementally maintained prompt sections
+        self._decision_lines = _FormattedLog(self._format_decision_entry)
+        self._message_lines = _FormattedLog(self._format_message_entry)
+        self._shot_lines = _FormattedLog(self._format_shot_entry)
+        self._shot_tally_source: Optional[List[Dict[str, Any]]] = None
+        self._shots_tallied = 0
+        self._hits_by_range: Dict[str, List[int]] = {}
+        self._system_prompt_key: Optional[tuple] = None
+        self._system_prompt: str = ""
+        self._decision_tally = _RollingTally(self._decision_summary_keys)
+        self._message_tally = _RollingTally(self._message_summary_keys)
+
+        # Token accounting for the most recent decision prompt
+        self.last_prompt_report: Optional[BudgetReport] = None
+
+        # Checkpoint-wide geometry and threats, shared by the battle runner
+        self.tactical_picture: Optional[TacticalPicture] = None
+
         # Multi-ship targeting support
         self.primary_target_id: Optional[str] = None  # Current target ship ID
         self.targeting_me: List[str] = []  # Ship IDs that have us as primary target
@@ -123,6 +254,7 @@ class LLMCaptain:
         """Get ship's name from config."""
         return self.config.ship_name
 
+    @instrumented("personality", _personality_labels)
     def select_personality(self, distance_km: float, verbose: bool = False) -> Dict[str, Any]:
         """
         Let the LLM choose its personality before battle starts.
@@ -233,6 +365,7 @@ class LLMCaptain:
         self.discussion_exchanges = 0
         self.order_response = None
 
+    @instrumented("captain", _decision_labels)
     def decide(
         self,
         ship_id: str,
@@ -248,13 +381,73 @@ class LLMCaptain:
         Returns:
             List of commands to execute (Maneuvers, fire orders, etc.)
         """
-        if self.has_surrendered:
+        request = self._prepare_decision(ship_id, simulation)
+        if request is None:
+            return []
+
+        messages, tools = request
+        executor = _ToolCallExecutor(self, simulation, ship_id)
+        # Call LLM with tools (use captain's configured model)
+        tool_calls = self.client.decide_with_tools(
+            messages, tools, model=self.config.model, **self._streaming(executor)
+        )
+        return self._apply_tool_calls(tool_calls, simulation, ship_id, executor)
+
+    @instrumented("captain", _decision_labels)
+    async def decide_async(
+        self,
+        ship_id: str,
+        simulation: Any,
+    ) -> List[Any]:
+        """
+        Async version of decide() for concurrent fleet checkpoints.
+
+        The prompt is built from the simulation before the LLM call is
+        awaited, so the simulation must not advance while decisions are
+        pending.
+
+        Args:
+            ship_id: ID of this captain's ship
+            simulation: CombatSimulation instance
+
+        Returns:
+            List of commands to execute (Maneuvers, fire orders, etc.)
+        """
+        request = self._prepare_decision(ship_id, simulation)
+        if request is None:
             return []
 
+        messages, tools = request
+        executor = _ToolCallExecutor(self, simulation, ship_id)
+        tool_calls = await self.client.decide_with_tools_async(
+            messages, tools, model=self.config.model, **self._streaming(executor)
+        )
+        return self._apply_tool_calls(tool_calls, simulation, ship_id, executor)
+
+    def _streaming(self, executor: _ToolCallExecutor) -> Dict[str, Any]:
+        """Client arguments that stream tool calls into executor, if enabled."""
+        if not self.config.stream_tool_calls:
+            return {}
+        return {"on_tool_call": executor.execute}
+
+    def _prepare_decision(
+        self,
+        ship_id: str,
+        simulation: Any,
+    ) -> Optional[Tuple[List[Dict[str, str]], List[Dict[str, Any]]]]:
+        """
+        Build LLM messages and tools for a decision.
+
+        Returns:
+            (messages, tools), or None if this captain cannot act.
+        """
+        if self.has_surrendered:
+            return None
+
         # Get ship state
         ship = simulation.get_ship(ship_id)
         if not ship or ship.is_destroyed:
-            return []
+            return None
 
         # Set up weapon groups if not done yet
         if not self.weapon_groups and self.config.fleet_data and self.config.ship_type:
@@ -282,73 +475,139 @@ class LLMCaptain:
             )
             self.received_messages.clear()
 
-        # Build history context
-        decision_history = self._format_decision_history(last_n=5)
-        message_history = self._format_message_history(last_n=6)
+        # Build prompt: static system prompt (stable prefix for provider
+        # prompt caching) followed by this checkpoint's situation report
         battle_summary = self._format_battle_summary(distance_km)
-        shot_history = self._format_shot_history(last_n=10)
-
-        # Build prompt
         recent_hits_text = self._format_recent_hits()
-        system_prompt = build_captain_prompt(
-            captain_name=self.config.name,
-            ship_name=self.config.ship_name,
-            ship_status=ship_status,
-            tactical_status=tactical_status,
-            personality=self.config.personality,
-            personality_text=self.personality_text,
-            received_messages=messages_text if messages_text else None,
-            decision_history=decision_history,
-            message_history=message_history,
-            battle_summary=battle_summary,
-            shot_history=shot_history,
-            recent_hits=recent_hits_text if recent_hits_text else None,
-            ship_type=self.config.ship_type,
-            fleet_data=self.config.fleet_data,
-        )
-
-        # Add Admiral orders to prompt if present
+        system_prompt = self._get_system_prompt(ship_status.get("heatsink_capacity", 525))
+        admiral_orders_text = ""
         if self.has_admiral and (self.admiral_orders or self.fleet_directive):
             admiral_orders_text = format_admiral_orders_for_captain(
                 self.admiral_orders,
                 self.fleet_directive,
             )
-            system_prompt = system_prompt + "\n\n" + admiral_orders_text
+
+        def build_user_content(histories: Dict[str, str]) -> str:
+            situation = build_captain_situation_prompt(
+                ship_name=self.config.ship_name,
+                ship_status=ship_status,
+                tactical_status=tactical_status,
+                received_messages=messages_text if messages_text else None,
+                decision_history=histories["decision_history"],
+                message_history=histories["message_history"],
+                battle_summary=battle_summary,
+                shot_history=histories["shot_history"],
+                recent_hits=recent_hits_text if recent_hits_text else None,
+                ship_type=self.config.ship_type,
+                fleet_data=self.config.fleet_data,
+            )
+            # Add Admiral orders to prompt if present
+            if admiral_orders_text:
+                situation = situation + "\n\n" + admiral_orders_text
+            return f"{situation}\n\nDECISION POINT {self.decision_count + 1}. What are your orders, Captain?"
+
+        # History sections, in the order they are compacted when over budget
+        sections = self._history_sections(compactable=self.config.prompt_token_budget is not None)
+        user_content = build_user_content({section.name: section.text for section in sections})
+        full_tokens = estimate_tokens(system_prompt) + estimate_tokens(user_content)
+        self.last_prompt_report = fit_to_budget(
+            sections,
+            fixed_tokens=full_tokens - sum(section.tokens for section in sections),
+            budget=self.config.prompt_token_budget,
+            role="captain",
+        )
+        if self.last_prompt_report.compactions:
+            user_content = build_user_content({section.name: section.text for section in sections})
 
         # Build messages for LLM
         messages = [
             {"role": "system", "content": system_prompt},
-            {"role": "user", "content": f"DECISION POINT {self.decision_count + 1}. What are your orders, Captain?"},
+            {"role": "user", "content": user_content},
         ]
 
         # Get context-appropriate tools (may exclude draw tools if Admiral exists)
         tools = self.get_tools_for_context()
 
-        # Call LLM with tools (use captain's configured model)
-        tool_calls = self.client.decide_with_tools(messages, tools, model=self.config.model)
+        return messages, tools
 
-        # Execute tool calls
-        # Track maneuver commands - only one maneuver per decision allowed
-        maneuver_tools = {"set_maneuver", "set_heading"}
-        maneuver_issued = False
+    def _history_sections(self, compactable: bool) -> List[PromptSection]:
+        """
+        History prompt sections with their compact variants.
 
-        commands = []
-        executed_tool_calls = []  # Track actually executed tool calls
-        for tc in tool_calls:
-            # Skip duplicate maneuver commands (only first one takes effect)
-            if tc.name in maneuver_tools:
-                if maneuver_issued:
-                    continue  # Skip this maneuver, one already issued
-                maneuver_issued = True
+        Messages are compacted first, then decisions, then shots. Entries
+        that leave the window are folded into a one-line rolling summary.
+
+        Args:
+            compactable: Build the compact variants (only needed under a budget).
+        """
+        def variants(full: str, *compact) -> List[str]:
+            return [full] + ([build() for build in compact] if compactable else [])
+
+        return [
+            PromptSection("message_history", variants(
+                self._format_message_history(last_n=6),
+                lambda: self._format_message_history(last_n=2),
+                lambda: self._format_message_history(last_n=0),
+            )),
+            PromptSection("decision_history", variants(
+                self._format_decision_history(last_n=5),
+                lambda: self._format_decision_history(last_n=2),
+                lambda: self._format_decision_history(last_n=0),
+            )),
+            PromptSection("shot_history", variants(
+                self._format_shot_history(last_n=10),
+                lambda: self._format_shot_history(last_n=10, detail=False),
+            )),
+        ]
+
+    def _get_system_prompt(self, heatsink_capacity: float) -> str:
+        """Static system prompt, rebuilt only if the personality or ship changes."""
+        key = (
+            self.config.name,
+            self.config.ship_name,
+            self.config.personality,
+            self.personality_text,
+            self.config.ship_type,
+            id(self.config.fleet_data),
+            heatsink_capacity,
+        )
+        if key != self._system_prompt_key:
+            self._system_prompt = build_captain_system_prompt(
+                captain_name=self.config.name,
+                ship_name=self.config.ship_name,
+                personality=self.config.personality,
+                personality_text=self.personality_text,
+                ship_type=self.config.ship_type,
+                fleet_data=self.config.fleet_data,
+                heatsink_capacity=heatsink_capacity,
+            )
+            self._system_prompt_key = key
+        return self._system_prompt
 
-            cmd = self._execute_tool(tc, simulation, ship_id)
-            executed_tool_calls.append(tc)
-            if cmd is not None:
-                commands.append(cmd)
+    def _apply_tool_calls(
+        self,
+        tool_calls: List[ToolCall],
+        simulation: Any,
+        ship_id: str,
+        executor: Optional[_ToolCallExecutor] = None,
+    ) -> List[Any]:
+        """
+        Execute the LLM's tool calls and record the decision.
+
+        Args:
+            tool_calls: All tool calls of the response.
+            simulation: CombatSimulation instance.
+            ship_id: ID of this captain's ship.
+            executor: Executor that already ran some calls while streaming.
+        """
+        executor = executor or _ToolCallExecutor(self, simulation, ship_id)
+        for tc in tool_calls:
+            executor.execute(tc)
+        commands = executor.commands
 
         # Track decision
         self.decision_count += 1
-        self.last_tool_calls = executed_tool_calls  # Store only executed calls for verbose output
+        self.last_tool_calls = executor.executed  # Store only executed calls for verbose output
         self.decision_history.append({
             "checkpoint": self.decision_count,
             "time": simulation.current_time,
@@ -422,66 +681,108 @@ class LLMCaptain:
         if not self.decision_history:
             return ""
 
-        recent = self.decision_history[-last_n:]
-        lines = ["YOUR RECENT DECISIONS:"]
-
-        for decision in recent:
-            checkpoint = decision["checkpoint"]
-            time = decision["time"]
-            actions = []
-
-            for tc in decision["tool_calls"]:
-                name = tc["name"]
-                args = tc["args"]
-
-                if name == "set_maneuver":
-                    maneuver = args.get("maneuver_type", "?")
-                    throttle = args.get("throttle", 1.0)
-                    actions.append(f"{maneuver}@{throttle*100:.0f}%")
-                elif name == "set_weapons_order":
-                    spinal = args.get("spinal_mode", "")
-                    turret = args.get("turret_mode", "")
-                    if spinal and turret:
-                        actions.append(f"weapons:{spinal}/{turret}")
-                    elif spinal:
-                        actions.append(f"spinal:{spinal}")
-                    elif turret:
-                        actions.append(f"turret:{turret}")
-                elif name == "set_radiators":
-                    actions.append("radiators:" + ("extend" if args.get("extend") else "retract"))
-                elif name == "send_message":
-                    actions.append("sent_msg")
-                elif name == "surrender":
-                    actions.append("SURRENDER")
-                elif name == "propose_draw":
-                    actions.append("PROPOSE_DRAW")
-                elif name == "retract_draw":
-                    actions.append("RETRACT_DRAW")
-
-            action_str = ", ".join(actions) if actions else "none"
-            lines.append(f"  T+{time:.0f}s: {action_str}")
+        lines = self._decision_lines.lines(self.decision_history)[-last_n:] if last_n else []
+        older = len(self.decision_history) - len(lines)
+        header = ["YOUR RECENT DECISIONS:"]
+        if older:
+            counts = self._decision_tally.counts(self.decision_history, older)
+            actions = ", ".join(f"{name} x{n}" for name, n in counts) or "none"
+            header.append(
+                f"  Earlier ({self._time_span(self.decision_history, older)}, "
+                f"{older} decisions): {actions}"
+            )
+        return "\n".join(header + lines)
+
+    @staticmethod
+    def _time_span(history: List[Dict[str, Any]], count: int) -> str:
+        """Time span covered by the first count history entries."""
+        return f"T+{history[0]['time']:.0f}s to T+{history[count - 1]['time']:.0f}s"
+
+    @staticmethod
+    def _decision_summary_keys(decision: Dict[str, Any]) -> List[str]:
+        """Action labels a decision contributes to the rolling summary."""
+        keys = []
+        for tc in decision["tool_calls"]:
+            name = tc["name"]
+            if name == "set_maneuver":
+                keys.append(tc["args"].get("maneuver_type", "?"))
+            elif name == "set_weapons_order":
+                keys.append("weapons")
+            elif name == "set_radiators":
+                keys.append("radiators")
+            elif name == "send_message":
+                keys.append("sent_msg")
+            elif name in ("surrender", "propose_draw", "retract_draw"):
+                keys.append(name.upper())
+        return keys
+
+    @staticmethod
+    def _format_decision_entry(decision: Dict[str, Any]) -> str:
+        """Format one decision history entry."""
+        time = decision["time"]
+        actions = []
 
-        return "\n".join(lines)
+        for tc in decision["tool_calls"]:
+            name = tc["name"]
+            args = tc["args"]
+
+            if name == "set_maneuver":
+                maneuver = args.get("maneuver_type", "?")
+                throttle = args.get("throttle", 1.0)
+                actions.append(f"{maneuver}@{throttle*100:.0f}%")
+            elif name == "set_weapons_order":
+                spinal = args.get("spinal_mode", "")
+                turret = args.get("turret_mode", "")
+                if spinal and turret:
+                    actions.append(f"weapons:{spinal}/{turret}")
+                elif spinal:
+                    actions.append(f"spinal:{spinal}")
+                elif turret:
+                    actions.append(f"turret:{turret}")
+            elif name == "set_radiators":
+                actions.append("radiators:" + ("extend" if args.get("extend") else "retract"))
+            elif name == "send_message":
+                actions.append("sent_msg")
+            elif name == "surrender":
+                actions.append("SURRENDER")
+            elif name == "propose_draw":
+                actions.append("PROPOSE_DRAW")
+            elif name == "retract_draw":
+                actions.append("RETRACT_DRAW")
+
+        action_str = ", ".join(actions) if actions else "none"
+        return f"  T+{time:.0f}s: {action_str}"
 
     def _format_message_history(self, last_n: int = 6) -> str:
         """Format recent message history for the prompt."""
         if not self.message_history:
             return ""
 
-        recent = self.message_history[-last_n:]
-        lines = ["COMMUNICATION LOG:"]
-
-        for msg in recent:
-            sender = msg["sender"]
-            time = msg["time"]
-            text = msg["text"]
-            # Truncate long messages
-            if len(text) > 100:
-                text = text[:100] + "..."
-            who = "You" if sender == "self" else "Enemy"
-            lines.append(f"  T+{time:.0f}s [{who}]: \"{text}\"")
-
-        return "\n".join(lines)
+        lines = self._message_lines.lines(self.message_history)[-last_n:] if last_n else []
+        older = len(self.message_history) - len(lines)
+        header = ["COMMUNICATION LOG:"]
+        if older:
+            counts = dict(self._message_tally.counts(self.message_history, older))
+            header.append(
+                f"  Earlier ({self._time_span(self.message_history, older)}): "
+                f"{counts.get('sent', 0)} sent, {counts.get('received', 0)} received"
+            )
+        return "\n".join(header + lines)
+
+    @staticmethod
+    def _message_summary_keys(msg: Dict[str, Any]) -> List[str]:
+        """Direction of a message for the rolling summary."""
+        return ["sent" if msg["sender"] == "self" else "received"]
+
+    @staticmethod
+    def _format_message_entry(msg: Dict[str, Any]) -> str:
+        """Format one communication log entry."""
+        text = msg["text"]
+        # Truncate long messages
+        if len(text) > 100:
+            text = text[:100] + "..."
+        who = "You" if msg["sender"] == "self" else "Enemy"
+        return f"  T+{msg['time']:.0f}s [{who}]: \"{text}\""
 
     def _format_battle_summary(self, distance_km: float) -> str:
         """Format battle progression summary."""
@@ -565,16 +866,23 @@ class LLMCaptain:
         """Get current primary target ID."""
         return self.primary_target_id
 
-    def _format_shot_history(self, last_n: int = 10) -> str:
-        """Format recent shot history for prompt."""
+    def _format_shot_history(self, last_n: int = 10, detail: bool = True) -> str:
+        """
+        Format recent shot history for prompt.
+
+        Args:
+            last_n: Shots considered for the detail lines (at most 5 are shown).
+            detail: Include per-shot detail; False keeps only the range stats.
+        """
         if not self.shot_history:
             return ""
 
-        recent = self.shot_history[-last_n:]
-
-        # Calculate stats by range bracket
-        hits_by_range = {"<100km": [0, 0], "100-300km": [0, 0], ">300km": [0, 0]}
-        for shot in self.shot_history:
+        # Hit stats by range bracket, tallied incrementally
+        if self.shot_history is not self._shot_tally_source or self._shots_tallied > len(self.shot_history):
+            self._shot_tally_source = self.shot_history
+            self._shots_tallied = 0
+            self._hits_by_range = {"<100km": [0, 0], "100-300km": [0, 0], ">300km": [0, 0]}
+        for shot in self.shot_history[self._shots_tallied:]:
             d = shot["distance_km"]
             if d < 100:
                 bracket = "<100km"
@@ -582,30 +890,39 @@ class LLMCaptain:
                 bracket = "100-300km"
             else:
                 bracket = ">300km"
-            hits_by_range[bracket][1] += 1  # total
+            self._hits_by_range[bracket][1] += 1  # total
             if shot["result"] == "HIT":
-                hits_by_range[bracket][0] += 1  # hits
+                self._hits_by_range[bracket][0] += 1  # hits
+        self._shots_tallied = len(self.shot_history)
 
         lines = ["YOUR SHOTS FIRED (at enemy):"]
 
         # Stats by range
-        for bracket, (hits, total) in hits_by_range.items():
+        for bracket, (hits, total) in self._hits_by_range.items():
             if total > 0:
                 pct = (hits / total) * 100
                 lines.append(f"  {bracket}: {hits}/{total} hits ({pct:.0f}%)")
 
+        if not detail:
+            return "\n".join(lines)
+
         # Recent shots detail
         lines.append("  Recent:")
-        for shot in recent[-5:]:  # Last 5 only for detail
-            result_str = f"HIT enemy {shot['damage_gj']:.1f}GJ" if shot["result"] == "HIT" else "MISS"
-            closing = "closing" if shot["rel_velocity_kps"] < 0 else "separating"
-            lines.append(
-                f"    You fired {shot['weapon']}: {shot['distance_km']:.0f}km, "
-                f"{abs(shot['rel_velocity_kps']):.1f}km/s {closing} -> {result_str}"
-            )
+        recent = self.shot_history[-last_n:][-5:]  # Last 5 only for detail
+        lines.extend(self._shot_lines.lines(self.shot_history)[-len(recent):])
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _format_shot_entry(shot: Dict[str, Any]) -> str:
+        """Format one shot history entry."""
+        result_str = f"HIT enemy {shot['damage_gj']:.1f}GJ" if shot["result"] == "HIT" else "MISS"
+        closing = "closing" if shot["rel_velocity_kps"] < 0 else "separating"
+        return (
+            f"    You fired {shot['weapon']}: {shot['distance_km']:.0f}km, "
+            f"{abs(shot['rel_velocity_kps']):.1f}km/s {closing} -> {result_str}"
+        )
+
     def _format_recent_hits(self) -> str:
         """Format recent hits received for the prompt."""
         if not self.recent_hits:
@@ -711,26 +1028,15 @@ class LLMCaptain:
 
         return status
 
-    def _calculate_impact_bearing(self, ship: Any, proj_pos: Any, proj_vel: Any) -> str:
+    @staticmethod
+    def _calculate_impact_bearing(threat: MunitionThreat) -> str:
         """
         Calculate which armor section a projectile is likely to hit.
 
         Returns bearing like 'NOSE', 'TAIL', 'PORT', 'STARBOARD', 'PORT-AFT', etc.
         """
-        import math
-
-        # Direction from projectile to ship (approach vector)
-        to_ship = (ship.position - proj_pos).normalized()
-
-        # Get ship orientation vectors
-        forward = ship.forward
-        up = ship.up if hasattr(ship, 'up') else type(forward)(0, 0, 1)
-        right = forward.cross(up).normalized() if hasattr(forward, 'cross') else type(forward)(0, 1, 0)
-
-        # Calculate angles
-        forward_dot = forward.dot(to_ship)  # positive = coming from ahead
-        right_dot = right.dot(to_ship)  # positive = coming from starboard
-        up_dot = up.dot(to_ship)  # positive = coming from above
+        forward_dot = threat.forward_dot  # positive = coming from ahead
+        right_dot = threat.right_dot  # positive = coming from starboard
 
         # Determine primary bearing
         bearings = []
@@ -766,50 +1072,21 @@ class LLMCaptain:
 
         return bearing
 
-    def _build_enemy_info(self, ship: Any, enemy: Any, simulation: Any) -> Dict[str, Any]:
+    def _build_enemy_info(self, ship: Any, enemy: Any, picture: TacticalPicture) -> Dict[str, Any]:
         """Build tactical info for a single enemy ship."""
-        import math
-
         info = {
             "ship_id": enemy.ship_id,
             "name": getattr(enemy, 'name', enemy.ship_id),
             "ship_class": getattr(enemy, 'ship_class', 'unknown'),
         }
 
-        # Calculate relative position
-        rel_pos = enemy.position - ship.position
-        distance_m = rel_pos.magnitude
-        distance_km = distance_m / 1000
+        geometry = picture.pair(ship.ship_id, enemy.ship_id)
+        distance_km = geometry.distance_km
         info["distance_km"] = distance_km
-
-        info["relative_position"] = {
-            "x": rel_pos.x / 1000,
-            "y": rel_pos.y / 1000,
-            "z": rel_pos.z / 1000,
-        }
-
-        # Calculate relative velocity
-        rel_vel = enemy.velocity - ship.velocity
-        info["relative_velocity"] = {
-            "x": rel_vel.x / 1000,
-            "y": rel_vel.y / 1000,
-            "z": rel_vel.z / 1000,
-        }
-
-        # Closing rate
-        if distance_m > 0:
-            info["closing_rate"] = -rel_pos.normalized().dot(rel_vel) / 1000
-        else:
-            info["closing_rate"] = 0
-
-        # Angle to enemy
-        if distance_m > 0:
-            direction_to_enemy = rel_pos.normalized()
-            dot = ship.forward.dot(direction_to_enemy)
-            dot = max(-1.0, min(1.0, dot))
-            info["angle_deg"] = math.degrees(math.acos(dot))
-        else:
-            info["angle_deg"] = 0
+        info["relative_position"] = geometry.relative_position_km
+        info["relative_velocity"] = geometry.relative_velocity_kps
+        info["closing_rate"] = geometry.closing_rate_kps
+        info["angle_deg"] = geometry.angle_deg
 
         # Hit probability
         if distance_km <= 500:
@@ -849,8 +1126,7 @@ class LLMCaptain:
         simulation: Any,
     ) -> Dict[str, Any]:
         """Build tactical status dict with multi-ship support."""
-        from ..physics import Vector3D
-        import math
+        picture = TacticalPicture.current(self.tactical_picture, simulation)
 
         status = {
             "sim_time": simulation.current_time,
@@ -879,7 +1155,7 @@ class LLMCaptain:
         # Build enemy info list with primary target first
         enemies_info = []
         for e in all_enemies:
-            info = self._build_enemy_info(ship, e, simulation)
+            info = self._build_enemy_info(ship, e, picture)
             info["is_primary_target"] = (e.ship_id == self.primary_target_id)
             info["has_us_targeted"] = (e.ship_id in self.targeting_me)
             enemies_info.append(info)
@@ -892,77 +1168,32 @@ class LLMCaptain:
         for f in all_friendlies:
             if f.ship_id == ship.ship_id:
                 continue  # Skip self
-            rel_pos = f.position - ship.position
-            distance_km = rel_pos.magnitude / 1000
+            geometry = picture.pair(ship.ship_id, f.ship_id)
             status["friendlies"].append({
                 "ship_id": f.ship_id,
                 "name": getattr(f, 'name', f.ship_id),
-                "distance_km": distance_km,
+                "distance_km": geometry.distance_km,
                 "hull_percent": f.hull_integrity,
-                "relative_position": {
-                    "x": rel_pos.x / 1000,
-                    "y": rel_pos.y / 1000,
-                    "z": rel_pos.z / 1000,
-                },
+                "relative_position": geometry.relative_position_km,
             })
 
         # Legacy fields for backward compatibility (from primary target or first enemy)
-        primary_enemy = None
-        if self.primary_target_id:
-            for e in all_enemies:
-                if e.ship_id == self.primary_target_id:
-                    primary_enemy = e
-                    break
-        if not primary_enemy and all_enemies:
-            primary_enemy = all_enemies[0]
-
-        if primary_enemy:
-            rel_pos = primary_enemy.position - ship.position
-            distance_m = rel_pos.magnitude
-            distance_km = distance_m / 1000
-            status["distance_km"] = distance_km
-            status["relative_position"] = {
-                "x": rel_pos.x / 1000,
-                "y": rel_pos.y / 1000,
-                "z": rel_pos.z / 1000,
-            }
-            rel_vel = primary_enemy.velocity - ship.velocity
-            status["relative_velocity"] = {
-                "x": rel_vel.x / 1000,
-                "y": rel_vel.y / 1000,
-                "z": rel_vel.z / 1000,
-            }
-            if distance_m > 0:
-                status["closing_rate"] = -rel_pos.normalized().dot(rel_vel) / 1000
-                direction_to_enemy = rel_pos.normalized()
-                dot = ship.forward.dot(direction_to_enemy)
-                dot = max(-1.0, min(1.0, dot))
-                status["angle_to_enemy_deg"] = math.degrees(math.acos(dot))
-            else:
-                status["closing_rate"] = 0
-                status["angle_to_enemy_deg"] = 0
-
-            if distance_km <= 500:
-                base_hit = max(0.05, 0.9 - (distance_km / 500) * 0.85)
-            else:
-                base_hit = 0.05
-            status["our_hit_chance"] = base_hit * 100
-
-            status["enemy_shots"] = primary_enemy.shots_fired
-            status["enemy_hits"] = primary_enemy.hits_scored
-            status["enemy_hull_percent"] = primary_enemy.hull_integrity
-
-            if primary_enemy.armor:
-                enemy_nose = primary_enemy.armor.get_section("nose")
-                enemy_lateral = primary_enemy.armor.get_section("lateral")
-                enemy_tail = primary_enemy.armor.get_section("tail")
-                status["enemy_armor"] = {
-                    "nose_damage_pct": enemy_nose.damage_percent if enemy_nose else 0,
-                    "lateral_damage_pct": enemy_lateral.damage_percent if enemy_lateral else 0,
-                    "tail_damage_pct": enemy_tail.damage_percent if enemy_tail else 0,
-                }
-            else:
-                status["enemy_armor"] = {}
+        info_by_id = {info["ship_id"]: info for info in enemies_info}
+        primary_info = info_by_id.get(self.primary_target_id)
+        if not primary_info and all_enemies:
+            primary_info = info_by_id[all_enemies[0].ship_id]
+
+        if primary_info:
+            status["distance_km"] = primary_info["distance_km"]
+            status["relative_position"] = primary_info["relative_position"]
+            status["relative_velocity"] = primary_info["relative_velocity"]
+            status["closing_rate"] = primary_info["closing_rate"]
+            status["angle_to_enemy_deg"] = primary_info["angle_deg"]
+            status["our_hit_chance"] = primary_info["hit_chance"]
+            status["enemy_shots"] = primary_info["shots_fired"]
+            status["enemy_hits"] = primary_info["hits_scored"]
+            status["enemy_hull_percent"] = primary_info["hull_percent"]
+            status["enemy_armor"] = primary_info["armor"]
         else:
             # No enemies - set defaults
             status["distance_km"] = 1000
@@ -978,60 +1209,26 @@ class LLMCaptain:
 
         # Build incoming projectiles with source and bearing
         incoming_projectiles = []
-        if hasattr(simulation, 'projectiles') and simulation.projectiles:
-            for proj in simulation.projectiles:
-                if hasattr(proj, 'target_id') and proj.target_id == ship.ship_id:
-                    proj_pos = proj.position if hasattr(proj, 'position') else Vector3D(0, 0, 0)
-                    proj_vel = proj.velocity if hasattr(proj, 'velocity') else Vector3D(0, 0, 0)
-
-                    dist_to_ship = (ship.position - proj_pos).magnitude
-                    dist_km = dist_to_ship / 1000
-
-                    to_ship = (ship.position - proj_pos).normalized()
-                    approach_speed = proj_vel.dot(to_ship)
-
-                    if approach_speed > 0:
-                        eta_s = dist_to_ship / approach_speed
-                    else:
-                        eta_s = 999
-
-                    proj_speed_kps = proj_vel.magnitude / 1000
-                    weapon_type = "Spinal" if proj_speed_kps > 8 else "Turret"
-
-                    # Get source ship name
-                    source_name = "Unknown"
-                    if hasattr(proj, 'source_ship_id'):
-                        source_ship = simulation.get_ship(proj.source_ship_id)
-                        if source_ship:
-                            source_name = getattr(source_ship, 'name', proj.source_ship_id)
-
-                    # Calculate bearing
-                    bearing = self._calculate_impact_bearing(ship, proj_pos, proj_vel)
-
-                    incoming_projectiles.append({
-                        "weapon_type": weapon_type,
-                        "source": source_name,
-                        "distance_km": dist_km,
-                        "eta_seconds": eta_s,
-                        "bearing": bearing,
-                    })
+        for threat in picture.projectiles_targeting([ship.ship_id]):
+            source_ship = simulation.get_ship(threat.source_ship_id)
+            source_name = getattr(source_ship, 'name', threat.source_ship_id) if source_ship else "Unknown"
+            incoming_projectiles.append({
+                "weapon_type": "Spinal" if threat.speed_kps > 8 else "Turret",
+                "source": source_name,
+                "distance_km": threat.distance_km,
+                "eta_seconds": threat.eta_seconds,
+                "bearing": self._calculate_impact_bearing(threat),
+            })
 
         # Sort by ETA
         incoming_projectiles.sort(key=lambda p: p["eta_seconds"])
         status["incoming_projectiles"] = incoming_projectiles[:5]  # Limit to 5
 
         # Check for incoming torpedoes
-        torpedo_threats = []
-        if hasattr(simulation, 'torpedoes') and simulation.torpedoes:
-            for torp_flight in simulation.torpedoes:
-                torp = torp_flight.torpedo
-                if torp.target_id == ship.ship_id and not torp_flight.is_disabled:
-                    dist = (torp.position - ship.position).magnitude / 1000
-                    torpedo_threats.append({
-                        "distance_km": dist,
-                        "source": getattr(torp, 'source_ship_id', 'Unknown'),
-                    })
-        status["torpedo_threats"] = torpedo_threats
+        status["torpedo_threats"] = [
+            {"distance_km": threat.distance_km, "source": threat.source_ship_id}
+            for threat in picture.torpedoes_targeting([ship.ship_id])
+        ]
 
         # Add current configuration to status
         current_maneuver_info = None
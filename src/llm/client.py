@@ -2,16 +2,23 @@
 OpenRouter client for captain decision-making.
 
 Uses OpenRouter API directly with httpx for tool/function calling.
+Tool-call responses can optionally be streamed, handing each tool call to
+the caller as soon as its arguments are complete.
 """
 
 import os
 import json
+import time
 import httpx
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, replace
+from typing import Callable, List, Dict, Any, Optional
 
 from dotenv import load_dotenv
 
+from .request_pool import AsyncRequestPool, HedgePolicy, RetryPolicy
+from .response_cache import CacheMissError, CacheMode, ResponseCache
+from .telemetry import LLMTelemetry
+
 # Load environment variables
 load_dotenv()
 
@@ -34,11 +41,191 @@ class ToolCall:
     arguments: Dict[str, Any]
 
 
+@dataclass
+class UsageStats:
+    """
+    Cumulative LLM usage of a client.
+
+    Tokens are the provider-reported usage of live calls; cache hits cost
+    nothing and are only counted. Latency is summed per request, so with
+    concurrent async calls it can exceed wall time. For streamed calls
+    that produced a tool call, the time until the first one was complete
+    is summed in first_tool_call_s.
+    """
+    calls: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_s: float = 0.0
+    streamed_calls: int = 0
+    first_tool_call_s: float = 0.0
+
+    def copy(self) -> "UsageStats":
+        return replace(self)
+
+    def __sub__(self, other: "UsageStats") -> "UsageStats":
+        return UsageStats(
+            calls=self.calls - other.calls,
+            cache_hits=self.cache_hits - other.cache_hits,
+            prompt_tokens=self.prompt_tokens - other.prompt_tokens,
+            completion_tokens=self.completion_tokens - other.completion_tokens,
+            latency_s=self.latency_s - other.latency_s,
+            streamed_calls=self.streamed_calls - other.streamed_calls,
+            first_tool_call_s=self.first_tool_call_s - other.first_tool_call_s,
+        )
+
+
+def _parse_tool_call(tc: Dict[str, Any]) -> ToolCall:
+    """Build a ToolCall from an API tool call (malformed arguments -> {})."""
+    try:
+        args = json.loads(tc["function"]["arguments"] or "{}")
+    except json.JSONDecodeError:
+        args = {}
+    return ToolCall(id=tc["id"], name=tc["function"]["name"], arguments=args)
+
+
+class ToolCallStream:
+    """
+    Assembles streamed chat completion chunks into tool calls.
+
+    A tool call is complete once its arguments parse as a JSON object, or
+    at the latest when the next call starts or the stream finishes.
+    Completed calls are passed to on_tool_call in order. An exception
+    raised by on_tool_call stops further callbacks and is kept in
+    callback_error, so a failing consumer is not mistaken for a network
+    error.
+    """
+
+    def __init__(
+        self,
+        on_tool_call: Optional[Callable[[ToolCall], None]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Args:
+            on_tool_call: Called with each tool call as soon as it is complete.
+            clock: Time source for first_tool_call_at.
+        """
+        self.on_tool_call = on_tool_call
+        self.tool_calls: List[ToolCall] = []
+        self.first_tool_call_at: Optional[float] = None
+        self.callback_error: Optional[BaseException] = None
+        self.model: Optional[str] = None
+        self.usage: Dict[str, int] = {}
+        self.finish_reason: Optional[str] = None
+        self._clock = clock
+        self._content: List[str] = []
+        self._pending: Dict[int, Dict[str, Any]] = {}  # index -> partial API tool call
+        self._done: List[int] = []
+
+    def feed_line(self, line: str) -> None:
+        """Feed one server-sent event line ("data: {...}")."""
+        if not line.startswith("data:"):
+            return
+        data = line[len("data:"):].strip()
+        if data and data != "[DONE]":
+            self.feed(json.loads(data))
+
+    def feed(self, chunk: Dict[str, Any]) -> None:
+        """Feed one decoded chat.completion.chunk."""
+        self.model = chunk.get("model", self.model)
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+
+        for choice in chunk.get("choices") or []:
+            delta = choice.get("delta") or {}
+            if delta.get("content"):
+                self._content.append(delta["content"])
+
+            for part in delta.get("tool_calls") or []:
+                index = part.get("index", 0)
+                # A new call starting means every earlier one is complete
+                for earlier in sorted(self._pending):
+                    if earlier < index:
+                        self._complete(earlier)
+                call = self._pending.get(index)
+                if call is None:
+                    if index in self._done:
+                        continue
+                    call = {"id": "", "type": "function", "function": {"name": "", "arguments": ""}}
+                    self._pending[index] = call
+                call["id"] = part.get("id") or call["id"]
+                function = part.get("function") or {}
+                call["function"]["name"] += function.get("name") or ""
+                fragment = function.get("arguments") or ""
+                call["function"]["arguments"] += fragment
+                if fragment.rstrip().endswith("}") and self._arguments_complete(call):
+                    self._complete(index)
+
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+                self.finish()
+
+    def finish(self) -> None:
+        """Complete any calls still pending (end of stream)."""
+        for index in sorted(self._pending):
+            self._complete(index)
+
+    @staticmethod
+    def _arguments_complete(call: Dict[str, Any]) -> bool:
+        try:
+            return isinstance(json.loads(call["function"]["arguments"]), dict)
+        except json.JSONDecodeError:
+            return False
+
+    def _complete(self, index: int) -> None:
+        call = self._pending.pop(index)
+        self._done.append(index)
+        tool_call = _parse_tool_call(call)
+        self.tool_calls.append(tool_call)
+        if self.first_tool_call_at is None:
+            self.first_tool_call_at = self._clock()
+        if self.on_tool_call is not None and self.callback_error is None:
+            try:
+                self.on_tool_call(tool_call)
+            except Exception as e:
+                self.callback_error = e
+
+    def response(self) -> Dict[str, Any]:
+        """The equivalent non-streamed chat completion (for the cache)."""
+        message: Dict[str, Any] = {"role": "assistant", "content": "".join(self._content)}
+        if self.tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {"name": tc.name, "arguments": json.dumps(tc.arguments)},
+                }
+                for tc in self.tool_calls
+            ]
+        return {
+            "object": "chat.completion",
+            "model": self.model,
+            "choices": [{"index": 0, "message": message, "finish_reason": self.finish_reason}],
+            "usage": self.usage,
+        }
+
+
 class CaptainClient:
     """
     LLM client for captain decision-making using OpenRouter directly.
 
-    Uses tool/function calling for structured command output.
+    Uses tool/function calling for structured command output. Blocking
+    methods use a shared httpx.Client; the *_async variants go through an
+    AsyncRequestPool (pooled connections, per-provider concurrency cap,
+    per-model rate limit, retries and optional hedging) so a fleet
+    checkpoint can fan out captain calls without flooding one backend.
+
+    With a ResponseCache attached, every call is served from the cache
+    when possible; in strict replay mode a miss raises CacheMissError
+    instead of reaching the API.
+
+    Token usage and latency of every call accumulate in ``usage``; with an
+    LLMTelemetry attached, every call is also recorded individually.
+
+    Passing ``on_tool_call`` to decide_with_tools() (or its async variant)
+    streams the response: each tool call is handed over as soon as its
+    arguments are complete, while the model is still generating the rest.
     """
 
     BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -49,6 +236,13 @@ class CaptainClient:
         api_key: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 1024,
+        max_concurrent_per_provider: int = 4,
+        requests_per_minute: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        base_url: Optional[str] = None,
+        telemetry: Optional[LLMTelemetry] = None,
     ):
         """
         Initialize the captain client.
@@ -58,6 +252,14 @@ class CaptainClient:
             api_key: OpenRouter API key (defaults to OPENROUTER_API_KEY env var)
             temperature: Sampling temperature
             max_tokens: Maximum response tokens
+            max_concurrent_per_provider: In-flight async requests allowed per
+                provider (the model ID prefix, e.g. "anthropic")
+            requests_per_minute: Async rate limit per model (None = unlimited)
+            retry_policy: Backoff for transient async failures
+            hedge_policy: Hedged duplicate requests for slow async calls
+            cache: Response cache (no API key needed in replay mode)
+            base_url: Override BASE_URL, e.g. a local mock provider
+            telemetry: Per-call latency, token and error records
         """
         # Strip openrouter/ prefix if present
         if model.startswith("openrouter/"):
@@ -67,19 +269,95 @@ class CaptainClient:
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
+        if base_url:
+            self.BASE_URL = base_url
 
-        if not self.api_key:
+        replaying = cache is not None and cache.mode == CacheMode.REPLAY
+        if not self.api_key and not replaying:
             raise ValueError(
                 "OpenRouter API key required. Set OPENROUTER_API_KEY env var or pass api_key."
             )
 
         self._client = httpx.Client(timeout=60.0)
+        self.usage = UsageStats()
+        self.telemetry = telemetry
+
+        self.pool = AsyncRequestPool(
+            max_concurrent_per_provider=max_concurrent_per_provider,
+            requests_per_minute=requests_per_minute,
+            retry=retry_policy,
+            hedge=hedge_policy,
+        )
+
+    provider_of = staticmethod(AsyncRequestPool.provider_of)
+
+    def _resolve_model(self, model: Optional[str]) -> str:
+        """Use provided model or fall back to client's default, without openrouter/ prefix."""
+        request_model = model or self.model
+        if request_model.startswith("openrouter/"):
+            request_model = request_model[len("openrouter/"):]
+        return request_model
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/ai-commanders",
+            "X-Title": "AI Commanders",
+        }
+
+    def _tools_payload(
+        self,
+        messages: List[Dict[str, str]],
+        tools: List[Dict[str, Any]],
+        model: str,
+    ) -> Dict[str, Any]:
+        return {
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "tool_choice": "auto",
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+
+    def _completion_payload(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+
+    @staticmethod
+    def _parse_tool_calls(data: Dict[str, Any]) -> List[ToolCall]:
+        """Extract tool calls from a chat completion response."""
+        message = data["choices"][0]["message"]
+        tool_calls = []
+
+        if "tool_calls" in message and message["tool_calls"]:
+            for tc in message["tool_calls"]:
+                tool_calls.append(_parse_tool_call(tc))
+
+        return tool_calls
+
+    def _parse_completion(self, data: Dict[str, Any]) -> LLMResponse:
+        message = data["choices"][0]["message"]
+        return LLMResponse(
+            content=message.get("content", ""),
+            tool_calls=[],
+            model=data.get("model", self.model),
+            usage=data.get("usage", {}),
+            raw_response=data,
+        )
 
     def decide_with_tools(
         self,
         messages: List[Dict[str, str]],
         tools: List[Dict[str, Any]],
         model: Optional[str] = None,
+        on_tool_call: Optional[Callable[[ToolCall], None]] = None,
     ) -> List[ToolCall]:
         """
         Make a decision using tool/function calling.
@@ -88,60 +366,274 @@ class CaptainClient:
             messages: Conversation messages (system, user, assistant)
             tools: Available tools in OpenAI function calling format
             model: Optional model to use (defaults to client's model)
+            on_tool_call: If given, stream the response and call this with
+                each tool call as soon as it is complete
 
         Returns:
             List of ToolCall objects representing the LLM's decisions
+            (when streaming, those completed before any error)
         """
-        # Use provided model or fall back to client's default
-        request_model = model or self.model
-        # Strip openrouter/ prefix if present
-        if request_model.startswith("openrouter/"):
-            request_model = request_model[len("openrouter/"):]
+        request_model = self._resolve_model(model)
+        payload = self._tools_payload(messages, tools, request_model)
+        if on_tool_call is not None:
+            return self._stream_tool_calls(payload, on_tool_call)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/ai-commanders",
-            "X-Title": "AI Commanders",
-        }
+        try:
+            data = self._post(payload)
+            return self._parse_tool_calls(data)
 
-        payload = {
-            "model": request_model,
-            "messages": messages,
-            "tools": tools,
-            "tool_choice": "auto",
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-        }
+        except CacheMissError:
+            raise
+        except httpx.HTTPStatusError as e:
+            print(f"[LLM ERROR] HTTP {e.response.status_code}: {e.response.text}")
+            return []
+        except Exception as e:
+            print(f"[LLM ERROR] {e}")
+            return []
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+    ) -> LLMResponse:
+        """
+        Make a simple completion without tools.
+
+        Args:
+            messages: Conversation messages
 
+        Returns:
+            LLMResponse with content
+        """
+        return self._parse_completion(self._post(self._completion_payload(messages)))
+
+    def _cached(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached response for a request, if a cache is set and has one."""
+        if self.cache is None:
+            return None
+        cached = self.cache.lookup(payload)
+        if cached is not None:
+            self.usage.cache_hits += 1
+            if self.telemetry is not None:
+                self.telemetry.record_call(payload.get("model", self.model), 0.0, cache_hit=True)
+        return cached
+
+    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a chat completion, going through the response cache if set."""
+        cached = self._cached(payload)
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
         try:
             response = self._client.post(
                 self.BASE_URL,
-                headers=headers,
+                headers=self._headers(),
                 json=payload,
             )
             response.raise_for_status()
             data = response.json()
+        except Exception as e:
+            self._record_failure(payload, start, e)
+            raise
+        self._record_usage(payload, data, time.perf_counter() - start)
+
+        if self.cache is not None:
+            self.cache.store(payload, data)
+        return data
+
+    def _record_usage(
+        self,
+        payload: Dict[str, Any],
+        data: Dict[str, Any],
+        latency_s: float,
+        retries: int = 0,
+        first_tool_call_s: Optional[float] = None,
+    ) -> None:
+        """
+        Add a live response's token usage and latency to the totals.
+
+        Args:
+            payload: Request body.
+            data: Response body.
+            latency_s: Request latency.
+            retries: Retried attempts before the successful one.
+            first_tool_call_s: Time to the first tool call (streamed responses).
+        """
+        usage = data.get("usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+        self.usage.calls += 1
+        self.usage.prompt_tokens += prompt_tokens
+        self.usage.completion_tokens += completion_tokens
+        self.usage.latency_s += latency_s
+        if first_tool_call_s is not None:
+            self.usage.streamed_calls += 1
+            self.usage.first_tool_call_s += first_tool_call_s
+
+        if self.telemetry is not None:
+            self.telemetry.record_call(
+                payload.get("model", self.model),
+                latency_s,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                streamed=first_tool_call_s is not None,
+                first_tool_call_s=first_tool_call_s,
+                retries=retries,
+            )
+
+    def _record_failure(
+        self,
+        payload: Dict[str, Any],
+        start: float,
+        error: Exception,
+        retries: int = 0,
+    ) -> None:
+        """Record a failed live call in the telemetry."""
+        if self.telemetry is None:
+            return
+        if isinstance(error, httpx.HTTPStatusError):
+            description = f"HTTP {error.response.status_code}"
+        else:
+            description = f"{type(error).__name__}: {error}"
+        self.telemetry.record_call(
+            payload.get("model", self.model),
+            time.perf_counter() - start,
+            retries=retries,
+            error=description,
+        )
 
-            # Extract tool calls from response
-            message = data["choices"][0]["message"]
-            tool_calls = []
+    # -------------------------------------------------------------------------
+    # Streaming
+    # -------------------------------------------------------------------------
 
-            if "tool_calls" in message and message["tool_calls"]:
-                for tc in message["tool_calls"]:
-                    try:
-                        args = json.loads(tc["function"]["arguments"])
-                    except json.JSONDecodeError:
-                        args = {}
+    @staticmethod
+    def _stream_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {**payload, "stream": True, "stream_options": {"include_usage": True}}
 
-                    tool_calls.append(ToolCall(
-                        id=tc["id"],
-                        name=tc["function"]["name"],
-                        arguments=args,
-                    ))
+    @staticmethod
+    def _replay_tool_calls(
+        data: Dict[str, Any],
+        on_tool_call: Callable[[ToolCall], None],
+    ) -> List[ToolCall]:
+        """Hand a complete (cached) response's tool calls to on_tool_call."""
+        tool_calls = CaptainClient._parse_tool_calls(data)
+        for tc in tool_calls:
+            on_tool_call(tc)
+        return tool_calls
 
-            return tool_calls
+    def _finish_stream(
+        self,
+        payload: Dict[str, Any],
+        stream: ToolCallStream,
+        start: float,
+        retries: int = 0,
+    ) -> None:
+        """Record usage of a completed stream and cache the assembled response."""
+        latency_s = time.perf_counter() - start
+        data = stream.response()
+        first = stream.first_tool_call_at
+        first_tool_call_s = latency_s if first is None else first - start
+        self._record_usage(payload, data, latency_s, retries, first_tool_call_s)
+
+        if self.cache is not None:
+            self.cache.store(payload, data)
+
+    def _stream_tool_calls(
+        self,
+        payload: Dict[str, Any],
+        on_tool_call: Callable[[ToolCall], None],
+    ) -> List[ToolCall]:
+        """Streaming body of decide_with_tools()."""
+        cached = self._cached(payload)
+        if cached is not None:
+            return self._replay_tool_calls(cached, on_tool_call)
 
+        stream = ToolCallStream(on_tool_call)
+        start = time.perf_counter()
+        try:
+            with self._client.stream(
+                "POST", self.BASE_URL, headers=self._headers(), json=self._stream_payload(payload)
+            ) as response:
+                if response.is_error:
+                    response.read()
+                    response.raise_for_status()
+                for line in response.iter_lines():
+                    stream.feed_line(line)
+            stream.finish()
+            self._finish_stream(payload, stream, start)
+        except httpx.HTTPStatusError as e:
+            self._record_failure(payload, start, e)
+            print(f"[LLM ERROR] HTTP {e.response.status_code}: {e.response.text}")
+        except Exception as e:
+            self._record_failure(payload, start, e)
+            print(f"[LLM ERROR] {e}")
+
+        if stream.callback_error is not None:
+            raise stream.callback_error
+        return stream.tool_calls
+
+    # -------------------------------------------------------------------------
+    # Async API
+    # -------------------------------------------------------------------------
+
+    async def _post_async(self, model: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a chat completion through the response cache and request pool."""
+        cached = self._cached(payload)
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        retries = 0
+
+        def count_retry() -> None:
+            nonlocal retries
+            retries += 1
+
+        try:
+            data = await self.pool.post_json(
+                self.BASE_URL, self._headers(), payload, model, on_retry=count_retry
+            )
+        except Exception as e:
+            self._record_failure(payload, start, e, retries)
+            raise
+        self._record_usage(payload, data, time.perf_counter() - start, retries)
+
+        if self.cache is not None:
+            self.cache.store(payload, data)
+        return data
+
+    async def decide_with_tools_async(
+        self,
+        messages: List[Dict[str, str]],
+        tools: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        on_tool_call: Optional[Callable[[ToolCall], None]] = None,
+    ) -> List[ToolCall]:
+        """
+        Async version of decide_with_tools().
+
+        Args:
+            messages: Conversation messages (system, user, assistant)
+            tools: Available tools in OpenAI function calling format
+            model: Optional model to use (defaults to client's model)
+            on_tool_call: If given, stream the response and call this with
+                each tool call as soon as it is complete
+
+        Returns:
+            List of ToolCall objects representing the LLM's decisions
+            (when streaming, those completed before any error)
+        """
+        request_model = self._resolve_model(model)
+        payload = self._tools_payload(messages, tools, request_model)
+        if on_tool_call is not None:
+            return await self._stream_tool_calls_async(request_model, payload, on_tool_call)
+
+        try:
+            data = await self._post_async(request_model, payload)
+            return self._parse_tool_calls(data)
+
+        except CacheMissError:
+            raise
         except httpx.HTTPStatusError as e:
             print(f"[LLM ERROR] HTTP {e.response.status_code}: {e.response.text}")
             return []
@@ -149,12 +641,49 @@ class CaptainClient:
             print(f"[LLM ERROR] {e}")
             return []
 
-    def complete(
+    async def _stream_tool_calls_async(
+        self,
+        model: str,
+        payload: Dict[str, Any],
+        on_tool_call: Callable[[ToolCall], None],
+    ) -> List[ToolCall]:
+        """Streaming body of decide_with_tools_async(), through the request pool."""
+        cached = self._cached(payload)
+        if cached is not None:
+            return self._replay_tool_calls(cached, on_tool_call)
+
+        stream = ToolCallStream(on_tool_call)
+        start = time.perf_counter()
+        retries = 0
+
+        def count_retry() -> None:
+            nonlocal retries
+            retries += 1
+
+        try:
+            await self.pool.post_stream(
+                self.BASE_URL, self._headers(), self._stream_payload(payload), model,
+                stream.feed_line, on_retry=count_retry,
+            )
+            stream.finish()
+            self._finish_stream(payload, stream, start, retries)
+        except httpx.HTTPStatusError as e:
+            self._record_failure(payload, start, e, retries)
+            print(f"[LLM ERROR] HTTP {e.response.status_code}: {e.response.text}")
+        except Exception as e:
+            self._record_failure(payload, start, e, retries)
+            print(f"[LLM ERROR] {e}")
+
+        if stream.callback_error is not None:
+            raise stream.callback_error
+        return stream.tool_calls
+
+    async def complete_async(
         self,
         messages: List[Dict[str, str]],
     ) -> LLMResponse:
         """
-        Make a simple completion without tools.
+        Async version of complete().
 
         Args:
             messages: Conversation messages
@@ -162,34 +691,9 @@ class CaptainClient:
         Returns:
             LLMResponse with content
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/ai-commanders",
-            "X-Title": "AI Commanders",
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-        }
+        data = await self._post_async(self.model, self._completion_payload(messages))
+        return self._parse_completion(data)
 
-        response = self._client.post(
-            self.BASE_URL,
-            headers=headers,
-            json=payload,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        message = data["choices"][0]["message"]
-
-        return LLMResponse(
-            content=message.get("content", ""),
-            tool_calls=[],
-            model=data.get("model", self.model),
-            usage=data.get("usage", {}),
-            raw_response=data,
-        )
+    async def aclose(self) -> None:
+        """Close the async client (it is recreated on next async use)."""
+        await self.pool.aclose()
@@ -75,6 +75,8 @@ class BattleFleetConfig:
     unlimited_mode: bool = False
     record_battle: bool = True
     record_sim_trace: bool = False
+    recording_format: str = "json"  # "json", "columnar" or "stream"
+    trajectory_error_m: Optional[float] = None  # Keyframe + delta sim trace (JSON)
     personality_selection: bool = True  # Let models choose personalities
 
     @classmethod
@@ -116,6 +118,8 @@ class BattleFleetConfig:
             unlimited_mode=data.get("unlimited_mode", False),
             record_battle=data.get("record_battle", True),
             record_sim_trace=data.get("record_sim_trace", False),
+            recording_format=data.get("recording_format", "json"),
+            trajectory_error_m=data.get("trajectory_error_m"),
             personality_selection=data.get("personality_selection", True),
         )
 
@@ -0,0 +1,247 @@
+"""
+MCP command validation and batching.
+
+Commands arriving over the HTTP API or the WebSocket stream are checked
+against a schema compiled once per process (command types, required ship
+IDs, parameter types and allowed enum values), so malformed commands are
+rejected when they are submitted instead of failing when the checkpoint
+applies them. Valid commands are queued per faction in bulk.
+
+At the checkpoint the runner applies a faction's commands as one batch.
+resolve_command_conflicts() settles conflicting orders once, before
+anything touches the simulation:
+
+- Maneuver, primary target and radiator orders: the last one per ship wins
+- Weapons orders: merged per ship (later modes override earlier ones)
+- Torpedo launches: all kept
+
+and orders them by phase (targets before weapons orders, which fire at the
+ship's primary target; then maneuvers, radiators and launches).
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .mcp_state import MCPCommand, MCPCommandType
+
+
+class CommandValidationError(ValueError):
+    """A submitted command does not match the command schema."""
+
+
+@dataclass(frozen=True)
+class ParamSpec:
+    """
+    Schema of one command parameter.
+
+    Attributes:
+        types: Accepted value types (None, or leaving the parameter out, is
+            always accepted; the simulation then uses its default).
+        choices: Accepted values (enum names), if restricted.
+        minimum: Smallest accepted number.
+        maximum: Largest accepted number.
+    """
+    types: Tuple[type, ...]
+    choices: Optional[FrozenSet[str]] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """
+    Schema of one command type.
+
+    Attributes:
+        command_type: Command type.
+        needs_ship: Command must name a ship.
+        params: Known parameters (unknown ones are passed through).
+    """
+    command_type: MCPCommandType
+    needs_ship: bool
+    params: Tuple[Tuple[str, ParamSpec], ...] = ()
+
+
+_NUMBER = (int, float)
+
+# Commands applied to the simulation, in phase order
+SHIP_COMMAND_PHASES = (
+    MCPCommandType.SET_PRIMARY_TARGET,
+    MCPCommandType.SET_WEAPONS_ORDER,
+    MCPCommandType.SET_MANEUVER,
+    MCPCommandType.SET_RADIATORS,
+    MCPCommandType.LAUNCH_TORPEDO,
+)
+
+# Ship commands where only the last one per ship counts
+LAST_WINS = frozenset({
+    MCPCommandType.SET_PRIMARY_TARGET,
+    MCPCommandType.SET_MANEUVER,
+    MCPCommandType.SET_RADIATORS,
+})
+
+
+@functools.lru_cache(maxsize=None)
+def command_schema() -> Dict[str, CommandSpec]:
+    """Compiled command schema, keyed by command type value."""
+    from ..simulation import ManeuverType
+    from ..firecontrol import WeaponsCommand
+
+    maneuvers = frozenset(m.name for m in ManeuverType)
+    weapons_modes = frozenset(c.name for c in WeaponsCommand)
+    target = ParamSpec((str,))
+
+    specs = [
+        CommandSpec(MCPCommandType.SET_MANEUVER, True, (
+            ("maneuver_type", ParamSpec((str,), maneuvers)),
+            ("throttle", ParamSpec(_NUMBER, minimum=0.0, maximum=1.0)),
+            ("target_id", target),
+            ("heading_direction", ParamSpec((dict,))),
+        )),
+        CommandSpec(MCPCommandType.SET_WEAPONS_ORDER, True, (
+            ("spinal_mode", ParamSpec((str,), weapons_modes)),
+            ("turret_mode", ParamSpec((str,), weapons_modes)),
+            ("pd_mode", ParamSpec((str,))),
+        )),
+        CommandSpec(MCPCommandType.SET_PRIMARY_TARGET, True, (
+            ("target_id", target),
+        )),
+        CommandSpec(MCPCommandType.LAUNCH_TORPEDO, True, (("target_id", target),)),
+        CommandSpec(MCPCommandType.SET_RADIATORS, True, (("extend", ParamSpec((bool,))),)),
+        CommandSpec(MCPCommandType.SEND_MESSAGE, False, (
+            ("content", ParamSpec((str,))),
+            ("recipient", ParamSpec((str,))),
+        )),
+        CommandSpec(MCPCommandType.PROPOSE_DRAW, False, (("accept", ParamSpec((bool,))),)),
+        CommandSpec(MCPCommandType.SURRENDER, False),
+        CommandSpec(MCPCommandType.READY, False),
+    ]
+    return {spec.command_type.value: spec for spec in specs}
+
+
+def _check_param(name: str, value: Any, spec: ParamSpec) -> None:
+    if value is None:
+        return
+    # bool is an int, but never a valid number here
+    if not isinstance(value, spec.types) or (isinstance(value, bool) and bool not in spec.types):
+        expected = "/".join(t.__name__ for t in spec.types)
+        raise CommandValidationError(f"Parameter {name} must be {expected}, got {type(value).__name__}")
+    if spec.choices is not None and value not in spec.choices:
+        raise CommandValidationError(f"Invalid {name}: {value}")
+    if spec.minimum is not None and value < spec.minimum:
+        raise CommandValidationError(f"Parameter {name} must be >= {spec.minimum}")
+    if spec.maximum is not None and value > spec.maximum:
+        raise CommandValidationError(f"Parameter {name} must be <= {spec.maximum}")
+
+
+def parse_command(data: Dict[str, Any]) -> MCPCommand:
+    """
+    Validate one submitted command.
+
+    Args:
+        data: Command as sent by MCP clients (command_type, ship_id,
+            parameters, timestamp)
+
+    Returns:
+        The command
+
+    Raises:
+        CommandValidationError: If the command does not match the schema
+    """
+    if not isinstance(data, dict):
+        raise CommandValidationError("Command must be an object")
+
+    command_type = data.get("command_type", "")
+    spec = command_schema().get(command_type) if isinstance(command_type, str) else None
+    if spec is None:
+        raise CommandValidationError(f"{command_type!r} is not a valid MCPCommandType")
+
+    ship_id = data.get("ship_id")
+    if spec.needs_ship and not isinstance(ship_id, str):
+        raise CommandValidationError(f"{command_type} needs a ship_id")
+
+    parameters = data.get("parameters", {})
+    if parameters is None:
+        parameters = {}
+    if not isinstance(parameters, dict):
+        raise CommandValidationError("parameters must be an object")
+    for name, param_spec in spec.params:
+        _check_param(name, parameters.get(name), param_spec)
+
+    timestamp = data.get("timestamp", 0.0)
+    if not isinstance(timestamp, _NUMBER) or isinstance(timestamp, bool):
+        raise CommandValidationError("timestamp must be a number")
+
+    return MCPCommand(
+        command_type=spec.command_type,
+        ship_id=ship_id,
+        parameters=parameters,
+        timestamp=timestamp,
+    )
+
+
+def parse_commands(
+    commands_data: List[Dict[str, Any]],
+) -> Tuple[List[MCPCommand], List[Dict[str, Any]]]:
+    """
+    Validate a batch of submitted commands.
+
+    Args:
+        commands_data: Commands as sent by MCP clients
+
+    Returns:
+        (valid commands, errors); each error names the command type and
+        the problem
+    """
+    commands = []
+    errors = []
+    for data in commands_data:
+        try:
+            commands.append(parse_command(data))
+        except CommandValidationError as e:
+            errors.append({
+                "command_type": data.get("command_type") if isinstance(data, dict) else None,
+                "error": str(e),
+            })
+    return commands, errors
+
+
+def resolve_command_conflicts(commands: List[MCPCommand]) -> Tuple[List[MCPCommand], int]:
+    """
+    Settle conflicting ship orders of one batch.
+
+    Args:
+        commands: A faction's commands for one checkpoint, in arrival order
+
+    Returns:
+        (ship commands to apply, in phase order; number of commands
+        superseded by later ones). Non-ship commands (messages, draw,
+        surrender, ready) are not included.
+    """
+    phases: Dict[MCPCommandType, Dict[Any, MCPCommand]] = {t: {} for t in SHIP_COMMAND_PHASES}
+    superseded = 0
+
+    for index, cmd in enumerate(commands):
+        orders = phases.get(cmd.command_type)
+        if orders is None:
+            continue
+        if cmd.command_type is MCPCommandType.LAUNCH_TORPEDO:
+            orders[index] = cmd
+            continue
+
+        previous = orders.get(cmd.ship_id)
+        if previous is None:
+            orders[cmd.ship_id] = cmd
+            continue
+        superseded += 1
+        if cmd.command_type in LAST_WINS:
+            # Keep the ship's slot in the phase, take the later order
+            orders[cmd.ship_id] = cmd
+        else:
+            parameters = dict(previous.parameters)
+            parameters.update({k: v for k, v in cmd.parameters.items() if v is not None})
+            orders[cmd.ship_id] = MCPCommand(cmd.command_type, cmd.ship_id, parameters, cmd.timestamp)
+
+    batch = [cmd for command_type in SHIP_COMMAND_PHASES for cmd in phases[command_type].values()]
+    return batch, superseded
@@ -7,16 +7,20 @@ bypassing AI captains entirely.
 """
 
 import asyncio
+import time
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 
 from .mcp_state import (
+    DEFAULT_BATTLE_ID,
     get_mcp_state,
     MCPBattleState,
     MCPCommand,
     MCPCommandType,
 )
 from .mcp_chat import AdmiralChat, ChatMessage
+from .mcp_commands import resolve_command_conflicts
+from .tactical_picture import MunitionThreat, TacticalPicture
 from .admiral import (
     AdmiralSnapshot,
     FriendlyShipSnapshot,
@@ -34,6 +38,7 @@ class MCPControllerConfig:
     faction: str
     name: str = "MCP Commander"
     command_timeout: float = 60.0  # Seconds to wait for MCP client
+    battle_id: str = DEFAULT_BATTLE_ID  # Battle on a multi-battle MCP server
 
 
 class MCPController:
@@ -63,8 +68,8 @@ class MCPController:
         self.fleet_data = fleet_data
         self.chat = chat or AdmiralChat()
 
-        # Get shared state singleton
-        self._state = get_mcp_state()
+        # Get this battle's store from the shared state singleton
+        self._state = get_mcp_state().get_or_create_battle(config.battle_id)
         self._state.register_faction(self.faction)
 
         # State tracking
@@ -80,6 +85,17 @@ class MCPController:
         self._ship_id_to_name: Dict[str, str] = {}
         self._ship_name_to_id: Dict[str, str] = {}
 
+        # Checkpoint-wide geometry and threats, shared by the battle runner
+        self.tactical_picture: Optional[TacticalPicture] = None
+
+        # Per-ship data that does not change during a battle, by ship ID
+        self._ship_statics: Dict[str, Dict[str, Any]] = {}
+        # Last checkpoint's per-ship sections, by (ship ID, section)
+        self._previous_sections: Dict[Tuple[str, str], Any] = {}
+        # Armor, module and hull sections with the damage_taken_gj they were
+        # built at, by ship ID
+        self._damage_sections: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
     @property
     def name(self) -> str:
         """Get controller name."""
@@ -98,7 +114,13 @@ class MCPController:
         """
         Build battle state for MCP consumption.
 
-        Converts simulation state to MCPBattleState format.
+        Converts simulation state to MCPBattleState format. Per-ship data
+        that cannot change during a battle (names, class specs, weapon
+        loadout) is looked up once per battle. Armor, module and hull
+        sections are rebuilt only for ships that took damage since the
+        previous checkpoint; other per-ship sections equal to the previous
+        checkpoint's (weapons, stats) are reused as the same objects. Delta
+        encoding skips reused objects without comparing them.
 
         Args:
             simulation: Combat simulation instance
@@ -107,6 +129,12 @@ class MCPController:
         Returns:
             MCPBattleState ready for MCP client
         """
+        picture = TacticalPicture.current(self.tactical_picture, simulation)
+
+        # Enemy ships targeting each ship, found once per checkpoint
+        targeted_by: Dict[str, List[str]] = {}
+        enemies_listed = False
+
         # Build friendly ship data
         friendly_ships = []
         for captain in captains:
@@ -115,7 +143,15 @@ class MCPController:
                 continue
             ship = simulation.get_ship(ship_id)
             if ship and not ship.is_destroyed:
-                ship_data = self._build_friendly_ship_data(ship, captain, simulation)
+                if not enemies_listed:
+                    for enemy in simulation.get_enemy_ships(ship.ship_id):
+                        target_id = getattr(enemy, 'primary_target_id', None)
+                        if target_id:
+                            targeted_by.setdefault(target_id, []).append(self._ship_name(enemy))
+                    enemies_listed = True
+                ship_data = self._build_friendly_ship_data(
+                    ship, captain, simulation, picture, targeted_by.get(ship.ship_id, []),
+                )
                 friendly_ships.append(ship_data)
 
         # Build enemy ship data
@@ -123,16 +159,17 @@ class MCPController:
         if captains:
             first_ship_id = getattr(captains[0], 'ship_id', None)
             if first_ship_id:
+                friendly_ids = [f["ship_id"] for f in friendly_ships]
                 for enemy in simulation.get_enemy_ships(first_ship_id):
                     if not enemy.is_destroyed:
-                        enemy_data = self._build_enemy_ship_data(enemy, friendly_ships, simulation)
+                        enemy_data = self._build_enemy_ship_data(enemy, friendly_ids, picture)
                         enemy_ships.append(enemy_data)
 
         # Build projectile data
-        projectiles = self._build_projectile_data(simulation)
+        projectiles = self._build_projectile_data(simulation, picture)
 
         # Build torpedo data
-        torpedoes = self._build_torpedo_data(simulation, friendly_ships)
+        torpedoes = self._build_torpedo_data(simulation, friendly_ships, picture)
 
         # Get chat history
         chat_history = self.chat.get_recent_history(self.faction)
@@ -159,16 +196,110 @@ class MCPController:
             enemy_proposed_draw=False,  # TODO: Get from enemy controller
         )
 
+    # -------------------------------------------------------------------------
+    # Static per-ship data (built once per battle)
+    # -------------------------------------------------------------------------
+
+    def _ship_name(self, ship: Any) -> str:
+        """Display name of a ship (cached)."""
+        statics = self._ship_statics.get(ship.ship_id)
+        if statics is not None:
+            return statics["ship_name"]
+        return ship.ship_name if hasattr(ship, 'ship_name') else ship.ship_id
+
+    def _friendly_statics(self, ship: Any, captain: 'LLMCaptain') -> Dict[str, Any]:
+        """Name, class specs and weapon loadout of a friendly ship."""
+        statics = self._ship_statics.get(ship.ship_id)
+        if statics is not None:
+            return statics
+
+        # Get ship capabilities from fleet data
+        ship_spec = self.fleet_data.get("ships", {}).get(captain.config.ship_type, {})
+        propulsion = ship_spec.get("propulsion", {})
+
+        # Heatsink capacity
+        heatsink_capacity = 0
+        if hasattr(ship, 'heatsink_capacity_gj'):
+            heatsink_capacity = ship.heatsink_capacity_gj
+        elif hasattr(ship, 'thermal') and ship.thermal:
+            heatsink_capacity = ship.thermal.heatsink_capacity_gj if hasattr(ship.thermal, 'heatsink_capacity_gj') else 0
+
+        # Turret or spinal mount per weapon slot
+        turreted = {}
+        if hasattr(ship, 'weapons'):
+            for slot, weapon in ship.weapons.items():
+                turreted[slot] = weapon.weapon.is_turreted if hasattr(weapon, 'weapon') else False
+
+        statics = self._ship_statics[ship.ship_id] = {
+            "ship_name": ship.ship_name if hasattr(ship, 'ship_name') else ship.ship_id,
+            "ship_type": captain.config.ship_type,
+            "captain_name": captain.config.name,
+            "heatsink_capacity_gj": heatsink_capacity,
+            "max_acceleration_g": propulsion.get("combat_acceleration_g", 2.0),
+            "max_delta_v": propulsion.get("delta_v_kps", 500),
+            "turreted": turreted,
+        }
+        return statics
+
+    def _enemy_statics(self, ship: Any) -> Dict[str, Any]:
+        """Name and class specs of an enemy ship."""
+        statics = self._ship_statics.get(ship.ship_id)
+        if statics is not None:
+            return statics
+
+        # Get enemy ship capabilities from fleet data (if available)
+        ship_type = ship.ship_type if hasattr(ship, 'ship_type') else "unknown"
+        ship_spec = self.fleet_data.get("ships", {}).get(ship_type, {})
+        propulsion = ship_spec.get("propulsion", {})
+
+        statics = self._ship_statics[ship.ship_id] = {
+            "ship_name": ship.ship_name if hasattr(ship, 'ship_name') else ship.ship_id,
+            "ship_type": ship_type,
+            "ship_class": ship_type.title() if ship_type != "unknown" else "Unknown",
+            "max_acceleration_g": propulsion.get("combat_acceleration_g"),
+            "max_delta_v": propulsion.get("delta_v_kps"),
+        }
+        return statics
+
+    def _damage_state(self, ship: Any, build: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        A ship's damage-dependent sections, rebuilt only after it took damage.
+
+        Every hit adds to the ship's damage_taken_gj before damaging its
+        armor or modules, so an unchanged total means unchanged sections.
+        """
+        cached = self._damage_sections.get(ship.ship_id)
+        damage_taken = getattr(ship, 'damage_taken_gj', None)
+        if cached is not None and damage_taken is not None and cached[0] == damage_taken:
+            return cached[1]
+        sections = build(ship)
+        self._damage_sections[ship.ship_id] = (damage_taken, sections)
+        return sections
+
+    def _reuse(self, ship_id: str, section: str, value: Any) -> Any:
+        """The previous checkpoint's value of a ship section if equal, else value."""
+        key = (ship_id, section)
+        previous = self._previous_sections.get(key)
+        if previous is not None and previous == value:
+            return previous
+        self._previous_sections[key] = value
+        return value
+
+    # -------------------------------------------------------------------------
+    # Dynamic per-ship data (built every checkpoint)
+    # -------------------------------------------------------------------------
+
     def _build_friendly_ship_data(
         self,
         ship: Any,
         captain: 'LLMCaptain',
         simulation: Any,
+        picture: TacticalPicture,
+        targeted_by: List[str],
     ) -> Dict[str, Any]:
         """Build detailed data for a friendly ship (same info captains see)."""
-        # Get ship capabilities from fleet data
-        ship_spec = self.fleet_data.get("ships", {}).get(captain.config.ship_type, {})
-        propulsion = ship_spec.get("propulsion", {})
+        statics = self._friendly_statics(ship, captain)
+        ship_id = ship.ship_id
 
         # Position in km
         pos = ship.position
@@ -177,7 +308,7 @@ class MCPController:
         # Velocity
         vel = ship.velocity
         vel_vector = {"x": vel.x / 1000, "y": vel.y / 1000, "z": vel.z / 1000}
-        vel_kps = vel.magnitude / 1000
+        vel_kps = picture.ship_speed_kps(ship_id)
 
         # Ship forward vector (for firing arc calculations)
         forward = {"x": ship.forward.x, "y": ship.forward.y, "z": ship.forward.z}
@@ -188,12 +319,13 @@ class MCPController:
         weapons_destroyed = []
         weapons_detailed = {}
         if hasattr(ship, 'weapons'):
+            turreted = statics["turreted"]
             for slot, weapon in ship.weapons.items():
                 if slot.startswith("pd_"):
                     continue
                 weapon_info = {
                     "slot": slot,
-                    "is_turreted": weapon.weapon.is_turreted if hasattr(weapon, 'weapon') else False,
+                    "is_turreted": turreted.get(slot, False),
                     "operational": weapon.is_operational if hasattr(weapon, 'is_operational') else True,
                     "ready": weapon.cooldown_remaining <= 0,
                     "cooldown_remaining": weapon.cooldown_remaining,
@@ -210,33 +342,7 @@ class MCPController:
                         "cooldown_remaining": weapon.cooldown_remaining,
                     })
 
-        # Armor status per section (like captains see)
-        from ..combat import HitLocation
-        armor_status = {
-            "nose": {"thickness_cm": 0, "damage_percent": 0},
-            "lateral": {"thickness_cm": 0, "damage_percent": 0},
-            "tail": {"thickness_cm": 0, "damage_percent": 0},
-        }
-        if hasattr(ship, 'armor') and ship.armor:
-            for section_name, location in [("nose", HitLocation.NOSE), ("lateral", HitLocation.LATERAL), ("tail", HitLocation.TAIL)]:
-                section = ship.armor.get_section(location)
-                if section:
-                    armor_status[section_name] = {
-                        "thickness_cm": section.thickness_cm,
-                        "damage_percent": section.damage_percent,
-                    }
-
-        # Module damage status (only damaged/destroyed modules, like captains see)
-        damaged_modules = {}
-        if hasattr(ship, 'module_layout') and ship.module_layout:
-            for module in ship.module_layout.get_all_modules():
-                if module.health_percent < 100:
-                    damaged_modules[module.name] = {
-                        "health_percent": module.health_percent,
-                        "operational": module.is_functional,
-                        "destroyed": module.is_destroyed,
-                        "type": module.module_type.value,
-                    }
+        damage = self._damage_state(ship, self._build_friendly_damage)
 
         # Combat statistics (like captains see)
         combat_stats = {
@@ -246,139 +352,79 @@ class MCPController:
             "damage_taken_gj": ship.damage_taken_gj if hasattr(ship, 'damage_taken_gj') else 0,
         }
 
-        # Get targeting info
-        targeted_by = []
-        for enemy in simulation.get_enemy_ships(ship.ship_id):
-            if hasattr(enemy, 'primary_target_id') and enemy.primary_target_id == ship.ship_id:
-                targeted_by.append(enemy.ship_name if hasattr(enemy, 'ship_name') else enemy.ship_id)
-
         # Current maneuver
         maneuver_str = "MAINTAIN"
         if hasattr(ship, 'current_maneuver') and ship.current_maneuver:
             maneuver_str = ship.current_maneuver.maneuver_type.name
 
-        # Heatsink capacity
-        heatsink_capacity = 0
-        if hasattr(ship, 'heatsink_capacity_gj'):
-            heatsink_capacity = ship.heatsink_capacity_gj
-        elif hasattr(ship, 'thermal') and ship.thermal:
-            heatsink_capacity = ship.thermal.heatsink_capacity_gj if hasattr(ship.thermal, 'heatsink_capacity_gj') else 0
-
         return {
-            "ship_id": ship.ship_id,
-            "ship_name": ship.ship_name if hasattr(ship, 'ship_name') else ship.ship_id,
-            "ship_type": captain.config.ship_type,
-            "captain_name": captain.config.name,
+            "ship_id": ship_id,
+            "ship_name": statics["ship_name"],
+            "ship_type": statics["ship_type"],
+            "captain_name": statics["captain_name"],
             "position_km": pos_km,
             "velocity_kps": vel_kps,
             "velocity_vector": vel_vector,
             "forward_vector": forward,
-            "hull_integrity": ship.hull_integrity,  # Already a percentage (0-100)
+            "hull_integrity": damage["hull_integrity"],
             "delta_v_remaining": ship.remaining_delta_v_kps,
             "heat_percent": ship.heat_percent if hasattr(ship, 'heat_percent') else 0,
-            "heatsink_capacity_gj": heatsink_capacity,
-            "max_acceleration_g": propulsion.get("combat_acceleration_g", 2.0),
-            "max_delta_v": propulsion.get("delta_v_kps", 500),
+            "heatsink_capacity_gj": statics["heatsink_capacity_gj"],
+            "max_acceleration_g": statics["max_acceleration_g"],
+            "max_delta_v": statics["max_delta_v"],
             # Armor (per section)
-            "armor": armor_status,
+            "armor": damage["armor"],
             # Weapons (detailed)
-            "weapons": weapons_detailed,
-            "weapons_ready": weapons_ready,
-            "weapons_cooling": weapons_cooling,
-            "weapons_destroyed": weapons_destroyed,
+            "weapons": self._reuse(ship_id, "weapons", weapons_detailed),
+            "weapons_ready": self._reuse(ship_id, "weapons_ready", weapons_ready),
+            "weapons_cooling": self._reuse(ship_id, "weapons_cooling", weapons_cooling),
+            "weapons_destroyed": self._reuse(ship_id, "weapons_destroyed", weapons_destroyed),
             # Modules
-            "damaged_modules": damaged_modules,
+            "damaged_modules": damage["damaged_modules"],
             # Combat stats
-            "combat_stats": combat_stats,
+            "combat_stats": self._reuse(ship_id, "combat_stats", combat_stats),
             # Current state
             "current_maneuver": maneuver_str,
             "current_target": ship.primary_target_id if hasattr(ship, 'primary_target_id') else None,
             "radiators_extended": ship.radiators_extended if hasattr(ship, 'radiators_extended') else False,
-            "targeted_by": targeted_by,
+            "targeted_by": self._reuse(ship_id, "targeted_by", list(targeted_by)),
         }
 
     def _build_enemy_ship_data(
         self,
         ship: Any,
-        friendly_ships: List[Dict[str, Any]],
-        simulation: Any,
+        friendly_ids: List[str],
+        picture: TacticalPicture,
     ) -> Dict[str, Any]:
         """Build observable data for an enemy ship (same info captains see about enemies)."""
+        statics = self._enemy_statics(ship)
+        ship_id = ship.ship_id
+
         pos = ship.position
         pos_km = {"x": pos.x / 1000, "y": pos.y / 1000, "z": pos.z / 1000}
 
         vel = ship.velocity
         vel_vector = {"x": vel.x / 1000, "y": vel.y / 1000, "z": vel.z / 1000}
-        vel_kps = vel.magnitude / 1000
+        vel_kps = picture.ship_speed_kps(ship_id)
 
         # Find closest friendly and calculate relative info
         min_dist = float('inf')
         closing_rate = 0.0
-        closest_friendly_id = None
-        closest_friendly_forward = None
+        angle_deg = 0.0
         relative_position = {"x": 0, "y": 0, "z": 0}
         relative_velocity = {"x": 0, "y": 0, "z": 0}
 
-        for friendly in friendly_ships:
-            f_pos = friendly["position_km"]
-            dx = pos_km["x"] - f_pos["x"]
-            dy = pos_km["y"] - f_pos["y"]
-            dz = pos_km["z"] - f_pos["z"]
-            dist = (dx*dx + dy*dy + dz*dz) ** 0.5
-
-            if dist < min_dist:
-                min_dist = dist
-                closest_friendly_id = friendly["ship_id"]
-                closest_friendly_forward = friendly.get("forward_vector")
-                relative_position = {"x": dx, "y": dy, "z": dz}
-                f_vel = friendly["velocity_vector"]
-                dvx = vel_vector["x"] - f_vel["x"]
-                dvy = vel_vector["y"] - f_vel["y"]
-                dvz = vel_vector["z"] - f_vel["z"]
-                relative_velocity = {"x": dvx, "y": dvy, "z": dvz}
-                if dist > 0:
-                    closing_rate = -(dx*dvx + dy*dvy + dz*dvz) / dist
+        closest_id = picture.closest(ship_id, friendly_ids)
+        if closest_id:
+            # Seen from the closest friendly: angle is off that ship's nose
+            geometry = picture.pair(closest_id, ship_id)
+            min_dist = geometry.distance_km
+            closing_rate = geometry.closing_rate_kps
+            relative_position = geometry.relative_position_km
+            relative_velocity = geometry.relative_velocity_kps
+            angle_deg = geometry.angle_deg
 
-        # Hull integrity (actual - like captains see, already 0-100%)
-        hull_percent = ship.hull_integrity if hasattr(ship, 'hull_integrity') else 100
-
-        # Armor damage per section (actual - like captains see)
-        from ..combat import HitLocation
-        armor_damage = {
-            "nose_damage_pct": 0,
-            "lateral_damage_pct": 0,
-            "tail_damage_pct": 0,
-        }
-        if hasattr(ship, 'armor') and ship.armor:
-            nose = ship.armor.get_section(HitLocation.NOSE)
-            lateral = ship.armor.get_section(HitLocation.LATERAL)
-            tail = ship.armor.get_section(HitLocation.TAIL)
-            if nose:
-                armor_damage["nose_damage_pct"] = nose.damage_percent
-            if lateral:
-                armor_damage["lateral_damage_pct"] = lateral.damage_percent
-            if tail:
-                armor_damage["tail_damage_pct"] = tail.damage_percent
-
-        # Calculate angle from closest friendly's nose to this enemy
-        angle_deg = 0.0
-        if closest_friendly_forward and min_dist > 0:
-            # Normalize relative position
-            import math
-            rel_mag = math.sqrt(relative_position["x"]**2 + relative_position["y"]**2 + relative_position["z"]**2)
-            if rel_mag > 0:
-                rel_norm = {
-                    "x": relative_position["x"] / rel_mag,
-                    "y": relative_position["y"] / rel_mag,
-                    "z": relative_position["z"] / rel_mag,
-                }
-                # Dot product with forward vector
-                dot = (closest_friendly_forward["x"] * rel_norm["x"] +
-                       closest_friendly_forward["y"] * rel_norm["y"] +
-                       closest_friendly_forward["z"] * rel_norm["z"])
-                # Clamp to [-1, 1] to avoid math domain error
-                dot = max(-1.0, min(1.0, dot))
-                angle_deg = math.degrees(math.acos(dot))
+        damage = self._damage_state(ship, self._build_enemy_damage)
 
         # Estimate hit chance based on range (simplified - captains use more complex calculation)
         # This is a rough approximation based on typical weapon accuracy curves
@@ -397,25 +443,15 @@ class MCPController:
         }
 
         # Check if enemy has us targeted
-        has_friendly_targeted = False
-        targeting_friendly_id = None
-        if hasattr(ship, 'primary_target_id') and ship.primary_target_id:
-            for friendly in friendly_ships:
-                if ship.primary_target_id == friendly["ship_id"]:
-                    has_friendly_targeted = True
-                    targeting_friendly_id = friendly["ship_id"]
-                    break
-
-        # Get enemy ship capabilities from fleet data (if available)
-        ship_type = ship.ship_type if hasattr(ship, 'ship_type') else "unknown"
-        ship_spec = self.fleet_data.get("ships", {}).get(ship_type, {})
-        propulsion = ship_spec.get("propulsion", {})
+        target_id = getattr(ship, 'primary_target_id', None)
+        has_friendly_targeted = bool(target_id) and target_id in friendly_ids
+        targeting_friendly_id = target_id if has_friendly_targeted else None
 
         return {
-            "ship_id": ship.ship_id,
-            "ship_name": ship.ship_name if hasattr(ship, 'ship_name') else ship.ship_id,
-            "ship_type": ship_type,
-            "ship_class": ship_type.title() if ship_type != "unknown" else "Unknown",
+            "ship_id": ship_id,
+            "ship_name": statics["ship_name"],
+            "ship_type": statics["ship_type"],
+            "ship_class": statics["ship_class"],
             "position_km": pos_km,
             "velocity_kps": vel_kps,
             "velocity_vector": vel_vector,
@@ -429,96 +465,122 @@ class MCPController:
             "angle_deg": angle_deg,
             "hit_chance": hit_chance,
             # Condition (actual values - like captains see)
-            "hull_percent": hull_percent,
-            "armor": armor_damage,
+            "hull_percent": damage["hull_percent"],
+            "armor": damage["armor"],
             # Combat stats
-            "combat_stats": combat_stats,
+            "combat_stats": self._reuse(ship_id, "combat_stats", combat_stats),
             # Targeting
             "has_friendly_targeted": has_friendly_targeted,
             "targeting_friendly_id": targeting_friendly_id,
             # Capabilities (from ship class data)
-            "max_acceleration_g": propulsion.get("combat_acceleration_g"),
-            "max_delta_v": propulsion.get("delta_v_kps"),
+            "max_acceleration_g": statics["max_acceleration_g"],
+            "max_delta_v": statics["max_delta_v"],
+        }
+
+    def _build_friendly_damage(self, ship: Any) -> Dict[str, Any]:
+        """Armor, damaged modules and hull integrity of a friendly ship."""
+        # Armor status per section (like captains see)
+        from ..combat import HitLocation
+        armor_status = {
+            "nose": {"thickness_cm": 0, "damage_percent": 0},
+            "lateral": {"thickness_cm": 0, "damage_percent": 0},
+            "tail": {"thickness_cm": 0, "damage_percent": 0},
         }
+        if hasattr(ship, 'armor') and ship.armor:
+            for section_name, location in [("nose", HitLocation.NOSE), ("lateral", HitLocation.LATERAL), ("tail", HitLocation.TAIL)]:
+                section = ship.armor.get_section(location)
+                if section:
+                    armor_status[section_name] = {
+                        "thickness_cm": section.thickness_cm,
+                        "damage_percent": section.damage_percent,
+                    }
 
-    def _build_projectile_data(self, simulation: Any) -> List[Dict[str, Any]]:
+        # Module damage status (only damaged/destroyed modules, like captains see)
+        damaged_modules = {}
+        if hasattr(ship, 'module_layout') and ship.module_layout:
+            for module in ship.module_layout.get_all_modules():
+                if module.health_percent < 100:
+                    damaged_modules[module.name] = {
+                        "health_percent": module.health_percent,
+                        "operational": module.is_functional,
+                        "destroyed": module.is_destroyed,
+                        "type": module.module_type.value,
+                    }
+
+        return {
+            "armor": armor_status,
+            "damaged_modules": damaged_modules,
+            "hull_integrity": ship.hull_integrity,  # Already a percentage (0-100)
+        }
+
+    def _build_enemy_damage(self, ship: Any) -> Dict[str, Any]:
+        """Hull integrity and armor damage of an enemy ship."""
+        # Hull integrity (actual - like captains see, already 0-100%)
+        hull_percent = ship.hull_integrity if hasattr(ship, 'hull_integrity') else 100
+
+        # Armor damage per section (actual - like captains see)
+        from ..combat import HitLocation
+        armor_damage = {
+            "nose_damage_pct": 0,
+            "lateral_damage_pct": 0,
+            "tail_damage_pct": 0,
+        }
+        if hasattr(ship, 'armor') and ship.armor:
+            nose = ship.armor.get_section(HitLocation.NOSE)
+            lateral = ship.armor.get_section(HitLocation.LATERAL)
+            tail = ship.armor.get_section(HitLocation.TAIL)
+            if nose:
+                armor_damage["nose_damage_pct"] = nose.damage_percent
+            if lateral:
+                armor_damage["lateral_damage_pct"] = lateral.damage_percent
+            if tail:
+                armor_damage["tail_damage_pct"] = tail.damage_percent
+
+        return {"hull_percent": hull_percent, "armor": armor_damage}
+
+    def _source_name(self, simulation: Any, ship_id: str) -> str:
+        """Display name of a munition's source ship."""
+        statics = self._ship_statics.get(ship_id)
+        if statics is not None:
+            return statics["ship_name"]
+        source_ship = simulation.get_ship(ship_id)
+        if source_ship:
+            return getattr(source_ship, 'ship_name', ship_id)
+        return ship_id
+
+    def _build_projectile_data(self, simulation: Any, picture: TacticalPicture) -> List[Dict[str, Any]]:
         """Build data for projectiles in flight (enhanced like captains see)."""
-        import math
         projectiles = []
 
-        for proj in simulation.projectiles:
-            if hasattr(proj, 'target_ship_id') and proj.target_ship_id:
-                target = simulation.get_ship(proj.target_ship_id)
-                if target:
-                    # Position and distance
-                    proj_pos = proj.projectile.position if hasattr(proj.projectile, 'position') else proj.position
-                    proj_vel = proj.projectile.velocity if hasattr(proj.projectile, 'velocity') else proj.velocity
-
-                    dist_m = (target.position - proj_pos).magnitude
-                    dist_km = dist_m / 1000
-
-                    # Calculate ETA based on approach speed
-                    to_target = (target.position - proj_pos).normalized()
-                    approach_speed = proj_vel.dot(to_target) if hasattr(proj_vel, 'dot') else proj_vel.magnitude
-                    eta = dist_m / approach_speed if approach_speed > 0 else 999
-
-                    # Infer weapon type from speed (like captains do)
-                    proj_speed_kps = proj_vel.magnitude / 1000
-                    weapon_type = "Spinal" if proj_speed_kps > 8 else "Turret"
-
-                    # Get source ship name
-                    source_name = proj.source_ship_id
-                    source_ship = simulation.get_ship(proj.source_ship_id)
-                    if source_ship:
-                        source_name = getattr(source_ship, 'ship_name', proj.source_ship_id)
-
-                    # Calculate bearing to target (what direction it's coming from)
-                    bearing = self._calculate_bearing(target, proj_pos, proj_vel)
-
-                    # Damage
-                    damage_gj = proj.projectile.kinetic_energy_gj if hasattr(proj.projectile, 'kinetic_energy_gj') else 0
-
-                    projectiles.append({
-                        "source_ship": proj.source_ship_id,
-                        "source_name": source_name,
-                        "target_ship": proj.target_ship_id,
-                        "weapon_type": weapon_type,
-                        "distance_km": dist_km,
-                        "eta_seconds": eta,
-                        "damage_gj": damage_gj,
-                        "bearing": bearing,
-                        "speed_kps": proj_speed_kps,
-                    })
+        for threat in picture.projectiles:
+            projectiles.append({
+                "source_ship": threat.source_ship_id,
+                "source_name": self._source_name(simulation, threat.source_ship_id),
+                "target_ship": threat.target_ship_id,
+                # Infer weapon type from speed (like captains do)
+                "weapon_type": "Spinal" if threat.speed_kps > 8 else "Turret",
+                "distance_km": threat.distance_km,
+                "eta_seconds": threat.eta_seconds,
+                "damage_gj": threat.damage_gj,
+                # What direction it's coming from, relative to the target
+                "bearing": self._calculate_bearing(threat),
+                "speed_kps": threat.speed_kps,
+            })
 
         # Sort by ETA
         projectiles.sort(key=lambda p: p["eta_seconds"])
         return projectiles
 
-    def _calculate_bearing(self, ship: Any, proj_pos: Any, proj_vel: Any) -> str:
+    @staticmethod
+    def _calculate_bearing(threat: MunitionThreat) -> str:
         """Calculate bearing from ship's perspective (like captains do)."""
-        import math
-
-        # Vector from ship to projectile
-        to_proj = proj_pos - ship.position
-        if to_proj.magnitude < 1:
+        if threat.distance_m < 1:
             return "IMPACT"
 
-        to_proj_norm = to_proj.normalized()
-
-        # Ship's orientation vectors
-        forward = ship.forward
-        # Assume +Y is "up" for the ship, calculate right vector
-        up = getattr(ship, 'up', None)
-        if up is None:
-            # Default up vector
-            from ..physics import Vector3D
-            up = Vector3D(0, 0, 1)
-        right = forward.cross(up).normalized()
-
-        # Project onto ship's reference frame
-        forward_comp = to_proj_norm.dot(forward)  # +1 = nose, -1 = tail
-        right_comp = to_proj_norm.dot(right)      # +1 = starboard, -1 = port
-        up_comp = to_proj_norm.dot(up)            # +1 = dorsal, -1 = ventral
+        # Direction from ship to projectile in the ship's frame
+        forward_comp = threat.forward_dot  # +1 = nose, -1 = tail
+        right_comp = threat.right_dot      # +1 = starboard, -1 = port
+        up_comp = threat.up_dot            # +1 = dorsal, -1 = ventral
 
         # Determine primary direction
         if abs(forward_comp) > 0.7:
@@ -553,40 +615,21 @@ class MCPController:
         self,
         simulation: Any,
         friendly_ships: List[Dict[str, Any]],
+        picture: TacticalPicture,
     ) -> List[Dict[str, Any]]:
         """Build data for torpedo threats targeting our ships."""
         torpedoes = []
-        friendly_ids = {s["ship_id"] for s in friendly_ships}
-
-        if hasattr(simulation, 'torpedoes') and simulation.torpedoes:
-            for torp_flight in simulation.torpedoes:
-                torp = torp_flight.torpedo
-                # Only include torpedoes targeting our ships
-                if torp.target_id in friendly_ids and not torp_flight.is_disabled:
-                    # Get target ship info
-                    target_ship = simulation.get_ship(torp.target_id)
-                    if target_ship:
-                        dist_km = (torp.position - target_ship.position).magnitude / 1000
-
-                        # Calculate ETA
-                        to_target = (target_ship.position - torp.position).normalized()
-                        approach_speed = torp.velocity.dot(to_target) if hasattr(torp.velocity, 'dot') else torp.velocity.magnitude
-                        eta = (target_ship.position - torp.position).magnitude / approach_speed if approach_speed > 0 else 999
-
-                        # Get source info
-                        source_name = getattr(torp, 'source_ship_id', 'Unknown')
-                        source_ship = simulation.get_ship(source_name) if source_name != 'Unknown' else None
-                        if source_ship:
-                            source_name = getattr(source_ship, 'ship_name', source_name)
-
-                        torpedoes.append({
-                            "target_ship": torp.target_id,
-                            "source_ship": getattr(torp, 'source_ship_id', 'Unknown'),
-                            "source_name": source_name,
-                            "distance_km": dist_km,
-                            "eta_seconds": eta,
-                            "speed_kps": torp.velocity.magnitude / 1000 if hasattr(torp, 'velocity') else 0,
-                        })
+
+        # Only include torpedoes targeting our ships
+        for threat in picture.torpedoes_targeting(s["ship_id"] for s in friendly_ships):
+            torpedoes.append({
+                "target_ship": threat.target_ship_id,
+                "source_ship": threat.source_ship_id,
+                "source_name": self._source_name(simulation, threat.source_ship_id),
+                "distance_km": threat.distance_km,
+                "eta_seconds": threat.eta_seconds,
+                "speed_kps": threat.speed_kps,
+            })
 
         # Sort by ETA
         torpedoes.sort(key=lambda t: t["eta_seconds"])
@@ -696,7 +739,9 @@ def apply_mcp_commands_to_simulation(
     """
     Apply MCP commands to the simulation.
 
-    Converts MCP commands to simulation-level actions.
+    Converts MCP commands to simulation-level actions. The commands are
+    applied as one batch: conflicting orders are resolved first (see
+    resolve_command_conflicts) and each ship is looked up once.
 
     Args:
         commands: List of MCP commands
@@ -704,16 +749,23 @@ def apply_mcp_commands_to_simulation(
         faction: Faction issuing commands
 
     Returns:
-        Dict with results/errors for each command
+        Dict with results/errors for each applied command, the number of
+        commands superseded by later ones and the batch's application
+        time (apply_ms)
     """
     from ..simulation import ManeuverType, Maneuver
 
+    start = time.perf_counter()
     results = {"applied": [], "errors": []}
+    batch, superseded = resolve_command_conflicts(commands)
+    ships: Dict[Optional[str], Any] = {}
 
-    for cmd in commands:
+    for cmd in batch:
+        if cmd.ship_id not in ships:
+            ships[cmd.ship_id] = simulation.get_ship(cmd.ship_id)
+        ship = ships[cmd.ship_id]
         try:
             if cmd.command_type == MCPCommandType.SET_MANEUVER:
-                ship = simulation.get_ship(cmd.ship_id)
                 if ship:
                     # Convert maneuver type string to enum
                     maneuver_type_str = cmd.parameters.get("maneuver_type", "MAINTAIN")
@@ -747,7 +799,6 @@ def apply_mcp_commands_to_simulation(
                     })
 
             elif cmd.command_type == MCPCommandType.SET_WEAPONS_ORDER:
-                ship = simulation.get_ship(cmd.ship_id)
                 if ship:
                     from ..firecontrol import WeaponsCommand, WeaponsOrder
 
@@ -824,7 +875,6 @@ def apply_mcp_commands_to_simulation(
                     })
 
             elif cmd.command_type == MCPCommandType.SET_PRIMARY_TARGET:
-                ship = simulation.get_ship(cmd.ship_id)
                 if ship:
                     target_id = cmd.parameters.get("target_id")
                     if target_id == "NONE":
@@ -844,7 +894,6 @@ def apply_mcp_commands_to_simulation(
                     })
 
             elif cmd.command_type == MCPCommandType.SET_RADIATORS:
-                ship = simulation.get_ship(cmd.ship_id)
                 if ship:
                     extend = cmd.parameters.get("extend", True)
                     # Actually extend/retract radiators in thermal system
@@ -868,7 +917,6 @@ def apply_mcp_commands_to_simulation(
                     })
 
             elif cmd.command_type == MCPCommandType.LAUNCH_TORPEDO:
-                ship = simulation.get_ship(cmd.ship_id)
                 if ship:
                     target_id = cmd.parameters.get("target_id")
                     # TODO: Implement torpedo launch
@@ -894,4 +942,6 @@ def apply_mcp_commands_to_simulation(
                 "error": str(e),
             })
 
+    results["superseded"] = superseded
+    results["apply_ms"] = (time.perf_counter() - start) * 1000
     return results
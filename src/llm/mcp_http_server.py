@@ -2,10 +2,16 @@
 MCP HTTP Server - REST API for MCP clients to communicate with the battle runner.
 
 Provides HTTP endpoints for:
-- Getting battle state per faction
+- Getting battle state per faction (ETag revalidation, deltas against the
+  client's version and gzip, see mcp_state_codec)
 - Submitting commands
 - Signaling ready for turn advancement
 - Querying battle status
+- Creating, listing and deleting battles, so one server can host many
+  battles at once (routes under /battles/{battle_id}/...)
+- A WebSocket stream per faction (/ws/{faction}) that pushes each new
+  battle state as soon as it is published and accepts commands and ready
+  signals over the same connection
 
 This allows MCP servers (spawned by Claude Code as subprocesses) to communicate
 with the battle runner even though they run in separate processes.
@@ -15,22 +21,26 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
 from typing import Dict, Any, List, Optional, Callable, Awaitable, TYPE_CHECKING
 
 try:
-    from aiohttp import web
+    from aiohttp import web, WSMsgType
     AIOHTTP_AVAILABLE = True
 except ImportError:
     AIOHTTP_AVAILABLE = False
     web = None
+    WSMsgType = None
 
 from .mcp_state import (
+    DEFAULT_BATTLE_ID,
+    STATE_DELTA_IM,
+    MCPBattleStore,
     MCPSharedState,
     MCPBattleState,
-    MCPCommand,
-    MCPCommandType,
     get_mcp_state,
 )
+from .mcp_commands import parse_commands
 
 if TYPE_CHECKING:
     from aiohttp import web as web_typing
@@ -43,6 +53,11 @@ class MCPHttpServer:
 
     Runs alongside the battle runner and provides REST endpoints for
     MCP servers to get state, send commands, and signal readiness.
+
+    One server can host many battles at once. Battle-scoped routes live
+    under /battles/{battle_id}/...; the unscoped routes (/state/{faction},
+    /commands/{faction}, /ready/{faction}, /status) address the default
+    battle, so single-battle clients work unchanged.
     """
 
     def __init__(
@@ -50,6 +65,8 @@ class MCPHttpServer:
         host: str = "localhost",
         port: int = 8765,
         shared_state: Optional[MCPSharedState] = None,
+        battle_idle_timeout_s: Optional[float] = None,
+        middlewares: Optional[List[Any]] = None,
     ):
         """
         Initialize HTTP server.
@@ -58,6 +75,9 @@ class MCPHttpServer:
             host: Host to bind to
             port: Port to listen on
             shared_state: Shared state instance (uses singleton if not provided)
+            battle_idle_timeout_s: Drop ended or never-started battles idle
+                for this long (None keeps them until deleted)
+            middlewares: Extra aiohttp middlewares (e.g. request metrics)
         """
         if not AIOHTTP_AVAILABLE:
             raise RuntimeError("aiohttp package not installed. Run: pip install aiohttp")
@@ -65,32 +85,32 @@ class MCPHttpServer:
         self.host = host
         self.port = port
         self._state = shared_state or get_mcp_state()
+        self.battle_idle_timeout_s = battle_idle_timeout_s
+        self._middlewares = list(middlewares or [])
 
-        # Track which factions have connected
-        self._connected_factions: set = set()
-
-        # Battle status
-        self._battle_status = "waiting"  # "waiting", "running", "paused", "ended"
-        self._current_checkpoint = 0
-        self._waiting_for: List[str] = []
-
-        # Controllers for building state
-        self._controllers: Dict[str, 'MCPController'] = {}
+        # Controllers for building state, per battle and faction
+        self._controllers: Dict[str, Dict[str, 'MCPController']] = {}
 
         # Callbacks
-        self._on_ready_callback: Optional[Callable[[str], Awaitable[None]]] = None
+        self._on_ready_callback: Optional[Callable[[str, str], Awaitable[None]]] = None
 
         # Server instances
         self._app: Optional[web.Application] = None
         self._runner: Optional[web.AppRunner] = None
         self._site: Optional[web.TCPSite] = None
+        self._reaper: Optional[asyncio.Task] = None
 
-    def register_controller(self, faction: str, controller: 'MCPController') -> None:
-        """Register an MCP controller for a faction."""
-        self._controllers[faction] = controller
+    def register_controller(
+        self,
+        faction: str,
+        controller: 'MCPController',
+        battle_id: str = DEFAULT_BATTLE_ID,
+    ) -> None:
+        """Register an MCP controller for a faction of a battle."""
+        self._controllers.setdefault(battle_id, {})[faction] = controller
 
-    def set_on_ready_callback(self, callback: Callable[[str], Awaitable[None]]) -> None:
-        """Set callback to be called when a faction signals ready."""
+    def set_on_ready_callback(self, callback: Callable[[str, str], Awaitable[None]]) -> None:
+        """Set callback to be called with (faction, battle_id) when a faction signals ready."""
         self._on_ready_callback = callback
 
     def set_battle_status(
@@ -98,15 +118,23 @@ class MCPHttpServer:
         status: str,
         checkpoint: int = 0,
         waiting_for: Optional[List[str]] = None,
+        battle_id: str = DEFAULT_BATTLE_ID,
     ) -> None:
-        """Update battle status."""
-        self._battle_status = status
-        self._current_checkpoint = checkpoint
-        self._waiting_for = waiting_for or []
+        """Update the status of a battle (created if unknown)."""
+        self._state.get_or_create_battle(battle_id).set_status(status, checkpoint, waiting_for)
+
+    def create_battle(self, battle_id: Optional[str] = None) -> MCPBattleStore:
+        """Create a battle on this server (random ID if not given)."""
+        return self._state.create_battle(battle_id)
+
+    def remove_battle(self, battle_id: str) -> bool:
+        """Drop a battle and its controllers."""
+        self._controllers.pop(battle_id, None)
+        return self._state.remove_battle(battle_id)
 
     async def start(self) -> None:
         """Start the HTTP server."""
-        self._app = web.Application()
+        self._app = web.Application(middlewares=self._middlewares)
         self._setup_routes()
 
         self._runner = web.AppRunner(self._app)
@@ -115,23 +143,77 @@ class MCPHttpServer:
         self._site = web.TCPSite(self._runner, self.host, self.port)
         await self._site.start()
 
+        if self.battle_idle_timeout_s is not None:
+            self._reaper = asyncio.create_task(self._reap_idle_battles())
+
         print(f"MCP HTTP API running on http://{self.host}:{self.port}")
         print(f"Waiting for MCP clients to connect...")
 
     async def stop(self) -> None:
         """Stop the HTTP server."""
+        if self._reaper:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
         if self._site:
             await self._site.stop()
         if self._runner:
             await self._runner.cleanup()
 
+    async def _reap_idle_battles(self) -> None:
+        """Periodically drop idle battles."""
+        interval = max(self.battle_idle_timeout_s / 2, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            for battle_id in self._state.remove_idle_battles(self.battle_idle_timeout_s):
+                self._controllers.pop(battle_id, None)
+
     def _setup_routes(self) -> None:
         """Setup HTTP routes."""
         self._app.router.add_get("/health", self._handle_health)
+
+        # Default battle
         self._app.router.add_get("/status", self._handle_status)
         self._app.router.add_get("/state/{faction}", self._handle_get_state)
         self._app.router.add_post("/commands/{faction}", self._handle_commands)
         self._app.router.add_post("/ready/{faction}", self._handle_ready)
+        self._app.router.add_get("/ws/{faction}", self._handle_stream)
+
+        # Battle lifecycle and battle-scoped routes
+        self._app.router.add_get("/battles", self._handle_list_battles)
+        self._app.router.add_post("/battles", self._handle_create_battle)
+        self._app.router.add_delete("/battles/{battle_id}", self._handle_delete_battle)
+        self._app.router.add_get("/battles/{battle_id}/status", self._handle_status)
+        self._app.router.add_get("/battles/{battle_id}/state/{faction}", self._handle_get_state)
+        self._app.router.add_post("/battles/{battle_id}/commands/{faction}", self._handle_commands)
+        self._app.router.add_post("/battles/{battle_id}/ready/{faction}", self._handle_ready)
+        self._app.router.add_get("/battles/{battle_id}/ws/{faction}", self._handle_stream)
+
+    def _resolve(self, request: web.Request, with_faction: bool = True):
+        """
+        Battle store (and faction) addressed by a request.
+
+        Returns:
+            (store, faction, None), or (None, None, error response)
+        """
+        battle_id = request.match_info.get("battle_id", DEFAULT_BATTLE_ID)
+        store = self._state.battle(battle_id)
+        if store is None:
+            return None, None, web.json_response(
+                {"error": f"Unknown battle: {battle_id}"},
+                status=404,
+            )
+
+        faction = request.match_info.get("faction") if with_faction else None
+        if with_faction and faction not in ("alpha", "beta"):
+            return None, None, web.json_response(
+                {"error": f"Invalid faction: {faction}"},
+                status=400,
+            )
+        return store, faction, None
 
     async def _handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
@@ -139,39 +221,98 @@ class MCPHttpServer:
 
     async def _handle_status(self, request: web.Request) -> web.Response:
         """Get battle status."""
+        store, _, error = self._resolve(request, with_faction=False)
+        if error:
+            return error
+        return web.json_response(store.status_dict())
+
+    async def _handle_list_battles(self, request: web.Request) -> web.Response:
+        """List hosted battles with their status."""
+        battles = [self._state.battle(battle_id) for battle_id in self._state.battle_ids()]
         return web.json_response({
-            "status": self._battle_status,
-            "checkpoint": self._current_checkpoint,
-            "waiting_for": self._waiting_for,
-            "connected_factions": list(self._connected_factions),
+            "battles": [store.status_dict() for store in battles if store is not None],
         })
 
-    async def _handle_get_state(self, request: web.Request) -> web.Response:
-        """Get battle state for a faction."""
-        faction = request.match_info["faction"]
+    async def _handle_create_battle(self, request: web.Request) -> web.Response:
+        """Create a battle; the body may name it with {"battle_id": ...}."""
+        data = {}
+        if request.can_read_body:
+            try:
+                data = await request.json()
+            except json.JSONDecodeError:
+                return web.json_response(
+                    {"error": "Invalid JSON"},
+                    status=400,
+                )
+
+        try:
+            store = self.create_battle(data.get("battle_id"))
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=409)
+
+        return web.json_response(store.status_dict(), status=201)
 
-        if faction not in ("alpha", "beta"):
+    async def _handle_delete_battle(self, request: web.Request) -> web.Response:
+        """Drop a battle and its pending state."""
+        battle_id = request.match_info["battle_id"]
+        if battle_id == DEFAULT_BATTLE_ID:
             return web.json_response(
-                {"error": f"Invalid faction: {faction}"},
+                {"error": "The default battle cannot be deleted"},
                 status=400,
             )
+        if not self.remove_battle(battle_id):
+            return web.json_response(
+                {"error": f"Unknown battle: {battle_id}"},
+                status=404,
+            )
+        return web.json_response({"deleted": battle_id})
+
+    async def _handle_get_state(self, request: web.Request) -> web.Response:
+        """Get battle state for a faction."""
+        store, faction, error = self._resolve(request)
+        if error:
+            return error
 
         # Track connection
-        self._connected_factions.add(faction)
+        store.connected_factions.add(faction)
+        store.touch()
+
+        # Revalidation: the client's ETag names the version it holds
+        etag = store.state_etag(faction)
+        known = None
+        for tag in request.headers.get("If-None-Match", "").split(","):
+            if tag.strip() == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            known = store.parse_state_etag(faction, tag) if known is None else known
+
+        wants_delta = STATE_DELTA_IM in request.headers.get("A-IM", "")
+        payload = store.encode_state(
+            faction,
+            since=known if wants_delta else None,
+            compress="gzip" in request.headers.get("Accept-Encoding", ""),
+        )
 
-        # Get state from shared state
-        state = self._state.get_state(faction)
-        return web.json_response(state.to_dict())
+        headers = {
+            "ETag": store.state_etag(faction, payload.version),
+            "Vary": "Accept-Encoding, A-IM",
+        }
+        if payload.gzipped:
+            headers["Content-Encoding"] = "gzip"
+        if payload.is_delta:
+            headers["IM"] = STATE_DELTA_IM
+            headers["Delta-Base"] = store.state_etag(faction, payload.base_version)
+        return web.Response(
+            status=226 if payload.is_delta else 200,
+            body=payload.body,
+            content_type="application/json",
+            headers=headers,
+        )
 
     async def _handle_commands(self, request: web.Request) -> web.Response:
         """Handle command submission."""
-        faction = request.match_info["faction"]
-
-        if faction not in ("alpha", "beta"):
-            return web.json_response(
-                {"error": f"Invalid faction: {faction}"},
-                status=400,
-            )
+        store, faction, error = self._resolve(request)
+        if error:
+            return error
 
         try:
             data = await request.json()
@@ -187,65 +328,154 @@ class MCPHttpServer:
         else:
             commands_data = [data]
 
-        # Parse and store commands
-        accepted = []
-        errors = []
-
-        for cmd_data in commands_data:
-            try:
-                command_type_str = cmd_data.get("command_type", "")
-                command_type = MCPCommandType(command_type_str)
-
-                command = MCPCommand(
-                    command_type=command_type,
-                    ship_id=cmd_data.get("ship_id"),
-                    parameters=cmd_data.get("parameters", {}),
-                    timestamp=cmd_data.get("timestamp", 0.0),
-                )
-
-                self._state.add_command(faction, command)
-                accepted.append({
-                    "command_type": command_type_str,
-                    "ship_id": cmd_data.get("ship_id"),
-                })
+        return web.json_response(self._accept_commands(store, faction, commands_data))
 
-            except (ValueError, KeyError) as e:
-                errors.append({
-                    "command_type": cmd_data.get("command_type"),
-                    "error": str(e),
-                })
+    def _accept_commands(
+        self,
+        store: MCPBattleStore,
+        faction: str,
+        commands_data: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Validate and queue a batch of commands.
 
-        return web.json_response({
-            "accepted": len(accepted),
-            "commands": accepted,
+        Returns:
+            Summary with the accepted commands, per-command errors and the
+            batch's validation time (validate_ms)
+        """
+        start = time.perf_counter()
+        if not isinstance(commands_data, list):
+            commands_data = [commands_data]
+        commands, errors = parse_commands(commands_data)
+        validate_ms = (time.perf_counter() - start) * 1000
+
+        store.add_commands(faction, commands)
+        return {
+            "accepted": len(commands),
+            "commands": [
+                {"command_type": command.command_type.value, "ship_id": command.ship_id}
+                for command in commands
+            ],
             "errors": errors,
-        })
+            "validate_ms": round(validate_ms, 3),
+        }
 
     async def _handle_ready(self, request: web.Request) -> web.Response:
         """Handle ready signal from a faction."""
-        faction = request.match_info["faction"]
+        store, faction, error = self._resolve(request)
+        if error:
+            return error
 
-        if faction not in ("alpha", "beta"):
-            return web.json_response(
-                {"error": f"Invalid faction: {faction}"},
-                status=400,
-            )
+        return web.json_response(await self._signal_ready(store, faction))
 
-        # Signal ready
-        self._state.signal_ready(faction)
+    async def _signal_ready(self, store: MCPBattleStore, faction: str) -> Dict[str, Any]:
+        """Mark a faction ready and run the ready callback."""
+        store.signal_ready(faction)
 
         # Call callback if registered
         if self._on_ready_callback:
             try:
-                await self._on_ready_callback(faction)
+                await self._on_ready_callback(faction, store.battle_id)
             except Exception as e:
                 print(f"[MCPHttpServer] Error in ready callback: {e}")
 
-        return web.json_response({
+        return {
             "status": "ready",
             "faction": faction,
-            "checkpoint": self._current_checkpoint,
-        })
+            "battle_id": store.battle_id,
+            "checkpoint": store.checkpoint,
+        }
+
+    # === Push Stream ===
+
+    async def _handle_stream(self, request: web.Request) -> web.StreamResponse:
+        """
+        WebSocket stream for a faction.
+
+        Server messages:
+            {"type": "state", "version": n, "state": {...}} on connect and
+            after every state update (intermediate versions may be skipped
+            if the client falls behind)
+            A reply to each commands/ready message, in order
+
+        Client messages:
+            {"type": "commands", "commands": [...]} -> {"type": "commands", "accepted": ...}
+            {"type": "ready"} -> {"type": "ready", "checkpoint": ...}
+            {"type": "state"} -> current state pushed again
+        """
+        store, faction, error = self._resolve(request)
+        if error:
+            return error
+
+        ws = web.WebSocketResponse(heartbeat=30.0)
+        await ws.prepare(request)
+        store.connected_factions.add(faction)
+        store.touch()
+
+        send_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        updates: asyncio.Queue = asyncio.Queue()
+
+        def on_update(version: int, state: MCPBattleState) -> None:
+            # Published from the controller's thread; hand off to this loop
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(updates.put_nowait, version)
+
+        async def send_state() -> int:
+            # Reuses the full-state encoding shared with HTTP clients
+            payload = store.encode_state(faction)
+            message = f'{{"type":"state","version":{payload.version},"state":{payload.body.decode()}}}'
+            async with send_lock:
+                await ws.send_str(message)
+            return payload.version
+
+        async def push_states(sent: int) -> None:
+            # sent: version the client last received (updates published
+            # while it was being sent are still queued and pushed here)
+            while True:
+                version = await updates.get()
+                # Coalesce a backlog into the latest state
+                while not updates.empty():
+                    version = updates.get_nowait()
+                if version > sent:
+                    sent = await send_state()
+
+        unsubscribe = store.subscribe(faction, on_update)
+        pusher = None
+        try:
+            pusher = asyncio.create_task(push_states(await send_state()))
+
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    data = json.loads(message.data)
+                    kind = data.get("type")
+                except (json.JSONDecodeError, AttributeError):
+                    data, kind = {}, None
+                    reply = {"type": "error", "error": "Invalid JSON"}
+                else:
+                    if kind == "commands":
+                        reply = {"type": "commands", **self._accept_commands(
+                            store, faction, data.get("commands", []),
+                        )}
+                    elif kind == "ready":
+                        reply = {"type": "ready", **await self._signal_ready(store, faction)}
+                    elif kind == "state":
+                        await send_state()
+                        continue
+                    else:
+                        reply = {"type": "error", "error": f"Unknown message type: {kind}"}
+
+                async with send_lock:
+                    await ws.send_json(reply)
+        finally:
+            unsubscribe()
+            if pusher is not None:
+                pusher.cancel()
+                await asyncio.gather(pusher, return_exceptions=True)
+
+        return ws
 
 
 async def run_battle_with_http_server(
@@ -272,10 +502,11 @@ async def run_battle_with_http_server(
     http_server = MCPHttpServer(host=host, port=port)
 
     # Register controllers if present
+    battle_id = battle_runner.config.mcp_battle_id
     if battle_runner.alpha_mcp:
-        http_server.register_controller("alpha", battle_runner.alpha_mcp)
+        http_server.register_controller("alpha", battle_runner.alpha_mcp, battle_id)
     if battle_runner.beta_mcp:
-        http_server.register_controller("beta", battle_runner.beta_mcp)
+        http_server.register_controller("beta", battle_runner.beta_mcp, battle_id)
 
     try:
         await http_server.start()
@@ -303,6 +534,10 @@ async def run_fleet_battle_with_http(
 
     This is similar to run_fleet_battle_async but uses HTTP for MCP communication
     instead of in-process shared state.
+
+    The battle is hosted under runner.config.mcp_battle_id, so several battles
+    can run concurrently against one server. Simulation steps run in a worker
+    thread to keep the server responsive to the other battles' clients.
     """
     from ..simulation import CombatSimulation, ManeuverType, Maneuver
     from .mcp_controller import apply_mcp_commands_to_simulation
@@ -357,9 +592,11 @@ async def run_fleet_battle_with_http(
     if runner.mcp_chat:
         runner.mcp_chat.new_turn()
 
-    # Get shared state for MCP coordination
-    shared_state = get_mcp_state()
+    # Get this battle's store for MCP coordination
+    battle_id = runner.config.mcp_battle_id
+    shared_state = get_mcp_state().get_or_create_battle(battle_id)
     shared_state.set_event_loop(asyncio.get_event_loop())
+    http_server.set_battle_status("running", battle_id=battle_id)
 
     # Determine which factions need MCP
     mcp_factions = []
@@ -370,8 +607,7 @@ async def run_fleet_battle_with_http(
         mcp_factions.append("beta")
         shared_state.register_faction("beta")
 
-    while not runner._is_fleet_battle_over():
-        # === SIMULATION PHASE ===
+    def simulate_interval() -> None:
         steps = int(decision_interval)
         for step_i in range(steps):
             current_time = runner.simulation.current_time
@@ -389,6 +625,10 @@ async def run_fleet_battle_with_http(
             if runner._is_fleet_battle_over():
                 break
 
+    while not runner._is_fleet_battle_over():
+        # === SIMULATION PHASE ===
+        await asyncio.to_thread(simulate_interval)
+
         if runner._is_fleet_battle_over():
             break
 
@@ -409,6 +649,7 @@ async def run_fleet_battle_with_http(
             "paused",
             checkpoint=runner.checkpoint_count,
             waiting_for=mcp_factions.copy(),
+            battle_id=battle_id,
         )
 
         # === MCP/ADMIRAL DECISION PHASE ===
@@ -432,36 +673,41 @@ async def run_fleet_battle_with_http(
         for faction in mcp_factions:
             shared_state.clear_ready(faction)
 
-        # Wait for all MCP factions (no timeout)
-        while mcp_factions:
-            for faction in list(mcp_factions):
-                if shared_state.is_ready(faction):
-                    mcp_factions.remove(faction)
-                    http_server.set_battle_status(
-                        "paused",
-                        checkpoint=runner.checkpoint_count,
-                        waiting_for=mcp_factions.copy(),
-                    )
-
-                    if runner.config.verbose:
-                        print(f"  [{faction.title()}] Ready signal received")
+        # Wait for all MCP factions (no timeout), handling each as soon as
+        # its ready signal arrives
+        waiting = {
+            asyncio.ensure_future(shared_state.wait_for_ready(faction, timeout=None)): faction
+            for faction in mcp_factions
+        }
+        while waiting:
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                faction = waiting.pop(task)
+                mcp_factions.remove(faction)
+                http_server.set_battle_status(
+                    "paused",
+                    checkpoint=runner.checkpoint_count,
+                    waiting_for=mcp_factions.copy(),
+                    battle_id=battle_id,
+                )
 
-                    # Process commands
-                    commands = shared_state.get_pending_commands(faction)
-                    if runner.config.verbose:
-                        print(f"  Received {len(commands)} commands")
+                if runner.config.verbose:
+                    print(f"  [{faction.title()}] Ready signal received")
 
-                    # Apply commands to simulation
-                    results = apply_mcp_commands_to_simulation(
-                        commands, runner.simulation, faction
-                    )
+                # Process commands
+                commands = shared_state.get_pending_commands(faction)
+                if runner.config.verbose:
+                    print(f"  Received {len(commands)} commands")
 
-                    if runner.config.verbose and results.get("applied"):
-                        for cmd_result in results["applied"]:
-                            print(f"    Applied: {cmd_result}")
+                # Apply commands to simulation
+                results = apply_mcp_commands_to_simulation(
+                    commands, runner.simulation, faction
+                )
 
-            if mcp_factions:
-                await asyncio.sleep(0.1)
+                if runner.config.verbose:
+                    print(f"  Applied batch in {results['apply_ms']:.2f} ms ({results['superseded']} superseded)")
+                    for cmd_result in results["applied"]:
+                        print(f"    Applied: {cmd_result}")
 
         # Reset mcp_factions for next checkpoint
         mcp_factions = []
@@ -613,5 +859,5 @@ async def run_fleet_battle_with_http(
                     print(f"\n=== CHECKPOINT LIMIT REACHED ===")
                 break
 
-    http_server.set_battle_status("ended", checkpoint=runner.checkpoint_count)
+    http_server.set_battle_status("ended", checkpoint=runner.checkpoint_count, battle_id=battle_id)
     return runner._evaluate_fleet_result()
@@ -0,0 +1,383 @@
+"""
+Offline load test for the MCP HTTP stack.
+
+Spins up an MCPHttpServer in a child process hosting several simulated
+fleet battles (both fleets MCP-controlled, run by run_fleet_battle_with_http)
+and drives it from this process with scripted async clients:
+
+- Two commanders per battle (alpha and beta). Each checkpoint they read the
+  state, send a batch of commands and signal ready.
+- Optional observers that keep reading state until their battle ends.
+
+It reports requests, throughput and p50/p99 latency per endpoint as seen by
+the clients, the handler time per endpoint measured in the server, and the
+server process's CPU time (HTTP plus simulation). Running the server in its
+own process keeps client CPU out of that figure. No network access or LLM
+is needed.
+
+Usage:
+    report = run_load_test(LoadTestConfig(battles=8, checkpoints=5))
+    print(report.format())
+"""
+
+import asyncio
+import contextlib
+import io
+import multiprocessing
+import queue
+import socket
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .mcp_state import MCPCommand, MCPCommandType, MCPHttpClient
+
+
+@dataclass
+class LoadTestConfig:
+    """
+    Load test parameters.
+
+    Attributes:
+        battles: Concurrent battles hosted by the server.
+        checkpoints: Checkpoints per battle.
+        ships_per_side: Destroyers per fleet.
+        decision_interval_s: Simulated seconds between checkpoints (small
+            values give rapid checkpoints).
+        state_reads_per_turn: State reads per commander per checkpoint.
+        commands_per_turn: Commands per batch (spread over the fleet).
+        observers_per_battle: Extra clients reading state continuously.
+        poll_interval_s: Delay between a client's status polls.
+        host: Interface the server binds to.
+        seed: Battle seed (battle i uses seed + i).
+        timeout_s: Abort the test after this long.
+    """
+    battles: int = 4
+    checkpoints: int = 5
+    ships_per_side: int = 3
+    decision_interval_s: float = 10.0
+    state_reads_per_turn: int = 2
+    commands_per_turn: int = 4
+    observers_per_battle: int = 0
+    poll_interval_s: float = 0.02
+    host: str = "127.0.0.1"
+    seed: int = 1
+    timeout_s: float = 300.0
+
+
+@dataclass
+class EndpointStats:
+    """Latency and throughput of one endpoint."""
+    requests: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    server_ms: float = 0.0  # Total handler time in the server
+
+
+@dataclass
+class LoadTestReport:
+    """
+    Load test results.
+
+    Attributes:
+        config: Parameters of the run.
+        wall_s: Wall time from the first client request to the last battle's end.
+        checkpoints: Checkpoints completed, summed over battles.
+        endpoints: Client-side stats per endpoint ("GET /state/{faction}", ...).
+        server_cpu_s: Server process CPU time while battles ran.
+        server_requests: Requests handled by the server.
+    """
+    config: LoadTestConfig
+    wall_s: float
+    checkpoints: int
+    endpoints: Dict[str, EndpointStats] = field(default_factory=dict)
+    server_cpu_s: float = 0.0
+    server_requests: int = 0
+
+    @property
+    def server_cpu_pct(self) -> float:
+        """Server CPU as a percentage of one core over the run."""
+        return 100 * self.server_cpu_s / self.wall_s if self.wall_s else 0.0
+
+    @property
+    def requests(self) -> int:
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["server_cpu_pct"] = self.server_cpu_pct
+        return data
+
+    def format(self) -> str:
+        """Human-readable report."""
+        c = self.config
+        lines = [
+            f"Battles: {c.battles} x {c.ships_per_side}v{c.ships_per_side}, "
+            f"{self.checkpoints} checkpoints, "
+            f"{2 * c.battles} commanders + {c.observers_per_battle * c.battles} observers",
+            f"Wall time: {self.wall_s:.2f}s, {self.requests} requests "
+            f"({self.requests / self.wall_s:.0f} req/s), "
+            f"{self.checkpoints / self.wall_s:.1f} checkpoints/s",
+            f"Server CPU: {self.server_cpu_s:.2f}s ({self.server_cpu_pct:.0f}% of one core, "
+            f"HTTP + simulation), {self.server_requests} requests handled",
+            "",
+            f"{'endpoint':<24} {'requests':>8} {'errors':>6} {'req/s':>8} "
+            f"{'p50 ms':>7} {'p99 ms':>7} {'max ms':>7} {'server ms':>9}",
+        ]
+        for name, s in sorted(self.endpoints.items()):
+            lines.append(
+                f"{name:<24} {s.requests:>8} {s.errors:>6} {s.throughput_rps:>8.0f} "
+                f"{s.p50_ms:>7.2f} {s.p99_ms:>7.2f} {s.max_ms:>7.2f} {s.server_ms:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+# =============================================================================
+# Server process
+# =============================================================================
+
+def _endpoint_name(method: str, path: str) -> str:
+    """Endpoint key shared by client and server ("GET /state/{faction}")."""
+    return f"{method} {path.replace('/battles/{battle_id}', '')}"
+
+
+def _battle_runner(config: LoadTestConfig, index: int):
+    from .battle_runner import BattleConfig, LLMBattleRunner
+    from .client import CaptainClient
+    from .fleet_config import BattleFleetConfig
+
+    fleet = {
+        "mcp": {"enabled": True},
+        "ships": [{"ship_type": "destroyer", "model": "dummy"}] * config.ships_per_side,
+    }
+    fleet_config = BattleFleetConfig.from_dict({
+        "battle_name": f"Load {index}",
+        "initial_distance_km": 500,
+        "decision_interval_s": config.decision_interval_s,
+        "alpha_fleet": dict(fleet),
+        "beta_fleet": dict(fleet),
+    })
+    return LLMBattleRunner(
+        config=BattleConfig(
+            verbose=False, max_checkpoints=config.checkpoints, seed=config.seed + index,
+            record_battle=False, personality_selection=False, mcp_battle_id=f"load_{index}",
+        ),
+        alpha_config=None,
+        beta_config=None,
+        client=CaptainClient(api_key="unused"),
+        fleet_config=fleet_config,
+    )
+
+
+async def _serve(config: LoadTestConfig, port: int, events, stop) -> None:
+    from aiohttp import web
+
+    from .battle_runner import load_fleet_data
+    from .mcp_http_server import MCPHttpServer, run_fleet_battle_with_http
+
+    handled: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+
+    @web.middleware
+    async def metrics(request, handler):
+        start = time.perf_counter()
+        try:
+            return await handler(request)
+        finally:
+            route = request.match_info.route.resource
+            name = _endpoint_name(request.method, route.canonical if route else request.path)
+            handled[name] = handled.get(name, 0.0) + time.perf_counter() - start
+            counts[name] = counts.get(name, 0) + 1
+
+    server = MCPHttpServer(host=config.host, port=port, middlewares=[metrics])
+    runners = [_battle_runner(config, i) for i in range(config.battles)]
+    for runner in runners:
+        server.create_battle(runner.config.mcp_battle_id)
+    fleet_data = load_fleet_data()
+
+    await server.start()
+    events.put(("ready", None))
+    try:
+        cpu_start = time.process_time()
+        results = await asyncio.gather(
+            *(run_fleet_battle_with_http(runner, fleet_data, server) for runner in runners)
+        )
+        cpu_s = time.process_time() - cpu_start
+
+        # Keep serving until every client has seen its battle end
+        await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        events.put(("done", {
+            "cpu_s": cpu_s,
+            "checkpoints": sum(result.checkpoints_used for result in results),
+            "handled_ms": {name: seconds * 1000 for name, seconds in handled.items()},
+            "requests": sum(counts.values()),
+        }))
+    finally:
+        await server.stop()
+
+
+def _server_main(config: LoadTestConfig, port: int, events, stop) -> None:
+    """Child process entry point."""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(_serve(config, port, events, stop))
+    except BaseException as e:
+        events.put(("error", repr(e)))
+        raise
+
+
+# =============================================================================
+# Clients
+# =============================================================================
+
+class _Recorder:
+    """Client-side latency samples per endpoint."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    async def call(self, name: str, request):
+        start = time.perf_counter()
+        try:
+            return await request
+        except Exception:
+            self.errors[name] = self.errors.get(name, 0) + 1
+            raise
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start)
+
+
+async def _commander(client: MCPHttpClient, config: LoadTestConfig, recorder: _Recorder) -> int:
+    """Answer every checkpoint: read state, send a command batch, signal ready."""
+    handled = 0
+    state: Dict[str, Any] = {"friendly_ships": []}
+    while True:
+        status = await recorder.call("GET /status", client.get_status())
+        if status["status"] == "ended":
+            return handled
+        if status["checkpoint"] > handled and client.faction in status["waiting_for"]:
+            handled = status["checkpoint"]
+            for _ in range(config.state_reads_per_turn):
+                state = await recorder.call("GET /state/{faction}", client.get_state_dict())
+            ships = [ship["ship_id"] for ship in state["friendly_ships"]] or [None]
+            commands = [
+                MCPCommand(
+                    MCPCommandType.SET_MANEUVER,
+                    ship_id=ships[k % len(ships)],
+                    parameters={"maneuver_type": ("INTERCEPT", "EVASIVE")[(handled + k) % 2], "throttle": 0.5},
+                )
+                for k in range(config.commands_per_turn)
+            ]
+            await recorder.call("POST /commands/{faction}", client.send_commands(commands))
+            await recorder.call("POST /ready/{faction}", client.signal_ready())
+        else:
+            await asyncio.sleep(config.poll_interval_s)
+
+
+async def _observer(client: MCPHttpClient, config: LoadTestConfig, recorder: _Recorder) -> None:
+    """Read state until the battle ends."""
+    while True:
+        await recorder.call("GET /state/{faction}", client.get_state_dict())
+        status = await recorder.call("GET /status", client.get_status())
+        if status["status"] == "ended":
+            return
+        await asyncio.sleep(config.poll_interval_s)
+
+
+async def _drive(config: LoadTestConfig, base_url: str, recorder: _Recorder) -> float:
+    clients = []
+    tasks = []
+    for i in range(config.battles):
+        for faction in ("alpha", "beta"):
+            client = MCPHttpClient(base_url, faction, battle_id=f"load_{i}")
+            clients.append(client)
+            tasks.append(_commander(client, config, recorder))
+        for k in range(config.observers_per_battle):
+            client = MCPHttpClient(base_url, ("alpha", "beta")[k % 2], battle_id=f"load_{i}")
+            clients.append(client)
+            tasks.append(_observer(client, config, recorder))
+
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(asyncio.gather(*tasks), config.timeout_s)
+        return time.perf_counter() - start
+    finally:
+        for client in clients:
+            await client.close()
+
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def run_load_test(config: Optional[LoadTestConfig] = None) -> LoadTestReport:
+    """
+    Run a load test and report the results.
+
+    Args:
+        config: Parameters (defaults if None)
+
+    Returns:
+        LoadTestReport
+
+    Raises:
+        RuntimeError: If the server process fails or does not start
+    """
+    config = config or LoadTestConfig()
+    context = multiprocessing.get_context("spawn")
+    events = context.Queue()
+    stop = context.Event()
+    port = _free_port(config.host)
+    process = context.Process(target=_server_main, args=(config, port, events, stop), daemon=True)
+    process.start()
+
+    def next_event(timeout: float):
+        try:
+            kind, payload = events.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError("MCP load test server did not respond")
+        if kind == "error":
+            raise RuntimeError(f"MCP load test server failed: {payload}")
+        return payload
+
+    recorder = _Recorder()
+    try:
+        next_event(timeout=60.0)
+        wall_s = asyncio.run(_drive(config, f"http://{config.host}:{port}", recorder))
+        stop.set()
+        server = next_event(timeout=config.timeout_s)
+    finally:
+        stop.set()
+        process.join(timeout=10.0)
+        if process.is_alive():
+            process.terminate()
+
+    endpoints = {}
+    for name, samples in recorder.samples.items():
+        ms = np.array(samples) * 1000
+        endpoints[name] = EndpointStats(
+            requests=len(samples),
+            errors=recorder.errors.get(name, 0),
+            throughput_rps=len(samples) / wall_s,
+            p50_ms=float(np.percentile(ms, 50)),
+            p99_ms=float(np.percentile(ms, 99)),
+            max_ms=float(ms.max()),
+            server_ms=server["handled_ms"].get(name, 0.0),
+        )
+
+    return LoadTestReport(
+        config=config,
+        wall_s=wall_s,
+        checkpoints=server["checkpoints"],
+        endpoints=endpoints,
+        server_cpu_s=server["cpu_s"],
+        server_requests=server["requests"],
+    )
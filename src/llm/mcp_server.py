@@ -32,31 +32,16 @@ except ImportError:
     TextContent = None
     stdio_server = None
 
-from .mcp_state import get_mcp_state, MCPCommand, MCPCommandType, MCPHttpClient
+from .mcp_state import get_mcp_state, MCPCommand, MCPCommandType, MCPHttpClient, MCPStreamClient
 
-import math
-
-
-def get_velocity_arrow(vx: float, vy: float) -> str:
-    """Convert velocity vector to arrow character."""
-    if abs(vx) < 0.1 and abs(vy) < 0.1:
-        return "·"  # Stationary
-
-    angle = math.atan2(vy, vx)  # radians
-    # 8 directions, starting from right (0 rad) going counterclockwise
-    # Normalize angle to [0, 2*pi]
-    if angle < 0:
-        angle += 2 * math.pi
-    # Each sector is pi/4 wide
-    index = int((angle + math.pi / 8) / (math.pi / 4)) % 8
-    arrows = ["→", "↗", "↑", "↖", "←", "↙", "↓", "↘"]
-    return arrows[index]
+from .tactical_map import TacticalMap, TacticalMapCache, get_velocity_arrow
 
 
 def generate_battle_plot(
     state_dict: Dict[str, Any],
     faction: str,
     projection: str = "xy",
+    tracks: bool = False,
 ) -> str:
     """
     Generate ASCII tactical map showing ship positions and velocities.
@@ -65,201 +50,12 @@ def generate_battle_plot(
         state_dict: Battle state dictionary with friendly_ships and enemy_ships
         faction: Our faction ("alpha" or "beta")
         projection: Which 2D plane to project onto ("xy", "xz", "yz")
+        tracks: Also draw projectiles and torpedoes with their tracks
 
     Returns:
         ASCII tactical map string
     """
-    # Extract ship data
-    friendly_ships = state_dict.get("friendly_ships", [])
-    enemy_ships = state_dict.get("enemy_ships", [])
-    timestamp = state_dict.get("timestamp", 0)
-
-    # Determine axis mapping based on projection
-    if projection == "xy":
-        axis_x, axis_y = "x", "y"
-        axis_label = "X/Y plane (Z ignored)"
-    elif projection == "xz":
-        axis_x, axis_y = "x", "z"
-        axis_label = "X/Z plane (Y ignored)"
-    else:  # yz
-        axis_x, axis_y = "y", "z"
-        axis_label = "Y/Z plane (X ignored)"
-
-    # Collect all ship data
-    all_ships = []
-
-    for ship in friendly_ships:
-        pos = ship.get("position_km", {})
-        vel = ship.get("velocity_vector", {})
-        all_ships.append({
-            "id": ship.get("ship_id", "?"),
-            "name": ship.get("ship_name", ship.get("ship_id", "?")),
-            "x": pos.get(axis_x, 0),
-            "y": pos.get(axis_y, 0),
-            "vx": vel.get(axis_x, 0),
-            "vy": vel.get(axis_y, 0),
-            "hull": ship.get("hull_integrity"),  # 0-100
-            "friendly": True,
-        })
-
-    for ship in enemy_ships:
-        pos = ship.get("position_km", {})
-        vel = ship.get("velocity_vector", {})
-        all_ships.append({
-            "id": ship.get("ship_id", "?"),
-            "name": ship.get("ship_name", ship.get("ship_id", "?")),
-            "x": pos.get(axis_x, 0),
-            "y": pos.get(axis_y, 0),
-            "vx": vel.get(axis_x, 0),
-            "vy": vel.get(axis_y, 0),
-            "hull": None,  # Fog of war - no hull for enemies
-            "friendly": False,
-        })
-
-    if not all_ships:
-        return "No ships to display."
-
-    # Calculate bounds
-    xs = [s["x"] for s in all_ships]
-    ys = [s["y"] for s in all_ships]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-
-    # Add padding (10% or minimum 10km)
-    padding_x = max((max_x - min_x) * 0.1, 10)
-    padding_y = max((max_y - min_y) * 0.1, 10)
-    min_x -= padding_x
-    max_x += padding_x
-    min_y -= padding_y
-    max_y += padding_y
-
-    # Ensure non-zero range
-    if max_x - min_x < 1:
-        min_x -= 5
-        max_x += 5
-    if max_y - min_y < 1:
-        min_y -= 5
-        max_y += 5
-
-    # Grid size (~60 chars wide, ~20 chars tall for the plot area)
-    grid_width = 60
-    grid_height = 20
-
-    # Calculate scale
-    scale_x = (max_x - min_x) / grid_width
-    scale_y = (max_y - min_y) / grid_height
-    scale = max(scale_x, scale_y)  # Use same scale for both to preserve aspect
-
-    # Create grid (y=0 is top of display)
-    grid = [[" " for _ in range(grid_width)] for _ in range(grid_height)]
-
-    # Ship labels for the map
-    friendly_label = "A" if faction == "alpha" else "B"
-    enemy_label = "B" if faction == "alpha" else "A"
-
-    # Place ships on grid
-    placed_ships = []
-    friendly_idx = 1
-    enemy_idx = 1
-
-    for ship in all_ships:
-        # Convert to grid coordinates
-        gx = int((ship["x"] - min_x) / scale) if scale > 0 else grid_width // 2
-        gy = int((max_y - ship["y"]) / scale) if scale > 0 else grid_height // 2  # Flip Y
-
-        # Clamp to grid bounds
-        gx = max(0, min(grid_width - 1, gx))
-        gy = max(0, min(grid_height - 1, gy))
-
-        # Assign label
-        if ship["friendly"]:
-            label = f"{friendly_label}{friendly_idx}"
-            friendly_idx += 1
-        else:
-            label = f"{enemy_label}{enemy_idx}"
-            enemy_idx += 1
-
-        # Get velocity arrow
-        arrow = get_velocity_arrow(ship["vx"], ship["vy"])
-
-        placed_ships.append({
-            **ship,
-            "gx": gx,
-            "gy": gy,
-            "label": label,
-            "arrow": arrow,
-        })
-
-    # Draw ships on grid - use markers that won't overlap
-    for ps in placed_ships:
-        gx, gy = ps["gx"], ps["gy"]
-        marker = f"[{ps['label']}]"
-        # Try to place the marker (5 chars wide)
-        start_x = max(0, min(gx - 2, grid_width - 5))
-        if gy < grid_height:
-            for i, ch in enumerate(marker):
-                if start_x + i < grid_width:
-                    grid[gy][start_x + i] = ch
-
-    # Build output
-    lines = []
-    border = "═" * 62
-    lines.append(f"╔{border}╗")
-    lines.append(f"║  TACTICAL MAP - T={timestamp:.0f}s  ({axis_label}){'':>14}║")
-    lines.append(f"╠{border}╣")
-
-    # Add grid rows
-    for row in grid:
-        line = "".join(row)
-        lines.append(f"║ {line} ║")
-
-    lines.append(f"╠{border}╣")
-
-    # Legend section
-    lines.append(f"║  SHIPS:{'':>54}║")
-
-    # Group by friendly/enemy
-    friendly_list = [s for s in placed_ships if s["friendly"]]
-    enemy_list = [s for s in placed_ships if not s["friendly"]]
-
-    # Show friendly ships with hull
-    for s in friendly_list:
-        hull_str = f"({s['hull']:.0f}%)" if s["hull"] is not None else ""
-        arrow = s["arrow"]
-        entry = f"  {arrow}[{s['label']}] {s['name'][:15]:<15} {hull_str}"
-        lines.append(f"║{entry:<62}║")
-
-    # Show enemy ships (no hull - fog of war)
-    for s in enemy_list:
-        arrow = s["arrow"]
-        entry = f"  {arrow}[{s['label']}] {s['name'][:15]:<15} (enemy)"
-        lines.append(f"║{entry:<62}║")
-
-    # Calculate and show distances between closest pairs
-    lines.append(f"║{'':>62}║")
-    lines.append(f"║  DISTANCES:{'':>50}║")
-
-    # Show distance from each friendly to closest enemy
-    for fs in friendly_list:
-        min_dist = float('inf')
-        closest_enemy = None
-        for es in enemy_list:
-            dx = fs["x"] - es["x"]
-            dy = fs["y"] - es["y"]
-            dist = math.sqrt(dx*dx + dy*dy)
-            if dist < min_dist:
-                min_dist = dist
-                closest_enemy = es
-        if closest_enemy:
-            entry = f"  [{fs['label']}] → [{closest_enemy['label']}]: {min_dist:.1f} km"
-            lines.append(f"║{entry:<62}║")
-
-    lines.append(f"╠{border}╣")
-    lines.append(f"║  Scale: 1 char ≈ {scale:.1f}km  |  Arrows show velocity direction{'':>5}║")
-    lines.append(f"║  Friendly hull shown  |  Enemy hull hidden (fog of war){'':>6}║")
-    lines.append(f"╚{border}╝")
-
-    return "\n".join(lines)
+    return TacticalMap(state_dict, faction).render(projection, tracks)
 
 
 class StateProvider(Protocol):
@@ -277,6 +73,10 @@ class StateProvider(Protocol):
         """Signal that commands are complete."""
         ...
 
+    def state_key(self, faction: str) -> Optional[str]:
+        """Version of the last state returned (None if unknown)."""
+        ...
+
 
 class SharedStateProvider:
     """State provider using in-process shared memory."""
@@ -295,18 +95,44 @@ class SharedStateProvider:
     def signal_ready(self, faction: str) -> None:
         self._state.signal_ready(faction)
 
+    def state_key(self, faction: str) -> Optional[str]:
+        return self._state.state_etag(faction)
+
 
 class HttpStateProvider:
-    """State provider using HTTP API."""
+    """
+    State provider using HTTP API.
+
+    With push=True, state arrives over the server's WebSocket stream as soon
+    as it is published (no polling), and commands and ready signals go over
+    the same connection.
+    """
 
-    def __init__(self, base_url: str, faction: str):
+    def __init__(
+        self,
+        base_url: str,
+        faction: str,
+        battle_id: Optional[str] = None,
+        push: bool = False,
+    ):
         self.faction = faction
         self.base_url = base_url
-        self._client = MCPHttpClient(base_url, faction)
+        self._client = MCPHttpClient(base_url, faction, battle_id=battle_id)
+        self._stream = MCPStreamClient(base_url, faction, battle_id=battle_id) if push else None
+        self._stream_connected = False
         self._pending_commands: List[MCPCommand] = []
 
+    async def _connected_stream(self) -> MCPStreamClient:
+        if not self._stream_connected:
+            await self._stream.connect()
+            self._stream_connected = True
+        return self._stream
+
     async def get_state_dict_async(self) -> Dict[str, Any]:
-        """Async version of get_state_dict."""
+        """Async version of get_state_dict (latest pushed state in push mode)."""
+        if self._stream is not None:
+            stream = await self._connected_stream()
+            return await stream.wait_for_state()
         return await self._client.get_state_dict()
 
     def get_state_dict(self, faction: str) -> Dict[str, Any]:
@@ -324,7 +150,10 @@ class HttpStateProvider:
         self._pending_commands.append(command)
 
     async def send_command_async(self, command: MCPCommand) -> Dict[str, Any]:
-        """Send a single command via HTTP."""
+        """Send a single command via HTTP (or the stream in push mode)."""
+        if self._stream is not None:
+            stream = await self._connected_stream()
+            return await stream.send_commands([command])
         return await self._client.send_command(command)
 
     def signal_ready(self, faction: str) -> None:
@@ -337,16 +166,30 @@ class HttpStateProvider:
 
     async def signal_ready_async(self) -> Dict[str, Any]:
         """Async version of signal_ready."""
+        if self._stream is not None:
+            stream = await self._connected_stream()
+            return await stream.signal_ready()
         return await self._client.signal_ready()
 
+    def state_key(self, faction: str) -> Optional[str]:
+        """Version of the last fetched or pushed state (None if unknown)."""
+        if self._stream is not None:
+            return f"push-{self._stream.version}" if self._stream.state is not None else None
+        return self._client.etag
+
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and stream."""
         await self._client.close()
+        if self._stream_connected:
+            await self._stream.close()
+            self._stream_connected = False
 
 
 def create_mcp_server(
     faction: str,
     http_url: Optional[str] = None,
+    battle_id: Optional[str] = None,
+    push: bool = False,
 ) -> Optional['Server']:
     """
     Create an MCP server for a specific faction.
@@ -354,6 +197,8 @@ def create_mcp_server(
     Args:
         faction: "alpha" or "beta"
         http_url: If provided, use HTTP mode to connect to this URL
+        battle_id: Battle to join on a multi-battle HTTP server (HTTP mode only)
+        push: Receive state over the WebSocket stream instead of polling (HTTP mode only)
 
     Returns:
         MCP Server instance or None if MCP not available
@@ -365,7 +210,7 @@ def create_mcp_server(
 
     # Create state provider (HTTP or shared memory)
     if http_url:
-        state_provider = HttpStateProvider(http_url, faction)
+        state_provider = HttpStateProvider(http_url, faction, battle_id=battle_id, push=push)
         is_http_mode = True
     else:
         state_provider = SharedStateProvider(faction)
@@ -374,6 +219,9 @@ def create_mcp_server(
     # For backwards compatibility, also get shared state reference
     state = get_mcp_state() if not is_http_mode else None
 
+    # Rendered tactical maps per state version
+    plot_cache = TacticalMapCache()
+
     # === RESOURCES ===
 
     @server.list_resources()
@@ -616,6 +464,10 @@ def create_mcp_server(
                             "enum": ["xy", "xz", "yz"],
                             "description": "Which 2D plane to project onto (default: xy)",
                         },
+                        "tracks": {
+                            "type": "boolean",
+                            "description": "Also show projectiles and torpedoes with tracks to their targets (default: false)",
+                        },
                     },
                     "required": [],
                 },
@@ -817,13 +669,15 @@ def create_mcp_server(
             )]
 
         elif name == "battle_plot":
-            if state_dict is None:
-                if is_http_mode:
-                    state_dict = await state_provider.get_state_dict_async()
-                else:
-                    state_dict = state_provider.get_state_dict(faction)
-            projection = arguments.get("projection", "xy")
-            plot = generate_battle_plot(state_dict, faction, projection)
+            # In HTTP mode state_dict is already fetched; in shared memory
+            # mode it is only built if this state version was not plotted yet
+            plot = plot_cache.render(
+                state_provider.state_key(faction),
+                faction,
+                lambda: state_dict if state_dict is not None else state_provider.get_state_dict(faction),
+                projection=arguments.get("projection", "xy"),
+                tracks=bool(arguments.get("tracks", False)),
+            )
             return [TextContent(
                 type="text",
                 text=plot,
@@ -838,18 +692,25 @@ def create_mcp_server(
     return server
 
 
-async def run_mcp_server(faction: str, http_url: Optional[str] = None) -> None:
+async def run_mcp_server(
+    faction: str,
+    http_url: Optional[str] = None,
+    battle_id: Optional[str] = None,
+    push: bool = False,
+) -> None:
     """
     Run the MCP server for a faction.
 
     Args:
         faction: "alpha" or "beta"
         http_url: If provided, use HTTP mode to connect to this URL
+        battle_id: Battle to join on a multi-battle HTTP server (HTTP mode only)
+        push: Receive state over the WebSocket stream instead of polling (HTTP mode only)
     """
     if not MCP_AVAILABLE:
         raise RuntimeError("MCP package not installed. Run: pip install mcp")
 
-    server = create_mcp_server(faction, http_url=http_url)
+    server = create_mcp_server(faction, http_url=http_url, battle_id=battle_id, push=push)
     if server is None:
         raise RuntimeError("Failed to create MCP server")
 
@@ -907,9 +768,19 @@ def parse_args():
         metavar="URL",
         help="HTTP API URL (e.g., http://localhost:8765). If provided, uses HTTP mode instead of shared memory.",
     )
+    parser.add_argument(
+        "--battle-id",
+        metavar="ID",
+        help="Battle to join when the HTTP API hosts several battles (default battle if omitted).",
+    )
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="Receive battle state over the HTTP API's WebSocket stream instead of polling.",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    asyncio.run(run_mcp_server(args.faction, http_url=args.http))
+    asyncio.run(run_mcp_server(args.faction, http_url=args.http, battle_id=args.battle_id, push=args.push))
@@ -1,18 +1,31 @@
 """
 MCP Shared State - Thread-safe singleton for MCP server/controller communication.
 
-Manages:
+Manages, per hosted battle:
 - Current battle state for MCP clients to read
 - Pending commands from MCP tools
 - Synchronization primitives for async coordination
+
+One process can host many battles at once: each has its own MCPBattleStore,
+keyed by battle ID. The singleton is the store of the default battle.
 """
 
 import asyncio
+import json
 import threading
+import time
+import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from enum import Enum
 
+from .mcp_state_codec import EncodedState, StateEncoder, apply_state_delta
+
+
+# Instance manipulation (RFC 3229 A-IM / IM header) naming the delta format
+STATE_DELTA_IM = "mcp-state-delta"
+
 
 class MCPCommandType(Enum):
     """Types of commands that can be issued via MCP."""
@@ -92,31 +105,34 @@ class MCPBattleState:
         }
 
 
-class MCPSharedState:
-    """
-    Thread-safe singleton managing shared state between MCP server and controller.
+DEFAULT_BATTLE_ID = "default"
 
-    The MCP server reads state and writes commands.
-    The battle controller reads commands and writes state.
+
+class MCPBattleStore:
     """
+    State, commands and ready flags of one battle's MCP-controlled factions.
 
-    _instance: Optional['MCPSharedState'] = None
-    _lock = threading.Lock()
+    The MCP server (or HTTP API) reads state and writes commands.
+    The battle controller reads commands and writes state.
 
-    def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+    Attributes:
+        battle_id: Battle this store belongs to.
+        status: Battle status ("waiting", "running", "paused", "ended").
+        checkpoint: Current checkpoint number.
+        waiting_for: Factions the battle is waiting on.
+        connected_factions: Factions whose MCP client has read state.
+        last_active: time.monotonic() of the last read or write.
+    """
 
-    def __init__(self):
-        if self._initialized:
-            return
+    def __init__(self, battle_id: str = DEFAULT_BATTLE_ID):
+        """
+        Args:
+            battle_id: Battle this store belongs to.
+        """
+        self.battle_id = battle_id
 
         # Thread-safe state storage
         self._state_lock = threading.Lock()
-        self._command_lock = threading.Lock()
 
         # Current battle state per faction
         self._battle_states: Dict[str, MCPBattleState] = {
@@ -124,12 +140,25 @@ class MCPSharedState:
             "beta": MCPBattleState(faction="beta"),
         }
 
-        # Pending commands per faction (cleared after processing)
-        self._pending_commands: Dict[str, List[MCPCommand]] = {
-            "alpha": [],
-            "beta": [],
+        # Pending commands per faction (drained after processing). deque
+        # appends and pops are atomic, so producers and the consumer need
+        # no lock
+        self._pending_commands: Dict[str, deque] = {
+            "alpha": deque(),
+            "beta": deque(),
         }
 
+        # State version per faction (bumped on every update) and listeners
+        # notified of each new version
+        self._state_versions: Dict[str, int] = {"alpha": 0, "beta": 0}
+        self._subscribers: Dict[str, List[Callable[[int, MCPBattleState], None]]] = {}
+
+        # Version history and encoded payloads per faction (for ETags and
+        # deltas); the epoch tells this store's versions apart from those of
+        # an earlier battle with the same ID
+        self._encoders: Dict[str, StateEncoder] = {}
+        self.epoch = uuid.uuid4().hex[:8]
+
         # Ready flags - set when MCP client signals commands complete
         self._ready_flags: Dict[str, asyncio.Event] = {}
 
@@ -139,20 +168,38 @@ class MCPSharedState:
         # Battle registration
         self._active_factions: set = set()
 
-        self._initialized = True
-
-    @classmethod
-    def get_instance(cls) -> 'MCPSharedState':
-        """Get the singleton instance."""
-        return cls()
-
-    @classmethod
-    def reset(cls) -> None:
-        """Reset the singleton (for testing)."""
-        with cls._lock:
-            if cls._instance is not None:
-                cls._instance._initialized = False
-                cls._instance = None
+        # Battle status (served by the HTTP API)
+        self.status = "waiting"
+        self.checkpoint = 0
+        self.waiting_for: List[str] = []
+        self.connected_factions: set = set()
+        self.last_active = time.monotonic()
+
+    def touch(self) -> None:
+        """Mark the battle as active now."""
+        self.last_active = time.monotonic()
+
+    def set_status(
+        self,
+        status: str,
+        checkpoint: int = 0,
+        waiting_for: Optional[List[str]] = None,
+    ) -> None:
+        """Update battle status."""
+        self.status = status
+        self.checkpoint = checkpoint
+        self.waiting_for = list(waiting_for or [])
+        self.touch()
+
+    def status_dict(self) -> Dict[str, Any]:
+        """Battle status for the HTTP API."""
+        return {
+            "battle_id": self.battle_id,
+            "status": self.status,
+            "checkpoint": self.checkpoint,
+            "waiting_for": list(self.waiting_for),
+            "connected_factions": sorted(self.connected_factions),
+        }
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """Set the event loop for async coordination."""
@@ -166,7 +213,7 @@ class MCPSharedState:
         with self._state_lock:
             self._active_factions.add(faction)
             self._battle_states[faction] = MCPBattleState(faction=faction)
-            self._pending_commands[faction] = []
+            self._pending_commands[faction] = deque()
 
     def unregister_faction(self, faction: str) -> None:
         """Unregister a faction."""
@@ -181,9 +228,84 @@ class MCPSharedState:
     # === State Management (written by controller, read by MCP server) ===
 
     def update_state(self, faction: str, state: MCPBattleState) -> None:
-        """Update battle state for a faction."""
+        """Update battle state for a faction and notify its subscribers."""
         with self._state_lock:
             self._battle_states[faction] = state
+            version = self._state_versions.get(faction, 0) + 1
+            self._state_versions[faction] = version
+            subscribers = list(self._subscribers.get(faction, ()))
+            self._encoders.setdefault(faction, StateEncoder()).publish(version, state)
+        self.touch()
+
+        for callback in subscribers:
+            callback(version, state)
+
+    def get_state_version(self, faction: str) -> int:
+        """Number of state updates published for a faction."""
+        with self._state_lock:
+            return self._state_versions.get(faction, 0)
+
+    def state_etag(self, faction: str, version: Optional[int] = None) -> str:
+        """Entity tag of a faction's state version (latest by default)."""
+        if version is None:
+            version = self.get_state_version(faction)
+        return f'"{self.epoch}-{faction}-{version}"'
+
+    def parse_state_etag(self, faction: str, etag: str) -> Optional[int]:
+        """Version named by an entity tag of this store, or None."""
+        parts = etag.strip().removeprefix("W/").strip('"').split("-")
+        if len(parts) != 3 or parts[0] != self.epoch or parts[1] != faction:
+            return None
+        try:
+            return int(parts[2])
+        except ValueError:
+            return None
+
+    def encode_state(
+        self,
+        faction: str,
+        since: Optional[int] = None,
+        compress: bool = False,
+    ) -> EncodedState:
+        """
+        Encoded latest state for a faction.
+
+        Args:
+            faction: Faction to encode
+            since: Version the client holds (a delta is sent if still known)
+            compress: gzip the payload
+
+        Returns:
+            Cached EncodedState (full state or delta)
+        """
+        with self._state_lock:
+            encoder = self._encoders.setdefault(faction, StateEncoder())
+        return encoder.encode(since, compress, current=self.get_state(faction))
+
+    def subscribe(
+        self,
+        faction: str,
+        callback: Callable[[int, MCPBattleState], None],
+    ) -> Callable[[], None]:
+        """
+        Call callback(version, state) on every state update for a faction.
+
+        The callback runs synchronously in the thread that publishes the
+        state, so it should only hand the update off (e.g. to a queue).
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._state_lock:
+            self._subscribers.setdefault(faction, []).append(callback)
+
+        def unsubscribe() -> None:
+            with self._state_lock:
+                callbacks = self._subscribers.get(faction, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+
+        return unsubscribe
 
     def get_state(self, faction: str) -> MCPBattleState:
         """Get current battle state for a faction."""
@@ -198,21 +320,35 @@ class MCPSharedState:
 
     def add_command(self, faction: str, command: MCPCommand) -> None:
         """Add a command from MCP client."""
-        with self._command_lock:
-            if faction in self._pending_commands:
-                self._pending_commands[faction].append(command)
+        queue = self._pending_commands.get(faction)
+        if queue is not None:
+            queue.append(command)
+        self.touch()
+
+    def add_commands(self, faction: str, commands: List[MCPCommand]) -> None:
+        """Add a batch of commands from MCP client, keeping their order."""
+        queue = self._pending_commands.get(faction)
+        if queue is not None:
+            queue.extend(commands)
+        self.touch()
 
     def get_pending_commands(self, faction: str) -> List[MCPCommand]:
         """Get and clear pending commands for a faction."""
-        with self._command_lock:
-            commands = self._pending_commands.get(faction, [])
-            self._pending_commands[faction] = []
+        queue = self._pending_commands.get(faction)
+        commands = []
+        if queue is None:
+            return commands
+        # Pop rather than swap the queue, so a command appended meanwhile is
+        # either returned now or kept for the next call
+        try:
+            while True:
+                commands.append(queue.popleft())
+        except IndexError:
             return commands
 
     def peek_pending_commands(self, faction: str) -> List[MCPCommand]:
         """Get pending commands without clearing."""
-        with self._command_lock:
-            return list(self._pending_commands.get(faction, []))
+        return list(self._pending_commands.get(faction, ()))
 
     # === Ready Signaling ===
 
@@ -220,19 +356,20 @@ class MCPSharedState:
         """Signal that MCP client has finished issuing commands for this turn."""
         if faction in self._ready_flags:
             self._ready_flags[faction].set()
+        self.touch()
 
     def clear_ready(self, faction: str) -> None:
         """Clear ready flag for next turn."""
         if faction in self._ready_flags:
             self._ready_flags[faction].clear()
 
-    async def wait_for_ready(self, faction: str, timeout: float = 60.0) -> bool:
+    async def wait_for_ready(self, faction: str, timeout: Optional[float] = 60.0) -> bool:
         """
         Wait for MCP client to signal ready.
 
         Args:
             faction: Faction to wait for
-            timeout: Maximum wait time in seconds
+            timeout: Maximum wait time in seconds (None waits indefinitely)
 
         Returns:
             True if ready received, False if timeout
@@ -256,12 +393,151 @@ class MCPSharedState:
         return self._ready_flags[faction].is_set()
 
 
+class MCPSharedState(MCPBattleStore):
+    """
+    Thread-safe singleton managing shared state between MCP server and controller.
+
+    The singleton is itself the store of the default battle, so single-battle
+    code can keep calling the faction methods on it directly. Further battles
+    hosted by the same process get their own MCPBattleStore, created with
+    create_battle() and looked up with battle().
+    """
+
+    _instance: Optional['MCPSharedState'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        super().__init__(DEFAULT_BATTLE_ID)
+
+        # Hosted battles by ID (the default battle is this store)
+        self._battles_lock = threading.Lock()
+        self._battles: Dict[str, MCPBattleStore] = {DEFAULT_BATTLE_ID: self}
+
+        self._initialized = True
+
+    @classmethod
+    def get_instance(cls) -> 'MCPSharedState':
+        """Get the singleton instance."""
+        return cls()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the singleton (for testing)."""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance._initialized = False
+                cls._instance = None
+
+    # === Battle Registry ===
+
+    def create_battle(self, battle_id: Optional[str] = None) -> MCPBattleStore:
+        """
+        Create the store of a new battle.
+
+        Args:
+            battle_id: Battle ID (a random one if not given)
+
+        Returns:
+            The new store
+
+        Raises:
+            ValueError: If a battle with this ID already exists
+        """
+        battle_id = battle_id or uuid.uuid4().hex[:12]
+        with self._battles_lock:
+            if battle_id in self._battles:
+                raise ValueError(f"Battle already exists: {battle_id}")
+            store = MCPBattleStore(battle_id)
+            self._battles[battle_id] = store
+            return store
+
+    def battle(self, battle_id: str = DEFAULT_BATTLE_ID) -> Optional[MCPBattleStore]:
+        """Store of a battle, or None if it does not exist."""
+        with self._battles_lock:
+            return self._battles.get(battle_id)
+
+    def get_or_create_battle(self, battle_id: str = DEFAULT_BATTLE_ID) -> MCPBattleStore:
+        """Store of a battle, created if it does not exist yet."""
+        with self._battles_lock:
+            store = self._battles.get(battle_id)
+            if store is None:
+                store = self._battles[battle_id] = MCPBattleStore(battle_id)
+            return store
+
+    def battle_ids(self) -> List[str]:
+        """IDs of all hosted battles, including the default one."""
+        with self._battles_lock:
+            return list(self._battles)
+
+    def remove_battle(self, battle_id: str) -> bool:
+        """
+        Drop a battle's store (the default battle cannot be removed).
+
+        Returns:
+            True if the battle existed and was removed
+        """
+        if battle_id == DEFAULT_BATTLE_ID:
+            return False
+        with self._battles_lock:
+            return self._battles.pop(battle_id, None) is not None
+
+    def remove_idle_battles(
+        self,
+        max_idle_s: float,
+        statuses: tuple = ("waiting", "ended"),
+    ) -> List[str]:
+        """
+        Drop battles idle for longer than max_idle_s.
+
+        Only battles in one of the given statuses are dropped, so a running
+        battle that waits on a slow MCP client is kept.
+
+        Args:
+            max_idle_s: Idle time after which a battle is dropped
+            statuses: Statuses eligible for removal
+
+        Returns:
+            IDs of the removed battles
+        """
+        now = time.monotonic()
+        with self._battles_lock:
+            expired = [
+                battle_id for battle_id, store in self._battles.items()
+                if battle_id != DEFAULT_BATTLE_ID
+                and store.status in statuses
+                and now - store.last_active > max_idle_s
+            ]
+            for battle_id in expired:
+                del self._battles[battle_id]
+        return expired
+
+
 # Convenience function to get singleton
 def get_mcp_state() -> MCPSharedState:
     """Get the MCP shared state singleton."""
     return MCPSharedState.get_instance()
 
 
+def _command_to_dict(command: MCPCommand) -> Dict[str, Any]:
+    """Wire format of a command."""
+    return {
+        "command_type": command.command_type.value,
+        "ship_id": command.ship_id,
+        "parameters": command.parameters,
+        "timestamp": command.timestamp,
+    }
+
+
 class MCPHttpClient:
     """
     HTTP client for MCP servers to communicate with the battle API server.
@@ -270,18 +546,36 @@ class MCPHttpClient:
     and need to communicate with the battle runner via HTTP.
     """
 
-    def __init__(self, base_url: str, faction: str):
+    def __init__(self, base_url: str, faction: str, battle_id: Optional[str] = None):
         """
         Initialize HTTP client.
 
         Args:
             base_url: Base URL of the battle API server (e.g., "http://localhost:8765")
             faction: Faction this client represents ("alpha" or "beta")
+            battle_id: Battle to join on a multi-battle server (default battle if None)
         """
         self.base_url = base_url.rstrip("/")
         self.faction = faction
+        self.battle_id = battle_id
         self._client = None
 
+        # Last fetched state and its ETag
+        self._etag: Optional[str] = None
+        self._cached_state: Optional[Dict[str, Any]] = None
+
+    @property
+    def battle_url(self) -> str:
+        """Base URL of this client's battle routes."""
+        if self.battle_id is None:
+            return self.base_url
+        return f"{self.base_url}/battles/{self.battle_id}"
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag of the last fetched state (None before the first fetch)."""
+        return self._etag
+
     async def _get_client(self):
         """Get or create the HTTP client."""
         if self._client is None:
@@ -305,11 +599,7 @@ class MCPHttpClient:
         Returns:
             MCPBattleState for this faction
         """
-        client = await self._get_client()
-        response = await client.get(f"{self.base_url}/state/{self.faction}")
-        response.raise_for_status()
-
-        data = response.json()
+        data = await self.get_state_dict()
         return MCPBattleState(
             timestamp=data.get("timestamp", 0.0),
             faction=data.get("faction", self.faction),
@@ -328,13 +618,29 @@ class MCPHttpClient:
         """
         Fetch current battle state as dictionary.
 
+        Revalidates the last fetched state with its ETag: an unchanged state
+        costs a 304 with no body, a changed one usually only a delta.
+
         Returns:
-            Battle state as dictionary
+            Battle state as dictionary (shared with the client's cache; do
+            not modify)
         """
         client = await self._get_client()
-        response = await client.get(f"{self.base_url}/state/{self.faction}")
+        headers = {"A-IM": STATE_DELTA_IM, "Accept-Encoding": "gzip"}
+        if self._etag is not None:
+            headers["If-None-Match"] = self._etag
+
+        response = await client.get(f"{self.battle_url}/state/{self.faction}", headers=headers)
+        if response.status_code == 304:
+            return self._cached_state
         response.raise_for_status()
-        return response.json()
+
+        data = response.json()
+        if response.status_code == 226:
+            data = apply_state_delta(self._cached_state, data["ops"])
+        self._etag = response.headers.get("ETag")
+        self._cached_state = data
+        return data
 
     async def send_command(self, command: MCPCommand) -> Dict[str, Any]:
         """
@@ -348,17 +654,9 @@ class MCPHttpClient:
         """
         client = await self._get_client()
 
-        # Serialize command
-        command_data = {
-            "command_type": command.command_type.value,
-            "ship_id": command.ship_id,
-            "parameters": command.parameters,
-            "timestamp": command.timestamp,
-        }
-
         response = await client.post(
-            f"{self.base_url}/commands/{self.faction}",
-            json=command_data,
+            f"{self.battle_url}/commands/{self.faction}",
+            json=_command_to_dict(command),
         )
         response.raise_for_status()
         return response.json()
@@ -375,20 +673,9 @@ class MCPHttpClient:
         """
         client = await self._get_client()
 
-        # Serialize commands
-        commands_data = [
-            {
-                "command_type": cmd.command_type.value,
-                "ship_id": cmd.ship_id,
-                "parameters": cmd.parameters,
-                "timestamp": cmd.timestamp,
-            }
-            for cmd in commands
-        ]
-
         response = await client.post(
-            f"{self.base_url}/commands/{self.faction}",
-            json={"commands": commands_data},
+            f"{self.battle_url}/commands/{self.faction}",
+            json={"commands": [_command_to_dict(cmd) for cmd in commands]},
         )
         response.raise_for_status()
         return response.json()
@@ -401,7 +688,7 @@ class MCPHttpClient:
             Server response
         """
         client = await self._get_client()
-        response = await client.post(f"{self.base_url}/ready/{self.faction}")
+        response = await client.post(f"{self.battle_url}/ready/{self.faction}")
         response.raise_for_status()
         return response.json()
 
@@ -413,7 +700,7 @@ class MCPHttpClient:
             Status dict with keys: status, checkpoint, waiting_for, etc.
         """
         client = await self._get_client()
-        response = await client.get(f"{self.base_url}/status")
+        response = await client.get(f"{self.battle_url}/status")
         response.raise_for_status()
         return response.json()
 
@@ -430,3 +717,151 @@ class MCPHttpClient:
             return response.status_code == 200
         except Exception:
             return False
+
+
+class MCPStreamClient:
+    """
+    WebSocket client for push-based state delivery.
+
+    Keeps one connection to the battle API server's /ws/{faction} route.
+    The server pushes every new battle state as soon as the controller
+    publishes it; commands and ready signals go over the same connection.
+
+    Usage:
+        client = MCPStreamClient("http://localhost:8765", "alpha")
+        await client.connect()
+        state = await client.wait_for_state()
+        await client.send_commands(commands)
+        await client.signal_ready()
+        await client.close()
+    """
+
+    def __init__(self, base_url: str, faction: str, battle_id: Optional[str] = None):
+        """
+        Initialize stream client.
+
+        Args:
+            base_url: Base URL of the battle API server (e.g., "http://localhost:8765")
+            faction: Faction this client represents ("alpha" or "beta")
+            battle_id: Battle to join on a multi-battle server (default battle if None)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.faction = faction
+        self.battle_id = battle_id
+
+        # Latest pushed state and its version
+        self.state: Optional[Dict[str, Any]] = None
+        self.version = 0
+        self.states_received = 0
+
+        self._session = None
+        self._ws = None
+        self._reader: Optional[asyncio.Task] = None
+        self._state_changed: Optional[asyncio.Condition] = None
+        self._send_lock: Optional[asyncio.Lock] = None
+        self._replies: List[asyncio.Future] = []
+
+    @property
+    def stream_url(self) -> str:
+        """WebSocket URL of this client's battle and faction."""
+        base = self.base_url if self.battle_id is None else f"{self.base_url}/battles/{self.battle_id}"
+        return f"{base}/ws/{self.faction}"
+
+    async def connect(self) -> None:
+        """Open the connection and start receiving pushed states."""
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError("aiohttp package not installed. Run: pip install aiohttp")
+
+        self._state_changed = asyncio.Condition()
+        self._send_lock = asyncio.Lock()
+        self._session = aiohttp.ClientSession()
+        self._ws = await self._session.ws_connect(self.stream_url, heartbeat=30.0)
+        self._reader = asyncio.create_task(self._read())
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+        self._ws = self._session = self._reader = None
+
+    async def _read(self) -> None:
+        """Dispatch incoming messages: states to self.state, replies to waiters."""
+        import aiohttp
+
+        try:
+            async for message in self._ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(message.data)
+                if data.get("type") == "state":
+                    async with self._state_changed:
+                        self.state = data["state"]
+                        self.version = data["version"]
+                        self.states_received += 1
+                        self._state_changed.notify_all()
+                elif self._replies:
+                    future = self._replies.pop(0)
+                    if not future.done():
+                        future.set_result(data)
+        finally:
+            for future in self._replies:
+                if not future.done():
+                    future.set_exception(ConnectionError("MCP stream closed"))
+            self._replies.clear()
+
+    async def wait_for_state(
+        self,
+        after_version: int = -1,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for a state newer than after_version.
+
+        Args:
+            after_version: Last version the caller has seen (-1 for any state)
+            timeout: Maximum wait time in seconds (None waits indefinitely)
+
+        Returns:
+            Battle state as dictionary (self.version is its version)
+
+        Raises:
+            asyncio.TimeoutError: If no newer state arrives in time
+        """
+        async with self._state_changed:
+            await asyncio.wait_for(
+                self._state_changed.wait_for(
+                    lambda: self.state is not None and self.version > after_version
+                ),
+                timeout=timeout,
+            )
+            return self.state
+
+    async def _request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a message and wait for the server's reply to it."""
+        future = asyncio.get_running_loop().create_future()
+        async with self._send_lock:
+            self._replies.append(future)
+            await self._ws.send_json(payload)
+        return await future
+
+    async def send_commands(self, commands: List[MCPCommand]) -> Dict[str, Any]:
+        """
+        Send commands over the stream.
+
+        Returns:
+            Server response (accepted count, commands, errors)
+        """
+        return await self._request({
+            "type": "commands",
+            "commands": [_command_to_dict(cmd) for cmd in commands],
+        })
+
+    async def signal_ready(self) -> Dict[str, Any]:
+        """Signal that all commands for this turn have been issued."""
+        return await self._request({"type": "ready"})
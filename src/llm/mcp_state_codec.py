@@ -0,0 +1,267 @@
+"""
+Versioned, delta-encoded and compressed MCP battle state.
+
+Every state update gets a version number. Clients that already hold a
+version can ask for:
+
+- Nothing, if their version is current (ETag / If-None-Match -> 304)
+- A delta: only the fields that changed since their version
+- The full state otherwise
+
+Payloads are compact JSON, optionally gzip-compressed, and are encoded once
+per (version, base version, compression) however many clients fetch them.
+
+Delta format:
+    {"base_version": m, "version": n, "ops": [op, ...]}
+
+where each op is a list:
+    ["s", path, value]   set the value at path
+    ["d", path]          delete the dict key or list item at path
+    ["a", path, items]   append items to the list at path
+
+and a path is a list of dict keys and list indices from the state root.
+Dicts are diffed key by key; lists of the same length element by element;
+a list that grew by appending (chat history) gets an "a" op. Ship lists
+are matched by ship_id, so a destroyed ship costs a "d" op instead of
+resending the fleet. Any other list change replaces the list.
+"""
+
+import copy
+import gzip
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_HISTORY = 8  # Versions kept per faction as delta bases
+LIST_KEY = "ship_id"  # Identifies items of keyed lists
+
+
+def encode_json(data: Any) -> bytes:
+    """Compact JSON encoding (no whitespace)."""
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def diff_state(old: Any, new: Any) -> List[list]:
+    """
+    Ops that turn old into new.
+
+    Args:
+        old: Base state (JSON-compatible)
+        new: Target state (JSON-compatible)
+
+    Returns:
+        Delta ops (empty if the states are equal)
+    """
+    ops: List[list] = []
+    _diff(old, new, [], ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: list, ops: List[list]) -> None:
+    if old is new:
+        return  # Reused unchanged (states are not modified once published)
+    if type(old) is dict and type(new) is dict:
+        for key in old:
+            if key not in new:
+                ops.append(["d", path + [key]])
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["s", path + [key], value])
+            else:
+                _diff(old[key], value, path + [key], ops)
+    elif type(old) is list and type(new) is list:
+        if len(old) == len(new):
+            for index, (a, b) in enumerate(zip(old, new)):
+                _diff(a, b, path + [index], ops)
+        elif len(new) > len(old) and new[:len(old)] == old:
+            ops.append(["a", path, new[len(old):]])
+        else:
+            _diff_keyed_list(old, new, path, ops)
+    elif type(old) is not type(new) or old != new:
+        ops.append(["s", path, new])
+
+
+def _item_keys(items: list) -> Optional[list]:
+    keys = []
+    for item in items:
+        if type(item) is not dict or LIST_KEY not in item:
+            return None
+        keys.append(item[LIST_KEY])
+    return keys
+
+
+def _diff_keyed_list(old: list, new: list, path: list, ops: List[list]) -> None:
+    old_keys = _item_keys(old)
+    new_keys = _item_keys(new) if old_keys else None
+    if not old_keys or not new_keys or len(set(old_keys)) != len(old_keys):
+        ops.append(["s", path, new])
+        return
+
+    # Items may only drop out, or be added at the end, in the same order
+    kept = []
+    removed = []
+    for index, key in enumerate(old_keys):
+        if len(kept) < len(new_keys) and new_keys[len(kept)] == key:
+            kept.append(index)
+        else:
+            removed.append(index)
+    added = new[len(kept):]
+    if set(old_keys) & set(new_keys[len(kept):]):
+        ops.append(["s", path, new])
+        return
+
+    for index in reversed(removed):
+        ops.append(["d", path + [index]])
+    for position, index in enumerate(kept):
+        _diff(old[index], new[position], path + [position], ops)
+    if added:
+        ops.append(["a", path, added])
+
+
+def apply_state_delta(state: Any, ops: List[list]) -> Any:
+    """
+    Apply delta ops to a state.
+
+    Args:
+        state: Base state (not modified)
+        ops: Ops from diff_state
+
+    Returns:
+        The new state
+    """
+    state = copy.deepcopy(state)
+    for op in ops:
+        kind, path = op[0], op[1]
+        if not path:
+            state = copy.deepcopy(op[2])
+            continue
+
+        parent = state
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+
+        if kind == "s":
+            parent[key] = op[2]
+        elif kind == "d":
+            del parent[key]
+        elif kind == "a":
+            parent[key].extend(op[2])
+        else:
+            raise ValueError(f"Unknown delta op: {kind}")
+    return state
+
+
+@dataclass
+class EncodedState:
+    """
+    One encoded state payload.
+
+    Attributes:
+        version: State version the payload brings the client to.
+        base_version: Version the delta applies to (None for a full state).
+        body: Encoded bytes.
+        gzipped: Body is gzip-compressed.
+    """
+    version: int
+    base_version: Optional[int]
+    body: bytes
+    gzipped: bool = False
+
+    @property
+    def is_delta(self) -> bool:
+        return self.base_version is not None
+
+
+class StateEncoder:
+    """
+    Version history and payload cache for one faction's state.
+
+    Keeps the last few published states as delta bases and caches every
+    payload it encodes, so concurrent clients share one serialization.
+    Thread-safe.
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY):
+        """
+        Args:
+            history: Number of versions kept as delta bases.
+        """
+        self.history = history
+        self._lock = threading.Lock()
+        self._states: "OrderedDict[int, Any]" = OrderedDict()  # version -> state object
+        self._dicts: Dict[int, Dict[str, Any]] = {}
+        self._payloads: Dict[Tuple[int, Optional[int], bool], EncodedState] = {}
+
+    @property
+    def version(self) -> int:
+        """Latest published version (0 before the first one)."""
+        with self._lock:
+            return next(reversed(self._states)) if self._states else 0
+
+    def publish(self, version: int, state: Any) -> None:
+        """
+        Record a new state version.
+
+        Args:
+            version: Version number (increasing)
+            state: State object with to_dict(); converted lazily
+        """
+        with self._lock:
+            self._states[version] = state
+            while len(self._states) > self.history:
+                dropped, _ = self._states.popitem(last=False)
+                self._dicts.pop(dropped, None)
+            self._payloads = {
+                key: payload for key, payload in self._payloads.items()
+                if key[0] in self._states and (key[1] is None or key[1] in self._states)
+            }
+
+    def _as_dict(self, version: int) -> Dict[str, Any]:
+        if version not in self._dicts:
+            self._dicts[version] = self._states[version].to_dict()
+        return self._dicts[version]
+
+    def encode(
+        self,
+        since: Optional[int] = None,
+        compress: bool = False,
+        current: Any = None,
+    ) -> EncodedState:
+        """
+        Payload bringing a client to the latest version.
+
+        Args:
+            since: Version the client holds; a delta is sent if it is still
+                in the history, else the full state
+            compress: gzip the body
+            current: State to encode if nothing was published yet
+
+        Returns:
+            The (cached) encoded payload
+        """
+        with self._lock:
+            if not self._states:
+                body = encode_json(current.to_dict())
+                return EncodedState(0, None, gzip.compress(body) if compress else body, compress)
+
+            version = next(reversed(self._states))
+            base = since if since is not None and since in self._states and since != version else None
+            key = (version, base, compress)
+            payload = self._payloads.get(key)
+            if payload is None:
+                if base is None:
+                    body = encode_json(self._as_dict(version))
+                else:
+                    body = encode_json({
+                        "base_version": base,
+                        "version": version,
+                        "ops": diff_state(self._as_dict(base), self._as_dict(version)),
+                    })
+                if compress:
+                    body = gzip.compress(body)
+                payload = self._payloads[key] = EncodedState(version, base, body, compress)
+            return payload
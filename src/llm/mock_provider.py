@@ -0,0 +1,456 @@
+"""
+Local mock of an OpenAI/OpenRouter-compatible chat completions endpoint.
+
+Returns schema-valid tool calls for whatever tools the request offers
+(captain tools from tools.py, Admiral tools from admiral_tools.py, or any
+other JSON-schema function), with configurable latency, error injection
+and token counts. Requests with ``"stream": true`` get server-sent event
+chunks, with generation time spread across the tool calls. Used to load-test LLMBattleRunner, LLMAdmiral and
+LLMCaptain without paying for model calls.
+
+In-process::
+
+    with MockLLMProvider(MockProviderConfig(latency_median_s=1.2)) as provider:
+        client = CaptainClient(api_key="mock", base_url=provider.url)
+
+As a subprocess::
+
+    python -m src.llm.mock_provider --port 8780 --latency-median 1.2 --error-rate 0.02
+"""
+
+import argparse
+import json
+import math
+import random
+import string
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Tools that end a battle or stall it; never called unless weighted explicitly
+DEFAULT_TOOL_WEIGHTS: Dict[str, float] = {
+    "surrender": 0.0,
+    "propose_draw": 0.0,
+    "retract_draw": 0.0,
+    "propose_fleet_draw": 0.0,
+    "accept_fleet_draw": 0.0,
+    "reject_fleet_draw": 0.0,
+    "discuss_with_admiral": 0.0,
+    # Admirals are expected to issue orders every checkpoint
+    "issue_order": 3.0,
+}
+
+_WORDS = (
+    "hold", "advance", "flank", "target", "engage", "cover", "withdraw",
+    "focus", "fire", "starboard", "port", "vector", "intercept", "spinal",
+)
+
+
+@dataclass
+class MockProviderConfig:
+    """
+    Behaviour of the mock provider.
+
+    Latency is lognormal around ``latency_median_s`` plus a per-output-token
+    generation time, which approximates real provider response curves.
+
+    Attributes:
+        latency_median_s: Median time to first byte.
+        latency_sigma: Lognormal shape (0 = constant latency).
+        latency_per_output_token_s: Extra time per completion token.
+        error_rate: Probability a request fails with an injected error.
+        error_statuses: HTTP statuses used for injected errors.
+        retry_after_s: Retry-After header sent with injected 429s.
+        completion_tokens: (min, max) completion tokens per response.
+        chars_per_prompt_token: Prompt token estimate divisor.
+        tool_calls_per_response: (min, max) tool calls when tools are offered.
+        tool_weights: Relative selection weight per tool name (default 1.0).
+        seed: Random seed for reproducible behaviour.
+    """
+    latency_median_s: float = 0.5
+    latency_sigma: float = 0.35
+    latency_per_output_token_s: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (429, 500, 503)
+    retry_after_s: float = 1.0
+    completion_tokens: Tuple[int, int] = (40, 200)
+    chars_per_prompt_token: float = 4.0
+    tool_calls_per_response: Tuple[int, int] = (1, 3)
+    tool_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TOOL_WEIGHTS))
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockProviderStats:
+    """Counters for requests served by a MockLLMProvider."""
+    requests: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_latency_s: float = 0.0
+    tool_calls: Dict[str, int] = field(default_factory=dict)
+
+
+# =============================================================================
+# SCHEMA-DRIVEN ARGUMENT GENERATION
+# =============================================================================
+
+def generate_from_schema(schema: Dict[str, Any], rng: random.Random) -> Any:
+    """
+    Generate a random value that validates against a JSON schema.
+
+    Supports the subset used by the tool definitions: object (properties,
+    required), string (enum), number/integer (minimum, maximum), boolean
+    and array (items, minItems, maxItems).
+
+    Args:
+        schema: JSON schema.
+        rng: Random source.
+
+    Returns:
+        Generated value.
+    """
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+
+    kind = schema.get("type", "object")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", []))
+        return {
+            name: generate_from_schema(prop, rng)
+            for name, prop in properties.items()
+            if name in required or rng.random() < 0.5
+        }
+    if kind == "string":
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 6))).capitalize()
+    if kind in ("number", "integer"):
+        low = schema.get("minimum", 0.0)
+        high = schema.get("maximum", max(low, 0.0) + 1.0)
+        if kind == "integer":
+            return rng.randint(math.ceil(low), math.floor(high))
+        return round(rng.uniform(low, high), 3)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "array":
+        count = rng.randint(schema.get("minItems", 0), schema.get("maxItems", 3))
+        return [generate_from_schema(schema.get("items", {}), rng) for _ in range(count)]
+    return None
+
+
+# =============================================================================
+# PROVIDER
+# =============================================================================
+
+class MockLLMProvider:
+    """
+    Threaded HTTP server speaking the chat completions protocol.
+
+    Each request is handled on its own thread, so concurrent clients see
+    overlapping latency just as with a real provider.
+    """
+
+    def __init__(
+        self,
+        config: Optional[MockProviderConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            config: Provider behaviour (defaults to MockProviderConfig()).
+            host: Bind address.
+            port: Bind port (0 = pick a free port).
+        """
+        self.config = config or MockProviderConfig()
+        self.stats = MockProviderStats()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._counter = 0
+
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    payload = json.loads(body or b"{}")
+                except json.JSONDecodeError:
+                    self._send(400, {"error": {"message": "invalid JSON"}}, {})
+                    return
+                status, response, headers, delay_s = provider.respond(payload)
+                if status == 200 and payload.get("stream"):
+                    self._send_stream(response, delay_s)
+                    return
+                time.sleep(delay_s)
+                self._send(status, response, headers)
+
+            def _send_stream(self, response, delay_s):
+                steps = provider.stream_chunks(response)
+                generation_s = (
+                    response["usage"]["completion_tokens"] * provider.config.latency_per_output_token_s
+                )
+                time.sleep(max(0.0, delay_s - generation_s))
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.end_headers()
+                    for number, chunks in enumerate(steps):
+                        if number and len(steps) > 1:
+                            time.sleep(generation_s / (len(steps) - 1))
+                        for chunk in chunks:
+                            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                        self.wfile.flush()
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                self.close_connection = True
+
+            def _send(self, status, response, headers):
+                data = json.dumps(response).encode()
+                try:
+                    self.send_response(status)
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Client gave up (timeout or cancelled hedge)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Chat completions URL, suitable for CaptainClient(base_url=...)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def start(self) -> 'MockLLMProvider':
+        """Serve requests on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'MockLLMProvider':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread (subprocess mode)."""
+        self._server.serve_forever()
+
+    # -------------------------------------------------------------------------
+    # Response generation
+    # -------------------------------------------------------------------------
+
+    def respond(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any], Dict[str, str], float]:
+        """
+        Build the response for a chat completion request.
+
+        Args:
+            payload: Request body.
+
+        Returns:
+            (status, body, headers, delay_s) - the server sleeps delay_s
+            before sending.
+        """
+        config = self.config
+        with self._lock:
+            self._counter += 1
+            request_number = self._counter
+            self.stats.requests += 1
+
+            if config.error_rate and self._rng.random() < config.error_rate:
+                self.stats.errors += 1
+                status = self._rng.choice(config.error_statuses)
+                headers = {"Retry-After": f"{config.retry_after_s:g}"} if status == 429 else {}
+                delay_s = self._sample_latency(0)
+                self.stats.total_latency_s += delay_s
+                return status, {"error": {"message": "injected error", "code": status}}, headers, delay_s
+
+            completion_tokens = self._rng.randint(*config.completion_tokens)
+            tool_calls = self._choose_tool_calls(payload, request_number)
+            for call in tool_calls:
+                name = call["function"]["name"]
+                self.stats.tool_calls[name] = self.stats.tool_calls.get(name, 0) + 1
+            content = "" if tool_calls else self._text(completion_tokens)
+            delay_s = self._sample_latency(completion_tokens)
+
+            prompt_tokens = int(
+                len(json.dumps(payload.get("messages", []))) / config.chars_per_prompt_token
+            )
+            self.stats.prompt_tokens += prompt_tokens
+            self.stats.completion_tokens += completion_tokens
+            self.stats.total_latency_s += delay_s
+
+        message: Dict[str, Any] = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        body = {
+            "id": f"mock-{request_number}",
+            "object": "chat.completion",
+            "model": payload.get("model", "mock/model"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+        return 200, body, {}, delay_s
+
+    @staticmethod
+    def stream_chunks(body: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """
+        Split a chat completion into streaming chunks.
+
+        Args:
+            body: Response from respond().
+
+        Returns:
+            Steps of chat.completion.chunk dicts, sent with generation time
+            spread evenly between steps: the role, then each tool call (name,
+            then arguments in two fragments) or the text, then the finish
+            reason and usage.
+        """
+        choice = body["choices"][0]
+        message = choice["message"]
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+            return {
+                "id": body["id"],
+                "object": "chat.completion.chunk",
+                "model": body["model"],
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        steps = [[chunk({"role": "assistant", "content": ""})]]
+        for index, call in enumerate(message.get("tool_calls") or []):
+            arguments = call["function"]["arguments"]
+            half = len(arguments) // 2
+            steps.append([
+                chunk({"tool_calls": [{
+                    "index": index, "id": call["id"], "type": "function",
+                    "function": {"name": call["function"]["name"], "arguments": arguments[:half]},
+                }]}),
+                chunk({"tool_calls": [{"index": index, "function": {"arguments": arguments[half:]}}]}),
+            ])
+        if message.get("content"):
+            steps.append([chunk({"content": message["content"]})])
+        steps.append([
+            chunk({}, choice["finish_reason"]),
+            {"id": body["id"], "object": "chat.completion.chunk", "model": body["model"],
+             "choices": [], "usage": body["usage"]},
+        ])
+        return steps
+
+    def _sample_latency(self, completion_tokens: int) -> float:
+        config = self.config
+        base = config.latency_median_s
+        if config.latency_sigma > 0 and base > 0:
+            base = self._rng.lognormvariate(math.log(base), config.latency_sigma)
+        return base + completion_tokens * config.latency_per_output_token_s
+
+    def _text(self, tokens: int) -> str:
+        words = [self._rng.choice(_WORDS) for _ in range(max(1, tokens // 2))]
+        return " ".join(words).capitalize() + "."
+
+    def _choose_tool_calls(self, payload: Dict[str, Any], request_number: int) -> List[Dict[str, Any]]:
+        """Pick tools from the request and generate arguments for each."""
+        tools = [t["function"] for t in payload.get("tools") or [] if t.get("type") == "function"]
+        if not tools:
+            return []
+
+        tool_choice = payload.get("tool_choice")
+        if isinstance(tool_choice, dict):
+            forced = tool_choice.get("function", {}).get("name")
+            tools = [t for t in tools if t["name"] == forced] or tools
+        if len(tools) == 1:
+            chosen = tools
+        else:
+            weights = [self.config.tool_weights.get(t["name"], 1.0) for t in tools]
+            candidates = [(t, w) for t, w in zip(tools, weights) if w > 0] or [(t, 1.0) for t in tools]
+            low, high = self.config.tool_calls_per_response
+            count = min(len(candidates), self._rng.randint(low, high))
+            chosen = []
+            for _ in range(count):
+                pick = self._rng.choices(range(len(candidates)), [w for _, w in candidates])[0]
+                chosen.append(candidates.pop(pick)[0])
+
+        return [
+            {
+                "id": f"call_{request_number}_{index}_"
+                      + "".join(self._rng.choices(string.ascii_lowercase, k=6)),
+                "type": "function",
+                "function": {
+                    "name": tool["name"],
+                    "arguments": json.dumps(
+                        generate_from_schema(tool.get("parameters", {}), self._rng)
+                    ),
+                },
+            }
+            for index, tool in enumerate(chosen)
+        ]
+
+
+def main() -> None:
+    """Run the mock provider as a standalone server."""
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible LLM provider")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8780)
+    parser.add_argument("--latency-median", type=float, default=0.5, help="Median latency (s)")
+    parser.add_argument("--latency-sigma", type=float, default=0.35, help="Lognormal sigma")
+    parser.add_argument("--per-token", type=float, default=0.0, help="Seconds per output token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected error probability")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    provider = MockLLMProvider(
+        MockProviderConfig(
+            latency_median_s=args.latency_median,
+            latency_sigma=args.latency_sigma,
+            latency_per_output_token_s=args.per_token,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Mock LLM provider listening on {provider.url}", flush=True)
+    try:
+        provider.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        provider.stop()
+
+
+if __name__ == "__main__":
+    main()
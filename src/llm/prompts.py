@@ -5,9 +5,12 @@ Prompts include simulation disclaimer to avoid AI guardrails,
 ship capabilities, and personality modifiers.
 """
 
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 
+from .token_budget import BudgetReport, PromptSection, estimate_tokens, fit_to_budget
+
 
 def get_ship_turn_time_90deg(ship_type: str) -> float:
     """Calculate approximate 90-degree turn time using thrust vectoring."""
@@ -158,7 +161,10 @@ PERSONALITY_PRESETS = {
     },
 }
 
-SHIP_CAPABILITIES_DESTROYER = """
+# Ship capabilities are split into the static class description, which
+# never changes during a battle, and the status report that changes every
+# checkpoint. Static text goes in the cacheable system prompt.
+SHIP_CLASS_DESTROYER = """
 YOUR SHIP: {ship_name} (Destroyer class)
 
 PROPULSION:
@@ -186,21 +192,9 @@ THERMAL:
 - Radiators retracted: 0 MW cooling (protected)
 - Engine heat: ~60 MW at full burn
 - Weapons overheat at 95%+ heat
-
-CURRENT STATUS:
-- Hull: {hull_integrity:.0f}%
-- Heat: {heat_percent:.0f}%
-- Delta-V remaining: {delta_v_remaining:.0f} km/s
-- Radiators: {radiator_status}
-- Armor: Nose {nose_armor:.0f}cm | Lateral {lateral_armor:.0f}cm | Tail {tail_armor:.0f}cm
-
-WEAPON STATUS:
-{weapon_status}
-
-{damage_report}
 """
 
-SHIP_CAPABILITIES_TEMPLATE = """
+SHIP_CLASS_TEMPLATE = """
 YOUR SHIP: {ship_name} ({ship_class} class)
 
 PROPULSION:
@@ -222,11 +216,13 @@ THERMAL:
 - Radiators retracted: 0 MW cooling (protected)
 - Engine heat: ~60 MW at full burn
 - Weapons overheat at 95%+ heat
+"""
 
+SHIP_STATUS_TEMPLATE = """
 CURRENT STATUS:
 - Hull: {hull_integrity:.0f}%
 - Heat: {heat_percent:.0f}%
-- Delta-V remaining: {delta_v_remaining:.0f}/{delta_v_total} km/s
+- Delta-V remaining: {delta_v_remaining:.0f}{delta_v_budget} km/s
 - Radiators: {radiator_status}
 - Armor: Nose {nose_armor:.0f}cm | Lateral {lateral_armor:.0f}cm | Tail {tail_armor:.0f}cm
 
@@ -237,22 +233,16 @@ WEAPON STATUS:
 """
 
 
-def build_ship_capabilities_from_fleet(
+def build_ship_class_section(
     ship_name: str,
-    ship_type: str,
-    fleet_data: Dict[str, Any],
-    hull_integrity: float,
-    heat_percent: float,
-    delta_v_remaining: float,
-    nose_armor: float,
-    lateral_armor: float,
-    tail_armor: float,
-    heatsink_capacity: float,
-    radiators_extended: bool,
-    weapons: Optional[Dict[str, Any]] = None,
-    damaged_modules: Optional[Dict[str, Any]] = None,
+    ship_type: str = "destroyer",
+    fleet_data: Optional[Dict[str, Any]] = None,
+    heatsink_capacity: float = 525,
 ) -> str:
-    """Build ship capabilities section dynamically from fleet data."""
+    """Build the static ship class description (propulsion, weapons, defense, thermal)."""
+    if not fleet_data:
+        return SHIP_CLASS_DESTROYER.format(ship_name=ship_name, heatsink_capacity=heatsink_capacity)
+
     ship_spec = fleet_data["ships"].get(ship_type, {})
     weapon_types = fleet_data.get("weapon_types", {})
 
@@ -262,39 +252,83 @@ def build_ship_capabilities_from_fleet(
     accel_mps = performance.get("combat_acceleration_ms2", accel_g * 9.81)
     delta_v_total = performance.get("delta_v_kps", 500)
 
-    # Get turn time
-    turn_time = get_ship_turn_time_90deg(ship_type)
-
-    # Format weapons
-    ship_weapons = ship_spec.get("weapons", [])
-    weapons_section = format_weapon_groups_for_prompt(ship_weapons, weapon_types)
-
-    # Format status
-    radiator_status = "EXTENDED (cooling, vulnerable)" if radiators_extended else "RETRACTED (protected, no cooling)"
-    weapon_status = format_weapon_status(weapons or {})
-    damage_report = format_damage_report(damaged_modules or {})
-
-    # Get ship class name (title case of ship_type)
-    ship_class = ship_type.title()
-
-    return SHIP_CAPABILITIES_TEMPLATE.format(
+    return SHIP_CLASS_TEMPLATE.format(
         ship_name=ship_name,
-        ship_class=ship_class,
+        ship_class=ship_type.title(),
         accel_g=accel_g,
         accel_mps=accel_mps,
         delta_v_total=delta_v_total,
-        turn_time=turn_time,
-        weapons_section=weapons_section,
+        turn_time=get_ship_turn_time_90deg(ship_type),
+        weapons_section=format_weapon_groups_for_prompt(ship_spec.get("weapons", []), weapon_types),
         heatsink_capacity=heatsink_capacity,
+    )
+
+
+def build_ship_status_section(
+    hull_integrity: float,
+    heat_percent: float,
+    delta_v_remaining: float,
+    nose_armor: float,
+    lateral_armor: float,
+    tail_armor: float,
+    radiators_extended: bool,
+    weapons: Optional[Dict[str, Any]] = None,
+    damaged_modules: Optional[Dict[str, Any]] = None,
+    delta_v_total: Optional[float] = None,
+) -> str:
+    """Build the per-checkpoint ship status report."""
+    radiator_status = "EXTENDED (cooling, vulnerable)" if radiators_extended else "RETRACTED (protected, no cooling)"
+    return SHIP_STATUS_TEMPLATE.format(
         hull_integrity=hull_integrity,
         heat_percent=heat_percent,
         delta_v_remaining=delta_v_remaining,
+        delta_v_budget=f"/{delta_v_total}" if delta_v_total is not None else "",
         radiator_status=radiator_status,
         nose_armor=nose_armor,
         lateral_armor=lateral_armor,
         tail_armor=tail_armor,
-        weapon_status=weapon_status,
-        damage_report=damage_report,
+        weapon_status=format_weapon_status(weapons or {}),
+        damage_report=format_damage_report(damaged_modules or {}),
+    )
+
+
+def _fleet_delta_v_total(ship_type: str, fleet_data: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Total delta-v budget from fleet data (None without fleet data)."""
+    if not fleet_data:
+        return None
+    performance = fleet_data["ships"].get(ship_type, {}).get("performance", {})
+    return performance.get("delta_v_kps", 500)
+
+
+def build_ship_capabilities_from_fleet(
+    ship_name: str,
+    ship_type: str,
+    fleet_data: Dict[str, Any],
+    hull_integrity: float,
+    heat_percent: float,
+    delta_v_remaining: float,
+    nose_armor: float,
+    lateral_armor: float,
+    tail_armor: float,
+    heatsink_capacity: float,
+    radiators_extended: bool,
+    weapons: Optional[Dict[str, Any]] = None,
+    damaged_modules: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build ship capabilities section dynamically from fleet data."""
+    return build_ship_class_section(
+        ship_name, ship_type, fleet_data, heatsink_capacity
+    ) + build_ship_status_section(
+        hull_integrity=hull_integrity,
+        heat_percent=heat_percent,
+        delta_v_remaining=delta_v_remaining,
+        nose_armor=nose_armor,
+        lateral_armor=lateral_armor,
+        tail_armor=tail_armor,
+        radiators_extended=radiators_extended,
+        weapons=weapons,
+        damaged_modules=damaged_modules,
+        delta_v_total=_fleet_delta_v_total(ship_type, fleet_data),
     )
 
 
@@ -324,36 +358,17 @@ HIT PROBABILITY BY RANGE (approximate):
 - TO WIN: Close range aggressively OR have overwhelming accuracy advantage
 """
 
+# Static captain system prompt: identical at every checkpoint for a given
+# captain, so providers with prompt caching can reuse it as a prefix.
 CAPTAIN_SYSTEM_PROMPT = """
 You are Captain {captain_name}, commanding {ship_name} in a space combat simulation.
 
 {simulation_disclaimer}
 
-{ship_capabilities}
+{ship_class}
 
 {projectile_reference}
 
-=== TACTICAL DATA (T+{sim_time:.0f}s) ===
-
-YOUR SHIP:
-  Nose pointing: ({fwd_x:+.2f}, {fwd_y:+.2f}, {fwd_z:+.2f})
-  Angle to primary target: {angle_to_enemy:.1f}° {spinal_status}
-
-YOUR CURRENT CONFIGURATION:
-{current_config}
-
-{battlefield_overview}
-
-{combat_statistics}
-
-{incoming_projectiles}
-
-{recent_hits}
-
-{received_messages}
-
-{history_context}
-
 === CONTROLS ===
 
 MANEUVERS:
@@ -449,6 +464,32 @@ Your ship will execute your orders for 30 seconds regardless of what happens.
 {personality_prompt}
 """
 
+# Per-checkpoint situation report, sent after the static system prompt
+CAPTAIN_SITUATION_PROMPT = """
+=== SITUATION REPORT (T+{sim_time:.0f}s) ===
+{ship_status}
+=== TACTICAL DATA ===
+
+YOUR SHIP:
+  Nose pointing: ({fwd_x:+.2f}, {fwd_y:+.2f}, {fwd_z:+.2f})
+  Angle to primary target: {angle_to_enemy:.1f}° {spinal_status}
+
+YOUR CURRENT CONFIGURATION:
+{current_config}
+
+{battlefield_overview}
+
+{combat_statistics}
+
+{incoming_projectiles}
+
+{recent_hits}
+
+{received_messages}
+
+{history_context}
+"""
+
 # Prompt for pre-battle personality selection
 PERSONALITY_SELECTION_PROMPT = """
 You are {model_name}, about to command a {ship_class} in a space combat simulation.
@@ -550,22 +591,16 @@ def build_ship_capabilities(
         )
 
     # Legacy fallback using destroyer template
-    radiator_status = "EXTENDED (cooling, vulnerable)" if radiators_extended else "RETRACTED (protected, no cooling)"
-    weapon_status = format_weapon_status(weapons or {})
-    damage_report = format_damage_report(damaged_modules or {})
-
-    return SHIP_CAPABILITIES_DESTROYER.format(
-        ship_name=ship_name,
+    return build_ship_class_section(ship_name, heatsink_capacity=heatsink_capacity) + build_ship_status_section(
         hull_integrity=hull_integrity,
         heat_percent=heat_percent,
         delta_v_remaining=delta_v_remaining,
         nose_armor=nose_armor,
         lateral_armor=lateral_armor,
         tail_armor=tail_armor,
-        heatsink_capacity=heatsink_capacity,
-        radiator_status=radiator_status,
-        weapon_status=weapon_status,
-        damage_report=damage_report,
+        radiators_extended=radiators_extended,
+        weapons=weapons,
+        damaged_modules=damaged_modules,
     )
 
 
@@ -840,13 +875,64 @@ def build_personality_selection_prompt(
     )
 
 
-def build_captain_prompt(
+@lru_cache(maxsize=64)
+def build_personality_section(
+    personality: CaptainPersonality = CaptainPersonality.BALANCED,
+    personality_text: Optional[str] = None,
+) -> str:
+    """Build the personality section (custom text overrides the preset)."""
+    if personality_text:
+        return f"YOUR PERSONALITY:\n{personality_text}"
+    preset = PERSONALITY_PRESETS.get(personality.value)
+    if preset:
+        return f"YOUR PERSONALITY: {preset['name']}\n{preset['description']}\nMotto: \"{preset['motto']}\""
+    return ""
+
+
+def build_captain_system_prompt(
     captain_name: str,
     ship_name: str,
-    ship_status: Dict[str, Any],
-    tactical_status: Dict[str, Any],
     personality: CaptainPersonality = CaptainPersonality.BALANCED,
     personality_text: Optional[str] = None,
+    ship_type: Optional[str] = None,
+    fleet_data: Optional[Dict[str, Any]] = None,
+    heatsink_capacity: float = 525,
+) -> str:
+    """
+    Build the static part of a captain's prompt.
+
+    Contains nothing that changes during a battle (ship class, physics
+    reference, controls, personality), so callers can build it once per
+    captain and providers with prompt caching see a stable prefix.
+
+    Args:
+        captain_name: Name of the captain
+        ship_name: Name of the ship
+        personality: Captain personality type (if using preset)
+        personality_text: Custom personality text (overrides preset if provided)
+        ship_type: Ship class key in fleet_data
+        fleet_data: Fleet specifications (legacy destroyer text if None)
+        heatsink_capacity: Heat sink capacity in GJ
+
+    Returns:
+        System prompt string
+    """
+    return CAPTAIN_SYSTEM_PROMPT.format(
+        captain_name=captain_name,
+        ship_name=ship_name,
+        simulation_disclaimer=SIMULATION_DISCLAIMER,
+        ship_class=build_ship_class_section(
+            ship_name, ship_type or "destroyer", fleet_data, heatsink_capacity
+        ),
+        projectile_reference=PROJECTILE_PHYSICS_REFERENCE,
+        personality_prompt=build_personality_section(personality, personality_text),
+    )
+
+
+def build_captain_situation_prompt(
+    ship_name: str,
+    ship_status: Dict[str, Any],
+    tactical_status: Dict[str, Any],
     received_messages: Optional[str] = None,
     decision_history: Optional[str] = None,
     message_history: Optional[str] = None,
@@ -857,39 +943,35 @@ def build_captain_prompt(
     fleet_data: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
-    Build the complete system prompt for a captain.
+    Build the per-checkpoint situation report for a captain.
 
     Args:
-        captain_name: Name of the captain
         ship_name: Name of the ship
         ship_status: Dict with hull_integrity, heat_percent, delta_v_remaining, armor values, etc.
         tactical_status: Dict with relative position/velocity, projectile info, enemies list, etc.
+        received_messages: Formatted string of messages from enemy captain
         decision_history: Formatted string of recent decisions
         message_history: Formatted string of message exchange history
         battle_summary: Formatted string summarizing battle progression
         shot_history: Formatted string of shot outcomes with range/velocity data
         recent_hits: Formatted string of recent damage taken
-        personality: Captain personality type (if using preset)
-        personality_text: Custom personality text (overrides preset if provided)
-        received_messages: Formatted string of messages from enemy captain
+        ship_type: Ship class key in fleet_data
+        fleet_data: Fleet specifications
 
     Returns:
-        Complete system prompt string
+        Situation report string
     """
-    ship_capabilities = build_ship_capabilities(
-        ship_name=ship_name,
+    ship_status_section = build_ship_status_section(
         hull_integrity=ship_status.get("hull_integrity", 100),
         heat_percent=ship_status.get("heat_percent", 0),
         delta_v_remaining=ship_status.get("delta_v_remaining", 500),
         nose_armor=ship_status.get("nose_armor", 10),
         lateral_armor=ship_status.get("lateral_armor", 5),
         tail_armor=ship_status.get("tail_armor", 3),
-        heatsink_capacity=ship_status.get("heatsink_capacity", 525),
         radiators_extended=ship_status.get("radiators_extended", False),
         weapons=ship_status.get("weapons"),
         damaged_modules=ship_status.get("damaged_modules"),
-        ship_type=ship_type or "destroyer",
-        fleet_data=fleet_data,
+        delta_v_total=_fleet_delta_v_total(ship_type or "destroyer", fleet_data),
     )
 
     # Ship forward vector
@@ -939,16 +1021,11 @@ def build_captain_prompt(
     battlefield_overview = format_battlefield_overview(enemies, friendlies)
 
     # Format combat statistics
-    our_shots = tactical_status.get("our_shots", 0)
-    our_hits = tactical_status.get("our_hits", 0)
-    our_damage_dealt = tactical_status.get("our_damage_dealt", 0)
-    our_damage_taken = tactical_status.get("our_damage_taken", 0)
-
     combat_statistics = format_combat_statistics(
-        our_shots=our_shots,
-        our_hits=our_hits,
-        our_damage_dealt=our_damage_dealt,
-        our_damage_taken=our_damage_taken,
+        our_shots=tactical_status.get("our_shots", 0),
+        our_hits=tactical_status.get("our_hits", 0),
+        our_damage_dealt=tactical_status.get("our_damage_dealt", 0),
+        our_damage_taken=tactical_status.get("our_damage_taken", 0),
         enemies=enemies,
         friendlies=friendlies,
         ship_name=ship_name,
@@ -966,41 +1043,16 @@ def build_captain_prompt(
     else:
         messages_section = ""
 
-    # Build personality prompt
-    if personality_text:
-        personality_prompt = f"YOUR PERSONALITY:\n{personality_text}"
-    elif personality in PERSONALITY_PRESETS or personality.value in PERSONALITY_PRESETS:
-        key = personality.value if isinstance(personality.value, str) else personality.name.lower()
-        if key in PERSONALITY_PRESETS:
-            preset = PERSONALITY_PRESETS[key]
-            personality_prompt = f"YOUR PERSONALITY: {preset['name']}\n{preset['description']}\nMotto: \"{preset['motto']}\""
-        else:
-            personality_prompt = ""
-    else:
-        personality_prompt = ""
-
     # Build history context section
-    history_parts = []
-    if battle_summary:
-        history_parts.append(battle_summary)
-    if shot_history:
-        history_parts.append(shot_history)
-    if decision_history:
-        history_parts.append(decision_history)
-    if message_history:
-        history_parts.append(message_history)
-    history_context = "\n\n".join(history_parts) if history_parts else ""
-
-    # Recent hits section
-    recent_hits_section = recent_hits if recent_hits else ""
+    history_parts = [
+        part for part in (battle_summary, shot_history, decision_history, message_history)
+        if part
+    ]
+    history_context = "\n\n".join(history_parts)
 
-    return CAPTAIN_SYSTEM_PROMPT.format(
-        captain_name=captain_name,
-        ship_name=ship_name,
-        simulation_disclaimer=SIMULATION_DISCLAIMER,
-        ship_capabilities=ship_capabilities,
-        projectile_reference=PROJECTILE_PHYSICS_REFERENCE,
+    return CAPTAIN_SITUATION_PROMPT.format(
         sim_time=sim_time,
+        ship_status=ship_status_section,
         fwd_x=fwd_x,
         fwd_y=fwd_y,
         fwd_z=fwd_z,
@@ -1010,13 +1062,77 @@ def build_captain_prompt(
         battlefield_overview=battlefield_overview,
         combat_statistics=combat_statistics,
         incoming_projectiles=incoming_projectiles,
-        recent_hits=recent_hits_section,
+        recent_hits=recent_hits or "",
         received_messages=messages_section,
         history_context=history_context,
-        personality_prompt=personality_prompt,
     )
 
 
+def build_captain_prompt(
+    captain_name: str,
+    ship_name: str,
+    ship_status: Dict[str, Any],
+    tactical_status: Dict[str, Any],
+    personality: CaptainPersonality = CaptainPersonality.BALANCED,
+    personality_text: Optional[str] = None,
+    received_messages: Optional[str] = None,
+    decision_history: Optional[str] = None,
+    message_history: Optional[str] = None,
+    battle_summary: Optional[str] = None,
+    shot_history: Optional[str] = None,
+    recent_hits: Optional[str] = None,
+    ship_type: Optional[str] = None,
+    fleet_data: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build the complete prompt for a captain as a single string.
+
+    Concatenates build_captain_system_prompt() and
+    build_captain_situation_prompt(). LLMCaptain sends the two parts as
+    separate system and user messages instead.
+
+    Args:
+        captain_name: Name of the captain
+        ship_name: Name of the ship
+        ship_status: Dict with hull_integrity, heat_percent, delta_v_remaining, armor values, etc.
+        tactical_status: Dict with relative position/velocity, projectile info, enemies list, etc.
+        decision_history: Formatted string of recent decisions
+        message_history: Formatted string of message exchange history
+        battle_summary: Formatted string summarizing battle progression
+        shot_history: Formatted string of shot outcomes with range/velocity data
+        recent_hits: Formatted string of recent damage taken
+        personality: Captain personality type (if using preset)
+        personality_text: Custom personality text (overrides preset if provided)
+        received_messages: Formatted string of messages from enemy captain
+
+    Returns:
+        Complete prompt string
+    """
+    system_prompt = build_captain_system_prompt(
+        captain_name=captain_name,
+        ship_name=ship_name,
+        personality=personality,
+        personality_text=personality_text,
+        ship_type=ship_type,
+        fleet_data=fleet_data,
+        heatsink_capacity=ship_status.get("heatsink_capacity", 525),
+    )
+    situation = build_captain_situation_prompt(
+        ship_name=ship_name,
+        ship_status=ship_status,
+        tactical_status=tactical_status,
+        received_messages=received_messages,
+        decision_history=decision_history,
+        message_history=message_history,
+        battle_summary=battle_summary,
+        shot_history=shot_history,
+        recent_hits=recent_hits,
+        ship_type=ship_type,
+        fleet_data=fleet_data,
+    )
+    return system_prompt + situation
+
+
 # =============================================================================
 # ADMIRAL PROMPTS
 # =============================================================================
@@ -1318,10 +1434,54 @@ def build_admiral_prompt(
     received_messages: Optional[List[str]] = None,
     communications_log: Optional[List[Any]] = None,
     phase: str = "full",  # "full", "directive", or "orders"
+    token_budget: Optional[int] = None,
 ) -> str:
     """
     Build Admiral system prompt with dual-snapshot comparison.
 
+    See build_admiral_prompt_with_report() for the arguments.
+
+    Returns:
+        Complete Admiral system prompt
+    """
+    prompt, _report = build_admiral_prompt_with_report(
+        admiral_name=admiral_name,
+        faction=faction,
+        snapshot_t_minus_15=snapshot_t_minus_15,
+        snapshot_t_zero=snapshot_t_zero,
+        personality=personality,
+        fleet_data=fleet_data,
+        enemy_has_admiral=enemy_has_admiral,
+        enemy_proposed_draw=enemy_proposed_draw,
+        received_messages=received_messages,
+        communications_log=communications_log,
+        phase=phase,
+        token_budget=token_budget,
+    )
+    return prompt
+
+
+def build_admiral_prompt_with_report(
+    admiral_name: str,
+    faction: str,
+    snapshot_t_minus_15: Any,
+    snapshot_t_zero: Any,
+    personality: Optional[str],
+    fleet_data: Dict[str, Any],
+    enemy_has_admiral: bool = False,
+    enemy_proposed_draw: bool = False,
+    received_messages: Optional[List[str]] = None,
+    communications_log: Optional[List[Any]] = None,
+    phase: str = "full",
+    token_budget: Optional[int] = None,
+) -> Tuple[str, BudgetReport]:
+    """
+    Build the Admiral system prompt and its token accounting.
+
+    Over budget, the least critical context is compacted first: captain
+    chatter, then projectile detail, then the T-15s snapshot (the change
+    analysis still carries the trajectory deltas).
+
     Args:
         admiral_name: Admiral's name
         faction: "alpha" or "beta"
@@ -1333,9 +1493,10 @@ def build_admiral_prompt(
         enemy_proposed_draw: Whether enemy has proposed draw
         received_messages: Messages from enemy Admiral
         communications_log: All captain communications (Admiral oversight)
+        token_budget: Maximum estimated prompt tokens (None = no limit)
 
     Returns:
-        Complete Admiral system prompt
+        (prompt, BudgetReport)
     """
     # Format fleet composition
     if snapshot_t_zero:
@@ -1367,28 +1528,31 @@ def build_admiral_prompt(
         fleet_data,
     )
 
-    # Format projectiles
-    projectile_info = _format_projectiles_for_admiral(
-        snapshot_t_zero.projectiles if snapshot_t_zero else []
-    )
+    projectiles = snapshot_t_zero.projectiles if snapshot_t_zero else []
+    compactable = token_budget is not None
 
-    # Communications section
-    comms_parts = []
-    if received_messages:
-        comms_parts.append("=== MESSAGES FROM ENEMY ADMIRAL ===")
-        for msg in received_messages:
-            comms_parts.append(f"  \"{msg}\"")
+    def variants(full: str, *compact) -> List[str]:
+        return [full] + ([build() for build in compact] if compactable else [])
 
-    if enemy_proposed_draw:
-        comms_parts.append("\n*** ENEMY HAS PROPOSED A DRAW ***")
-        comms_parts.append("Use accept_fleet_draw to accept or reject_fleet_draw to refuse.")
-
-    if communications_log:
-        comms_parts.append("\n=== CAPTAIN COMMUNICATIONS (You see all) ===")
-        for msg in communications_log[-5:]:  # Last 5 messages
-            comms_parts.append(f"  [{msg.ship_name}] {msg.sender_name}: \"{msg.content}\"")
+    def comms(last_n: int) -> str:
+        return _format_admiral_communications(
+            received_messages, enemy_proposed_draw, communications_log, last_n
+        )
 
-    communications_section = "\n".join(comms_parts) if comms_parts else ""
+    # Compactable sections, least critical first
+    sections = [
+        PromptSection("communications_section", variants(
+            comms(5), lambda: comms(2), lambda: comms(0),
+        )),
+        PromptSection("projectile_info", variants(
+            _format_projectiles_for_admiral(projectiles),
+            lambda: _summarize_projectiles_for_admiral(projectiles),
+        )),
+        PromptSection("snapshot_t_minus_15", variants(
+            snapshot_15_text,
+            lambda: "(omitted for length - see CHANGE ANALYSIS)",
+        )),
+    ]
 
     # Enemy Admiral note
     if enemy_has_admiral:
@@ -1415,25 +1579,64 @@ def build_admiral_prompt(
     # Generate dynamic ship class stats from fleet_data
     ship_class_stats = _generate_ship_class_stats(snapshot_t_zero, fleet_data)
 
-    return ADMIRAL_SYSTEM_PROMPT.format(
-        admiral_name=admiral_name,
-        faction=faction.upper(),
-        num_ships=num_ships,
-        ship_order_checklist=ship_order_checklist,
-        simulation_disclaimer=SIMULATION_DISCLAIMER,
-        fleet_composition=fleet_composition,
-        fleet_capabilities=fleet_capabilities,
-        snapshot_t_minus_15=snapshot_15_text,
-        snapshot_t_zero=snapshot_0_text,
-        change_analysis=change_analysis,
-        friendly_fleet_status=friendly_status,
-        enemy_fleet_status=enemy_status,
-        projectile_info=projectile_info,
-        communications_section=communications_section,
-        enemy_admiral_note=enemy_admiral_note,
-        personality_prompt=personality_prompt,
-        ship_class_stats=ship_class_stats,
+    def render() -> str:
+        return ADMIRAL_SYSTEM_PROMPT.format(
+            admiral_name=admiral_name,
+            faction=faction.upper(),
+            num_ships=num_ships,
+            ship_order_checklist=ship_order_checklist,
+            simulation_disclaimer=SIMULATION_DISCLAIMER,
+            fleet_composition=fleet_composition,
+            fleet_capabilities=fleet_capabilities,
+            snapshot_t_zero=snapshot_0_text,
+            change_analysis=change_analysis,
+            friendly_fleet_status=friendly_status,
+            enemy_fleet_status=enemy_status,
+            enemy_admiral_note=enemy_admiral_note,
+            personality_prompt=personality_prompt,
+            ship_class_stats=ship_class_stats,
+            **{section.name: section.text for section in sections},
+        )
+
+    prompt = render()
+    report = fit_to_budget(
+        sections,
+        fixed_tokens=estimate_tokens(prompt) - sum(section.tokens for section in sections),
+        budget=token_budget,
+        role="admiral",
     )
+    if report.compactions:
+        prompt = render()
+    return prompt, report
+
+
+def _format_admiral_communications(
+    received_messages: Optional[List[str]],
+    enemy_proposed_draw: bool,
+    communications_log: Optional[List[Any]],
+    last_n: int,
+) -> str:
+    """Format the Admiral communications section (last_n captain messages)."""
+    comms_parts = []
+    if received_messages:
+        comms_parts.append("=== MESSAGES FROM ENEMY ADMIRAL ===")
+        for msg in received_messages:
+            comms_parts.append(f"  \"{msg}\"")
+
+    if enemy_proposed_draw:
+        comms_parts.append("\n*** ENEMY HAS PROPOSED A DRAW ***")
+        comms_parts.append("Use accept_fleet_draw to accept or reject_fleet_draw to refuse.")
+
+    if communications_log:
+        comms_parts.append("\n=== CAPTAIN COMMUNICATIONS (You see all) ===")
+        shown = communications_log[-last_n:] if last_n else []
+        older = len(communications_log) - len(shown)
+        if older:
+            comms_parts.append(f"  ({older} earlier message{'s' if older != 1 else ''} not shown)")
+        for msg in shown:
+            comms_parts.append(f"  [{msg.ship_name}] {msg.sender_name}: \"{msg.content}\"")
+
+    return "\n".join(comms_parts) if comms_parts else ""
 
 
 def build_admiral_response_prompt(
@@ -1743,6 +1946,19 @@ def _format_projectiles_for_admiral(projectiles: List[Any]) -> str:
     return "\n".join(lines)
 
 
+def _summarize_projectiles_for_admiral(projectiles: List[Any]) -> str:
+    """One-line projectile summary used when the prompt is over budget."""
+    if not projectiles:
+        return "No projectiles in flight"
+
+    soonest = min(proj.eta_seconds for proj in projectiles)
+    total_gj = sum(proj.damage_gj for proj in projectiles)
+    return (
+        f"  {len(projectiles)} in flight, {total_gj:.1f} GJ total, "
+        f"first impact in {soonest:.1f}s"
+    )
+
+
 def format_admiral_orders_for_captain(
     orders: List[Any],
     fleet_directive: str,
@@ -0,0 +1,472 @@
+"""
+Columnar binary format for battle recordings.
+
+A JSON recording stores the sim trace as one nested dict per simulation
+step, with the same keys, ship IDs and projectile IDs repeated in every
+frame. The columnar format stores it as typed arrays instead:
+
+- Ships: one row per (ship, frame), grouped by ship (position, velocity,
+  forward, thrust, maneuver, destroyed, hull, armor)
+- Projectiles and torpedoes: an entity table (ID, source ship, first row,
+  row count) and one row per (entity, frame) it was in flight, grouped by
+  entity
+
+Values the recorder rounds (positions to 0.1 m, forward vectors to 1e-4,
+...) are stored as fixed-point integers, delta-encoded along each entity's
+rows, so the slowly changing motion compresses to a few bits per value.
+Decoding restores the rounded values exactly.
+
+Container layout (the whole file is gzip-compressed):
+    MAGIC, uint16 format version, uint32 header length,
+    JSON header (the recording with an empty sim_trace, plus the column
+    index),
+    column data (little-endian, 8-byte aligned)
+
+load_recording() reads JSON recordings, columnar containers and streamed
+recording logs (see recording_log) and returns the recording dict in the JSON shape, so
+analysis tools do not care which format was written. It also decodes a
+JSON sim trace stored as trajectory keyframes plus deltas (see
+trajectory_codec).
+"""
+
+import gzip
+import itertools
+import json
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .trajectory_codec import decode_recording_trajectories
+
+
+MAGIC = b"AICREC"
+FORMAT_VERSION = 1
+
+RECORDING_FORMATS = ("json", "columnar", "stream")
+RECORDING_EXTENSIONS = {"json": ".json", "columnar": ".rec.gz", "stream": ".reclog"}
+
+_PREFIX = struct.Struct("<6sHI")
+_ALIGN = 8
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    Storage of one sim trace field.
+
+    Attributes:
+        dtype: NumPy dtype the column is stored as.
+        digits: Decimal digits kept (fixed-point column), None for floats
+            and flags stored as-is.
+        delta: Stored as differences between consecutive rows.
+    """
+    dtype: str
+    digits: Optional[int] = None
+    delta: bool = False
+
+
+COLUMNS: Dict[str, Column] = {
+    "ship_row_frame": Column("<i4", delta=True),
+    "ship_pos": Column("<i8", 1, True),
+    "ship_vel": Column("<i8", 1, True),
+    "ship_fwd": Column("<i8", 4, True),
+    "ship_thrust": Column("<i8", 2, True),
+    "ship_maneuver": Column("<i2"),
+    "ship_destroyed": Column("|u1"),
+    "ship_hull": Column("<f8"),
+    "ship_armor": Column("<f8"),
+    "projectile_row_frame": Column("<i4", delta=True),
+    "projectile_row_slot": Column("<i4"),
+    "projectile_row_target": Column("<i4"),
+    "projectile_pos": Column("<i8", 1, True),
+    "projectile_vel": Column("<i8", 1, True),
+    "projectile_mass_kg": Column("<i8", 2, True),
+    "projectile_pd_engaged": Column("|u1"),
+    "projectile_pd_damage_kg": Column("<i8", 3, True),
+    "torpedo_row_frame": Column("<i4", delta=True),
+    "torpedo_row_slot": Column("<i4"),
+    "torpedo_row_target": Column("<i4"),
+    "torpedo_pos": Column("<i8", 1, True),
+    "torpedo_vel": Column("<i8", 1, True),
+    "torpedo_dv_remaining": Column("<i8", 2, True),
+    "torpedo_pd_heat_j": Column("<i8", 0, True),
+    "torpedo_disabled": Column("|u1"),
+}
+
+# Ship columns and their values per row
+_SHIP_COLUMNS = (
+    ("ship_row_frame", 1),
+    ("ship_pos", 3),
+    ("ship_vel", 3),
+    ("ship_fwd", 3),
+    ("ship_thrust", 1),
+    ("ship_maneuver", 1),
+    ("ship_destroyed", 1),
+    ("ship_hull", 1),
+    ("ship_armor", 1),
+)
+
+# Projectile and torpedo frame lists and their own fields: (frame key, column suffix)
+_ENTITY_KINDS = {
+    "projectile": ("projectiles", (
+        ("mass_kg", "mass_kg"),
+        ("pd_engaged", "pd_engaged"),
+        ("pd_damage_kg", "pd_damage_kg"),
+    )),
+    "torpedo": ("torpedoes", (
+        ("dv_remaining", "dv_remaining"),
+        ("pd_heat_j", "pd_heat_j"),
+        ("disabled", "disabled"),
+    )),
+}
+
+
+def _entity_columns(kind: str) -> Tuple[Tuple[str, int], ...]:
+    """Columns of a projectile or torpedo row and their values per row."""
+    own = tuple((f"{kind}_{suffix}", 1) for _, suffix in _ENTITY_KINDS[kind][1])
+    return (
+        (f"{kind}_row_frame", 1),
+        (f"{kind}_row_slot", 1),
+        (f"{kind}_row_target", 1),
+        (f"{kind}_pos", 3),
+        (f"{kind}_vel", 3),
+    ) + own
+
+
+# ---------------------------------------------------------------------------
+# Column encoding
+# ---------------------------------------------------------------------------
+
+def _to_column(name: str, values: Any) -> np.ndarray:
+    """Stored form of a column's values."""
+    column = COLUMNS[name]
+    if column.digits is not None:
+        array = np.rint(np.asarray(values, dtype=np.float64) * 10 ** column.digits).astype(np.int64)
+    else:
+        array = np.asarray(values)
+    array = array.astype(column.dtype)
+    if column.delta and len(array):
+        array = np.diff(array, axis=0, prepend=np.zeros_like(array[:1]))
+    return array
+
+
+def _from_column(name: str, array: np.ndarray) -> np.ndarray:
+    """Values of a stored column."""
+    column = COLUMNS[name]
+    if column.delta:
+        array = np.cumsum(array, axis=0, dtype=array.dtype)
+    if column.digits is not None:
+        array = array / 10 ** column.digits
+    return array
+
+
+class _Strings:
+    """String table (ship IDs, maneuver names, ...) shared by all columns."""
+
+    def __init__(self, strings: Optional[List[str]] = None):
+        self.strings: List[str] = list(strings or [])
+        self._index = {s: i for i, s in enumerate(self.strings)}
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def value(self, code: int) -> Optional[str]:
+        return self.strings[code] if code >= 0 else None
+
+
+# ---------------------------------------------------------------------------
+# Sim trace <-> columns
+# ---------------------------------------------------------------------------
+
+class SimTraceColumns:
+    """
+    Sim trace kept as per-entity column lists while it is recorded.
+
+    Frames are split into their entities' rows as they are added, so
+    encoding only concatenates lists into arrays.
+    """
+
+    def __init__(self):
+        self.times: List[float] = []
+        self._strings = _Strings()
+        self._armor_sections: Dict[str, int] = {}
+        self._ships: Dict[str, Dict[str, list]] = {}
+        # kind -> entity ID -> (source code, columns)
+        self._entities: Dict[str, Dict[str, Tuple[int, Dict[str, list]]]] = {kind: {} for kind in _ENTITY_KINDS}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def add_frame(self, frame: Dict[str, Any]) -> None:
+        """
+        Add one frame.
+
+        Args:
+            frame: Frame as recorded by BattleRecorder.record_sim_frame
+        """
+        index = len(self.times)
+        self.times.append(frame["t"])
+        code = self._strings.code
+
+        for ship_id, ship in frame["ships"].items():
+            rows = self._ships.get(ship_id)
+            if rows is None:
+                rows = self._ships[ship_id] = {name: [] for name, _ in _SHIP_COLUMNS}
+            rows["ship_row_frame"].append(index)
+            rows["ship_pos"].extend(ship["pos"])
+            rows["ship_vel"].extend(ship["vel"])
+            rows["ship_fwd"].extend(ship["fwd"])
+            rows["ship_thrust"].append(ship["thrust"])
+            rows["ship_maneuver"].append(code(ship["maneuver"]))
+            rows["ship_destroyed"].append(ship["destroyed"])
+            rows["ship_hull"].append(ship["hull"])
+            rows["ship_armor"].append(ship["armor"])
+            for section in ship["armor"]:
+                self._armor_sections.setdefault(section, len(self._armor_sections))
+
+        for kind, (key, fields) in _ENTITY_KINDS.items():
+            entities = self._entities[kind]
+            for slot, entity in enumerate(frame[key]):
+                known = entities.get(entity["id"])
+                if known is None:
+                    known = entities[entity["id"]] = (
+                        code(entity["source"]),
+                        {name: [] for name, _ in _entity_columns(kind)},
+                    )
+                rows = known[1]
+                rows[f"{kind}_row_frame"].append(index)
+                rows[f"{kind}_row_slot"].append(slot)
+                rows[f"{kind}_row_target"].append(code(entity["target"]))
+                rows[f"{kind}_pos"].extend(entity["pos"])
+                rows[f"{kind}_vel"].extend(entity["vel"])
+                for field_key, suffix in fields:
+                    rows[f"{kind}_{suffix}"].append(entity[field_key])
+
+    def encode(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """
+        Columns of the frames added so far.
+
+        Returns:
+            (header describing the trace, columns by name)
+        """
+        header: Dict[str, Any] = {
+            "times": list(self.times),
+            "ships": [[ship_id, len(rows["ship_row_frame"])] for ship_id, rows in self._ships.items()],
+            "armor_sections": list(self._armor_sections),
+        }
+        ships = list(self._ships.values())
+        columns = {name: _concat(name, [rows[name] for rows in ships], width) for name, width in _SHIP_COLUMNS
+                   if name != "ship_armor"}
+
+        armor_dicts = [armor for rows in ships for armor in rows["ship_armor"]]
+        armor = np.full((len(armor_dicts), len(self._armor_sections)), np.nan)
+        for row, sections in enumerate(armor_dicts):
+            for section, thickness in sections.items():
+                armor[row, self._armor_sections[section]] = thickness
+        columns["ship_armor"] = _to_column("ship_armor", armor)
+
+        for kind, (key, _) in _ENTITY_KINDS.items():
+            entities = self._entities[kind]
+            header[key] = [
+                [entity_id, source, len(rows[f"{kind}_row_frame"])]
+                for entity_id, (source, rows) in entities.items()
+            ]
+            for name, width in _entity_columns(kind):
+                columns[name] = _concat(name, [rows[name] for _, rows in entities.values()], width)
+
+        header["strings"] = list(self._strings.strings)
+        return header, columns
+
+
+def _concat(name: str, lists: List[list], width: int) -> np.ndarray:
+    """Column from its entities' row lists."""
+    values = list(itertools.chain.from_iterable(lists))
+    if width > 1:
+        return _to_column(name, np.reshape(np.asarray(values, dtype=np.float64), (-1, width)))
+    return _to_column(name, values)
+
+
+def encode_sim_trace(frames: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Convert sim trace frames to columns.
+
+    Args:
+        frames: Frames as recorded by BattleRecorder.record_sim_frame
+
+    Returns:
+        (header describing the trace, columns by name)
+    """
+    trace = SimTraceColumns()
+    for frame in frames:
+        trace.add_frame(frame)
+    return trace.encode()
+
+
+def decode_sim_trace(header: Dict[str, Any], columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Convert columns back to sim trace frames.
+
+    Args:
+        header: Header from encode_sim_trace
+        columns: Columns from encode_sim_trace
+
+    Returns:
+        Frames in the shape BattleRecorder.record_sim_frame records
+    """
+    strings = _Strings(header["strings"])
+    frames = [{"t": t, "ships": {}, "projectiles": [], "torpedoes": []} for t in header["times"]]
+    values = {name: _from_column(name, array).tolist() for name, array in columns.items()}
+
+    # Ships
+    sections = header["armor_sections"]
+    start = 0
+    for ship_id, count in header["ships"]:
+        for row in range(start, start + count):
+            armor = values["ship_armor"][row]
+            frames[values["ship_row_frame"][row]]["ships"][ship_id] = {
+                "pos": values["ship_pos"][row],
+                "vel": values["ship_vel"][row],
+                "fwd": values["ship_fwd"][row],
+                "thrust": values["ship_thrust"][row],
+                "maneuver": strings.value(values["ship_maneuver"][row]),
+                "destroyed": bool(values["ship_destroyed"][row]),
+                "hull": values["ship_hull"][row],
+                "armor": {s: a for s, a in zip(sections, armor) if a == a},  # NaN: section not recorded
+            }
+        start += count
+
+    # Projectiles and torpedoes, restored to their place in each frame
+    for kind, (key, fields) in _ENTITY_KINDS.items():
+        flags = {key for key, suffix in fields if COLUMNS[f"{kind}_{suffix}"].dtype == "|u1"}
+        placed = []
+        start = 0
+        for entity_id, source, count in header[key]:
+            source = strings.value(source)
+            for row in range(start, start + count):
+                entity = {
+                    "id": entity_id,
+                    "pos": values[f"{kind}_pos"][row],
+                    "vel": values[f"{kind}_vel"][row],
+                    "source": source,
+                    "target": strings.value(values[f"{kind}_row_target"][row]),
+                }
+                for field_key, suffix in fields:
+                    value = values[f"{kind}_{suffix}"][row]
+                    entity[field_key] = bool(value) if field_key in flags else value
+                placed.append((values[f"{kind}_row_frame"][row], values[f"{kind}_row_slot"][row], entity))
+            start += count
+        placed.sort(key=lambda p: (p[0], p[1]))
+        for index, _, entity in placed:
+            frames[index][key].append(entity)
+
+    return frames
+
+
+# ---------------------------------------------------------------------------
+# Container
+# ---------------------------------------------------------------------------
+
+def encode_recording(
+    recording: Dict[str, Any],
+    trace: Optional[SimTraceColumns] = None,
+    compresslevel: int = 6,
+) -> bytes:
+    """
+    Encode a recording in the columnar format.
+
+    Args:
+        recording: Recording in the JSON shape (sim_trace is ignored if
+            trace is given)
+        trace: Sim trace already split into columns while recording
+        compresslevel: gzip compression level
+
+    Returns:
+        Container bytes
+    """
+    metadata = dict(recording, sim_trace=[])  # Frames go in the columns
+    if trace is None:
+        trace_header, columns = encode_sim_trace(recording.get("sim_trace", []))
+    else:
+        trace_header, columns = trace.encode()
+
+    index = {}
+    blobs = []
+    offset = 0
+    for name, array in columns.items():
+        data = array.tobytes()
+        index[name] = {"offset": offset, "shape": list(array.shape)}
+        padding = -len(data) % _ALIGN
+        blobs.append(data + b"\0" * padding)
+        offset += len(data) + padding
+
+    header = json.dumps({
+        "recording": metadata,
+        "sim_trace": trace_header,
+        "columns": index,
+    }, separators=(",", ":")).encode()
+    header += b" " * (-(len(header) + _PREFIX.size) % _ALIGN)
+
+    raw = b"".join([_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)), header, *blobs])
+    return gzip.compress(raw, compresslevel=compresslevel, mtime=0)
+
+
+def decode_recording(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a columnar container.
+
+    Args:
+        data: Container bytes from encode_recording
+
+    Returns:
+        Recording in the JSON shape (with sim_trace frames)
+
+    Raises:
+        ValueError: If the data is not a columnar recording
+    """
+    raw = gzip.decompress(data)
+    magic, version, header_length = _PREFIX.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("Not a columnar battle recording")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar recording version: {version}")
+
+    header = json.loads(raw[_PREFIX.size:_PREFIX.size + header_length])
+    body = memoryview(raw)[_PREFIX.size + header_length:]
+    columns = {}
+    for name, spec in header["columns"].items():
+        dtype = np.dtype(COLUMNS[name].dtype)
+        count = int(np.prod(spec["shape"]))
+        columns[name] = np.frombuffer(body, dtype, count, spec["offset"]).reshape(spec["shape"])
+
+    recording = header["recording"]
+    recording["sim_trace"] = decode_sim_trace(header["sim_trace"], columns)
+    return recording
+
+
+def load_recording(filepath: str) -> Dict[str, Any]:
+    """
+    Load a recording in any format.
+
+    Args:
+        filepath: JSON, columnar or recording log (complete or partial)
+
+    Returns:
+        Recording in the JSON shape, with full sim frames
+    """
+    from .recording_log import is_recording_log, read_recording_log
+
+    data = Path(filepath).read_bytes()
+    if data[:2] == b"\x1f\x8b":  # gzip
+        return decode_recording(data)
+    if is_recording_log(data):
+        return read_recording_log(data)
+    return decode_recording_trajectories(json.loads(data))
@@ -0,0 +1,249 @@
+"""
+Streaming, crash-safe battle recording log.
+
+The JSON and columnar formats are written once, by save() at the end of a
+battle: until then every event and sim frame is held in memory, and a
+crash loses the whole battle. The log format is written while the battle
+runs instead. RecordingLogWriter buffers the events and frames of the
+current segment; a background thread encodes and appends the segment to
+the file every flush interval (or as soon as it holds segment_frames
+frames), then drops it, so memory use does not grow with battle length.
+
+File layout:
+    LOG_MAGIC, uint16 format version
+    records: 4-byte kind, uint32 payload length, uint32 CRC-32, payload
+
+Record kinds:
+    META  recording metadata at the start of the battle (JSON)
+    SEGM  events and sim frames since the previous segment (a columnar
+          container, see recording_codec)
+    END   final metadata: result, remaining ships, telemetry (JSON)
+
+Records are appended with one write and flushed to disk. A crash can only
+leave a torn last record, which the reader detects by its length or
+checksum and ignores: a partial recording loads up to its last complete
+segment (no END record: no result, no battle_end event).
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .recording_codec import SimTraceColumns, decode_recording, encode_recording
+
+
+LOG_MAGIC = b"AICLOG"
+LOG_VERSION = 1
+
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+DEFAULT_SEGMENT_FRAMES = 600
+
+_FILE_HEADER = struct.Struct("<6sH")
+_RECORD_HEADER = struct.Struct("<4sII")
+
+META = b"META"
+SEGMENT = b"SEGM"
+END = b"END "
+
+
+def _json_bytes(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+class RecordingLogWriter:
+    """
+    Appends a battle's events and sim frames to a recording log.
+
+    add_event() and add_frame() only buffer; a background thread writes
+    the buffered segment every flush_interval_s. Thread-safe. Once a
+    write has failed, add_event() and add_frame() raise its error instead
+    of buffering without limit.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        metadata: Dict[str, Any],
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        segment_frames: int = DEFAULT_SEGMENT_FRAMES,
+        fsync: bool = True,
+    ):
+        """
+        Create the log file and start the flush thread.
+
+        Args:
+            path: Log file path (created or truncated)
+            metadata: Recording metadata at the start of the battle
+            flush_interval_s: Longest time buffered data waits for disk
+            segment_frames: Frames that trigger an early flush
+            fsync: Force each record to disk (not just to the OS)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval_s = flush_interval_s
+        self.segment_frames = segment_frames
+        self.fsync = fsync
+        self.segments_written = 0
+        self.error: Optional[BaseException] = None
+
+        self._lock = threading.Lock()        # Guards the buffers
+        self._write_lock = threading.Lock()  # Keeps segments in order
+        self._events: List[Dict[str, Any]] = []
+        self._trace = SimTraceColumns()
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._file = open(self.path, "wb")
+        self._file.write(_FILE_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+        self._write_record(META, _json_bytes(metadata))
+
+        self._thread = threading.Thread(target=self._run, name="recording-log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def buffered_frames(self) -> int:
+        """Frames not yet written."""
+        with self._lock:
+            return len(self._trace)
+
+    def add_event(self, event: Dict[str, Any]) -> None:
+        """
+        Buffer one event (BattleEvent.to_dict()).
+
+        Raises:
+            Exception: The error that stopped the flush thread, if any
+        """
+        self._check_error()
+        with self._lock:
+            self._events.append(event)
+
+    def add_frame(self, frame: Dict[str, Any]) -> None:
+        """
+        Buffer one sim frame (as built by BattleRecorder.record_sim_frame).
+
+        Raises:
+            Exception: The error that stopped the flush thread, if any
+        """
+        self._check_error()
+        with self._lock:
+            self._trace.add_frame(frame)
+            full = len(self._trace) >= self.segment_frames
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write the buffered segment now (no-op if nothing is buffered)."""
+        with self._write_lock:
+            with self._lock:
+                events, trace = self._events, self._trace
+                if not events and not len(trace):
+                    return
+                self._events, self._trace = [], SimTraceColumns()
+            self._write_record(SEGMENT, encode_recording({"events": events}, trace, compresslevel=1))
+            self.segments_written += 1
+
+    def close(self, metadata: Dict[str, Any]) -> None:
+        """
+        Write the remaining data and the final metadata, then close the file.
+
+        Args:
+            metadata: Final recording metadata (result, telemetry, ...)
+
+        Raises:
+            Exception: The error that stopped the flush thread, if any
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        try:
+            if self.error is None:
+                self.flush()
+                self._write_record(END, _json_bytes(metadata))
+        finally:
+            self._file.close()
+        if self.error is not None:
+            raise self.error
+
+    def _check_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # Raised by the next add or close()
+                self.error = e
+                return
+
+    def _write_record(self, kind: bytes, payload: bytes) -> None:
+        header = _RECORD_HEADER.pack(kind, len(payload), zlib.crc32(payload))
+        self._file.write(header + payload)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+def is_recording_log(data: bytes) -> bool:
+    """True if data starts like a recording log."""
+    return data[:len(LOG_MAGIC)] == LOG_MAGIC
+
+
+def read_recording_log(data: bytes) -> Dict[str, Any]:
+    """
+    Read a recording log, complete or not.
+
+    Args:
+        data: Log file contents
+
+    Returns:
+        Recording in the JSON shape, with the events and sim frames of
+        every complete segment
+
+    Raises:
+        ValueError: If the data is not a recording log or has no metadata
+    """
+    magic, version = _FILE_HEADER.unpack_from(data)
+    if magic != LOG_MAGIC:
+        raise ValueError("Not a battle recording log")
+    if version > LOG_VERSION:
+        raise ValueError(f"Unsupported recording log version: {version}")
+
+    recording: Optional[Dict[str, Any]] = None
+    events: List[Dict[str, Any]] = []
+    frames: List[Dict[str, Any]] = []
+    offset = _FILE_HEADER.size
+    while offset + _RECORD_HEADER.size <= len(data):
+        kind, length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break  # Torn last record
+        offset = start + length
+
+        if kind == META:
+            recording = json.loads(payload)
+        elif kind == SEGMENT:
+            segment = decode_recording(payload)
+            events.extend(segment["events"])
+            frames.extend(segment["sim_trace"])
+        elif kind == END:
+            recording = dict(recording or {}, **json.loads(payload))
+
+    if recording is None:
+        raise ValueError("Recording log has no metadata")
+    recording["events"] = events
+    recording["sim_trace"] = frames
+    return recording
@@ -0,0 +1,495 @@
+"""
+Async request pool for LLM API calls.
+
+Wraps a pooled httpx.AsyncClient with the policies a fleet battle needs
+when a dozen captains hit the same providers at once:
+
+- Bounded in-flight requests per provider
+- Token-bucket rate limiting per model
+- Exponential backoff with jitter on 429/5xx and transport errors
+- Optional hedged duplicate requests once a call exceeds a latency
+  percentile of recent calls to the same model
+
+HTTP/2 is used when the optional ``h2`` package is installed
+(``pip install httpx[http2]``); otherwise connections fall back to
+pooled HTTP/1.1 keep-alive.
+"""
+
+import asyncio
+import importlib.util
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import httpx
+
+
+# =============================================================================
+# POLICIES
+# =============================================================================
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff for transient failures.
+
+    Attributes:
+        max_attempts: Total attempts including the first request.
+        base_delay_s: Delay before the first retry.
+        max_delay_s: Upper bound for any single delay (including Retry-After).
+        jitter: Random +/- fraction applied to each delay.
+        retry_statuses: HTTP statuses treated as transient.
+    """
+    max_attempts: int = 4
+    base_delay_s: float = 0.5
+    max_delay_s: float = 8.0
+    jitter: float = 0.25
+    retry_statuses: Tuple[int, ...] = (408, 409, 425, 429, 500, 502, 503, 504)
+
+    def delay_for(
+        self,
+        attempt: int,
+        retry_after_s: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ) -> float:
+        """
+        Delay before retrying after the given (1-based) failed attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed.
+            retry_after_s: Server-provided Retry-After, if any.
+            rng: Random source for jitter.
+
+        Returns:
+            Seconds to wait.
+        """
+        if retry_after_s is not None:
+            return min(self.max_delay_s, max(0.0, retry_after_s))
+        delay = min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay *= 1.0 + (rng or random).uniform(-self.jitter, self.jitter)
+        return delay
+
+
+@dataclass
+class HedgePolicy:
+    """
+    When to send a duplicate request for a slow call.
+
+    Hedging is off by default: every hedge is a second billed completion.
+
+    Attributes:
+        enabled: Send hedged requests at all.
+        percentile: Latency percentile (0-1) of recent calls that triggers a hedge.
+        min_samples: Recent calls needed before the percentile is trusted.
+        min_delay_s: Never hedge earlier than this.
+    """
+    enabled: bool = False
+    percentile: float = 0.95
+    min_samples: int = 20
+    min_delay_s: float = 0.5
+
+
+# =============================================================================
+# RATE LIMITING AND LATENCY TRACKING
+# =============================================================================
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate_per_s`` up to ``capacity``. Safe
+    for concurrent use within one event loop: the check-and-take step has
+    no await in it.
+    """
+
+    def __init__(self, rate_per_s: float, capacity: float, clock=time.monotonic):
+        """
+        Args:
+            rate_per_s: Refill rate in tokens per second.
+            capacity: Maximum burst size.
+            clock: Monotonic time source (seconds).
+        """
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if available.
+
+        Returns:
+            0.0 on success, otherwise seconds until enough tokens accrue.
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate_per_s
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until tokens are available and take them.
+
+        Returns:
+            Total seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return waited
+            waited += wait
+            await asyncio.sleep(wait)
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency_s: float) -> None:
+        self._samples.append(latency_s)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Nearest-rank percentile (p in 0-1), or None with no samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(p * len(ordered))) - 1))
+        return ordered[index]
+
+
+@dataclass
+class PoolStats:
+    """Counters for requests made through an AsyncRequestPool."""
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    hedges_sent: int = 0
+    hedges_won: int = 0
+    rate_limit_wait_s: float = 0.0
+
+
+# =============================================================================
+# REQUEST POOL
+# =============================================================================
+
+class AsyncRequestPool:
+    """
+    Pooled async HTTP client with per-provider concurrency, per-model rate
+    limits, retries and optional hedging.
+
+    Loop-bound resources (the httpx client and semaphores) are created
+    lazily for the running event loop, so the pool can be driven by a
+    long-lived loop or by repeated asyncio.run() calls.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_per_provider: int = 4,
+        requests_per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge: Optional[HedgePolicy] = None,
+        timeout_s: float = 60.0,
+        max_connections: int = 32,
+        http2: Optional[bool] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            max_concurrent_per_provider: In-flight requests allowed per provider.
+            requests_per_minute: Rate limit per model (None = unlimited).
+            burst: Token bucket capacity (defaults to max_concurrent_per_provider).
+            retry: Retry policy (defaults to RetryPolicy()).
+            hedge: Hedging policy (defaults to disabled).
+            timeout_s: Per-request timeout.
+            max_connections: Connection pool size.
+            http2: Force HTTP/2 on or off (None = use it if h2 is installed).
+            seed: Seed for retry jitter.
+        """
+        self.max_concurrent_per_provider = max_concurrent_per_provider
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst if burst is not None else max_concurrent_per_provider
+        self.retry = retry or RetryPolicy()
+        self.hedge = hedge or HedgePolicy()
+        self.timeout_s = timeout_s
+        self.max_connections = max_connections
+        self.http2 = http2 if http2 is not None else importlib.util.find_spec("h2") is not None
+        self.stats = PoolStats()
+
+        self._rng = random.Random(seed)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._latency: Dict[str, LatencyTracker] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def provider_of(model: str) -> str:
+        """Provider name for a model ID ("anthropic/claude-3.5-sonnet" -> "anthropic")."""
+        if model.startswith("openrouter/"):
+            model = model[len("openrouter/"):]
+        return model.split("/", 1)[0]
+
+    def _ensure_loop_state(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_s,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            self._semaphores = {}
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        provider = self.provider_of(model)
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_per_provider)
+            self._semaphores[provider] = semaphore
+        return semaphore
+
+    def _bucket(self, model: str) -> Optional[TokenBucket]:
+        if not self.requests_per_minute:
+            return None
+        bucket = self._buckets.get(model)
+        if bucket is None:
+            bucket = TokenBucket(self.requests_per_minute / 60.0, self.burst)
+            self._buckets[model] = bucket
+        return bucket
+
+    def latency_tracker(self, model: str) -> LatencyTracker:
+        tracker = self._latency.get(model)
+        if tracker is None:
+            tracker = LatencyTracker()
+            self._latency[model] = tracker
+        return tracker
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Seconds after which a hedge is sent for this model, or None."""
+        if not self.hedge.enabled:
+            return None
+        tracker = self.latency_tracker(model)
+        if len(tracker) < self.hedge.min_samples:
+            return None
+        return max(self.hedge.min_delay_s, tracker.percentile(self.hedge.percentile))
+
+    async def post_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        model: str,
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        POST a JSON payload and return the decoded JSON response.
+
+        Args:
+            url: Endpoint URL.
+            headers: Request headers.
+            payload: JSON body.
+            model: Model ID (selects provider limit, rate bucket, latency stats).
+            on_retry: Called each time a failed attempt is retried.
+
+        Returns:
+            Decoded response body.
+
+        Raises:
+            httpx.HTTPStatusError: Non-retryable status, or retries exhausted.
+            httpx.TransportError: Connection failures after retries exhausted.
+        """
+        self._ensure_loop_state()
+        self.stats.requests += 1
+        bucket = self._bucket(model)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if bucket:
+                self.stats.rate_limit_wait_s += await bucket.acquire()
+            self.stats.attempts += 1
+
+            try:
+                async with self._semaphore(model):
+                    response = await self._send_hedged(url, headers, payload, model)
+            except httpx.TransportError:
+                if attempt == self.retry.max_attempts:
+                    raise
+                delay = self.retry.delay_for(attempt, rng=self._rng)
+            else:
+                if (
+                    response.status_code not in self.retry.retry_statuses
+                    or attempt == self.retry.max_attempts
+                ):
+                    response.raise_for_status()
+                    return response.json()
+                delay = self.retry.delay_for(
+                    attempt, _retry_after_s(response), rng=self._rng
+                )
+
+            self.stats.retries += 1
+            if on_retry is not None:
+                on_retry()
+            await asyncio.sleep(delay)
+
+    async def post_stream(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        model: str,
+        on_line: Callable[[str], None],
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        POST a JSON payload and pass each line of the response body to
+        on_line as it arrives (e.g. server-sent events).
+
+        Concurrency, rate limits and retries apply as for post_json(), but
+        a request is only retried until its first line has been delivered,
+        and streamed requests are never hedged.
+
+        Args:
+            url: Endpoint URL.
+            headers: Request headers.
+            payload: JSON body.
+            model: Model ID (selects provider limit, rate bucket, latency stats).
+            on_line: Called with each response line.
+            on_retry: Called each time a failed attempt is retried.
+
+        Raises:
+            httpx.HTTPStatusError: Non-retryable status, or retries exhausted.
+            httpx.TransportError: Connection failures after retries exhausted,
+                or any failure once streaming has started.
+        """
+        self._ensure_loop_state()
+        self.stats.requests += 1
+        bucket = self._bucket(model)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if bucket:
+                self.stats.rate_limit_wait_s += await bucket.acquire()
+            self.stats.attempts += 1
+            streaming = False
+
+            try:
+                async with self._semaphore(model):
+                    start = time.monotonic()
+                    async with self._client.stream("POST", url, headers=headers, json=payload) as response:
+                        if (
+                            response.status_code not in self.retry.retry_statuses
+                            or attempt == self.retry.max_attempts
+                        ):
+                            if response.is_error:
+                                await response.aread()
+                                response.raise_for_status()
+                            async for line in response.aiter_lines():
+                                streaming = True
+                                on_line(line)
+                            self.latency_tracker(model).record(time.monotonic() - start)
+                            return
+                        retry_after_s = _retry_after_s(response)
+            except httpx.TransportError:
+                if streaming or attempt == self.retry.max_attempts:
+                    raise
+                delay = self.retry.delay_for(attempt, rng=self._rng)
+            else:
+                delay = self.retry.delay_for(attempt, retry_after_s, rng=self._rng)
+
+            self.stats.retries += 1
+            if on_retry is not None:
+                on_retry()
+            await asyncio.sleep(delay)
+
+    async def _timed_post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        model: str,
+    ) -> httpx.Response:
+        start = time.monotonic()
+        response = await self._client.post(url, headers=headers, json=payload)
+        if response.is_success:
+            self.latency_tracker(model).record(time.monotonic() - start)
+        return response
+
+    async def _send_hedged(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        model: str,
+    ) -> httpx.Response:
+        """Send one request, racing a duplicate if it runs past the hedge delay."""
+        delay = self.hedge_delay(model)
+        if delay is None:
+            return await self._timed_post(url, headers, payload, model)
+
+        primary = asyncio.ensure_future(self._timed_post(url, headers, payload, model))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        self.stats.hedges_sent += 1
+        hedge = asyncio.ensure_future(self._timed_post(url, headers, payload, model))
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    winner = primary if primary in succeeded else hedge
+                    if winner is hedge:
+                        self.stats.hedges_won += 1
+                    return winner.result()
+                # A failed racer only matters once the other one fails too
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client (it is recreated on next use)."""
+        if self._client is not None:
+            await self._client.aclose()
+        self._loop = None
+        self._client = None
+        self._semaphores = {}
+
+
+def _retry_after_s(response: httpx.Response) -> Optional[float]:
+    """Parse a numeric Retry-After header."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,179 @@
+"""
+Content-addressed cache for LLM responses.
+
+Responses are stored on disk under a SHA-256 of the request's model,
+messages, tools and temperature. With the simulation seed fixed, a battle
+recorded with a cache can be replayed offline: every prompt is rebuilt
+identically, so every lookup hits. Strict replay mode turns a miss into
+an error instead of a live API call, which makes any divergence visible.
+
+Layout::
+
+    <directory>/<key[:2]>/<key>.json
+
+Least-recently-used entries are evicted once the store exceeds its size
+budget (reads refresh an entry's mtime).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class CacheMode(Enum):
+    """How the cache participates in requests."""
+    READ_WRITE = "read_write"  # Serve hits, record misses from the live API
+    REPLAY = "replay"          # Serve hits, raise CacheMissError on a miss
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a request has no cached response."""
+
+    def __init__(self, key: str, model: str):
+        super().__init__(f"No cached LLM response for {model} (key {key[:16]}...)")
+        self.key = key
+        self.model = model
+
+
+# Request fields that determine the response
+KEY_FIELDS = ("model", "messages", "tools", "temperature")
+
+
+class ResponseCache:
+    """
+    On-disk store of raw chat-completion responses.
+
+    Attributes:
+        directory: Root of the store.
+        max_bytes: Size budget before LRU eviction.
+        mode: READ_WRITE or strict REPLAY.
+        hits: Lookups served from the store.
+        misses: Lookups not found.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        mode: CacheMode = CacheMode.READ_WRITE,
+    ):
+        """
+        Args:
+            directory: Cache directory (created if missing).
+            max_bytes: Maximum total size of cached responses.
+            mode: Cache mode.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = sum(path.stat().st_size for path in self._entries())
+
+    @staticmethod
+    def key_for(payload: Dict[str, Any]) -> str:
+        """
+        Content hash of the fields of a request payload that affect the response.
+
+        Args:
+            payload: Chat-completion request body.
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        material = {name: payload.get(name) for name in KEY_FIELDS}
+        canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        return self.directory.glob("??/*.json")
+
+    def lookup(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached response for a request.
+
+        Args:
+            payload: Chat-completion request body.
+
+        Returns:
+            Cached response body, or None on a miss (READ_WRITE mode).
+
+        Raises:
+            CacheMissError: On a miss in REPLAY mode.
+        """
+        key = self.key_for(payload)
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            if self.mode == CacheMode.REPLAY:
+                raise CacheMissError(key, str(payload.get("model")))
+            return None
+
+        self.hits += 1
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return data
+
+    def store(self, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """
+        Record a response, evicting old entries if over budget.
+
+        Writes are atomic so a crash never leaves a truncated entry.
+
+        Args:
+            payload: Chat-completion request body.
+            response: Response body to cache.
+        """
+        if self.mode == CacheMode.REPLAY:
+            return
+
+        path = self._path(self.key_for(payload))
+        path.parent.mkdir(exist_ok=True)
+        old_size = path.stat().st_size if path.exists() else 0
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(response, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+        self._total_bytes += path.stat().st_size - old_size
+        if self._total_bytes > self.max_bytes:
+            self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least-recently-used entries until under budget."""
+        entries = sorted(
+            ((p.stat().st_mtime, p.stat().st_size, p) for p in self._entries() if p != keep),
+            key=lambda entry: entry[0],
+        )
+        for _mtime, size, path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._total_bytes -= size
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        for path in self._entries():
+            path.unlink()
+        self._total_bytes = 0
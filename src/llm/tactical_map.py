@@ -0,0 +1,381 @@
+"""
+ASCII tactical map for MCP clients.
+
+Renders ship positions, velocity arrows and closest-enemy distances for one
+faction's view of the battle, projected onto the XY, XZ or YZ plane.
+
+Ship positions and velocities are gathered into arrays once per state and
+all three projections (grid cells, arrows, distances) are computed in one
+NumPy pass. TacticalMapCache keeps the rendered text per (state version,
+faction, projection), so repeated map fetches within a checkpoint cost a
+dictionary lookup.
+
+With tracks=True, projectiles and torpedoes are drawn as well. Their
+positions are estimated from the state (distance to target along the line
+from source ship to target ship) and each gets a dotted track to its
+target; the cost is linear in the number of munitions.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+
+GRID_WIDTH = 60
+GRID_HEIGHT = 20
+
+# Projection -> (horizontal axis, vertical axis, label)
+PROJECTIONS: Dict[str, Tuple[int, int, str]] = {
+    "xy": (0, 1, "X/Y plane (Z ignored)"),
+    "xz": (0, 2, "X/Z plane (Y ignored)"),
+    "yz": (1, 2, "Y/Z plane (X ignored)"),
+}
+_PLANE_AXES = np.array([PROJECTIONS[p][:2] for p in PROJECTIONS])  # (3, 2)
+
+# 8 directions, starting from right (0 rad) going counterclockwise
+ARROWS = ["→", "↗", "↑", "↖", "←", "↙", "↓", "↘"]
+STATIONARY = "·"
+_ARROW_GLYPHS = np.array(ARROWS)
+
+SLUG_GLYPH = "*"
+TORPEDO_GLYPH = "T"
+TRACK_GLYPH = "."
+
+DEFAULT_CACHED_STATES = 4  # State versions kept per cache
+
+
+def get_velocity_arrow(vx: float, vy: float) -> str:
+    """Convert velocity vector to arrow character."""
+    if abs(vx) < 0.1 and abs(vy) < 0.1:
+        return STATIONARY
+
+    angle = math.atan2(vy, vx)  # radians
+    # Normalize angle to [0, 2*pi]
+    if angle < 0:
+        angle += 2 * math.pi
+    # Each sector is pi/4 wide
+    index = int((angle + math.pi / 8) / (math.pi / 4)) % 8
+    return ARROWS[index]
+
+
+def _velocity_arrows(vx: np.ndarray, vy: np.ndarray) -> np.ndarray:
+    """get_velocity_arrow over arrays."""
+    angle = np.arctan2(vy, vx)
+    angle = np.where(angle < 0, angle + 2 * math.pi, angle)
+    index = ((angle + math.pi / 8) / (math.pi / 4)).astype(int) % 8
+    arrows = _ARROW_GLYPHS[index]
+    stationary = (np.abs(vx) < 0.1) & (np.abs(vy) < 0.1)
+    return np.where(stationary, STATIONARY, arrows)
+
+
+def _vector(data: Dict[str, Any]) -> Tuple[float, float, float]:
+    return (data.get("x", 0), data.get("y", 0), data.get("z", 0))
+
+
+def _paint(grid: np.ndarray, rows: np.ndarray, cols: np.ndarray, chars: np.ndarray) -> None:
+    """Write chars into grid cells; where cells repeat, the last write wins."""
+    if len(rows) == 0:
+        return
+    flat = rows * GRID_WIDTH + cols
+    _, first_from_end = np.unique(flat[::-1], return_index=True)
+    last = len(flat) - 1 - first_from_end
+    grid.reshape(-1)[flat[last]] = chars[last]
+
+
+class TacticalMap:
+    """
+    Geometry of one state for all projections, and its rendered maps.
+
+    Built once per (state, faction); render() only assembles text.
+    """
+
+    def __init__(self, state_dict: Dict[str, Any], faction: str):
+        """
+        Args:
+            state_dict: Battle state dictionary with friendly_ships and enemy_ships
+            faction: Our faction ("alpha" or "beta")
+        """
+        friendly_ships = state_dict.get("friendly_ships", [])
+        enemy_ships = state_dict.get("enemy_ships", [])
+        ships = friendly_ships + enemy_ships
+        self.timestamp = state_dict.get("timestamp", 0)
+        self.ship_count = len(ships)
+        if not ships:
+            return
+
+        # Ship labels for the map
+        friendly_label = "A" if faction == "alpha" else "B"
+        enemy_label = "B" if faction == "alpha" else "A"
+        self.labels = (
+            [f"{friendly_label}{i}" for i in range(1, len(friendly_ships) + 1)]
+            + [f"{enemy_label}{i}" for i in range(1, len(enemy_ships) + 1)]
+        )
+        self.names = [ship.get("ship_name", ship.get("ship_id", "?")) for ship in ships]
+        # Fog of war - no hull for enemies
+        self.hulls = [ship.get("hull_integrity") for ship in friendly_ships] + [None] * len(enemy_ships)
+        self.friendly_count = len(friendly_ships)
+        self.index = {ship.get("ship_id", "?"): i for i, ship in enumerate(ships)}
+
+        positions = np.array([_vector(ship.get("position_km", {})) for ship in ships], dtype=float)
+        velocities = np.array([_vector(ship.get("velocity_vector", {})) for ship in ships], dtype=float)
+        self.positions = positions
+
+        # Every projection at once: (projection, ship, plane axis)
+        planes = positions[:, _PLANE_AXES].transpose(1, 0, 2)
+        plane_velocities = velocities[:, _PLANE_AXES].transpose(1, 0, 2)
+
+        # Bounds, padded 10% or at least 10 km, with a non-zero range
+        low = planes.min(axis=1)
+        high = planes.max(axis=1)
+        padding = np.maximum((high - low) * 0.1, 10)
+        low = low - padding
+        high = high + padding
+        narrow = high - low < 1
+        low = np.where(narrow, low - 5, low)
+        high = np.where(narrow, high + 5, high)
+
+        # Same scale for both axes to preserve aspect
+        self.scales = np.maximum((high[:, 0] - low[:, 0]) / GRID_WIDTH, (high[:, 1] - low[:, 1]) / GRID_HEIGHT)
+        self._low = low
+        self._high = high
+
+        # Grid cells (row 0 is the top of the display)
+        self.cols, self.rows = self._cells(planes)
+
+        self.arrows = _velocity_arrows(plane_velocities[..., 0], plane_velocities[..., 1])
+
+        # Distance from each friendly to the closest enemy, per projection
+        self.closest: Optional[np.ndarray] = None
+        if self.friendly_count and len(enemy_ships):
+            offsets = planes[:, :self.friendly_count, None, :] - planes[:, None, self.friendly_count:, :]
+            distances = np.sqrt(offsets[..., 0] * offsets[..., 0] + offsets[..., 1] * offsets[..., 1])
+            self.closest = distances.argmin(axis=2)
+            self.closest_km = np.take_along_axis(distances, self.closest[..., None], axis=2)[..., 0]
+
+        self._munitions: Optional[Tuple[np.ndarray, ...]] = None
+        self._munition_counts = (0, 0)
+        self._state_dict = state_dict
+
+    def _cells(self, planes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Grid (col, row) of plane points, clamped to the grid: (projection, point) each."""
+        scale = self.scales[:, None]
+        cols = ((planes[..., 0] - self._low[:, None, 0]) / scale).astype(int)
+        rows = ((self._high[:, None, 1] - planes[..., 1]) / scale).astype(int)  # Flip Y
+        return np.clip(cols, 0, GRID_WIDTH - 1), np.clip(rows, 0, GRID_HEIGHT - 1)
+
+    def _munition_cells(self) -> Tuple[np.ndarray, ...]:
+        """
+        Track and head cells of projectiles and torpedoes, per projection.
+
+        Returns:
+            (track rows, track cols, head rows, head cols, head glyphs), the
+            first four shaped (projection, cells) with -1 marking cells off
+            the map
+        """
+        if self._munitions is not None:
+            return self._munitions
+
+        sources, targets, ranges, glyphs = [], [], [], []
+        slugs = torpedoes = 0
+        for key, glyph in (("projectiles", SLUG_GLYPH), ("torpedoes", TORPEDO_GLYPH)):
+            for munition in self._state_dict.get(key, []):
+                source = self.index.get(munition.get("source_ship"))
+                target = self.index.get(munition.get("target_ship"))
+                if source is None or target is None:
+                    continue  # Source or target not on the map
+                sources.append(source)
+                targets.append(target)
+                ranges.append(munition.get("distance_km", 0))
+                glyphs.append(glyph)
+                if glyph == SLUG_GLYPH:
+                    slugs += 1
+                else:
+                    torpedoes += 1
+        self._munition_counts = (slugs, torpedoes)
+
+        empty = np.empty((len(PROJECTIONS), 0), dtype=int)
+        if not sources:
+            self._munitions = (empty, empty, empty, empty, np.array([], dtype=str))
+            return self._munitions
+
+        # Estimated position: distance_km from the target, towards the source
+        source_pos = self.positions[sources]
+        target_pos = self.positions[targets]
+        offset = source_pos - target_pos
+        length = np.linalg.norm(offset, axis=1)
+        unit = np.divide(offset, length[:, None], out=np.zeros_like(offset), where=length[:, None] > 0)
+        heads = target_pos + unit * np.array(ranges, dtype=float)[:, None]
+
+        # Track: evenly spaced points from head to target (no more than a map width)
+        steps = np.linspace(0.0, 1.0, GRID_WIDTH, endpoint=False)[None, :, None]
+        track = heads[:, None, :] + steps * (target_pos - heads)[:, None, :]
+
+        def cells(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            planes = points.reshape(-1, 3)[:, _PLANE_AXES].transpose(1, 0, 2)
+            scale = self.scales[:, None]
+            cols = np.floor((planes[..., 0] - self._low[:, None, 0]) / scale).astype(int)
+            rows = np.floor((self._high[:, None, 1] - planes[..., 1]) / scale).astype(int)
+            off = (cols < 0) | (cols >= GRID_WIDTH) | (rows < 0) | (rows >= GRID_HEIGHT)
+            return np.where(off, -1, rows), np.where(off, -1, cols)
+
+        track_rows, track_cols = cells(track)
+        head_rows, head_cols = cells(heads)
+        self._munitions = (track_rows, track_cols, head_rows, head_cols, np.array(glyphs))
+        return self._munitions
+
+    def _grid(self, p: int, tracks: bool) -> List[List[str]]:
+        grid = np.full((GRID_HEIGHT, GRID_WIDTH), " ", dtype="<U1")
+        if tracks:
+            track_rows, track_cols, head_rows, head_cols, glyphs = self._munition_cells()
+            on = track_rows[p] >= 0
+            grid[track_rows[p][on], track_cols[p][on]] = TRACK_GLYPH
+            on = head_rows[p] >= 0
+            _paint(grid, head_rows[p][on], head_cols[p][on], glyphs[on])
+        rows = grid.tolist()
+
+        # Ship markers over munitions, later ships over earlier ones
+        for label, col, row in zip(self.labels, self.cols[p].tolist(), self.rows[p].tolist()):
+            marker = f"[{label}]"
+            # Try to place the marker (5 chars wide)
+            start = max(0, min(col - 2, GRID_WIDTH - 5))
+            marker = marker[:GRID_WIDTH - start]
+            rows[row][start:start + len(marker)] = marker
+        return rows
+
+    def render(self, projection: str = "xy", tracks: bool = False) -> str:
+        """
+        Render the map for one projection.
+
+        Args:
+            projection: Which 2D plane to project onto ("xy", "xz", "yz")
+            tracks: Also draw projectiles and torpedoes with their tracks
+
+        Returns:
+            ASCII tactical map string
+        """
+        if not self.ship_count:
+            return "No ships to display."
+
+        if projection not in PROJECTIONS:
+            projection = "yz"
+        p = list(PROJECTIONS).index(projection)
+        axis_label = PROJECTIONS[projection][2]
+
+        lines = []
+        border = "═" * 62
+        lines.append(f"╔{border}╗")
+        lines.append(f"║  TACTICAL MAP - T={self.timestamp:.0f}s  ({axis_label}){'':>14}║")
+        lines.append(f"╠{border}╣")
+
+        for row in self._grid(p, tracks):
+            lines.append(f"║ {''.join(row)} ║")
+
+        lines.append(f"╠{border}╣")
+
+        # Legend section: friendly ships with hull, then enemies (fog of war)
+        lines.append(f"║  SHIPS:{'':>54}║")
+        for i, label in enumerate(self.labels):
+            arrow = self.arrows[p, i]
+            if i < self.friendly_count:
+                hull = self.hulls[i]
+                hull_str = f"({hull:.0f}%)" if hull is not None else ""
+            else:
+                hull_str = "(enemy)"
+            entry = f"  {arrow}[{label}] {self.names[i][:15]:<15} {hull_str}"
+            lines.append(f"║{entry:<62}║")
+
+        lines.append(f"║{'':>62}║")
+        lines.append(f"║  DISTANCES:{'':>50}║")
+        if self.closest is not None:
+            for i in range(self.friendly_count):
+                enemy = self.friendly_count + int(self.closest[p, i])
+                entry = f"  [{self.labels[i]}] → [{self.labels[enemy]}]: {self.closest_km[p, i]:.1f} km"
+                lines.append(f"║{entry:<62}║")
+
+        if tracks:
+            self._munition_cells()
+            slugs, torpedoes = self._munition_counts
+            lines.append(f"║{'':>62}║")
+            entry = (
+                f"  MUNITIONS: {slugs} slugs ({SLUG_GLYPH})  {torpedoes} torpedoes ({TORPEDO_GLYPH})"
+                f"  {TRACK_GLYPH} = track"
+            )
+            lines.append(f"║{entry:<62}║")
+
+        lines.append(f"╠{border}╣")
+        lines.append(f"║  Scale: 1 char ≈ {self.scales[p]:.1f}km  |  Arrows show velocity direction{'':>5}║")
+        lines.append(f"║  Friendly hull shown  |  Enemy hull hidden (fog of war){'':>6}║")
+        lines.append(f"╚{border}╝")
+
+        return "\n".join(lines)
+
+
+class TacticalMapCache:
+    """
+    Rendered tactical maps per (state key, faction, projection, tracks).
+
+    The state key names a state version (e.g. the store's ETag); maps for
+    the last few keys are kept. Geometry is computed once per (state key,
+    faction) for all projections. Thread-safe.
+    """
+
+    def __init__(self, max_states: int = DEFAULT_CACHED_STATES):
+        """
+        Args:
+            max_states: Number of state keys kept.
+        """
+        self.max_states = max_states
+        self._lock = threading.Lock()
+        self._maps: "OrderedDict[Hashable, Dict[str, TacticalMap]]" = OrderedDict()
+        self._text: Dict[Tuple[Hashable, str, str, bool], str] = {}
+
+    def render(
+        self,
+        state_key: Optional[Hashable],
+        faction: str,
+        load_state: Callable[[], Dict[str, Any]],
+        projection: str = "xy",
+        tracks: bool = False,
+    ) -> str:
+        """
+        Tactical map of a state version, rendered at most once.
+
+        Args:
+            state_key: Version of the state (None renders without caching)
+            faction: Our faction ("alpha" or "beta")
+            load_state: Returns the state dictionary; only called on a miss
+            projection: Which 2D plane to project onto ("xy", "xz", "yz")
+            tracks: Also draw projectiles and torpedoes with their tracks
+
+        Returns:
+            ASCII tactical map string
+        """
+        if state_key is None:
+            return TacticalMap(load_state(), faction).render(projection, tracks)
+
+        key = (state_key, faction, projection, tracks)
+        with self._lock:
+            text = self._text.get(key)
+            if text is not None:
+                return text
+
+            maps = self._maps.get(state_key)
+            if maps is None:
+                maps = self._maps[state_key] = {}
+                while len(self._maps) > self.max_states:
+                    dropped, _ = self._maps.popitem(last=False)
+                    self._text = {k: v for k, v in self._text.items() if k[0] != dropped}
+            if faction not in maps:
+                maps[faction] = TacticalMap(load_state(), faction)
+
+            text = self._text[key] = maps[faction].render(projection, tracks)
+            return text
+
+    def clear(self) -> None:
+        """Drop all cached maps."""
+        with self._lock:
+            self._maps.clear()
+            self._text.clear()
@@ -0,0 +1,291 @@
+"""
+Shared tactical picture for one checkpoint.
+
+Captains, Admirals and the MCP controller all need the same geometry:
+distance, closing rate and nose angle between every pair of ships, and
+the range, ETA and approach bearing of every projectile and torpedo.
+TacticalPicture computes all of it once per checkpoint in a few
+vectorized numpy passes (pairwise over ships, batched over munitions)
+and serves per-ship and per-faction views.
+
+The battle runner builds one picture per checkpoint and hands it to every
+decision maker. A holder whose picture no longer matches the simulation
+(other simulation, later time, or munitions launched since) builds a
+fresh one via TacticalPicture.current().
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+NO_ETA_S = 999  # ETA reported for munitions not closing on their target
+
+
+@dataclass
+class PairGeometry:
+    """
+    Geometry of one ship (the observer) relative to another.
+
+    Attributes:
+        distance_km: Separation.
+        relative_position_km: Other ship's position minus the observer's.
+        relative_velocity_kps: Other ship's velocity minus the observer's.
+        closing_rate_kps: Rate the separation shrinks (positive = closing).
+        angle_deg: Angle between the observer's nose and the other ship.
+    """
+    distance_km: float
+    relative_position_km: Dict[str, float]
+    relative_velocity_kps: Dict[str, float]
+    closing_rate_kps: float
+    angle_deg: float
+
+
+@dataclass
+class MunitionThreat:
+    """
+    A projectile or torpedo closing on a ship.
+
+    Direction components are of the unit vector from the target to the
+    munition (where it is coming from), in the target's frame (forward,
+    right = forward x up, up).
+
+    Attributes:
+        source_ship_id: Ship that fired it.
+        target_ship_id: Ship it is tracking.
+        distance_m: Range to the target.
+        eta_seconds: Range over approach speed (NO_ETA_S if not closing).
+        speed_kps: Munition speed.
+        damage_gj: Kinetic energy (projectiles; 0 for torpedoes).
+        forward_dot: Threat direction along the target's nose axis (+1 = ahead).
+        right_dot: Threat direction along the target's starboard axis.
+        up_dot: Threat direction along the target's up axis.
+    """
+    source_ship_id: str
+    target_ship_id: str
+    distance_m: float
+    eta_seconds: float
+    speed_kps: float
+    damage_gj: float
+    forward_dot: float
+    right_dot: float
+    up_dot: float
+
+    @property
+    def distance_km(self) -> float:
+        return self.distance_m / 1000
+
+
+def _vectors(items: Iterable[Any]) -> np.ndarray:
+    """Stack Vector3D-like objects into an (n, 3) array."""
+    return np.array([(v.x, v.y, v.z) for v in items], dtype=float).reshape(-1, 3)
+
+
+def _unit(vectors: np.ndarray, norms: np.ndarray) -> np.ndarray:
+    """Unit vectors along the last axis; zero where the norm is zero."""
+    safe = np.where(norms > 0, norms, 1.0)
+    return np.where(norms[..., None] > 0, vectors / safe[..., None], 0.0)
+
+
+def _xyz(row: np.ndarray) -> Dict[str, float]:
+    return {"x": float(row[0]), "y": float(row[1]), "z": float(row[2])}
+
+
+class TacticalPicture:
+    """
+    Pairwise ship geometry and munition threats at one simulation time.
+
+    Attributes:
+        simulation: The simulation the picture was taken from.
+        sim_time: Simulation time of the picture.
+        ship_ids: Ships in simulation order (including destroyed ones).
+        distance_km: (n, n) separation matrix.
+        closing_rate_kps: (n, n) closing rate, row = observer.
+        angle_deg: (n, n) nose angle, row = observer.
+        projectiles: Projectile threats, in simulation order.
+        torpedoes: Active torpedo threats, in simulation order.
+    """
+
+    def __init__(self, simulation: Any):
+        """
+        Args:
+            simulation: CombatSimulation to take the picture from.
+        """
+        self.simulation = simulation
+        self.sim_time = simulation.current_time
+        self._munition_counts = self._count_munitions(simulation)
+
+        ships = list(simulation.ships.values())
+        self.ship_ids: List[str] = [ship.ship_id for ship in ships]
+        self._index = {ship_id: i for i, ship_id in enumerate(self.ship_ids)}
+
+        positions = _vectors(ship.position for ship in ships)
+        velocities = _vectors(ship.velocity for ship in ships)
+        forwards = _vectors(ship.forward for ship in ships)
+        ups = np.tile([0.0, 0.0, 1.0], (len(ships), 1))  # Ships carry no up axis: use +Z
+
+        # Pairwise geometry: [i, j] is ship j as seen from ship i
+        rel_pos = positions[None, :, :] - positions[:, None, :]
+        rel_vel = velocities[None, :, :] - velocities[:, None, :]
+        distance_m = np.linalg.norm(rel_pos, axis=2)
+        direction = _unit(rel_pos, distance_m)
+
+        self._rel_pos_km = rel_pos / 1000
+        self._rel_vel_kps = rel_vel / 1000
+        self.distance_km = distance_m / 1000
+        self.closing_rate_kps = -np.einsum("ijk,ijk->ij", direction, rel_vel) / 1000
+        cos_angle = np.clip(np.einsum("ik,ijk->ij", forwards, direction), -1.0, 1.0)
+        self.angle_deg = np.where(distance_m > 0, np.degrees(np.arccos(cos_angle)), 0.0)
+        self.speed_kps = np.linalg.norm(velocities, axis=1) / 1000
+
+        # Target frames for munition bearings
+        rights = np.cross(forwards, ups)
+        rights = _unit(rights, np.linalg.norm(rights, axis=1))
+        frames = (positions, forwards, rights, ups)
+
+        flights = [
+            p for p in getattr(simulation, "projectiles", None) or []
+            if getattr(p, "target_ship_id", None) in self._index
+        ]
+        self.projectiles: List[MunitionThreat] = self._threats(
+            frames,
+            sources=[p.source_ship_id for p in flights],
+            targets=[p.target_ship_id for p in flights],
+            positions=_vectors(p.projectile.position for p in flights),
+            velocities=_vectors(p.projectile.velocity for p in flights),
+            damage_gj=[getattr(p.projectile, "kinetic_energy_gj", 0.0) for p in flights],
+        )
+
+        torpedoes = [
+            t for t in getattr(simulation, "torpedoes", None) or []
+            if not t.is_disabled and t.torpedo.target_id in self._index
+        ]
+        self.torpedoes: List[MunitionThreat] = self._threats(
+            frames,
+            sources=[t.source_ship_id for t in torpedoes],
+            targets=[t.torpedo.target_id for t in torpedoes],
+            positions=_vectors(t.torpedo.position for t in torpedoes),
+            velocities=_vectors(t.torpedo.velocity for t in torpedoes),
+            damage_gj=[0.0] * len(torpedoes),
+        )
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _count_munitions(simulation: Any) -> tuple:
+        return (
+            len(getattr(simulation, "projectiles", None) or []),
+            len(getattr(simulation, "torpedoes", None) or []),
+        )
+
+    @classmethod
+    def current(cls, picture: Optional["TacticalPicture"], simulation: Any) -> "TacticalPicture":
+        """
+        Return picture if it still describes simulation, else a fresh one.
+
+        Args:
+            picture: Previously shared picture (may be None).
+            simulation: Simulation about to be read.
+        """
+        if (
+            picture is not None
+            and picture.simulation is simulation
+            and picture.sim_time == simulation.current_time
+            and picture._munition_counts == cls._count_munitions(simulation)
+        ):
+            return picture
+        return cls(simulation)
+
+    def _threats(
+        self,
+        frames: tuple,
+        sources: List[str],
+        targets: List[str],
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        damage_gj: List[float],
+    ) -> List[MunitionThreat]:
+        """Range, ETA and approach bearing for a batch of munitions."""
+        if not targets:
+            return []
+
+        ship_positions, forwards, rights, ups = frames
+        target_idx = np.array([self._index[t] for t in targets])
+
+        to_target = ship_positions[target_idx] - positions
+        distance = np.linalg.norm(to_target, axis=1)
+        direction = _unit(to_target, distance)
+        approach = np.einsum("ij,ij->i", velocities, direction)
+        safe_approach = np.where(approach > 0, approach, 1.0)
+        eta = np.where(approach > 0, distance / safe_approach, NO_ETA_S)
+        speed = np.linalg.norm(velocities, axis=1) / 1000
+
+        # Bearing of the munition as seen from the target
+        forward_dot = -np.einsum("ij,ij->i", forwards[target_idx], direction)
+        right_dot = -np.einsum("ij,ij->i", rights[target_idx], direction)
+        up_dot = -np.einsum("ij,ij->i", ups[target_idx], direction)
+
+        return [
+            MunitionThreat(
+                source_ship_id=sources[k],
+                target_ship_id=targets[k],
+                distance_m=float(distance[k]),
+                eta_seconds=float(eta[k]),
+                speed_kps=float(speed[k]),
+                damage_gj=float(damage_gj[k]),
+                forward_dot=float(forward_dot[k]),
+                right_dot=float(right_dot[k]),
+                up_dot=float(up_dot[k]),
+            )
+            for k in range(len(targets))
+        ]
+
+    # -------------------------------------------------------------------------
+    # Views
+    # -------------------------------------------------------------------------
+
+    def pair(self, observer_id: str, other_id: str) -> PairGeometry:
+        """Geometry of other_id as seen from observer_id."""
+        i, j = self._index[observer_id], self._index[other_id]
+        return PairGeometry(
+            distance_km=float(self.distance_km[i, j]),
+            relative_position_km=_xyz(self._rel_pos_km[i, j]),
+            relative_velocity_kps=_xyz(self._rel_vel_kps[i, j]),
+            closing_rate_kps=float(self.closing_rate_kps[i, j]),
+            angle_deg=float(self.angle_deg[i, j]),
+        )
+
+    def ship_speed_kps(self, ship_id: str) -> float:
+        """Speed of a ship."""
+        return float(self.speed_kps[self._index[ship_id]])
+
+    def closest(self, ship_id: str, candidate_ids: List[str]) -> Optional[str]:
+        """
+        Closest of candidate_ids to ship_id (first one on ties).
+
+        Args:
+            ship_id: Reference ship.
+            candidate_ids: Ships to choose from.
+
+        Returns:
+            Ship ID, or None if there are no candidates.
+        """
+        if not candidate_ids:
+            return None
+        row = self.distance_km[self._index[ship_id]]
+        distances = row[[self._index[c] for c in candidate_ids]]
+        return candidate_ids[int(np.argmin(distances))]
+
+    def projectiles_targeting(self, ship_ids: Iterable[str]) -> List[MunitionThreat]:
+        """Projectile threats against any of ship_ids (e.g. one ship or a faction)."""
+        wanted = set(ship_ids)
+        return [threat for threat in self.projectiles if threat.target_ship_id in wanted]
+
+    def torpedoes_targeting(self, ship_ids: Iterable[str]) -> List[MunitionThreat]:
+        """Active torpedo threats against any of ship_ids."""
+        wanted = set(ship_ids)
+        return [threat for threat in self.torpedoes if threat.target_ship_id in wanted]
+
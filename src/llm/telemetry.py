@@ -0,0 +1,384 @@
+"""
+Latency, token and error telemetry for LLM calls.
+
+LLMTelemetry collects two kinds of records:
+
+- CallRecord: one per chat completion made by a CaptainClient (live or
+  cached), with model, latency, tokens, retries and error.
+- DecisionRecord: one per instrumented decision span (an Admiral decision,
+  a captain decision, a captain turn including its Admiral discussion, a
+  discussion reply or a personality selection), with wall time and the
+  calls made inside it.
+
+Spans are tracked with a context variable, so calls made from concurrent
+asyncio tasks are attributed to the right captain. Records aggregate per
+model, per call kind and per decision kind into a JSON-ready summary.
+
+Captains, Admirals and the battle runner mark their decisions with the
+@instrumented decorator, which opens a span on the telemetry attached to
+the owner's client (and does nothing if there is none).
+
+Usage:
+    telemetry = LLMTelemetry()
+    client = CaptainClient(telemetry=telemetry)
+    with telemetry.span("captain", ship_id="alpha_1"):
+        client.decide_with_tools(messages, tools)
+    telemetry.write_summary("battle_telemetry.json")
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+@dataclass
+class CallRecord:
+    """
+    One chat completion request.
+
+    Attributes:
+        kind: Kind of the innermost open span ("other" outside any span).
+        model: Requested model ID.
+        started_at: Start time, seconds since the telemetry was created.
+        latency_s: Request latency (0 for cache hits).
+        prompt_tokens: Provider-reported prompt tokens.
+        completion_tokens: Provider-reported completion tokens.
+        cache_hit: Served from the response cache.
+        streamed: Response was streamed.
+        first_tool_call_s: Time to the first complete tool call (streamed only).
+        retries: Retried attempts before the final one.
+        error: Error description if the call failed.
+        ship_id: Ship of the enclosing span, if any.
+        checkpoint: Checkpoint number when the call was made.
+    """
+    kind: str
+    model: str
+    started_at: float
+    latency_s: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cache_hit: bool = False
+    streamed: bool = False
+    first_tool_call_s: Optional[float] = None
+    retries: int = 0
+    error: Optional[str] = None
+    ship_id: Optional[str] = None
+    checkpoint: int = 0
+
+
+@dataclass
+class DecisionRecord:
+    """
+    One instrumented decision span.
+
+    Attributes:
+        kind: Span kind ("admiral", "captain", "captain_turn", ...).
+        started_at: Start time, seconds since the telemetry was created.
+        wall_time_s: Wall time of the span.
+        llm_calls: Calls made inside the span (including nested spans).
+        errors: Failed calls inside the span, plus 1 if the span raised.
+        labels: Span labels (ship_id, faction, model, ...).
+        checkpoint: Checkpoint number when the span opened.
+    """
+    kind: str
+    started_at: float
+    wall_time_s: float
+    llm_calls: int = 0
+    errors: int = 0
+    labels: Dict[str, Any] = field(default_factory=dict)
+    checkpoint: int = 0
+
+
+class _Span:
+    def __init__(self, kind: str, labels: Dict[str, Any], parent: Optional["_Span"], started: float):
+        self.kind = kind
+        self.labels = labels
+        self.parent = parent
+        self.started = started
+        self.calls = 0
+        self.errors = 0
+
+    def chain(self) -> Iterator["_Span"]:
+        span: Optional[_Span] = self
+        while span is not None:
+            yield span
+            span = span.parent
+
+    def label(self, name: str) -> Any:
+        for span in self.chain():
+            if name in span.labels:
+                return span.labels[name]
+        return None
+
+
+_current_span: ContextVar[Optional[_Span]] = ContextVar("llm_telemetry_span", default=None)
+
+
+def _percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile of a non-empty list (p in 0-1)."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _latency_summary(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"total_s": 0.0, "mean_s": 0.0, "p50_s": 0.0, "p95_s": 0.0, "max_s": 0.0}
+    return {
+        "total_s": sum(values),
+        "mean_s": sum(values) / len(values),
+        "p50_s": _percentile(values, 0.5),
+        "p95_s": _percentile(values, 0.95),
+        "max_s": max(values),
+    }
+
+
+def _call_summary(records: List[CallRecord]) -> Dict[str, Any]:
+    """Aggregate of a group of calls. Latency covers live calls only."""
+    live = [r for r in records if not r.cache_hit]
+    first = [r.first_tool_call_s for r in live if r.first_tool_call_s is not None]
+    summary = {
+        "calls": len(records),
+        "live_calls": len(live),
+        "cache_hits": len(records) - len(live),
+        "errors": sum(1 for r in records if r.error),
+        "retries": sum(r.retries for r in records),
+        "prompt_tokens": sum(r.prompt_tokens for r in records),
+        "completion_tokens": sum(r.completion_tokens for r in records),
+        "latency": _latency_summary([r.latency_s for r in live if not r.error]),
+    }
+    if first:
+        summary["first_tool_call"] = _latency_summary(first)
+    return summary
+
+
+class LLMTelemetry:
+    """
+    Collector of per-call and per-decision LLM telemetry for one battle.
+
+    Thread-safe; a single instance may be shared by every client, captain
+    and Admiral of a battle.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Args:
+            clock: Monotonic time source (seconds).
+        """
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self.calls: List[CallRecord] = []
+        self.decisions: List[DecisionRecord] = []
+        self.checkpoint = 0
+
+    def set_checkpoint(self, checkpoint: int) -> None:
+        """Tag subsequent records with this checkpoint number."""
+        self.checkpoint = checkpoint
+
+    @contextlib.contextmanager
+    def span(self, kind: str, **labels: Any) -> Iterator[None]:
+        """
+        Attribute calls made inside the block to a decision of this kind.
+
+        Args:
+            kind: Decision kind ("admiral", "captain", "discussion", ...).
+            **labels: Extra labels (ship_id, faction, model, ...); None values are dropped.
+        """
+        labels = {name: value for name, value in labels.items() if value is not None}
+        span = _Span(kind, labels, _current_span.get(), self._clock())
+        checkpoint = self.checkpoint
+        token = _current_span.set(span)
+        raised = False
+        try:
+            yield
+        except BaseException:
+            raised = True
+            raise
+        finally:
+            _current_span.reset(token)
+            record = DecisionRecord(
+                kind=kind,
+                started_at=span.started - self._origin,
+                wall_time_s=self._clock() - span.started,
+                llm_calls=span.calls,
+                errors=span.errors + int(raised),
+                labels=labels,
+                checkpoint=checkpoint,
+            )
+            with self._lock:
+                self.decisions.append(record)
+
+    def record_call(
+        self,
+        model: str,
+        latency_s: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cache_hit: bool = False,
+        streamed: bool = False,
+        first_tool_call_s: Optional[float] = None,
+        retries: int = 0,
+        error: Optional[str] = None,
+    ) -> CallRecord:
+        """
+        Record one chat completion, attributed to the innermost open span.
+
+        Returns:
+            The stored CallRecord.
+        """
+        span = _current_span.get()
+        record = CallRecord(
+            kind=span.kind if span else "other",
+            model=model,
+            started_at=self._clock() - latency_s - self._origin,
+            latency_s=latency_s,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cache_hit=cache_hit,
+            streamed=streamed,
+            first_tool_call_s=first_tool_call_s,
+            retries=retries,
+            error=error,
+            ship_id=span.label("ship_id") if span else None,
+            checkpoint=self.checkpoint,
+        )
+        with self._lock:
+            self.calls.append(record)
+            for open_span in span.chain() if span else ():
+                open_span.calls += 1
+                open_span.errors += int(error is not None)
+        return record
+
+    # -------------------------------------------------------------------------
+    # Aggregation
+    # -------------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        JSON-ready aggregate of everything recorded.
+
+        Returns:
+            Dict with battle "totals", per-model "by_model", per-call-kind
+            "by_kind", and per-decision-kind "decisions" (count, errors,
+            calls and wall-time distribution).
+        """
+        with self._lock:
+            calls = list(self.calls)
+            decisions = list(self.decisions)
+
+        def grouped(records, key):
+            groups: Dict[str, List[Any]] = {}
+            for record in records:
+                groups.setdefault(key(record), []).append(record)
+            return dict(sorted(groups.items()))
+
+        return {
+            "totals": _call_summary(calls),
+            "by_model": {
+                model: _call_summary(records)
+                for model, records in grouped(calls, lambda r: r.model).items()
+            },
+            "by_kind": {
+                kind: _call_summary(records)
+                for kind, records in grouped(calls, lambda r: r.kind).items()
+            },
+            "decisions": {
+                kind: {
+                    "count": len(records),
+                    "errors": sum(r.errors for r in records),
+                    "llm_calls": sum(r.llm_calls for r in records),
+                    "wall_time": _latency_summary([r.wall_time_s for r in records]),
+                }
+                for kind, records in grouped(decisions, lambda r: r.kind).items()
+            },
+        }
+
+    def to_dict(self, include_records: bool = True) -> Dict[str, Any]:
+        """Summary, optionally with every call and decision record."""
+        data: Dict[str, Any] = {"summary": self.summary()}
+        if include_records:
+            with self._lock:
+                data["calls"] = [asdict(r) for r in self.calls]
+                data["decisions"] = [asdict(r) for r in self.decisions]
+        return data
+
+    def write_summary(self, filepath: str, include_records: bool = False) -> str:
+        """
+        Write the summary as JSON.
+
+        Args:
+            filepath: Output path (parent directories are created).
+            include_records: Also write every call and decision record.
+
+        Returns:
+            The path written.
+        """
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(include_records), f, indent=2)
+        return str(path)
+
+
+def telemetry_of(client: Any) -> Optional[LLMTelemetry]:
+    """The LLMTelemetry attached to a client, if any."""
+    telemetry = getattr(client, "telemetry", None)
+    return telemetry if isinstance(telemetry, LLMTelemetry) else None
+
+
+def decision_span(client: Any, kind: str, **labels: Any):
+    """
+    Span on the client's telemetry, or a no-op if it has none.
+
+    Args:
+        client: CaptainClient (or test double) making the decision's calls.
+        kind: Decision kind.
+        **labels: Span labels.
+    """
+    telemetry = telemetry_of(client)
+    if telemetry is None:
+        return contextlib.nullcontext()
+    return telemetry.span(kind, **labels)
+
+
+def instrumented(kind: str, labels: Optional[Callable[..., Dict[str, Any]]] = None):
+    """
+    Method decorator: run the method inside a decision span.
+
+    The span is opened on the telemetry of ``self.client``; without one the
+    method runs unchanged. Works for plain and async methods.
+
+    Args:
+        kind: Decision kind.
+        labels: Called with the method's arguments (including self) to get
+            the span labels.
+    """
+    def decorate(method):
+        def span_for(owner, args, kwargs):
+            telemetry = telemetry_of(getattr(owner, "client", None))
+            if telemetry is None:
+                return contextlib.nullcontext()
+            return telemetry.span(kind, **(labels(owner, *args, **kwargs) if labels else {}))
+
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with span_for(self, args, kwargs):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with span_for(self, args, kwargs):
+                return method(self, *args, **kwargs)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,121 @@
+"""
+Prompt token accounting and budget enforcement.
+
+Prompts are assembled from sections. Sections that may be shortened carry
+a list of variants, from the fullest to the most compact (e.g. detailed
+history, then a rolling summary of it). fit_to_budget() estimates the
+tokens of every section and steps compactable sections down, in priority
+order, until the prompt fits the role's budget.
+
+Token counts are estimated locally at ~4 characters per token (the same
+heuristic as the mock provider), so accounting costs no API calls and
+works without a tokenizer installed.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of a text (chars / 4, rounded up)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class PromptSection:
+    """
+    A prompt section with progressively more compact variants.
+
+    Attributes:
+        name: Section name used in reports.
+        variants: Texts from fullest (level 0) to most compact.
+        level: Index of the variant currently selected.
+    """
+    name: str
+    variants: List[str]
+    level: int = 0
+
+    @property
+    def text(self) -> str:
+        return self.variants[self.level]
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+    @property
+    def can_compact(self) -> bool:
+        return self.level < len(self.variants) - 1
+
+
+@dataclass
+class BudgetReport:
+    """
+    Token accounting for one prompt.
+
+    Attributes:
+        role: "captain" or "admiral".
+        budget: Token budget (None = unlimited).
+        tokens_before: Estimated prompt tokens with every section in full.
+        tokens_after: Estimated prompt tokens as sent.
+        section_tokens: Estimated tokens per section as sent.
+        compactions: Variant level chosen per compacted section.
+    """
+    role: str
+    budget: Optional[int]
+    tokens_before: int
+    tokens_after: int
+    section_tokens: Dict[str, int] = field(default_factory=dict)
+    compactions: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def over_budget(self) -> bool:
+        """True if the prompt still exceeds the budget at maximum compaction."""
+        return self.budget is not None and self.tokens_after > self.budget
+
+
+def fit_to_budget(
+    sections: List[PromptSection],
+    fixed_tokens: int,
+    budget: Optional[int],
+    role: str,
+) -> BudgetReport:
+    """
+    Compact sections until the prompt fits the budget.
+
+    Sections are compacted in list order: the first section is stepped
+    down to its most compact variant before the second is touched, so
+    callers list the least valuable context first.
+
+    Args:
+        sections: Compactable sections, in compaction order (modified in place).
+        fixed_tokens: Estimated tokens of the rest of the prompt.
+        budget: Maximum prompt tokens (None = no limit).
+        role: Role name for the report.
+
+    Returns:
+        BudgetReport describing the fitted prompt.
+    """
+    total = fixed_tokens + sum(section.tokens for section in sections)
+    tokens_before = total
+
+    if budget is not None:
+        for section in sections:
+            while total > budget and section.can_compact:
+                total -= section.tokens
+                section.level += 1
+                total += section.tokens
+            if total <= budget:
+                break
+
+    return BudgetReport(
+        role=role,
+        budget=budget,
+        tokens_before=tokens_before,
+        tokens_after=total,
+        section_tokens={section.name: section.tokens for section in sections},
+        compactions={section.name: section.level for section in sections if section.level},
+    )
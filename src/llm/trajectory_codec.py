@@ -0,0 +1,271 @@
+"""
+Keyframe plus ballistic-delta encoding of recorded trajectories.
+
+Between sim frames ships coast or burn steadily and slugs fly straight, so
+an entity's position and velocity are predictable from its previous
+states, and its other fields (armor, maneuver, source, target, ...) rarely
+change. Each entity (ship, projectile, torpedo) stores its full state only
+in keyframes: on first appearance and then every keyframe_interval of its
+frames. An entry between keyframes stores only
+
+- the fields that changed since the entity's previous frame (plus "id" for
+  projectiles and torpedoes), and
+- how far the true position and velocity deviate from the prediction,
+  quantized to the error bound, and nothing when the prediction is within
+  the bound:
+
+    velocity: v' = v1 + a * dt, a = (v1 - v0) / (t1 - t0)
+    position: p' = p1 + v * dt   (the simulation's semi-implicit Euler step)
+    stored:   "dv" = round((v - v') / (2 * velocity_error_mps))
+              "dp" = round((p - p') / (2 * position_error_m))
+
+Predictions are made from the decoded states (not the true ones), so
+errors never accumulate: every decoded coordinate is within the bound of
+the recorded one. The decoder only uses IEEE float addition,
+multiplication and division, so the visualizer's decoder
+(visualizer/src/TrajectoryCodec.js) reproduces it exactly.
+
+A keyframe entry is the recorded entry unchanged; an entry without "pos"
+is a delta entry. A recording with encoded trajectories has the codec
+settings in its "trajectory_codec" field (empty when not encoded).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+CODEC_VERSION = 1
+
+# Entity lists of a sim frame: (frame key, entities keyed by ID in a dict)
+_ENTITY_LISTS = (("ships", True), ("projectiles", False), ("torpedoes", False))
+_MOTION = ("pos", "vel")
+_DELTAS = ("dp", "dv")
+
+Vector = List[float]
+
+
+@dataclass(frozen=True)
+class TrajectoryCodec:
+    """
+    Error bounds of the trajectory encoding.
+
+    Attributes:
+        position_error_m: Largest position error per axis.
+        velocity_error_mps: Largest velocity error per axis.
+        keyframe_interval: Frames of an entity from one keyframe to the next.
+    """
+    position_error_m: float = 1.0
+    velocity_error_mps: float = 0.1
+    keyframe_interval: int = 60
+
+    def __post_init__(self):
+        if self.position_error_m <= 0 or self.velocity_error_mps <= 0:
+            raise ValueError("Trajectory error bounds must be positive")
+        if self.keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": CODEC_VERSION,
+            "position_error_m": self.position_error_m,
+            "velocity_error_mps": self.velocity_error_mps,
+            "keyframe_interval": self.keyframe_interval,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TrajectoryCodec':
+        if data.get("version", CODEC_VERSION) > CODEC_VERSION:
+            raise ValueError(f"Unsupported trajectory codec version: {data['version']}")
+        return cls(
+            position_error_m=data["position_error_m"],
+            velocity_error_mps=data["velocity_error_mps"],
+            keyframe_interval=data["keyframe_interval"],
+        )
+
+
+class _Track:
+    """Decoded state of one entity (the state predictions start from)."""
+
+    __slots__ = ("t", "pos", "vel", "prev_t", "prev_vel", "fields", "since_key")
+
+    def __init__(self, t: float, entity: Dict[str, Any]):
+        self.reset(t, entity)
+
+    def reset(self, t: float, entity: Dict[str, Any]) -> None:
+        """Start over from a keyframe entry."""
+        self.t, self.pos, self.vel = t, list(entity["pos"]), list(entity["vel"])
+        self.prev_t: Optional[float] = None
+        self.prev_vel: Optional[Vector] = None
+        self.fields = {key: value for key, value in entity.items() if key not in _MOTION}
+        self.since_key = 0
+
+    def advance(self, t: float, pos: Vector, vel: Vector) -> None:
+        self.prev_t, self.prev_vel = self.t, self.vel
+        self.t, self.pos, self.vel = t, pos, vel
+        self.since_key += 1
+
+    def predict_velocity(self, t: float) -> Vector:
+        if self.prev_vel is None or self.t == self.prev_t:
+            return list(self.vel)
+        dt = t - self.t
+        span = self.t - self.prev_t
+        return [v1 + (v1 - v0) / span * dt for v0, v1 in zip(self.prev_vel, self.vel)]
+
+    def predict_position(self, t: float, vel: Vector) -> Vector:
+        dt = t - self.t
+        return [p1 + v * dt for p1, v in zip(self.pos, vel)]
+
+
+def _quantize(actual: Vector, predicted: Vector, step: float) -> Tuple[List[int], Vector]:
+    """Quantized deviation and the decoded values it gives."""
+    steps = [round((a - p) / step) for a, p in zip(actual, predicted)]
+    return steps, _dequantize(predicted, steps, step)
+
+
+def _dequantize(predicted: Vector, steps: Optional[List[int]], step: float) -> Vector:
+    if not steps:
+        return predicted
+    return [p + s * step for p, s in zip(predicted, steps)]
+
+
+class _TrackCoder:
+    """Tracks of every entity seen so far (shared by encoder and decoder)."""
+
+    def __init__(self, codec: TrajectoryCodec):
+        self.codec = codec
+        self._pos_step = 2 * codec.position_error_m
+        self._vel_step = 2 * codec.velocity_error_mps
+        self._tracks: Dict[Tuple[str, str], _Track] = {}
+
+    def _code_frame(self, frame: Dict[str, Any], code_entity) -> Dict[str, Any]:
+        t = frame["t"]
+        coded = dict(frame)
+        for key, keyed in _ENTITY_LISTS:
+            entities = frame.get(key)
+            if entities is None:
+                continue
+            if keyed:
+                coded[key] = {
+                    entity_id: code_entity((key, entity_id), t, entity)
+                    for entity_id, entity in entities.items()
+                }
+            else:
+                coded[key] = [code_entity((key, entity["id"]), t, entity) for entity in entities]
+        return coded
+
+
+class TrajectoryEncoder(_TrackCoder):
+    """Encodes sim frames one at a time, in order."""
+
+    def encode_frame(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Encode one frame.
+
+        Args:
+            frame: Frame as built by BattleRecorder.record_sim_frame (not
+                modified)
+
+        Returns:
+            Encoded frame
+        """
+        return self._code_frame(frame, self._encode_entity)
+
+    def _encode_entity(self, track_key: Tuple[str, str], t: float, entity: Dict[str, Any]) -> Dict[str, Any]:
+        track = self._tracks.get(track_key)
+        if (
+            track is None
+            or track.since_key + 1 >= self.codec.keyframe_interval
+            or t <= track.t
+            or entity.keys() - _MOTION != track.fields.keys()
+        ):
+            if track is None:
+                self._tracks[track_key] = _Track(t, entity)
+            else:
+                track.reset(t, entity)
+            return entity
+
+        dv, vel = _quantize(entity["vel"], track.predict_velocity(t), self._vel_step)
+        dp, pos = _quantize(entity["pos"], track.predict_position(t, vel), self._pos_step)
+        track.advance(t, pos, vel)
+
+        entry = {}
+        if "id" in entity:
+            entry["id"] = entity["id"]
+        for key, value in entity.items():
+            if key not in _MOTION and track.fields[key] != value:
+                entry[key] = value
+                track.fields[key] = value
+        if any(dp):
+            entry["dp"] = dp
+        if any(dv):
+            entry["dv"] = dv
+        return entry
+
+
+class TrajectoryDecoder(_TrackCoder):
+    """Decodes frames encoded by TrajectoryEncoder, in order."""
+
+    def decode_frame(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decode one frame.
+
+        Args:
+            frame: Encoded frame (not modified)
+
+        Returns:
+            The frame as recorded, positions and velocities rounded to 0.1
+            like the recorder's
+        """
+        return self._code_frame(frame, self._decode_entity)
+
+    def _decode_entity(self, track_key: Tuple[str, str], t: float, entry: Dict[str, Any]) -> Dict[str, Any]:
+        if "pos" in entry:
+            track = self._tracks.get(track_key)
+            if track is None:
+                self._tracks[track_key] = _Track(t, entry)
+            else:
+                track.reset(t, entry)
+            return entry
+
+        track = self._tracks[track_key]
+        vel = _dequantize(track.predict_velocity(t), entry.get("dv"), self._vel_step)
+        pos = _dequantize(track.predict_position(t, vel), entry.get("dp"), self._pos_step)
+        track.advance(t, pos, vel)
+        for key, value in entry.items():
+            if key not in _DELTAS:
+                track.fields[key] = value
+
+        # Keyframe field order: "id" (if any), "pos", "vel", then the rest
+        entity = {"id": track.fields["id"]} if "id" in track.fields else {}
+        entity["pos"] = [round(x, 1) for x in pos]
+        entity["vel"] = [round(x, 1) for x in vel]
+        entity.update((key, value) for key, value in track.fields.items() if key != "id")
+        return entity
+
+
+def encode_trajectories(frames: List[Dict[str, Any]], codec: TrajectoryCodec) -> List[Dict[str, Any]]:
+    """Encode a whole sim trace."""
+    encoder = TrajectoryEncoder(codec)
+    return [encoder.encode_frame(frame) for frame in frames]
+
+
+def decode_trajectories(frames: List[Dict[str, Any]], codec: TrajectoryCodec) -> List[Dict[str, Any]]:
+    """Decode a whole sim trace."""
+    decoder = TrajectoryDecoder(codec)
+    return [decoder.decode_frame(frame) for frame in frames]
+
+
+def decode_recording_trajectories(recording: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode a recording's sim trace in place, if it is encoded.
+
+    Args:
+        recording: Recording dict (JSON shape)
+
+    Returns:
+        The recording, with a plain sim trace and an empty trajectory_codec
+    """
+    settings = recording.get("trajectory_codec")
+    if settings:
+        recording["sim_trace"] = decode_trajectories(recording["sim_trace"], TrajectoryCodec.from_dict(settings))
+        recording["trajectory_codec"] = {}
+    return recording
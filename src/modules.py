@@ -17,7 +17,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from .combat import HitLocation, HitResult
+import numpy as np
+
+from .combat import HitLocation, HitResult, Weapon, create_ship_armor_from_fleet_data
 
 
 class ModuleType(Enum):
@@ -1723,6 +1725,178 @@ def create_module_layout(ship_type: str, fleet_data_path: str | Path) -> ModuleL
     return ModuleLayout.from_ship_type(ship_type, fleet_data)
 
 
+# =============================================================================
+# SHOTS-TO-KILL TABLES
+# =============================================================================
+
+@dataclass(frozen=True)
+class ShotsToKill:
+    """
+    Hits needed to destroy a ship from full armor with one weapon at one location.
+
+    Attributes:
+        ship_type: Target ship type identifier.
+        weapon_type: Weapon type identifier.
+        location: Hit location value ('nose', 'lateral', 'tail').
+        shots_to_penetrate: Hits until the armor section is breached.
+        shots_to_kill: Hits until the ship is destroyed (max_shots if it survived).
+        kill_reason: Critical module destroyed, "hull", "no_armor" or "survived".
+    """
+    ship_type: str
+    weapon_type: str
+    location: str
+    shots_to_penetrate: int
+    shots_to_kill: int
+    kill_reason: str
+
+
+# Cache of shots-to-kill results shared across battles and balance studies
+_SHOTS_TO_KILL_CACHE: dict[tuple, ShotsToKill] = {}
+
+
+def calculate_shots_to_kill(
+    weapon: Weapon,
+    ship_type: str,
+    location: HitLocation,
+    fleet_data: dict,
+    max_shots: int = 500,
+    impact_area_m2: float = 0.01,
+) -> ShotsToKill:
+    """
+    Calculate hits needed to kill a ship from full armor, with caching.
+
+    Armor ablation for the whole shot sequence is resolved in one vectorized
+    pass (Armor.apply_energy_damage_batch); only hits after the breach are
+    propagated through the module layout. Results are cached by weapon
+    stats, ship definition and location.
+
+    Args:
+        weapon: The weapon firing every shot.
+        ship_type: Target ship type identifier.
+        location: Hit location for every shot.
+        fleet_data: The loaded fleet data dictionary.
+        max_shots: Give up after this many hits.
+        impact_area_m2: Impact area per hit in square meters.
+
+    Returns:
+        ShotsToKill for this combination.
+
+    Raises:
+        KeyError: If ship_type is not found in fleet_data.
+    """
+    ships = fleet_data.get("ships", {})
+    if ship_type not in ships:
+        raise KeyError(f"Ship type '{ship_type}' not found in fleet data")
+
+    key = (
+        weapon.weapon_type,
+        weapon.kinetic_energy_gj,
+        weapon.flat_chipping,
+        ship_type,
+        json.dumps(ships[ship_type], sort_keys=True),
+        location,
+        max_shots,
+        impact_area_m2,
+    )
+    cached = _SHOTS_TO_KILL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    armor = create_ship_armor_from_fleet_data(fleet_data, ship_type).get_section(location)
+    if armor is None:
+        result = ShotsToKill(
+            ship_type=ship_type,
+            weapon_type=weapon.weapon_type,
+            location=location.value,
+            shots_to_penetrate=1,
+            shots_to_kill=1,
+            kill_reason="no_armor",
+        )
+        _SHOTS_TO_KILL_CACHE[key] = result
+        return result
+
+    outcomes = armor.apply_energy_damage_batch(
+        np.full(max_shots, weapon.kinetic_energy_gj),
+        flat_chipping=weapon.flat_chipping,
+        impact_area_m2=impact_area_m2,
+    )
+    first_breach = outcomes.first_penetration_index
+
+    shots_to_penetrate = max_shots if first_breach is None else first_breach + 1
+    shots_to_kill = max_shots
+    kill_reason = "survived"
+
+    if first_breach is not None:
+        module_layout = ModuleLayout.from_ship_type(ship_type, fleet_data)
+        # Armor stays breached, so every later hit reaches the modules
+        hit_result = HitResult(
+            hit=True,
+            location=location,
+            penetrated=True,
+            remaining_damage_gj=weapon.kinetic_energy_gj * 0.9,
+        )
+        for shot in range(first_breach + 1, max_shots + 1):
+            module_layout.apply_penetrating_damage(hit_result, spread_angle_deg=15.0)
+            if module_layout.has_critical_damage:
+                destroyed = next(
+                    m for m in module_layout.get_critical_modules() if m.is_destroyed
+                )
+                shots_to_kill, kill_reason = shot, destroyed.module_type.value
+                break
+            if module_layout.ship_integrity_percent < 25.0:
+                shots_to_kill, kill_reason = shot, "hull"
+                break
+
+    result = ShotsToKill(
+        ship_type=ship_type,
+        weapon_type=weapon.weapon_type,
+        location=location.value,
+        shots_to_penetrate=shots_to_penetrate,
+        shots_to_kill=shots_to_kill,
+        kill_reason=kill_reason,
+    )
+    _SHOTS_TO_KILL_CACHE[key] = result
+    return result
+
+
+def build_shots_to_kill_table(
+    weapons: dict[str, Weapon],
+    ship_types: list[str],
+    fleet_data: dict,
+    locations: Optional[list[HitLocation]] = None,
+    max_shots: int = 500,
+) -> dict[tuple[str, str, str], ShotsToKill]:
+    """
+    Build a shots-to-kill table for every (weapon, ship class, location).
+
+    Args:
+        weapons: Mapping of table key to Weapon.
+        ship_types: Ship type identifiers to include.
+        fleet_data: The loaded fleet data dictionary.
+        locations: Hit locations to include (all if None).
+        max_shots: Give up after this many hits.
+
+    Returns:
+        Dictionary keyed by (weapon_key, ship_type, location value).
+    """
+    if locations is None:
+        locations = list(HitLocation)
+
+    table = {}
+    for weapon_key, weapon in weapons.items():
+        for ship_type in ship_types:
+            for location in locations:
+                table[(weapon_key, ship_type, location.value)] = calculate_shots_to_kill(
+                    weapon, ship_type, location, fleet_data, max_shots=max_shots
+                )
+    return table
+
+
+def clear_shots_to_kill_cache() -> None:
+    """Clear cached shots-to-kill results (e.g. after editing fleet data)."""
+    _SHOTS_TO_KILL_CACHE.clear()
+
+
 if __name__ == "__main__":
     # Example usage and validation
     import sys
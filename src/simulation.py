@@ -14,13 +14,18 @@ The simulation produces a comprehensive event log for analysis and replay.
 
 from __future__ import annotations
 
+import hashlib
 import math
+import pickle
 import random
 import uuid
+import zlib
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, Callable, Any, Dict
 
+import numpy as np
+
 # Import from existing modules using try/except for compatibility
 try:
     from .physics import Vector3D, ShipState as KinematicState, propagate_state, create_ship_state_from_specs
@@ -369,7 +374,8 @@ class WeaponState:
         target_position: Vector3D,
         target_velocity: Vector3D,
         shooter_position: Vector3D,
-        target_acceleration: Optional[Vector3D] = None
+        target_acceleration: Optional[Vector3D] = None,
+        lead_direction: Optional[Vector3D] = None
     ) -> Optional[Vector3D]:
         """
         Calculate the direction to fire this weapon.
@@ -381,6 +387,9 @@ class WeaponState:
             target_acceleration: Optional target acceleration in m/s^2.
                 If provided, uses quadratic prediction for better lead calculation
                 against maneuvering targets.
+            lead_direction: Optional precomputed intercept direction (from
+                solve_lead_directions). Skips the per-weapon lead solve when
+                several slots share the same target and muzzle velocity.
 
         Returns:
             Fire direction vector, or None if target not in arc.
@@ -396,21 +405,22 @@ class WeaponState:
         if not self.is_target_in_arc(ship_forward, target_dir):
             return None
 
-        if self.weapon.is_turreted:
-            # Turreted weapon: calculate intercept/lead direction
-            return self._calculate_lead_direction(
-                shooter_position, ship_velocity,
-                target_position, target_velocity,
-                target_acceleration
-            )
+        if lead_direction is not None:
+            lead_dir = lead_direction
+            self.current_aim_direction = lead_dir
         else:
-            # Fixed weapon (spinal): calculate lead, but limit to gimbal range
             lead_dir = self._calculate_lead_direction(
                 shooter_position, ship_velocity,
                 target_position, target_velocity,
                 target_acceleration
             )
 
+        if self.weapon.is_turreted:
+            # Turreted weapon: fire along intercept/lead direction
+            return lead_dir
+        else:
+            # Fixed weapon (spinal): use lead, but limit to gimbal range
+
             # Check if lead direction is within gimbal range of ship forward
             lead_angle_deg = math.degrees(ship_forward.angle_to(lead_dir))
 
@@ -568,6 +578,89 @@ class WeaponState:
         return aim_dir
 
 
+def solve_lead_directions(
+    rel_pos: np.ndarray,
+    rel_vel: np.ndarray,
+    target_accel: np.ndarray,
+    muzzle_mps: np.ndarray,
+) -> np.ndarray:
+    """
+    Solve intercept directions for many (target, muzzle velocity) pairs at once.
+
+    Vectorized form of WeaponState._calculate_lead_direction: rows with
+    negligible target acceleration use the closed-form quadratic, the rest
+    use the same damped fixed-point iteration on time-of-flight. Rows with
+    no valid intercept fall back to direct aim.
+
+    Args:
+        rel_pos: (N, 3) target position relative to shooter in meters.
+        rel_vel: (N, 3) target velocity relative to shooter in m/s.
+        target_accel: (N, 3) target acceleration in m/s^2.
+        muzzle_mps: (N,) projectile speed in m/s.
+
+    Returns:
+        (N, 3) unit aim directions.
+    """
+    rel_pos = np.asarray(rel_pos, dtype=float).reshape(-1, 3)
+    rel_vel = np.asarray(rel_vel, dtype=float).reshape(-1, 3)
+    target_accel = np.asarray(target_accel, dtype=float).reshape(-1, 3)
+    muzzle_mps = np.asarray(muzzle_mps, dtype=float).ravel()
+
+    distance = np.linalg.norm(rel_pos, axis=1)
+    valid = (muzzle_mps > 0) & (distance >= 1.0)
+    accelerating = valid & (np.linalg.norm(target_accel, axis=1) >= 0.01)
+    linear = valid & ~accelerating
+
+    # NaN time-of-flight means "aim directly at the target"
+    tof = np.full(distance.shape, np.nan)
+
+    # Constant velocity: (M² - V²) T² - 2 D·V T - D² = 0
+    a = muzzle_mps ** 2 - np.einsum("ij,ij->i", rel_vel, rel_vel)
+    b = -2.0 * np.einsum("ij,ij->i", rel_pos, rel_vel)
+    c = -distance ** 2
+    degenerate = linear & (np.abs(a) < 1e-10)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tof = np.where(degenerate & (np.abs(b) >= 1e-10), -c / b, tof)
+        quadratic = linear & ~degenerate
+        discriminant = b * b - 4.0 * a * c
+        sqrt_disc = np.sqrt(np.where(discriminant >= 0, discriminant, 0.0))
+        root_hi = (-b + sqrt_disc) / (2.0 * a)
+        root_lo = (-b - sqrt_disc) / (2.0 * a)
+    root = np.where(root_hi >= 0, root_hi, root_lo)
+    tof = np.where(quadratic & (discriminant >= 0) & (root >= 0), root, tof)
+
+    # Accelerating: iterate on time-of-flight with quadratic prediction
+    if accelerating.any():
+        iter_tof = np.where(accelerating, distance / np.where(valid, muzzle_mps, 1.0), 0.0)
+        active = accelerating.copy()
+        for _ in range(10):
+            with np.errstate(over="ignore", invalid="ignore"):
+                predicted = rel_pos + rel_vel * iter_tof[:, None] + target_accel * (0.5 * iter_tof ** 2)[:, None]
+                new_tof = np.linalg.norm(predicted, axis=1) / np.where(valid, muzzle_mps, 1.0)
+            converged = active & (np.abs(new_tof - iter_tof) < 0.0001)
+            stepping = active & ~converged
+            iter_tof = np.where(converged, new_tof, iter_tof)
+            iter_tof = np.where(stepping, 0.7 * new_tof + 0.3 * iter_tof, iter_tof)
+            active = stepping
+            if not active.any():
+                break
+        tof = np.where(accelerating, iter_tof, tof)
+
+    has_intercept = ~np.isnan(tof)
+    flight = np.where(has_intercept, tof, 0.0)[:, None]
+    with np.errstate(over="ignore", invalid="ignore"):
+        accel_term = np.where(accelerating[:, None], target_accel * (0.5 * flight ** 2), 0.0)
+    with np.errstate(over="ignore", invalid="ignore"):
+        aim = rel_pos + rel_vel * flight + accel_term
+    # Divergent iterations (target out-accelerating the projectile) aim direct
+    usable = has_intercept & np.isfinite(aim).all(axis=1)
+    aim = np.where(usable[:, None], aim, rel_pos)
+
+    norms = np.linalg.norm(aim, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(norms[:, None] > 0, aim / norms[:, None], 0.0)
+
+
 # =============================================================================
 # POINT DEFENSE STATE
 # =============================================================================
@@ -1122,6 +1215,9 @@ class CombatSimulation:
         # Event callbacks (for external recording/logging)
         self._event_callbacks: list[Callable[['SimulationEvent'], None]] = []
 
+        # Combat log lines held back instead of printed (forks only, see fork())
+        self._output: Optional[list[str]] = None
+
         # Simulation state
         self._running = False
         self._paused = False
@@ -1390,9 +1486,11 @@ class CombatSimulation:
 
         if not ship.weapons_orders:
             if debug:
-                print(f"  [{ship.ship_id}] No weapons orders")
+                self._print(f"  [{ship.ship_id}] No weapons orders")
             return
 
+        # Slots ready to fire this step, with their live targets
+        ready_slots = []
         for weapon_slot, order in ship.weapons_orders.items():
             if weapon_slot not in ship.weapons:
                 continue
@@ -1410,6 +1508,22 @@ class CombatSimulation:
             if not target or target.is_destroyed:
                 continue
 
+            ready_slots.append((weapon_slot, order, weapon_state, target))
+
+        if not ready_slots:
+            return
+
+        # One lead solve per (target, muzzle velocity), shared by all slots
+        lead_directions = self._solve_fire_control(
+            ship, [(target, ws.weapon.muzzle_velocity_kps) for _, _, ws, target in ready_slots]
+        )
+        solutions: dict[tuple[str, float], FiringSolution] = {}
+
+        for weapon_slot, order, weapon_state, target in ready_slots:
+            target_id = target.ship_id
+            muzzle_kps = weapon_state.weapon.muzzle_velocity_kps
+            lead_direction = lead_directions[(target_id, muzzle_kps)]
+
             # Check if target is in weapon arc
             to_target = (target.position - ship.position).normalized()
             if not weapon_state.is_target_in_arc(ship.forward, to_target):
@@ -1423,37 +1537,41 @@ class CombatSimulation:
                     ship_velocity=ship.velocity,
                     target_position=target.position,
                     target_velocity=target.velocity,
-                    shooter_position=ship.position
+                    shooter_position=ship.position,
+                    lead_direction=lead_direction,
                 )
                 if fire_direction is None:
                     # Lead direction is outside gimbal range - can't effectively fire
                     continue
 
-            # Calculate firing solution
-            is_evading = (target.current_maneuver is not None and
-                         hasattr(target.current_maneuver, 'maneuver_type') and
-                         target.current_maneuver.maneuver_type.name == 'EVADE')
-
-            # Use target geometry if available, otherwise create a simple one
-            target_geometry = target.geometry
-            if not target_geometry:
-                target_geometry = ShipGeometry(
-                    length_m=100.0,
-                    beam_m=20.0,
-                    nose_section_length=0.2,
-                    tail_section_length=0.2,
-                )
+            # Calculate firing solution (shared by slots with the same target and muzzle velocity)
+            solution = solutions.get((target_id, muzzle_kps))
+            if solution is None:
+                is_evading = (target.current_maneuver is not None and
+                             hasattr(target.current_maneuver, 'maneuver_type') and
+                             target.current_maneuver.maneuver_type.name == 'EVADE')
+
+                # Use target geometry if available, otherwise create a simple one
+                target_geometry = target.geometry
+                if not target_geometry:
+                    target_geometry = ShipGeometry(
+                        length_m=100.0,
+                        beam_m=20.0,
+                        nose_section_length=0.2,
+                        tail_section_length=0.2,
+                    )
 
-            solution = calculate_hit_probability(
-                shooter_position=ship.position,
-                shooter_velocity=ship.velocity,
-                target_position=target.position,
-                target_velocity=target.velocity,
-                target_geometry=target_geometry,
-                target_forward=target.forward,
-                muzzle_velocity_kps=weapon_state.weapon.muzzle_velocity_kps,
-                target_is_evading=is_evading,
-            )
+                solution = calculate_hit_probability(
+                    shooter_position=ship.position,
+                    shooter_velocity=ship.velocity,
+                    target_position=target.position,
+                    target_velocity=target.velocity,
+                    target_geometry=target_geometry,
+                    target_forward=target.forward,
+                    muzzle_velocity_kps=muzzle_kps,
+                    target_is_evading=is_evading,
+                )
+                solutions[(target_id, muzzle_kps)] = solution
 
             if not solution.can_fire:
                 continue
@@ -1495,11 +1613,58 @@ class CombatSimulation:
                         eta_s=time_to_target,
                         hit_probability=solution.hit_probability,
                         weapon_slot=weapon_slot,
+                        lead_direction=lead_direction,
                     )
 
-                    print(f"  [{ship.ship_id}] FIRED {weapon_name} at {target_id}")
-                    print(f"       Distance: {distance_km:.0f}km, ETA: {time_to_target:.1f}s, "
-                          f"v: {muzzle_v:.1f}km/s, P(hit): {solution.hit_probability:.1%}")
+                    self._print(f"  [{ship.ship_id}] FIRED {weapon_name} at {target_id}")
+                    self._print(f"       Distance: {distance_km:.0f}km, ETA: {time_to_target:.1f}s, "
+                                f"v: {muzzle_v:.1f}km/s, P(hit): {solution.hit_probability:.1%}")
+
+    def _solve_fire_control(
+        self,
+        ship: ShipCombatState,
+        engagements: list[tuple[ShipCombatState, float]],
+    ) -> dict[tuple[str, float], Vector3D]:
+        """
+        Compute acceleration-aware lead directions for a ship's fire control pass.
+
+        Every slot on a ship fires from the ship's position, so slots sharing a
+        target and muzzle velocity share an intercept solution. Target
+        acceleration is estimated once per target and all unique solutions are
+        solved together with solve_lead_directions().
+
+        Args:
+            ship: The firing ship.
+            engagements: (target, muzzle_velocity_kps) for each ready weapon slot.
+
+        Returns:
+            Lead direction keyed by (target_id, muzzle_velocity_kps).
+        """
+        targets = {target.ship_id: target for target, _ in engagements}
+        keys = list(dict.fromkeys(
+            (target.ship_id, muzzle_kps) for target, muzzle_kps in engagements
+        ))
+
+        accelerations = {
+            target_id: self._estimate_target_acceleration(target)
+            for target_id, target in targets.items()
+        }
+
+        shooter_pos = ship.position
+        shooter_vel = ship.velocity
+        rel_pos = np.array([
+            (targets[tid].position - shooter_pos).to_tuple() for tid, _ in keys
+        ])
+        rel_vel = np.array([
+            (targets[tid].velocity - shooter_vel).to_tuple() for tid, _ in keys
+        ])
+        accel = np.array([accelerations[tid].to_tuple() for tid, _ in keys])
+        muzzle_mps = np.array([muzzle_kps * 1000 for _, muzzle_kps in keys])
+
+        directions = solve_lead_directions(rel_pos, rel_vel, accel, muzzle_mps)
+        return {
+            key: Vector3D(*directions[i]) for i, key in enumerate(keys)
+        }
 
     # -------------------------------------------------------------------------
     # Projectile Launch
@@ -1586,6 +1751,7 @@ class CombatSimulation:
         eta_s: float = None,
         hit_probability: float = None,
         weapon_slot: int = None,
+        lead_direction: Optional[Vector3D] = None,
     ) -> bool:
         """Launch a kinetic projectile from shooter toward target.
 
@@ -1601,6 +1767,8 @@ class CombatSimulation:
             eta_s: Estimated time to target in seconds (for recording)
             hit_probability: Probability of hit (for recording)
             weapon_slot: Weapon slot index (for recording)
+            lead_direction: Precomputed intercept direction from the ship's
+                fire control pass (solved here if None)
 
         Returns:
             True if projectile was launched, False if target not in arc.
@@ -1608,7 +1776,9 @@ class CombatSimulation:
         weapon = weapon_state.weapon
 
         # Estimate target's current acceleration for better lead calculation
-        target_acceleration = self._estimate_target_acceleration(target)
+        target_acceleration = None
+        if lead_direction is None:
+            target_acceleration = self._estimate_target_acceleration(target)
 
         # Calculate fire direction based on weapon type
         fire_direction = weapon_state.calculate_fire_direction(
@@ -1617,7 +1787,8 @@ class CombatSimulation:
             target_position=target.position,
             target_velocity=target.velocity,
             shooter_position=shooter.position,
-            target_acceleration=target_acceleration
+            target_acceleration=target_acceleration,
+            lead_direction=lead_direction,
         )
 
         if fire_direction is None:
@@ -2220,7 +2391,7 @@ class CombatSimulation:
         # Add randomness (±15°) for unpredictability
         # Use ship-specific seed for this evasion cycle
         cycle_number = int(self.current_time / 8.0)  # New random every 8s
-        self.rng.seed(hash(ship.ship_id) + cycle_number + 999)
+        self.rng.seed(zlib.crc32(ship.ship_id.encode()) + cycle_number + 999)
 
         noise_angle = self.rng.gauss(0, math.radians(15))
         # Random left/right flip
@@ -2477,8 +2648,8 @@ class CombatSimulation:
                         'detection': 'coarse_tca',
                         'tca': tca
                     })
-                    print(f"  --- [{proj_flight.source_ship_id}] MISS {proj_flight.target_ship_id} "
-                          f"(closest: {closest_km:.2f}km, flight: {flight_time:.1f}s, tca: {tca:.1f}s)")
+                    self._print(f"  --- [{proj_flight.source_ship_id}] MISS {proj_flight.target_ship_id} "
+                                f"(closest: {closest_km:.2f}km, flight: {flight_time:.1f}s, tca: {tca:.1f}s)")
                     projectiles_to_remove.append(proj_flight)
                     continue
 
@@ -2567,8 +2738,8 @@ class CombatSimulation:
                             'detection': 'geometric',
                             'micro_steps': micro_steps
                         })
-                        print(f"  --- [{proj_flight.source_ship_id}] MISS {proj_flight.target_ship_id} "
-                              f"(closest: {closest_km:.2f}km, flight: {flight_time:.1f}s)")
+                        self._print(f"  --- [{proj_flight.source_ship_id}] MISS {proj_flight.target_ship_id} "
+                                    f"(closest: {closest_km:.2f}km, flight: {flight_time:.1f}s)")
                         projectiles_to_remove.append(proj_flight)
                         hit_detected = True  # Well, miss detected
                         break
@@ -3016,8 +3187,8 @@ class CombatSimulation:
 
         # Calculate flight time for display
         flight_time = self.current_time - proj_flight.launch_time
-        print(f"  >>> [{proj_flight.source_ship_id}] HIT {target.ship_id} "
-              f"({hit_location.value}): {effective_ke_gj:.1f} GJ, flight: {flight_time:.1f}s")
+        self._print(f"  >>> [{proj_flight.source_ship_id}] HIT {target.ship_id} "
+                    f"({hit_location.value}): {effective_ke_gj:.1f} GJ, flight: {flight_time:.1f}s")
 
         # Apply armor damage using Terra Invicta physics-based ablation
         penetrated = False
@@ -3149,7 +3320,7 @@ class CombatSimulation:
                         self._log_event(SimulationEventType.MODULE_DESTROYED, target.ship_id, data={
                             'module_name': module.name
                         })
-                        print(f"  !!! [{target.ship_id}] MODULE DESTROYED: {module.name}")
+                        self._print(f"  !!! [{target.ship_id}] MODULE DESTROYED: {module.name}")
                         # Disable corresponding weapon if weapon module destroyed
                         self._disable_weapon_for_module(target, module.name)
 
@@ -3311,7 +3482,7 @@ class CombatSimulation:
                 hit_probability = max(0.05, min(0.98, hit_probability))
 
                 # Roll for hit
-                roll = random.random()
+                roll = self.rng.random()
                 hit = roll < hit_probability
 
                 if hit:
@@ -3509,7 +3680,7 @@ class CombatSimulation:
                     self._log_event(SimulationEventType.MODULE_DESTROYED, target.ship_id, data={
                         'module_name': module.name
                     })
-                    print(f"  !!! [{target.ship_id}] MODULE DESTROYED: {module.name}")
+                    self._print(f"  !!! [{target.ship_id}] MODULE DESTROYED: {module.name}")
                     # Disable corresponding weapon if weapon module destroyed
                     self._disable_weapon_for_module(target, module.name)
 
@@ -4073,7 +4244,7 @@ class CombatSimulation:
                 self._log_event(SimulationEventType.MODULE_DESTROYED, ship.ship_id, data={
                     'module_name': result.module_name
                 })
-                print(f"  !!! [{ship.ship_id}] MODULE DESTROYED: {result.module_name}")
+                self._print(f"  !!! [{ship.ship_id}] MODULE DESTROYED: {result.module_name}")
                 self._disable_weapon_for_module(ship, result.module_name)
 
     def _disable_weapon_for_module(self, ship: ShipCombatState, module_name: str) -> None:
@@ -4093,7 +4264,7 @@ class CombatSimulation:
         weapon_slot = module_to_weapon.get(module_name)
         if weapon_slot and weapon_slot in ship.weapons:
             ship.weapons[weapon_slot].is_operational = False
-            print(f"  !!! [{ship.ship_id}] {module_name} DESTROYED - {weapon_slot} disabled")
+            self._print(f"  !!! [{ship.ship_id}] {module_name} DESTROYED - {weapon_slot} disabled")
 
         # Also check PD lasers
         if weapon_slot and hasattr(ship, 'pd_lasers') and ship.pd_lasers:
@@ -4215,6 +4386,94 @@ class CombatSimulation:
 
         return event
 
+    # -------------------------------------------------------------------------
+    # State Forking
+    # -------------------------------------------------------------------------
+
+    # Attributes that describe observers rather than simulation state
+    _OBSERVER_ATTRS = ('events', '_event_callbacks', '_decision_callback', '_output')
+
+    def _print(self, message: str) -> None:
+        """Print a combat log line (buffered while this is a fork)."""
+        if self._output is not None:
+            self._output.append(message)
+        else:
+            print(message)
+
+    def _state_bytes(self) -> bytes:
+        """Pickle everything that determines how the simulation evolves."""
+        state = {
+            name: value for name, value in self.__dict__.items()
+            if name not in self._OBSERVER_ATTRS
+        }
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def state_digest(self) -> str:
+        """
+        Digest of the simulation's evolving state.
+
+        Ships, projectiles, torpedoes, metrics, RNG state and clock are
+        covered; the event log and callbacks are not. Two digests of the
+        same simulation are equal only if nothing that affects future steps
+        changed in between (commands that rebuild equal-valued objects may
+        still change the digest, which errs on the side of "changed").
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        return hashlib.sha256(self._state_bytes()).hexdigest()
+
+    def fork(self) -> tuple['CombatSimulation', str]:
+        """
+        Create an independent copy of the simulation.
+
+        The fork shares no objects with the original, starts with an empty
+        event log and has no callbacks, and buffers its combat log instead
+        of printing it, so it can be stepped on another thread without side
+        effects.
+
+        Returns:
+            Tuple of (forked simulation, state digest of this simulation
+            at the time of the fork).
+        """
+        data = self._state_bytes()
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(pickle.loads(data))
+        clone.events = []
+        clone._event_callbacks = []
+        clone._decision_callback = None
+        clone._output = []
+        return clone, hashlib.sha256(data).hexdigest()
+
+    def adopt_observers(self, original: 'CombatSimulation') -> list[SimulationEvent]:
+        """
+        Take over the event log and callbacks of the simulation this was forked from.
+
+        Events logged by the fork are appended to the original's log and
+        delivered to its callbacks in order, and its buffered combat log is
+        printed, as if they had happened on the original.
+
+        Args:
+            original: Simulation this one was forked from.
+
+        Returns:
+            The fork's own events, in order.
+        """
+        own_events = self.events
+        self.events = original.events + own_events
+        self._event_callbacks = list(original._event_callbacks)
+        self._decision_callback = original._decision_callback
+        output, self._output = self._output, original._output
+        for line in output or ():
+            self._print(line)
+        for event in own_events:
+            for callback in self._event_callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"[SIM] Event callback error: {e}")
+        return own_events
+
     # -------------------------------------------------------------------------
     # State Snapshot
     # -------------------------------------------------------------------------
@@ -15,8 +15,11 @@ from __future__ import annotations
 
 import math
 import random
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from physics import Vector3D, ShipState
 from combat import Weapon
@@ -1316,6 +1319,232 @@ class TargetingSystem:
         return spinal_constraint.can_engage(ship_forward, target_direction)
 
 
+# =============================================================================
+# FLEET TARGETING ENGINE
+# =============================================================================
+
+# splitmix64 constants for the counter-based RNG
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_MUL1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_MUL2 = np.uint64(0x94D049BB133111EB)
+_TICK_MUL = np.uint64(0xD6E8FEB86659FD93)
+
+
+def _track_key(ship_id: str, target_id: str) -> int:
+    """Stable 64-bit identifier for a (ship, target) track."""
+    data = f"{ship_id}\x00{target_id}".encode()
+    return (zlib.crc32(data) << 32) | zlib.adler32(data)
+
+
+def counter_uniforms(seed: int, tick: int, keys: np.ndarray) -> np.ndarray:
+    """
+    Counter-based uniform draws in [0, 1) for a batch of tracks.
+
+    Each draw is a pure function of (seed, tick, track key), so results do
+    not depend on how many other tracks exist or the order they are
+    evaluated in.
+
+    Args:
+        seed: Engine seed.
+        tick: Tick counter.
+        keys: uint64 track keys.
+
+    Returns:
+        Array of uniforms, one per key.
+    """
+    # Mix seed and tick with Python ints (numpy scalars warn on wraparound)
+    salt = ((seed * int(_SPLITMIX_GAMMA)) ^ (tick * int(_TICK_MUL))) & 0xFFFFFFFFFFFFFFFF
+    x = np.asarray(keys, dtype=np.uint64) ^ np.uint64(salt)
+    x += _SPLITMIX_GAMMA
+    x = (x ^ (x >> np.uint64(30))) * _SPLITMIX_MUL1
+    x = (x ^ (x >> np.uint64(27))) * _SPLITMIX_MUL2
+    x ^= x >> np.uint64(31)
+    return (x >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+@dataclass
+class FleetTargetingEngine:
+    """
+    Batched targeting update for every track of every ship in a battle.
+
+    Evaluates range gates, effective ECM, lock breaks and lock progress for
+    all firing solutions in one set of array operations per tick, instead of
+    calling attempt_lock()/check_ecm_break() per solution. ECM break rolls
+    come from a counter-based RNG keyed by (seed, tick, ship, target), so a
+    battle replays identically regardless of track order.
+
+    Lock state is written back to each ship's FiringSolution objects, so
+    TargetingSystem.get_lock_status_summary() keeps working unchanged.
+
+    Attributes:
+        systems: Targeting systems keyed by ship ID.
+        seed: Seed for the counter-based RNG.
+        tick: Number of updates performed.
+        default_reacquisition_s: Cooldown after an ECM break when the target
+                                 has no ECMSystem.
+    """
+    systems: Dict[str, TargetingSystem] = field(default_factory=dict)
+    seed: int = 0
+    tick: int = 0
+    default_reacquisition_s: float = 5.0
+
+    def add_ship(self, ship_id: str, system: TargetingSystem) -> None:
+        """
+        Register a ship's targeting system.
+
+        Args:
+            ship_id: Unique identifier of the ship.
+            system: The ship's targeting system.
+        """
+        self.systems[ship_id] = system
+
+    def remove_ship(self, ship_id: str) -> bool:
+        """
+        Unregister a ship's targeting system.
+
+        Args:
+            ship_id: Unique identifier of the ship.
+
+        Returns:
+            True if the ship was registered.
+        """
+        return self.systems.pop(ship_id, None) is not None
+
+    def update(
+        self,
+        dt_seconds: float,
+        targets_ecm_systems: Dict[str, ECMSystem],
+        distances_km: Optional[Dict[Tuple[str, str], float]] = None,
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Update all tracks of all ships for one tick.
+
+        Per track this applies the same rules as
+        TargetingSystem.update_with_ecm_systems(), plus a range gate: tracks
+        outside TargetingComputer.sensor_range_km lose lock and progress.
+
+        Args:
+            dt_seconds: Time step in seconds.
+            targets_ecm_systems: ECMSystem keyed by target ID.
+            distances_km: Optional distance per (ship_id, target_id). Tracks
+                          without an entry are treated as in range.
+
+        Returns:
+            Dictionary mapping ship IDs to {target_id: True} for every lock
+            broken this tick (by ECM or range). Ships with no broken locks
+            are omitted.
+        """
+        self.tick += 1
+
+        ship_ids: list[str] = []
+        target_ids: list[str] = []
+        solutions: list[FiringSolution] = []
+        check_flags: list[bool] = []
+        bonuses: list[float] = []
+        lock_times: list[float] = []
+        sensor_ranges: list[float] = []
+
+        for ship_id in sorted(self.systems):
+            system = self.systems[ship_id]
+            system.time_since_ecm_check += dt_seconds
+            should_check_ecm = system.time_since_ecm_check >= system.ecm_check_interval_s
+            if should_check_ecm:
+                system.time_since_ecm_check = 0.0
+
+            for target_id, solution in system.solutions.items():
+                ship_ids.append(ship_id)
+                target_ids.append(target_id)
+                solutions.append(solution)
+                check_flags.append(should_check_ecm)
+                bonuses.append(system.computer.tracking_bonus)
+                lock_times.append(system.computer.lock_time_s)
+                sensor_ranges.append(system.computer.sensor_range_km)
+
+        if not solutions:
+            return {}
+
+        n = len(solutions)
+        locked = np.array([s.locked for s in solutions], dtype=bool)
+        progress = np.array([s.lock_progress for s in solutions], dtype=float)
+        time_to_lock = np.array([s.time_to_lock for s in solutions], dtype=float)
+        cooldown = np.array([s.cooldown_remaining for s in solutions], dtype=float)
+        check_ecm = np.array(check_flags, dtype=bool)
+        tracking_bonus = np.array(bonuses, dtype=float)
+        lock_time = np.array(lock_times, dtype=float)
+
+        ecm_strength = np.zeros(n)
+        reacquisition = np.full(n, self.default_reacquisition_s)
+        for i, target_id in enumerate(target_ids):
+            ecm_system = targets_ecm_systems.get(target_id)
+            if ecm_system is not None:
+                ecm_strength[i] = ecm_system.get_effective_strength()
+                reacquisition[i] = ecm_system.reacquisition_time_s
+
+        # Range gate (TargetingComputer.is_in_sensor_range)
+        if distances_km:
+            distance = np.array([
+                distances_km.get((ship_id, target_id), 0.0)
+                for ship_id, target_id in zip(ship_ids, target_ids)
+            ])
+            in_range = distance <= np.array(sensor_ranges)
+        else:
+            in_range = np.ones(n, dtype=bool)
+
+        effective_ecm = np.maximum(0.0, ecm_strength - tracking_bonus)
+
+        # ECM break rolls on locked, in-range tracks due for a check
+        keys = np.array(
+            [_track_key(a, b) for a, b in zip(ship_ids, target_ids)], dtype=np.uint64
+        )
+        rolls = counter_uniforms(self.seed, self.tick, keys)
+        ecm_broken = check_ecm & locked & in_range & (rolls < effective_ecm)
+        range_broken = locked & ~in_range
+
+        locked = locked & ~ecm_broken & ~range_broken
+        progress = np.where(ecm_broken | ~in_range, 0.0, progress)
+        cooldown = np.where(ecm_broken, reacquisition, cooldown)
+
+        # Lock progress (FiringSolution.attempt_lock)
+        cooling = cooldown > 0
+        cooldown = np.where(cooling, np.maximum(0.0, cooldown - dt_seconds), cooldown)
+
+        acquiring = ~cooling & ~locked & in_range
+        speed = 1.0 - effective_ecm * 0.5
+        progress = np.where(acquiring, progress + dt_seconds / lock_time * speed, progress)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            estimate = np.where(speed > 0, (1.0 - progress) * lock_time / speed, np.inf)
+        time_to_lock = np.where(acquiring, estimate, time_to_lock)
+
+        acquired = acquiring & (progress >= 1.0)
+        progress = np.where(acquired, 1.0, progress)
+        locked = locked | acquired
+        time_to_lock = np.where(acquired, 0.0, time_to_lock)
+
+        broken: Dict[str, Dict[str, bool]] = {}
+        for i, solution in enumerate(solutions):
+            solution.locked = bool(locked[i])
+            solution.lock_progress = float(progress[i])
+            solution.time_to_lock = float(time_to_lock[i])
+            solution.cooldown_remaining = float(cooldown[i])
+            if ecm_broken[i] or range_broken[i]:
+                broken.setdefault(ship_ids[i], {})[target_ids[i]] = True
+
+        return broken
+
+    def get_lock_status_summary(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Get lock status for every ship.
+
+        Returns:
+            Dictionary mapping ship IDs to the output of that ship's
+            TargetingSystem.get_lock_status_summary().
+        """
+        return {
+            ship_id: system.get_lock_status_summary()
+            for ship_id, system in self.systems.items()
+        }
+
+
 # =============================================================================
 # FACTORY FUNCTIONS
 # =============================================================================
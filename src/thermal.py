@@ -451,6 +451,84 @@ class HeatSink:
 
         return actual_dump
 
+    def integrate(
+        self,
+        heat_rate_gj_per_s: float,
+        dissipation_gj_per_s: float,
+        dt_seconds: float,
+    ) -> tuple[float, float, float]:
+        """
+        Integrate heat exactly over an interval with constant rates.
+
+        Heat level moves linearly at (generation - dissipation) until it
+        saturates at capacity or drains to zero, then holds there. Unlike
+        absorb() followed by dump_to_radiators(), the result does not
+        depend on how the interval is subdivided.
+
+        Args:
+            heat_rate_gj_per_s: Constant heat generation in GJ/s.
+            dissipation_gj_per_s: Constant radiator dissipation in GJ/s.
+            dt_seconds: Interval length in seconds.
+
+        Returns:
+            Tuple of (absorbed_gj, dumped_gj, overflow_gj) where overflow
+            is generated heat that could not be stored.
+        """
+        if dt_seconds <= 0:
+            return (0.0, 0.0, 0.0)
+
+        gen = max(0.0, heat_rate_gj_per_s)
+        diss = max(0.0, dissipation_gj_per_s)
+
+        if self.capacity_gj <= 0:
+            return (0.0, 0.0, gen * dt_seconds)
+
+        net_rate = gen - diss
+        boundary_time = self.time_to_reach(
+            self.capacity_gj if net_rate > 0 else 0.0, net_rate
+        )
+        linear_time = dt_seconds if boundary_time is None else min(dt_seconds, boundary_time)
+        held_time = dt_seconds - linear_time
+
+        absorbed = gen * linear_time
+        dumped = diss * linear_time
+        overflow = 0.0
+
+        if held_time > 0:
+            if net_rate > 0:
+                # Saturated: radiators remove diss, sink refills by the same amount
+                absorbed += diss * held_time
+                dumped += diss * held_time
+                overflow = net_rate * held_time
+            else:
+                # Drained: radiators only remove what is generated
+                absorbed += gen * held_time
+                dumped += gen * held_time
+
+        new_heat = self.current_heat_gj + net_rate * linear_time
+        self.current_heat_gj = min(self.capacity_gj, max(0.0, new_heat))
+
+        return (absorbed, dumped, overflow)
+
+    def time_to_reach(self, heat_gj: float, net_rate_gj_per_s: float) -> Optional[float]:
+        """
+        Get time until the stored heat reaches a level at a constant net rate.
+
+        Args:
+            heat_gj: Target heat level in gigajoules.
+            net_rate_gj_per_s: Net heating rate (negative = cooling).
+
+        Returns:
+            Seconds until the level is reached (0.0 if already there), or
+            None if the level is never reached at this rate.
+        """
+        delta = heat_gj - self.current_heat_gj
+        if delta == 0:
+            return 0.0
+        if net_rate_gj_per_s == 0 or (delta > 0) != (net_rate_gj_per_s > 0):
+            return None
+        return delta / net_rate_gj_per_s
+
 
 @dataclass
 class HeatSource:
@@ -467,6 +545,23 @@ class HeatSource:
     active: bool = False
 
 
+@dataclass
+class ThermalCrossing:
+    """
+    A thermal warning threshold crossed during an integrated interval.
+
+    Attributes:
+        threshold: Which threshold was crossed ("overheating" or "critical").
+        time_s: Offset from the start of the interval in seconds.
+        rising: True if heat rose through the threshold, False if it fell.
+        heat_percent: Threshold level as percentage of capacity.
+    """
+    threshold: str
+    time_s: float
+    rising: bool
+    heat_percent: float
+
+
 # Standard heat generation rates (kW)
 # Note: A destroyer with 58.56 MN thrust at full burn generates ~59 MW of engine heat.
 # With 4 radiators extended (260 MW total dissipation), ships can cool while burning.
@@ -687,6 +782,118 @@ class ThermalSystem:
             "is_critical": self.is_critical,
         }
 
+    def integrate(self, dt_seconds: float) -> dict:
+        """
+        Advance the thermal system exactly over an interval.
+
+        Assumes active heat sources and radiator configuration stay constant
+        for the whole interval, so the heat level is piecewise linear and the
+        moments at which warning thresholds are crossed can be solved in
+        closed form. This lets callers take large steps during quiet periods
+        without missing thermal warnings.
+
+        Args:
+            dt_seconds: Interval length in seconds.
+
+        Returns:
+            Dictionary with the same keys as update(), plus:
+            - heat_overflow_gj: Generated heat the saturated sink could not store
+            - crossings: List of ThermalCrossing, ordered by time
+        """
+        heat_gen_gj_per_s = self.get_total_heat_generation_kw() / 1_000_000.0
+        dissipation_gj_per_s = self.radiators.total_dissipation_kw / 1_000_000.0
+
+        crossings = self._find_crossings(
+            heat_gen_gj_per_s - dissipation_gj_per_s, dt_seconds
+        )
+
+        absorbed, dumped, overflow = self.heatsink.integrate(
+            heat_gen_gj_per_s, dissipation_gj_per_s, dt_seconds
+        )
+        heat_gen_gj = absorbed + overflow
+
+        return {
+            "heat_generated_gj": heat_gen_gj,
+            "heat_dissipated_gj": dumped,
+            "net_heat_gj": heat_gen_gj - dumped,
+            "heat_overflow_gj": overflow,
+            "heat_percent": self.heat_percent,
+            "is_overheating": self.is_overheating,
+            "is_critical": self.is_critical,
+            "crossings": crossings,
+        }
+
+    def time_to_threshold(self, threshold_percent: float) -> Optional[float]:
+        """
+        Get time until heat reaches a percentage of capacity.
+
+        Uses the current heat sources and radiator configuration. The
+        result accounts for the sink saturating at capacity and draining
+        to zero.
+
+        Args:
+            threshold_percent: Heat level as percentage of capacity.
+
+        Returns:
+            Seconds until the threshold is reached, 0.0 if heat is already
+            there, or None if it is never reached under current conditions.
+        """
+        if self.heatsink.capacity_gj <= 0:
+            return None
+        if not 0.0 <= threshold_percent <= 100.0:
+            return None
+        net_rate = (
+            self.get_total_heat_generation_kw()
+            - self.radiators.total_dissipation_kw
+        ) / 1_000_000.0
+        level_gj = self.heatsink.capacity_gj * threshold_percent / 100.0
+        return self.heatsink.time_to_reach(level_gj, net_rate)
+
+    def _find_crossings(
+        self, net_rate_gj_per_s: float, dt_seconds: float
+    ) -> List[ThermalCrossing]:
+        """
+        Solve for warning threshold crossings within an interval.
+
+        Args:
+            net_rate_gj_per_s: Constant net heating rate (negative = cooling).
+            dt_seconds: Interval length in seconds.
+
+        Returns:
+            Crossings ordered by time from the start of the interval.
+        """
+        capacity = self.heatsink.capacity_gj
+        if capacity <= 0 or net_rate_gj_per_s == 0 or dt_seconds <= 0:
+            return []
+
+        start = self.heatsink.current_heat_gj
+        end = min(capacity, max(0.0, start + net_rate_gj_per_s * dt_seconds))
+        rising = net_rate_gj_per_s > 0
+
+        crossings = []
+        for name, percent in (
+            ("overheating", self.OVERHEAT_THRESHOLD),
+            ("critical", self.CRITICAL_THRESHOLD),
+        ):
+            level = capacity * percent / 100.0
+            # Thresholds use >=, so reaching the level exactly counts as rising
+            if rising and start < level <= end:
+                crossed = True
+            elif not rising and end < level <= start:
+                crossed = True
+            else:
+                crossed = False
+            if crossed:
+                crossings.append(ThermalCrossing(
+                    threshold=name,
+                    time_s=(level - start) / net_rate_gj_per_s,
+                    rising=rising,
+                    heat_percent=percent,
+                ))
+
+        crossings.sort(key=lambda c: c.time_s)
+        return crossings
+
     def get_status(self) -> dict:
         """
         Get comprehensive thermal system status.
@@ -0,0 +1,81 @@
+"""
+Shared test fixtures.
+"""
+
+import contextlib
+import io
+
+import pytest
+
+from src.llm.battle_runner import BattleConfig, LLMBattleRunner, load_fleet_data
+from src.llm.client import CaptainClient
+from src.llm.fleet_config import BattleFleetConfig
+from src.llm.mcp_state import MCPSharedState
+
+
+@pytest.fixture
+def fresh_mcp_state():
+    """Reset the MCP shared state singleton before and after the test."""
+    MCPSharedState.reset()
+    yield
+    MCPSharedState.reset()
+
+
+@pytest.fixture
+def make_fleet_runner():
+    """
+    Factory of fleet battle runners with destroyer-only fleets.
+
+    Args (of the returned function):
+        alpha_ships: Alpha fleet size
+        beta_ships: Beta fleet size (default: same as alpha)
+        model: Captain model of every ship
+        admiral: Admiral model of both fleets (None: no Admirals)
+        mcp: Both fleets are MCP-controlled
+        distance_km: Initial distance
+        client: LLM client (default: one that is never called)
+        setup: Run setup_fleet_battle() (quietly) before returning
+        **config: BattleConfig fields; quiet, unrecorded and without
+            personality selection unless given
+    """
+    def make(
+        alpha_ships=1,
+        beta_ships=None,
+        *,
+        model=None,
+        admiral=None,
+        mcp=False,
+        distance_km=500,
+        client=None,
+        setup=False,
+        **config,
+    ) -> LLMBattleRunner:
+        def fleet(count):
+            ship = {"ship_type": "destroyer", **({"model": model} if model else {})}
+            data = {"ships": [dict(ship) for _ in range(count)]}
+            if admiral:
+                data["admiral"] = admiral
+            if mcp:
+                data["mcp"] = {"enabled": True}
+            return data
+
+        fleet_config = BattleFleetConfig.from_dict({
+            "battle_name": "Test Battle",
+            "initial_distance_km": distance_km,
+            "alpha_fleet": fleet(alpha_ships),
+            "beta_fleet": fleet(alpha_ships if beta_ships is None else beta_ships),
+        })
+        config = {"verbose": False, "personality_selection": False, "record_battle": False, **config}
+        runner = LLMBattleRunner(
+            config=BattleConfig(**config),
+            alpha_config=None,
+            beta_config=None,
+            client=client or CaptainClient(api_key="unused"),
+            fleet_config=fleet_config,
+        )
+        if setup:
+            with contextlib.redirect_stdout(io.StringIO()):
+                runner.setup_fleet_battle(load_fleet_data())
+        return runner
+
+    return make
@@ -0,0 +1,12 @@
+"""
+Shared test helpers (fixtures are in conftest.py).
+"""
+
+import socket
+
+
+def free_port() -> int:
+    """A free localhost TCP port for a test server."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -9,10 +9,12 @@ import random
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from src.combat import (
     Armor,
+    BatchHitResult,
     CombatResolver,
     HitLocation,
     HitResult,
@@ -24,6 +26,11 @@ from src.combat import (
     load_fleet_data,
     simulate_combat_exchange,
 )
+from src.modules import (
+    build_shots_to_kill_table,
+    calculate_shots_to_kill,
+    clear_shots_to_kill_cache,
+)
 
 
 # Fixtures
@@ -635,3 +642,152 @@ class TestRealFleetData:
 
         # Should have some hits and potentially some penetrations
         assert hits > 0
+
+
+class TestBatchResolution:
+    """Tests for vectorized batch hit resolution."""
+
+    @pytest.fixture
+    def real_fleet_data(self):
+        data_path = Path(__file__).parent.parent / "data" / "fleet_ships.json"
+        return load_fleet_data(data_path)
+
+    def _titanium(self, thickness_cm: float = 30.0) -> Armor:
+        return Armor(
+            armor_type="Titanium",
+            thickness_cm=thickness_cm,
+            baryonic_half_cm=10.5,
+            chip_resist=0.2,
+            kinetics_resist=0.5,
+        )
+
+    def test_batch_matches_sequential_energy_damage(self):
+        """Batch ablation reproduces apply_energy_damage called in order."""
+        sequential = self._titanium()
+        batched = self._titanium()
+        rng = random.Random(7)
+        energies = [rng.uniform(0.5, 5.0) for _ in range(200)]
+
+        expected = [
+            sequential.apply_energy_damage(e, flat_chipping=0.35, impact_area_m2=0.1)
+            for e in energies
+        ]
+        result = batched.apply_energy_damage_batch(
+            energies, flat_chipping=0.35, impact_area_m2=0.1
+        )
+
+        assert isinstance(result, BatchHitResult)
+        assert len(result) == 200
+        for i, (ablation, to_hull, chip) in enumerate(expected):
+            assert result.ablation_cm[i] == pytest.approx(ablation, abs=1e-9)
+            assert result.energy_to_hull_gj[i] == pytest.approx(to_hull, abs=1e-9)
+            assert result.chipping_added[i] == pytest.approx(chip, abs=1e-9)
+        assert batched.thickness_cm == pytest.approx(sequential.thickness_cm, abs=1e-9)
+        assert batched.chipping_fraction == pytest.approx(sequential.chipping_fraction)
+
+    def test_batch_penetration_is_sticky(self):
+        armor = self._titanium(thickness_cm=5.0)
+        result = armor.apply_energy_damage_batch([50.0] * 10, flat_chipping=0.35)
+
+        first = result.first_penetration_index
+        assert first is not None
+        assert result.penetrated[first:].all()
+        assert not result.penetrated[:first].any()
+        assert armor.is_penetrated()
+
+    def test_crit_rolls_use_chipping_before_hit(self):
+        armor = self._titanium()
+        armor.chipping_fraction = 0.3
+        result = armor.apply_energy_damage_batch(
+            [0.1, 0.1], crit_rolls=np.array([0.29, 0.99])
+        )
+        assert result.critical_through_chip.tolist() == [True, False]
+        assert result.penetrated[0]
+
+    def test_resolver_batch_reproducible(self, real_fleet_data):
+        weapon = create_weapon_from_fleet_data(real_fleet_data, "coilgun_mk3")
+        outcomes = []
+        for _ in range(2):
+            armor = create_ship_armor_from_fleet_data(real_fleet_data, "destroyer")
+            resolver = CombatResolver(rng=random.Random(42))
+            outcomes.append(resolver.resolve_hits_batch(
+                weapon, armor, impact_angles_deg=np.linspace(0, 60, 50)
+            ))
+        assert outcomes[0].locations == outcomes[1].locations
+        assert np.array_equal(outcomes[0].ablation_cm, outcomes[1].ablation_cm)
+        assert np.array_equal(outcomes[0].critical_hit, outcomes[1].critical_hit)
+
+    def test_resolver_batch_groups_by_location(self, real_fleet_data):
+        weapon = create_weapon_from_fleet_data(real_fleet_data, "coilgun_mk3")
+        armor = create_ship_armor_from_fleet_data(real_fleet_data, "destroyer")
+        reference = create_ship_armor_from_fleet_data(real_fleet_data, "destroyer")
+        locations = [HitLocation.NOSE, HitLocation.LATERAL] * 5
+
+        resolver = CombatResolver(rng=random.Random(1))
+        result = resolver.resolve_hits_batch(weapon, armor, locations=locations)
+
+        for location in (HitLocation.NOSE, HitLocation.LATERAL):
+            section = reference.get_section(location)
+            for _ in range(5):
+                section.apply_energy_damage(
+                    weapon.kinetic_energy_gj, flat_chipping=weapon.flat_chipping
+                )
+            assert armor.get_section(location).thickness_cm == pytest.approx(
+                section.thickness_cm
+            )
+        assert armor.get_section(HitLocation.TAIL).thickness_cm == pytest.approx(
+            reference.get_section(HitLocation.TAIL).thickness_cm
+        )
+        assert len(result.to_hit_results()) == 10
+
+    def test_oblique_hits_ablate_less(self, real_fleet_data):
+        weapon = create_weapon_from_fleet_data(real_fleet_data, "coilgun_mk3")
+        resolver = CombatResolver(rng=random.Random(3))
+        straight = resolver.resolve_hits_batch(
+            weapon,
+            create_ship_armor_from_fleet_data(real_fleet_data, "destroyer"),
+            impact_angles_deg=[0.0],
+            locations=[HitLocation.LATERAL],
+        )
+        oblique = resolver.resolve_hits_batch(
+            weapon,
+            create_ship_armor_from_fleet_data(real_fleet_data, "destroyer"),
+            impact_angles_deg=[60.0],
+            locations=[HitLocation.LATERAL],
+        )
+        assert oblique.ablation_cm[0] < straight.ablation_cm[0]
+
+
+class TestShotsToKillTable:
+    """Tests for cached shots-to-kill tables."""
+
+    @pytest.fixture
+    def real_fleet_data(self):
+        data_path = Path(__file__).parent.parent / "data" / "fleet_ships.json"
+        return load_fleet_data(data_path)
+
+    def test_spinal_coiler_kills_corvette(self, real_fleet_data):
+        weapon = create_weapon_from_fleet_data(real_fleet_data, "spinal_coiler_mk3")
+        result = calculate_shots_to_kill(
+            weapon, "corvette", HitLocation.LATERAL, real_fleet_data
+        )
+        assert 1 <= result.shots_to_penetrate <= result.shots_to_kill
+        assert result.kill_reason != "survived"
+
+    def test_results_are_cached(self, real_fleet_data):
+        clear_shots_to_kill_cache()
+        weapon = create_weapon_from_fleet_data(real_fleet_data, "coilgun_mk3")
+        first = calculate_shots_to_kill(weapon, "destroyer", HitLocation.NOSE, real_fleet_data)
+        second = calculate_shots_to_kill(weapon, "destroyer", HitLocation.NOSE, real_fleet_data)
+        assert first is second
+
+    def test_build_table_keys(self, real_fleet_data):
+        weapons = {
+            "coilgun": create_weapon_from_fleet_data(real_fleet_data, "coilgun_mk3"),
+        }
+        table = build_shots_to_kill_table(weapons, ["frigate"], real_fleet_data)
+        assert set(table) == {
+            ("coilgun", "frigate", "nose"),
+            ("coilgun", "frigate", "lateral"),
+            ("coilgun", "frigate", "tail"),
+        }
@@ -14,14 +14,16 @@ Tests create ships from fleet_ships.json and run actual simulation steps.
 """
 
 import json
+import random
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from src.simulation import (
     CombatSimulation, ShipCombatState, create_ship_from_fleet_data,
     SimulationEventType, SimulationEvent, Maneuver, ManeuverType,
-    WeaponState, ProjectileInFlight, TorpedoInFlight
+    WeaponState, ProjectileInFlight, TorpedoInFlight, solve_lead_directions
 )
 from src.physics import Vector3D, ShipState, create_ship_state_from_specs
 from src.combat import Weapon, create_weapon_from_fleet_data, create_ship_armor_from_fleet_data
@@ -901,6 +903,63 @@ class TestCombatEngagement:
         print(f"[DEBUG] Armor penetration events: {len(armor_penetrated_events)}")
 
 
+class TestBatchedLeadSolutions:
+    """Test the shared per-ship fire control lead solve."""
+
+    def test_matches_per_weapon_lead(self):
+        """Vectorized lead solve matches WeaponState._calculate_lead_direction."""
+        rng = random.Random(5)
+        rows = []
+        expected = []
+        for _ in range(200):
+            muzzle_kps = rng.choice([3.0, 8.0, 20.0])
+            weapon_state = WeaponState(
+                weapon=Weapon("Test", "test", 1.0, 1.0, 1000.0, 0.3,
+                              muzzle_velocity_kps=muzzle_kps),
+                ammo_remaining=10,
+            )
+            rel_pos = Vector3D(*(rng.uniform(-3e5, 3e5) for _ in range(3)))
+            rel_vel = Vector3D(*(rng.uniform(-1e3, 1e3) for _ in range(3)))
+            accel = (Vector3D(*(rng.uniform(-20, 20) for _ in range(3)))
+                     if rng.random() < 0.5 else Vector3D.zero())
+            expected.append(weapon_state._calculate_lead_direction(
+                Vector3D.zero(), Vector3D.zero(), rel_pos, rel_vel, accel
+            ).to_tuple())
+            rows.append((rel_pos.to_tuple(), rel_vel.to_tuple(), accel.to_tuple(),
+                         muzzle_kps * 1000))
+
+        directions = solve_lead_directions(
+            np.array([r[0] for r in rows]),
+            np.array([r[1] for r in rows]),
+            np.array([r[2] for r in rows]),
+            np.array([r[3] for r in rows]),
+        )
+        assert np.allclose(directions, np.array(expected), atol=1e-9)
+
+    def test_invalid_rows_aim_direct(self):
+        directions = solve_lead_directions(
+            np.array([[1000.0, 0, 0], [0.5, 0, 0]]),
+            np.array([[0.0, 100.0, 0], [0, 0, 0]]),
+            np.zeros((2, 3)),
+            np.array([0.0, 5000.0]),
+        )
+        assert np.allclose(directions[0], [1.0, 0.0, 0.0])
+
+    def test_fire_control_shares_solution_per_target(self, two_destroyer_simulation):
+        sim = two_destroyer_simulation
+        shooter = sim.get_ship("alpha_destroyer_1")
+        target = sim.get_ship("beta_destroyer_1")
+
+        solutions = sim._solve_fire_control(
+            shooter, [(target, 10.0), (target, 10.0), (target, 6.5)]
+        )
+        assert set(solutions) == {
+            ("beta_destroyer_1", 10.0), ("beta_destroyer_1", 6.5)
+        }
+        for direction in solutions.values():
+            assert direction.magnitude == pytest.approx(1.0)
+
+
 # =============================================================================
 # TEST: SCRIPT EXECUTION
 # =============================================================================
@@ -1241,6 +1300,75 @@ class TestFullBattle:
         print(f"[DEBUG] Simulation end events: {len(ended_events)}")
 
 
+# =============================================================================
+# TEST: STATE FORKING
+# =============================================================================
+
+def _kinematics(sim):
+    """Positions and velocities of everything in flight."""
+    ships = {
+        ship_id: (ship.position.to_tuple(), ship.velocity.to_tuple(), ship.hull_integrity)
+        for ship_id, ship in sim.ships.items()
+    }
+    projectiles = [p.projectile.position.to_tuple() for p in sim.projectiles]
+    return ships, projectiles, sim.rng.getstate(), sim.current_time
+
+
+class TestStateForking:
+    """Tests for forking, digesting and adopting simulation state."""
+
+    def test_fork_evolves_identically(self, two_destroyer_simulation):
+        sim = two_destroyer_simulation
+        slot = next(iter(sim.get_ship("alpha_destroyer_1").weapons))
+        sim.inject_command("alpha_destroyer_1", {
+            'type': 'fire_at', 'weapon_slot': slot, 'target_id': 'beta_destroyer_1'
+        })
+        sim.step()
+
+        fork, _ = sim.fork()
+        assert fork.events == [] and fork._event_callbacks == []
+        assert fork.get_ship("alpha_destroyer_1") is not sim.get_ship("alpha_destroyer_1")
+
+        for _ in range(20):
+            sim.step()
+            fork.step()
+        assert _kinematics(fork) == _kinematics(sim)
+
+    def test_digest_tracks_state_changes(self, two_destroyer_simulation):
+        sim = two_destroyer_simulation
+        _, digest = sim.fork()
+        assert sim.state_digest() == digest
+
+        sim._log_event(SimulationEventType.DECISION_POINT_REACHED)
+        assert sim.state_digest() == digest  # Event log is not state
+
+        sim.inject_command("alpha_destroyer_1", {
+            'type': 'set_target', 'target_id': 'beta_destroyer_1'
+        })
+        assert sim.state_digest() != digest
+
+    def test_adopt_observers_replays_fork_events(self, two_destroyer_simulation):
+        sim = two_destroyer_simulation
+        seen = []
+        sim.add_event_callback(seen.append)
+        sim._log_event(SimulationEventType.SIMULATION_STARTED)
+
+        fork, _ = sim.fork()
+        fork._log_event(SimulationEventType.DECISION_POINT_REACHED)
+        assert len(seen) == 1
+
+        replayed = fork.adopt_observers(sim)
+        assert [e.event_type for e in replayed] == [SimulationEventType.DECISION_POINT_REACHED]
+        assert [e.event_type for e in fork.events] == [
+            SimulationEventType.SIMULATION_STARTED,
+            SimulationEventType.DECISION_POINT_REACHED,
+        ]
+        assert seen[-1] is replayed[0]
+
+        fork._log_event(SimulationEventType.SIMULATION_ENDED)
+        assert seen[-1].event_type == SimulationEventType.SIMULATION_ENDED
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
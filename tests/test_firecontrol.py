@@ -10,6 +10,7 @@ Tests:
 """
 
 import math
+import random
 import pytest
 from dataclasses import dataclass
 from typing import Optional
@@ -18,6 +19,11 @@ from src.firecontrol import (
     FiringSolution,
     calculate_hit_probability,
     calculate_engagement_envelope,
+    calculate_engagement_geometry,
+    clear_engagement_grids,
+    get_engagement_grid,
+    lookup_hit_probability,
+    solve_from_engagement_geometry,
     HelmCommand,
     WeaponsCommand,
     TacticalPosture,
@@ -395,6 +401,119 @@ class TestEngagementEnvelope:
             assert probs[i] <= probs[i-1]
 
 
+class TestEngagementGrids:
+    """Tests for precomputed engagement grids and table lookup."""
+
+    @pytest.fixture
+    def geometry(self):
+        return ShipGeometry(
+            length_m=125.0,
+            radius_m=15.6,
+            nose_cone_length_m=25.0,
+            engine_section_length_m=18.75
+        )
+
+    def _random_engagement(self, rng):
+        """Random shooter/target state within weapon ranges."""
+        def vec(scale):
+            return Vector3D(*(rng.uniform(-scale, scale) for _ in range(3)))
+        return dict(
+            shooter_position=Vector3D(0, 0, 0),
+            shooter_velocity=vec(5000),
+            target_position=Vector3D(rng.uniform(1e3, 9e5), rng.uniform(-1e5, 1e5), 0),
+            target_velocity=vec(5000),
+            target_forward=vec(1).normalized(),
+            muzzle_velocity_kps=rng.choice([4.7, 5.0, 6.0, 7.0, 9.9]),
+            target_is_evading=rng.random() < 0.3,
+        )
+
+    def test_lookup_matches_exact_calculation(self, geometry):
+        """Grid lookup should track the exact model closely."""
+        rng = random.Random(7)
+        errors = []
+        for _ in range(1000):
+            kwargs = self._random_engagement(rng)
+            exact = calculate_hit_probability(target_geometry=geometry, **kwargs)
+            looked_up = lookup_hit_probability(target_geometry=geometry, **kwargs)
+
+            assert looked_up.can_fire == exact.can_fire
+            assert looked_up.target_aspect == exact.target_aspect
+            if exact.can_fire:
+                assert looked_up.time_of_flight_s == pytest.approx(exact.time_of_flight_s)
+                assert looked_up.predicted_range_km == pytest.approx(exact.predicted_range_km)
+            errors.append(abs(looked_up.hit_probability - exact.hit_probability))
+
+        assert max(errors) < 0.04
+        assert sum(errors) / len(errors) < 0.005
+
+    def test_grid_nodes_are_exact(self, geometry):
+        """At grid nodes interpolation reproduces the stored values."""
+        grid = get_engagement_grid(7.0, geometry.lateral_cross_section_m2)
+        distance = math.exp(grid.log_range[20])
+        closing = float(grid.closing_mps[5])
+        lateral = float(grid.lateral_mps[3])
+        assert grid.probability(distance, closing, lateral) == pytest.approx(
+            grid.values[20, 5, 3]
+        )
+        assert float(grid.probabilities(distance, closing, lateral)) == pytest.approx(
+            grid.values[20, 5, 3]
+        )
+
+    def test_scalar_and_vector_lookup_agree(self, geometry):
+        """Scalar fast path and numpy path should give identical results."""
+        grid = get_engagement_grid(5.0, geometry.nose_cross_section_m2)
+        rng = random.Random(3)
+        for _ in range(50):
+            d, c, l = rng.uniform(1e3, 1e6), rng.uniform(-4000, 15000), rng.uniform(0, 15000)
+            assert grid.probability(d, c, l) == pytest.approx(float(grid.probabilities(d, c, l)))
+
+    def test_grids_are_cached(self, geometry):
+        """Same weapon and aspect share one grid until cleared."""
+        first = get_engagement_grid(9.9, geometry.tail_cross_section_m2)
+        assert get_engagement_grid(9.9, geometry.tail_cross_section_m2) is first
+        clear_engagement_grids()
+        assert get_engagement_grid(9.9, geometry.tail_cross_section_m2) is not first
+
+    def test_out_of_grid_falls_back_to_exact(self, geometry):
+        """Queries beyond the grid use the exact model."""
+        geo = calculate_engagement_geometry(
+            Vector3D(0, 0, 0), Vector3D(0, 0, 0),
+            Vector3D(5e6, 0, 0), Vector3D(0, 0, 0),
+            geometry, Vector3D(1, 0, 0),
+        )
+        assert solve_from_engagement_geometry(geo, 7.0) is None
+
+        kwargs = dict(
+            shooter_position=Vector3D(0, 0, 0),
+            shooter_velocity=Vector3D(0, 0, 0),
+            target_position=Vector3D(5e6, 0, 0),
+            target_velocity=Vector3D(0, 0, 0),
+            target_geometry=geometry,
+            target_forward=Vector3D(1, 0, 0),
+            muzzle_velocity_kps=7.0,
+        )
+        assert lookup_hit_probability(**kwargs) == calculate_hit_probability(**kwargs)
+
+    def test_outrunning_target_cannot_be_fired_on(self, geometry):
+        """Targets receding faster than the projectile keep the exact verdict."""
+        solution = lookup_hit_probability(
+            shooter_position=Vector3D(0, 0, 0),
+            shooter_velocity=Vector3D(0, 0, 0),
+            target_position=Vector3D(100_000, 0, 0),
+            target_velocity=Vector3D(10_000, 0, 0),
+            target_geometry=geometry,
+            target_forward=Vector3D(1, 0, 0),
+            muzzle_velocity_kps=5.0,
+        )
+        assert not solution.can_fire
+
+    def test_envelope_is_memoized_but_copied(self):
+        """Mutating a returned envelope must not corrupt the cache."""
+        envelope = calculate_engagement_envelope(1000.0, 10.0)
+        envelope['brackets'].clear()
+        assert calculate_engagement_envelope(1000.0, 10.0)['brackets']
+
+
 class TestHelmCommands:
     """Tests for helm command enums and orders."""
 
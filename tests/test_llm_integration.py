@@ -6,7 +6,11 @@ Uses mocked LLM responses to test without API calls.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+import asyncio
 import json
+import time
+
+import httpx
 
 import sys
 from pathlib import Path
@@ -18,6 +22,8 @@ from src.llm.prompts import CaptainPersonality, build_captain_prompt
 from src.llm.communication import CommunicationChannel, CaptainMessage, MessageType
 from src.llm.victory import VictoryEvaluator, BattleOutcome
 from src.llm.tools import get_captain_tools, CAPTAIN_TOOLS
+from src.llm.battle_runner import LLMBattleRunner, BattleConfig
+from src.llm.request_pool import RetryPolicy
 
 
 class TestCaptainTools:
@@ -254,6 +260,96 @@ class TestPrompts:
         assert "AGGRESSIVE" in prompt or "aggressive" in prompt.lower()
         assert "Spinal" in prompt or "spinal" in prompt.lower()  # Coilgun weapon
 
+    def test_prompt_splits_into_static_and_situation(self):
+        """The static system prompt carries no per-checkpoint data."""
+        from src.llm.prompts import build_captain_system_prompt, build_captain_situation_prompt
+
+        ship_status = {"hull_integrity": 73, "heat_percent": 41, "heatsink_capacity": 525}
+        tactical_status = {"sim_time": 90}
+        static = build_captain_system_prompt(
+            "Chen", "Relentless", CaptainPersonality.CAUTIOUS,
+        )
+        situation = build_captain_situation_prompt("Relentless", ship_status, tactical_status)
+
+        assert "Hull: 73%" not in static and "Hull: 73%" in situation
+        assert "T+90s" in situation
+        assert "Cautious Commander" in static
+        assert static + situation == build_captain_prompt(
+            captain_name="Chen",
+            ship_name="Relentless",
+            ship_status=ship_status,
+            tactical_status=tactical_status,
+            personality=CaptainPersonality.CAUTIOUS,
+        )
+
+
+class TestIncrementalCaptainPrompts:
+    """Captain prompts reuse the static prefix and format histories incrementally."""
+
+    def _captain(self):
+        return LLMCaptain(LLMCaptainConfig(name="Chen", ship_name="Relentless"), Mock())
+
+    def test_system_prompt_cached_until_personality_changes(self):
+        captain = self._captain()
+        first = captain._get_system_prompt(525)
+        assert captain._get_system_prompt(525) is first
+
+        captain.personality_text = "Relentless hunter."
+        updated = captain._get_system_prompt(525)
+        assert updated is not first
+        assert "Relentless hunter." in updated
+
+    def test_histories_match_full_reformat(self):
+        captain = self._captain()
+        for i in range(8):
+            captain.decision_history.append({
+                "checkpoint": i + 1, "time": 30.0 * (i + 1),
+                "tool_calls": [{"name": "set_maneuver", "args": {"maneuver_type": "EVADE", "throttle": 0.5}}],
+                "commands_count": 1,
+            })
+            captain._record_sent_message("x" * (90 + 5 * i), 30.0 * i)
+            captain.record_shot("spinal", 50.0 + 40 * i, -1.5, "HIT" if i % 2 else "MISS", 4.3)
+
+            decisions = captain._format_decision_history(last_n=5).splitlines()
+            assert decisions[0] == "YOUR RECENT DECISIONS:"
+            assert decisions[-min(i + 1, 5):] == [
+                f"  T+{30 * (n + 1)}s: EVADE@50%" for n in range(max(0, i - 4), i + 1)
+            ]
+            if i >= 5:  # Older decisions are folded into a rolling summary
+                assert decisions[1] == f"  Earlier (T+30s to T+{30 * (i - 4)}s, {i - 4} decisions): EVADE x{i - 4}"
+
+        shots = captain._format_shot_history()
+        assert "  <100km: 1/2 hits (50%)" in shots
+        assert "  100-300km: 2/5 hits (40%)" in shots
+        assert "  >300km: 1/1 hits (100%)" in shots
+        assert shots.count("You fired spinal") == 5
+        assert captain._format_message_history().count("...") == 5  # Last 6, one is exactly 100 chars
+
+        # Replacing a history rebuilds its lines
+        captain.shot_history = [captain.shot_history[0]]
+        assert "  <100km: 0/1 hits (0%)" in captain._format_shot_history()
+        assert captain._format_shot_history().count("You fired spinal") == 1
+
+    def test_decision_messages_put_dynamic_data_after_static_prefix(self):
+        captain = self._captain()
+        sim = Mock()
+        ship = Mock(is_destroyed=False)
+        sim.get_ship.return_value = ship
+        sim.get_enemy_ships.return_value = []
+        sim.current_time = 60.0
+
+        with patch.object(LLMCaptain, "_build_ship_status", return_value={"hull_integrity": 55}), \
+                patch.object(LLMCaptain, "_build_tactical_status", side_effect=[
+                    {"sim_time": 30}, {"sim_time": 60},
+                ]):
+            first, _ = captain._prepare_decision("alpha", sim)
+            second, _ = captain._prepare_decision("alpha", sim)
+
+        assert first[0] == second[0]
+        assert first[0]["role"] == "system"
+        assert "Hull: 55%" in second[1]["content"]
+        assert "T+60s" in second[1]["content"] and "T+30s" in first[1]["content"]
+
 
 class TestLLMCaptain:
     """Test LLM captain decision-making."""
@@ -394,6 +490,7 @@ class TestIntegration:
         mock_enemy.ship_id = "beta"
         mock_enemy.position = Vector3D(250000, 1000, 0)  # Real Vector3D
         mock_enemy.velocity = Vector3D(0, 0, 0)
+        mock_enemy.forward = Vector3D(-1, 0, 0)
         mock_enemy.armor = None  # No armor for simplicity
         mock_enemy.hull_integrity = 100  # Hull damage info
         mock_enemy.shots_fired = 0
@@ -401,8 +498,9 @@ class TestIntegration:
         mock_enemy.damage_dealt_gj = 0.0
         mock_enemy.damage_taken_gj = 0.0
 
-        mock_sim = Mock(spec=['current_time', 'get_ship', 'get_enemy_ships', 'get_all_ships', 'get_friendly_ships', 'torpedoes', 'projectiles'])
+        mock_sim = Mock(spec=['current_time', 'ships', 'get_ship', 'get_enemy_ships', 'get_all_ships', 'get_friendly_ships', 'torpedoes', 'projectiles'])
         mock_sim.current_time = 30.0
+        mock_sim.ships = {"alpha": mock_ship, "beta": mock_enemy}
         mock_sim.get_ship = Mock(return_value=mock_ship)
         mock_sim.get_enemy_ships = Mock(return_value=[mock_enemy])
         mock_sim.get_all_ships = Mock(return_value=[mock_ship, mock_enemy])  # For multi-ship support
@@ -417,5 +515,267 @@ class TestIntegration:
         assert captain.decision_count == 1
 
 
+def _tool_call_response(model: str) -> dict:
+    """Minimal OpenAI-style chat completion with one tool call."""
+    return {
+        "model": model,
+        "choices": [{
+            "message": {
+                "content": "",
+                "tool_calls": [{
+                    "id": "call_1",
+                    "function": {"name": "set_maneuver", "arguments": '{"maneuver_type": "BRAKE"}'},
+                }],
+            },
+        }],
+    }
+
+
+class TestAsyncClient:
+    """Tests for the async CaptainClient API."""
+
+    def test_provider_of(self):
+        assert CaptainClient.provider_of("anthropic/claude-3.5-sonnet") == "anthropic"
+        assert CaptainClient.provider_of("openrouter/x-ai/grok-4") == "x-ai"
+
+    def test_concurrency_bounded_per_provider(self, monkeypatch):
+        """In-flight requests are capped per provider, not globally."""
+        in_flight = {}
+        peak = {}
+
+        async def handler(request):
+            provider = json.loads(request.content)["model"].split("/")[0]
+            in_flight[provider] = in_flight.get(provider, 0) + 1
+            peak[provider] = max(peak.get(provider, 0), in_flight[provider])
+            await asyncio.sleep(0.02)
+            in_flight[provider] -= 1
+            return httpx.Response(200, json=_tool_call_response("m"))
+
+        real_async_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            "src.llm.request_pool.httpx.AsyncClient",
+            lambda **kw: real_async_client(transport=httpx.MockTransport(handler), **kw),
+        )
+        client = CaptainClient(api_key="test", max_concurrent_per_provider=2)
+
+        async def run():
+            calls = [
+                client.decide_with_tools_async([], [], model=model)
+                for model in ["anthropic/a"] * 5 + ["openai/b"] * 5
+            ]
+            results = await asyncio.gather(*calls)
+            await client.aclose()
+            return results
+
+        results = asyncio.run(run())
+
+        assert all(r[0].name == "set_maneuver" for r in results)
+        assert peak == {"anthropic": 2, "openai": 2}
+
+    def test_http_error_returns_no_tool_calls(self, monkeypatch):
+        """Async errors degrade to an empty decision like the sync client."""
+        real_async_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            "src.llm.request_pool.httpx.AsyncClient",
+            lambda **kw: real_async_client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(500, text="boom")),
+                **kw,
+            ),
+        )
+        client = CaptainClient(api_key="test", retry_policy=RetryPolicy(max_attempts=1))
+        assert asyncio.run(client.decide_with_tools_async([], [])) == []
+
+
+class _SlowCaptain:
+    """Captain stub whose LLM call takes a fixed time."""
+
+    def __init__(self, ship_id, delay_s, discuss=False):
+        self.ship_id = ship_id
+        self.name = f"Captain {ship_id}"
+        self.ship_name = f"Ship {ship_id}"
+        self.delay_s = delay_s
+        self.discuss = discuss
+        self.admiral_orders = []
+
+    def clear_admiral_context(self):
+        self.admiral_orders = []
+
+    def receive_admiral_orders(self, orders, directive):
+        self.admiral_orders.extend(orders)
+
+    async def decide_async(self, ship_id, simulation):
+        await asyncio.sleep(self.delay_s)
+        if self.discuss and not self.admiral_orders:
+            return [{"type": "discuss_with_admiral", "question": "Hold or advance?"}]
+        return [{"type": "fire_at", "weapon_slot": "spinal", "ship": ship_id}]
+
+
+class TestConcurrentCaptainDecisions:
+    """Tests for concurrent captain decisions at fleet checkpoints."""
+
+    def _runner(self, captains):
+        runner = LLMBattleRunner(
+            config=BattleConfig(verbose=False),
+            alpha_config=None,
+            beta_config=None,
+            client=Mock(),
+        )
+        runner.simulation = Mock()
+        runner.simulation.current_time = 30.0
+        runner.simulation.get_ship = Mock(
+            return_value=Mock(is_destroyed=False, is_surrendered=False)
+        )
+        for faction, ship_id, captain in captains:
+            getattr(runner, f"{faction}_captains")[ship_id] = captain
+        return runner
+
+    def test_checkpoint_latency_is_slowest_call_not_sum(self):
+        delays = [0.15, 0.05, 0.10, 0.12, 0.02, 0.08]
+        captains = [
+            ("alpha" if i < 3 else "beta", f"ship_{i}", _SlowCaptain(f"ship_{i}", d))
+            for i, d in enumerate(delays)
+        ]
+        runner = self._runner(captains)
+
+        jobs = runner._prepare_captain_jobs({})
+        start = time.perf_counter()
+        decisions = asyncio.run(runner._decide_captains_concurrently(jobs))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < sum(delays) * 0.6
+        # Results come back in fleet order, not completion order
+        assert [d.ship_id for d in decisions] == [f"ship_{i}" for i in range(6)]
+
+        all_commands = {}
+        runner._apply_captain_decisions(jobs, decisions, all_commands)
+        assert list(all_commands) == [f"ship_{i}" for i in range(6)]
+        assert all_commands["ship_4"][0]["ship"] == "ship_4"
+
+    def test_skipped_factions_and_destroyed_ships(self):
+        captains = [
+            ("alpha", "a1", _SlowCaptain("a1", 0)),
+            ("beta", "b1", _SlowCaptain("b1", 0)),
+        ]
+        runner = self._runner(captains)
+        assert [job[0] for job in runner._prepare_captain_jobs({}, ("beta",))] == ["a1"]
+
+        runner.simulation.get_ship = Mock(return_value=Mock(is_destroyed=True))
+        assert runner._prepare_captain_jobs({}) == []
+
+    def test_admiral_discussion_runs_inside_captain_task(self):
+        captain = _SlowCaptain("a1", 0.01, discuss=True)
+        runner = self._runner([("alpha", "a1", captain)])
+        runner.recorder = Mock()
+
+        admiral = Mock()
+        admiral.name = "Admiral Vance"
+
+        async def respond(captain_ship_name, question, simulation):
+            return "Advance."
+        admiral.respond_to_captain_async = respond
+        runner.alpha_admiral = admiral
+
+        jobs = runner._prepare_captain_jobs({})
+        decisions = asyncio.run(runner._decide_captains_concurrently(jobs))
+
+        assert decisions[0].commands[0]["type"] == "fire_at"
+        assert "[CLARIFICATION] Advance." in captain.admiral_orders[0].order_text
+        # Discussion is buffered, then recorded when replayed in order
+        runner.recorder.record_captain_admiral_discussion.assert_not_called()
+        runner._apply_captain_decisions(jobs, decisions, {}, record_decisions=False)
+        runner.recorder.record_captain_admiral_discussion.assert_called_once()
+
+
+class TestSpeculativeSimulation:
+    """Tests for speculative simulation during checkpoint decisions."""
+
+    @pytest.fixture(autouse=True)
+    def _fleet_runners(self, make_fleet_runner):
+        self.make_fleet_runner = make_fleet_runner
+
+    def _run(self, tmp_path, speculative, orders, **config):
+        from src.llm.battle_runner import load_fleet_data
+
+        async def decide_async(captain, ship_id, simulation):
+            await asyncio.sleep(0.01)
+            return orders(ship_id, simulation)
+
+        runner = self.make_fleet_runner(
+            2,
+            distance_km=300,
+            client=Mock(aclose=Mock(side_effect=lambda: asyncio.sleep(0))),
+            **{
+                "record_battle": True,
+                "record_sim_trace": True,
+                "recording_dir": str(tmp_path / ("spec" if speculative else "serial")),
+                "max_checkpoints": 4,
+                "seed": 11,
+                "speculative_simulation": speculative,
+                **config,
+            },
+        )
+        with patch.object(LLMCaptain, "decide_async", decide_async):
+            asyncio.run(runner.run_fleet_battle_async(load_fleet_data()))
+        return runner
+
+    @staticmethod
+    def _final_state(runner):
+        ships = {
+            ship_id: (ship.position.to_tuple(), ship.velocity.to_tuple(), ship.primary_target_id)
+            for ship_id, ship in runner.simulation.ships.items()
+        }
+        events = [(e.event_type, e.timestamp, e.ship_id) for e in runner.simulation.events]
+        return ships, events, runner.recorder.recording.sim_trace
+
+    def test_unchanged_orders_commit_every_interval(self, tmp_path):
+        serial = self._run(tmp_path, False, lambda ship_id, sim: [])
+        spec = self._run(tmp_path, True, lambda ship_id, sim: [])
+
+        assert spec.speculative_commits == 3  # No fork after the final checkpoint
+        assert spec.speculative_rollbacks == 0
+        assert self._final_state(spec) == self._final_state(serial)
+        # Runner bookkeeping follows the committed fork
+        assert spec.alpha_ships["alpha_1"] is spec.simulation.ships["alpha_1"]
+
+    def test_changed_orders_roll_back(self, tmp_path):
+        def sticky_target(ship_id, sim):
+            return [{"type": "set_target", "target_id": sim.get_enemy_ships(ship_id)[0].ship_id}]
+
+        serial = self._run(tmp_path, False, sticky_target)
+        spec = self._run(tmp_path, True, sticky_target)
+
+        # The first set_target changes state; repeating it later changes nothing
+        assert spec.speculative_rollbacks == 1
+        assert spec.speculative_commits == 2
+        assert self._final_state(spec) == self._final_state(serial)
+
+    @pytest.mark.parametrize("switch_targets", [True, False])
+    def test_combat_log_only_from_adopted_forks(self, tmp_path, capsys, switch_targets):
+        from src.firecontrol import WeaponsCommand, WeaponsOrder
+
+        def fire(ship_id, sim):
+            enemies = sim.get_enemy_ships(ship_id)
+            index = int(sim.current_time // 30) % len(enemies) if switch_targets else 0
+            target_id = enemies[index].ship_id
+            return [
+                {"type": "set_target", "target_id": target_id},
+                {"type": "weapons_order", "order": WeaponsOrder(WeaponsCommand.FIRE_IMMEDIATE, target_id=target_id)},
+            ]
+
+        def combat_log():
+            lines = capsys.readouterr().out.splitlines()
+            return [line for line in lines if any(k in line for k in ("FIRED", "HIT", "MISS", "DESTROYED"))]
+
+        self._run(tmp_path, False, fire, record_battle=False)
+        serial = combat_log()
+        spec = self._run(tmp_path, True, fire, record_battle=False)
+
+        if switch_targets:
+            assert spec.speculative_rollbacks == 3  # Every fork discarded
+        else:
+            assert spec.speculative_commits == 2  # Fork output printed on commit
+        assert serial and combat_log() == serial
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
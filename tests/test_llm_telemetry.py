@@ -0,0 +1,197 @@
+"""
+Tests for LLM call and decision telemetry.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+
+import pytest
+
+from src.llm.battle_runner import load_fleet_data
+from src.llm.client import CaptainClient
+from src.llm.mock_provider import MockLLMProvider, MockProviderConfig
+from src.llm.request_pool import RetryPolicy
+from src.llm.telemetry import LLMTelemetry, instrumented
+from src.llm.tools import get_captain_tools
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSpans:
+    """Attribution of calls to decision spans."""
+
+    def test_nested_spans_and_errors(self):
+        clock = FakeClock()
+        telemetry = LLMTelemetry(clock=clock)
+
+        telemetry.record_call("m/a", 0.5)
+        telemetry.set_checkpoint(3)
+        with telemetry.span("captain_turn", ship_id="alpha_1", faction="alpha"):
+            with telemetry.span("captain", model="m/a"):
+                telemetry.record_call("m/a", 1.0, prompt_tokens=100, completion_tokens=20)
+            with telemetry.span("discussion", faction=None):
+                clock.now += 2.0
+                telemetry.record_call("m/b", 2.0, error="HTTP 503", retries=2)
+        with pytest.raises(ValueError):
+            with telemetry.span("admiral"):
+                raise ValueError("boom")
+
+        other, captain, discussion = telemetry.calls
+        assert other.kind == "other" and other.checkpoint == 0
+        assert (captain.kind, captain.ship_id, captain.checkpoint) == ("captain", "alpha_1", 3)
+        assert (discussion.kind, discussion.ship_id) == ("discussion", "alpha_1")
+
+        decisions = {d.kind: d for d in telemetry.decisions}
+        assert decisions["captain_turn"].llm_calls == 2
+        assert decisions["captain_turn"].errors == 1
+        assert decisions["captain_turn"].wall_time_s == pytest.approx(2.0)
+        assert decisions["discussion"].labels == {}
+        assert decisions["admiral"].errors == 1
+
+    def test_concurrent_tasks_keep_their_own_span(self):
+        telemetry = LLMTelemetry()
+
+        async def captain(ship_id, delay):
+            with telemetry.span("captain", ship_id=ship_id):
+                await asyncio.sleep(delay)
+                telemetry.record_call("m/a", delay)
+
+        async def run():
+            await asyncio.gather(captain("a", 0.02), captain("b", 0.01), captain("c", 0.0))
+
+        asyncio.run(run())
+        assert sorted((c.ship_id, c.latency_s) for c in telemetry.calls) == [
+            ("a", 0.02), ("b", 0.01), ("c", 0.0)
+        ]
+        assert all(d.llm_calls == 1 for d in telemetry.decisions)
+
+    def test_instrumented_methods(self):
+        telemetry = LLMTelemetry()
+
+        class Owner:
+            client = type("Client", (), {"telemetry": telemetry})()
+
+            @instrumented("admiral", lambda owner, faction: {"faction": faction})
+            def decide(self, faction):
+                telemetry.record_call("m/a", 0.1)
+                return faction
+
+            @instrumented("captain")
+            async def decide_async(self):
+                telemetry.record_call("m/a", 0.1)
+
+        owner = Owner()
+        assert owner.decide("beta") == "beta"
+        asyncio.run(owner.decide_async())
+        assert [c.kind for c in telemetry.calls] == ["admiral", "captain"]
+        assert telemetry.decisions[0].labels == {"faction": "beta"}
+
+        Owner.client = object()  # No telemetry: runs unchanged
+        assert owner.decide("alpha") == "alpha"
+        assert len(telemetry.decisions) == 2
+
+
+class TestSummary:
+    """Aggregation per model, kind and decision."""
+
+    def test_aggregates(self, tmp_path):
+        telemetry = LLMTelemetry()
+        with telemetry.span("captain"):
+            for latency in (1.0, 2.0, 3.0, 4.0):
+                telemetry.record_call("m/a", latency, prompt_tokens=10, completion_tokens=5)
+            telemetry.record_call("m/a", 0.0, cache_hit=True)
+        telemetry.record_call("m/b", 9.0, error="HTTP 500", retries=3)
+
+        summary = telemetry.summary()
+        by_model = summary["by_model"]
+        assert by_model["m/a"]["calls"] == 5
+        assert by_model["m/a"]["cache_hits"] == 1
+        assert by_model["m/a"]["prompt_tokens"] == 40
+        assert by_model["m/a"]["latency"]["mean_s"] == pytest.approx(2.5)
+        assert by_model["m/a"]["latency"]["p95_s"] == 4.0
+        # Failed calls count as errors, not latency samples
+        assert by_model["m/b"]["errors"] == 1 and by_model["m/b"]["retries"] == 3
+        assert by_model["m/b"]["latency"]["total_s"] == 0.0
+        assert summary["totals"]["calls"] == 6
+        assert summary["by_kind"]["other"]["calls"] == 1
+        assert summary["decisions"]["captain"]["llm_calls"] == 5
+
+        path = telemetry.write_summary(str(tmp_path / "out" / "telemetry.json"))
+        with open(path) as f:
+            assert json.load(f) == {"summary": summary}
+
+
+class TestClientTelemetry:
+    """CaptainClient records every call."""
+
+    def test_live_streamed_and_failed_calls(self):
+        telemetry = LLMTelemetry()
+        config = MockProviderConfig(seed=4, latency_median_s=0.0)
+        with MockLLMProvider(config) as provider:
+            client = CaptainClient(api_key="mock", base_url=provider.url, telemetry=telemetry)
+            client.decide_with_tools([{"role": "user", "content": "go"}], get_captain_tools(), model="mock/a")
+            client.decide_with_tools(
+                [{"role": "user", "content": "go"}], get_captain_tools(), model="mock/b",
+                on_tool_call=lambda tc: None,
+            )
+
+            provider.config.error_rate = 1.0
+            provider.config.error_statuses = (503,)
+            client.pool.retry = RetryPolicy(max_attempts=3, base_delay_s=0.0, jitter=0.0)
+
+            async def run():
+                try:
+                    return await client.decide_with_tools_async(
+                        [{"role": "user", "content": "go"}], get_captain_tools(), model="mock/c"
+                    )
+                finally:
+                    await client.aclose()
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                assert asyncio.run(run()) == []
+
+        plain, streamed, failed = telemetry.calls
+        assert plain.model == "mock/a" and plain.prompt_tokens > 0 and not plain.streamed
+        assert streamed.streamed and streamed.first_tool_call_s is not None
+        assert failed.error == "HTTP 503" and failed.retries == 2
+
+
+class TestBattleTelemetry:
+    """Telemetry of a full fleet battle."""
+
+    def test_fleet_battle_writes_telemetry(self, tmp_path, make_fleet_runner):
+        with MockLLMProvider(MockProviderConfig(seed=3, latency_median_s=0.0)) as provider:
+            runner = make_fleet_runner(
+                2, model="mock/captain", admiral="mock/admiral",
+                client=CaptainClient(api_key="mock", base_url=provider.url),
+                max_checkpoints=2, seed=3, personality_selection=True, record_battle=True,
+                recording_dir=str(tmp_path), telemetry_path=str(tmp_path / "telemetry.json"),
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = runner.run_battle(load_fleet_data())
+
+        summary = result.llm_telemetry
+        assert summary["totals"]["calls"] == provider.stats.requests
+        assert set(summary["by_model"]) == {"mock/admiral", "mock/captain"}
+        assert {"admiral", "captain", "personality"} <= set(summary["by_kind"])
+        assert "other" not in summary["by_kind"]
+        turns = summary["decisions"]["captain_turn"]
+        assert turns["count"] == 4 * result.checkpoints_used
+        assert summary["decisions"]["personality"]["count"] == 6  # 4 captains, 2 Admirals
+
+        with open(tmp_path / "telemetry.json") as f:
+            assert json.load(f)["summary"] == summary
+        with open(result.recording_file) as f:
+            recorded = json.load(f)["llm_telemetry"]
+        assert recorded["summary"] == summary
+        assert len(recorded["calls"]) == provider.stats.requests
+        # Personality selection happens before checkpoint 1
+        assert {call["checkpoint"] for call in recorded["calls"]} == set(range(result.checkpoints_used + 1))
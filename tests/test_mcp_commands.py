@@ -0,0 +1,169 @@
+"""
+Tests for MCP command validation, lock-free queueing and batched application.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm.mcp_commands import (
+    CommandValidationError,
+    parse_command,
+    parse_commands,
+    resolve_command_conflicts,
+)
+from src.llm.mcp_controller import apply_mcp_commands_to_simulation
+from src.llm.mcp_http_server import MCPHttpServer
+from src.llm.mcp_state import MCPBattleStore, MCPCommand, MCPCommandType
+from src.simulation import Maneuver, ManeuverType
+
+
+def _cmd(command_type, ship_id=None, **parameters):
+    return MCPCommand(command_type, ship_id=ship_id, parameters=parameters)
+
+
+class TestValidation:
+    """parse_command / parse_commands against the compiled schema."""
+
+    def test_valid_commands(self):
+        command = parse_command({
+            "command_type": "set_maneuver",
+            "ship_id": "alpha_1",
+            "parameters": {"maneuver_type": "INTERCEPT", "throttle": 1, "target_id": None, "extra": [1]},
+            "timestamp": 30,
+        })
+        assert command.command_type == MCPCommandType.SET_MANEUVER
+        assert command.parameters["extra"] == [1]  # Unknown parameters pass through
+        assert parse_command({"command_type": "surrender"}).ship_id is None
+        assert parse_command({"command_type": "set_weapons_order", "ship_id": "a", "parameters": None}).parameters == {}
+
+    @pytest.mark.parametrize("data, message", [
+        ({"command_type": "warp"}, "not a valid MCPCommandType"),
+        ({"command_type": ["set_maneuver"]}, "not a valid MCPCommandType"),
+        ("surrender", "must be an object"),
+        ({"command_type": "set_radiators", "parameters": {"extend": True}}, "needs a ship_id"),
+        ({"command_type": "set_maneuver", "ship_id": "a", "parameters": {"maneuver_type": "EVADE"}}, "Invalid maneuver_type"),
+        ({"command_type": "set_maneuver", "ship_id": "a", "parameters": {"throttle": 1.5}}, "<= 1.0"),
+        ({"command_type": "set_maneuver", "ship_id": "a", "parameters": {"throttle": True}}, "must be int/float"),
+        ({"command_type": "set_weapons_order", "ship_id": "a", "parameters": {"spinal_mode": "FIRE"}}, "Invalid spinal_mode"),
+        ({"command_type": "set_radiators", "ship_id": "a", "parameters": {"extend": "yes"}}, "must be bool"),
+        ({"command_type": "send_message", "parameters": []}, "parameters must be an object"),
+        ({"command_type": "ready", "timestamp": "now"}, "timestamp must be a number"),
+    ])
+    def test_rejected(self, data, message):
+        with pytest.raises(CommandValidationError, match=message):
+            parse_command(data)
+
+    def test_batch_keeps_valid_commands(self):
+        commands, errors = parse_commands([
+            {"command_type": "set_primary_target", "ship_id": "a", "parameters": {"target_id": "b"}},
+            {"command_type": "launch_nukes"},
+            {"command_type": "propose_draw", "parameters": {"accept": True}},
+        ])
+        assert [c.command_type for c in commands] == [MCPCommandType.SET_PRIMARY_TARGET, MCPCommandType.PROPOSE_DRAW]
+        assert errors == [{"command_type": "launch_nukes", "error": "'launch_nukes' is not a valid MCPCommandType"}]
+
+    def test_server_queues_batch(self):
+        store = MCPBattleStore("v")
+        reply = MCPHttpServer()._accept_commands(store, "beta", [
+            {"command_type": "set_maneuver", "ship_id": "b1", "parameters": {"maneuver_type": "BRAKE"}},
+            {"command_type": "set_maneuver", "ship_id": "b1", "parameters": {"maneuver_type": "SPIN"}},
+        ])
+        assert reply["accepted"] == 1 and len(reply["errors"]) == 1 and reply["validate_ms"] >= 0
+        assert [c.parameters["maneuver_type"] for c in store.get_pending_commands("beta")] == ["BRAKE"]
+
+
+class TestQueue:
+    """Per-faction command queues without a lock."""
+
+    def test_concurrent_producers_lose_nothing(self):
+        store = MCPBattleStore("q")
+        producers, per_producer = 4, 2000
+        drained = []
+        done = threading.Event()
+
+        def produce(p):
+            for i in range(0, per_producer, 4):
+                store.add_commands("alpha", [_cmd(MCPCommandType.READY, ship_id=f"{p}-{i + k}") for k in range(4)])
+
+        def consume():
+            while not done.is_set():
+                drained.extend(store.get_pending_commands("alpha"))
+            drained.extend(store.get_pending_commands("alpha"))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        consumer.join()
+
+        ids = [c.ship_id for c in drained]
+        assert len(ids) == len(set(ids)) == producers * per_producer
+        # Each producer's batches arrive in order
+        for p in range(producers):
+            mine = [int(i.split("-")[1]) for i in ids if i.startswith(f"{p}-")]
+            assert mine == sorted(mine)
+        assert store.peek_pending_commands("alpha") == []
+
+
+class TestBatchApplication:
+    """Conflict resolution and apply_mcp_commands_to_simulation."""
+
+    def test_conflicts_resolved_once(self):
+        batch, superseded = resolve_command_conflicts([
+            _cmd(MCPCommandType.SET_WEAPONS_ORDER, "a1", spinal_mode="HOLD_FIRE", turret_mode=None),
+            _cmd(MCPCommandType.SET_MANEUVER, "a1", maneuver_type="BURN"),
+            _cmd(MCPCommandType.SEND_MESSAGE, content="hi"),
+            _cmd(MCPCommandType.SET_PRIMARY_TARGET, "a1", target_id="b1"),
+            _cmd(MCPCommandType.LAUNCH_TORPEDO, "a1", target_id="b1"),
+            _cmd(MCPCommandType.SET_MANEUVER, "a2", maneuver_type="BRAKE"),
+            _cmd(MCPCommandType.SET_WEAPONS_ORDER, "a1", spinal_mode=None, turret_mode="FREE_FIRE"),
+            _cmd(MCPCommandType.SET_MANEUVER, "a1", maneuver_type="EVASIVE"),
+            _cmd(MCPCommandType.LAUNCH_TORPEDO, "a1", target_id="b2"),
+        ])
+        assert superseded == 2
+        assert [(c.command_type, c.ship_id) for c in batch] == [
+            (MCPCommandType.SET_PRIMARY_TARGET, "a1"),
+            (MCPCommandType.SET_WEAPONS_ORDER, "a1"),
+            (MCPCommandType.SET_MANEUVER, "a1"),
+            (MCPCommandType.SET_MANEUVER, "a2"),
+            (MCPCommandType.LAUNCH_TORPEDO, "a1"),
+            (MCPCommandType.LAUNCH_TORPEDO, "a1"),
+        ]
+        assert batch[1].parameters == {"spinal_mode": "HOLD_FIRE", "turret_mode": "FREE_FIRE"}
+        assert batch[2].parameters == {"maneuver_type": "EVASIVE"}
+
+    def test_apply_batch(self):
+        ship = SimpleNamespace(primary_target_id=None, weapons={}, thermal_system=None, radiators_extended=False)
+        looked_up, injected = [], []
+
+        def get_ship(ship_id):
+            looked_up.append(ship_id)
+            return ship if ship_id == "a1" else None
+
+        simulation = SimpleNamespace(
+            current_time=60.0,
+            get_ship=get_ship,
+            inject_command=lambda ship_id, command: injected.append((ship_id, command)),
+        )
+        results = apply_mcp_commands_to_simulation([
+            _cmd(MCPCommandType.SET_MANEUVER, "a1", maneuver_type="BURN"),
+            _cmd(MCPCommandType.SET_MANEUVER, "a1", maneuver_type="INTERCEPT", target_id="b1"),
+            _cmd(MCPCommandType.SET_PRIMARY_TARGET, "a1", target_id="b1"),
+            _cmd(MCPCommandType.SET_RADIATORS, "a1", extend=True),
+            _cmd(MCPCommandType.SET_RADIATORS, "ghost", extend=True),
+        ], simulation, "alpha")
+
+        assert [r["command"] for r in results["applied"]] == ["set_primary_target", "set_maneuver", "set_radiators"]
+        assert results["errors"] == [{"command": "set_radiators", "ship_id": "ghost", "error": "Ship not found"}]
+        assert results["superseded"] == 1 and results["apply_ms"] >= 0
+        assert sorted(looked_up) == ["a1", "ghost"]  # One lookup per ship
+
+        [(ship_id, maneuver)] = injected
+        assert isinstance(maneuver, Maneuver) and maneuver.maneuver_type == ManeuverType.INTERCEPT
+        assert ship.primary_target_id == "b1" and ship.radiators_extended
@@ -0,0 +1,29 @@
+"""
+Tests for the offline MCP load-test harness.
+"""
+
+import json
+
+from src.llm.mcp_load_test import LoadTestConfig, run_load_test
+
+
+def test_load_test_reports_every_endpoint():
+    config = LoadTestConfig(battles=2, checkpoints=2, ships_per_side=1, decision_interval_s=5, observers_per_battle=1)
+    report = run_load_test(config)
+
+    assert report.checkpoints == 4
+    assert set(report.endpoints) == {
+        "GET /status", "GET /state/{faction}", "POST /commands/{faction}", "POST /ready/{faction}",
+    }
+    # One command batch and one ready signal per commander per checkpoint
+    assert report.endpoints["POST /ready/{faction}"].requests == 2 * 2 * 2
+    assert report.endpoints["POST /commands/{faction}"].requests == 2 * 2 * 2
+    assert all(stats.errors == 0 for stats in report.endpoints.values())
+    assert report.server_requests == report.requests
+    for stats in report.endpoints.values():
+        assert 0 < stats.p50_ms <= stats.p99_ms <= stats.max_ms
+    assert report.server_cpu_s > 0
+
+    text = report.format()
+    assert "p99 ms" in text and "POST /ready/{faction}" in text
+    assert json.loads(json.dumps(report.to_dict()))["config"]["battles"] == 2
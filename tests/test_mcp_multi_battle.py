@@ -0,0 +1,243 @@
+"""
+Tests for hosting many MCP battles on one HTTP server.
+"""
+
+import asyncio
+import contextlib
+import io
+import time
+
+import httpx
+import pytest
+
+from src.llm.battle_runner import load_fleet_data
+from src.llm.mcp_controller import MCPController, MCPControllerConfig
+from src.llm.mcp_http_server import MCPHttpServer, run_fleet_battle_with_http
+from src.llm.mcp_state import (
+    DEFAULT_BATTLE_ID,
+    MCPBattleState,
+    MCPCommand,
+    MCPCommandType,
+    MCPHttpClient,
+    get_mcp_state,
+)
+from tests.helpers import free_port
+
+pytestmark = pytest.mark.usefixtures("fresh_mcp_state")
+
+
+@contextlib.asynccontextmanager
+async def _serving(**kwargs):
+    server = MCPHttpServer(host="127.0.0.1", port=free_port(), **kwargs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        await server.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.port}"
+    finally:
+        await server.stop()
+
+
+async def _play(client: MCPHttpClient, orders_per_turn: int = 2) -> int:
+    """MCP client: answer every checkpoint until the battle ends."""
+    handled = 0
+    try:
+        while True:
+            status = await client.get_status()
+            if status["status"] == "ended":
+                return handled
+            if status["checkpoint"] > handled and client.faction in status["waiting_for"]:
+                handled = status["checkpoint"]
+                state = await client.get_state_dict()
+                ship_id = state["friendly_ships"][0]["ship_id"] if state["friendly_ships"] else None
+                await client.send_commands([
+                    MCPCommand(
+                        MCPCommandType.SET_MANEUVER,
+                        ship_id=ship_id,
+                        parameters={"maneuver_type": "EVASIVE", "checkpoint": handled, "order": k},
+                    )
+                    for k in range(orders_per_turn)
+                ])
+                await client.signal_ready()
+            await asyncio.sleep(0.005)
+    finally:
+        await client.close()
+
+
+class TestBattleRegistry:
+    """Per-battle stores in the shared state."""
+
+    def test_battles_are_isolated(self):
+        shared = get_mcp_state()
+        assert shared.battle() is shared
+        one = shared.create_battle("one")
+        two = shared.create_battle()
+
+        one.register_faction("alpha")
+        one.add_command("alpha", MCPCommand(MCPCommandType.SURRENDER))
+        one.update_state("alpha", MCPBattleState(faction="alpha", checkpoint_number=4))
+
+        assert two.peek_pending_commands("alpha") == []
+        assert shared.peek_pending_commands("alpha") == []
+        assert shared.get_state("alpha").checkpoint_number == 0
+        assert one.get_state("alpha").checkpoint_number == 4
+        assert not shared.is_faction_active("alpha")
+        assert sorted(shared.battle_ids()) == sorted([DEFAULT_BATTLE_ID, "one", two.battle_id])
+
+        with pytest.raises(ValueError):
+            shared.create_battle("one")
+        assert shared.get_or_create_battle("one") is one
+
+    def test_lifecycle_cleanup(self):
+        shared = get_mcp_state()
+        ended = shared.create_battle("ended")
+        running = shared.create_battle("running")
+        ended.set_status("ended", checkpoint=3)
+        running.set_status("paused", checkpoint=3)
+        ended.last_active = running.last_active = time.monotonic() - 60
+
+        assert shared.remove_idle_battles(30) == ["ended"]
+        assert shared.battle("ended") is None
+        assert shared.battle("running") is running
+
+        assert not shared.remove_battle(DEFAULT_BATTLE_ID)
+        assert shared.remove_battle("running")
+        assert shared.battle_ids() == [DEFAULT_BATTLE_ID]
+
+    def test_controller_uses_its_battle(self):
+        controller = MCPController(MCPControllerConfig(faction="beta", battle_id="b7"), fleet_data={})
+        store = get_mcp_state().battle("b7")
+
+        assert store.is_faction_active("beta")
+        assert not get_mcp_state().is_faction_active("beta")
+        controller._state.add_command("beta", MCPCommand(MCPCommandType.SURRENDER))
+        assert len(store.peek_pending_commands("beta")) == 1
+
+
+class TestHttpRoutes:
+    """Battle-scoped and default routes."""
+
+    def test_routes(self):
+        async def run():
+            async with _serving() as (server, url):
+                async with httpx.AsyncClient(base_url=url) as http:
+                    created = await http.post("/battles", json={"battle_id": "b1"})
+                    assert created.status_code == 201 and created.json()["battle_id"] == "b1"
+                    assert (await http.post("/battles", json={"battle_id": "b1"})).status_code == 409
+                    generated = (await http.post("/battles")).json()["battle_id"]
+
+                    b1 = MCPHttpClient(url, "alpha", battle_id="b1")
+                    legacy = MCPHttpClient(url, "alpha")
+                    await b1.send_command(MCPCommand(MCPCommandType.SURRENDER))
+                    await b1.signal_ready()
+                    await legacy.get_state_dict()
+
+                    shared = get_mcp_state()
+                    assert len(shared.battle("b1").peek_pending_commands("alpha")) == 1
+                    assert shared.peek_pending_commands("alpha") == []
+                    assert (await b1.get_status())["connected_factions"] == []
+                    assert (await legacy.get_status())["connected_factions"] == ["alpha"]
+
+                    listed = (await http.get("/battles")).json()["battles"]
+                    assert {b["battle_id"] for b in listed} == {DEFAULT_BATTLE_ID, "b1", generated}
+
+                    assert (await http.get("/battles/nope/state/alpha")).status_code == 404
+                    assert (await http.get("/battles/b1/state/gamma")).status_code == 400
+                    assert (await http.delete(f"/battles/{generated}")).status_code == 200
+                    assert (await http.delete(f"/battles/{generated}")).status_code == 404
+                    assert (await http.delete(f"/battles/{DEFAULT_BATTLE_ID}")).status_code == 400
+                    await b1.close()
+                    await legacy.close()
+
+        asyncio.run(run())
+
+    def test_idle_battles_are_reaped(self):
+        async def run():
+            async with _serving(battle_idle_timeout_s=0.1) as (server, url):
+                server.create_battle("done").set_status("ended")
+                server.create_battle("live").set_status("paused", checkpoint=1)
+                await asyncio.sleep(0.4)
+                return get_mcp_state().battle_ids()
+
+        assert sorted(asyncio.run(run())) == [DEFAULT_BATTLE_ID, "live"]
+
+
+class TestManyBattles:
+    """Load: many battles driven against one server at once."""
+
+    BATTLES = 32
+    CHECKPOINTS = 3
+
+    def test_concurrent_battles_stay_isolated(self):
+        received = {}
+
+        async def drive(server, battle_id):
+            """Battle side: publish state, wait for both factions, collect orders."""
+            store = server.create_battle(battle_id)
+            store.set_event_loop(asyncio.get_running_loop())
+            for faction in ("alpha", "beta"):
+                store.register_faction(faction)
+            for checkpoint in range(1, self.CHECKPOINTS + 1):
+                for faction in ("alpha", "beta"):
+                    store.update_state(faction, MCPBattleState(
+                        faction=faction,
+                        checkpoint_number=checkpoint,
+                        friendly_ships=[{"ship_id": f"{battle_id}_{faction}_1"}],
+                    ))
+                    store.clear_ready(faction)
+                server.set_battle_status("paused", checkpoint, ["alpha", "beta"], battle_id=battle_id)
+                await asyncio.gather(*(
+                    store.wait_for_ready(faction, timeout=20) for faction in ("alpha", "beta")
+                ))
+                for faction in ("alpha", "beta"):
+                    received.setdefault((battle_id, faction), []).extend(
+                        store.get_pending_commands(faction)
+                    )
+            server.set_battle_status("ended", self.CHECKPOINTS, battle_id=battle_id)
+
+        async def run():
+            async with _serving() as (server, url):
+                ids = [f"battle_{i:02d}" for i in range(self.BATTLES)]
+                started = time.perf_counter()
+                turns = await asyncio.gather(
+                    *(drive(server, battle_id) for battle_id in ids),
+                    *(
+                        _play(MCPHttpClient(url, faction, battle_id=battle_id))
+                        for battle_id in ids for faction in ("alpha", "beta")
+                    ),
+                )
+                return ids, turns[self.BATTLES:], time.perf_counter() - started
+
+        ids, turns, elapsed = asyncio.run(run())
+
+        assert turns == [self.CHECKPOINTS] * (2 * self.BATTLES)
+        for battle_id in ids:
+            for faction in ("alpha", "beta"):
+                commands = received[(battle_id, faction)]
+                assert len(commands) == 2 * self.CHECKPOINTS
+                assert {c.ship_id for c in commands} == {f"{battle_id}_{faction}_1"}
+                assert [c.parameters["checkpoint"] for c in commands] == [1, 1, 2, 2, 3, 3]
+        assert elapsed < 20
+
+    def test_runner_battles_share_one_server(self, tmp_path, make_fleet_runner):
+        def runner(battle_id):
+            return make_fleet_runner(1, model="dummy", mcp=True, max_checkpoints=2, seed=5, mcp_battle_id=battle_id)
+
+        async def run():
+            async with _serving() as (server, url):
+                ids = ["r1", "r2", "r3"]
+                for battle_id in ids:
+                    server.create_battle(battle_id)
+                fleet_data = load_fleet_data()
+                return await asyncio.gather(
+                    *(run_fleet_battle_with_http(runner(b), fleet_data, server) for b in ids),
+                    *(_play(MCPHttpClient(url, f, battle_id=b), 1) for b in ids for f in ("alpha", "beta")),
+                )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            outcome = asyncio.run(run())
+
+        results, turns = outcome[:3], outcome[3:]
+        assert [r.checkpoints_used for r in results] == [2, 2, 2]
+        assert turns == [2] * 6
+        for battle_id in ("r1", "r2", "r3"):
+            assert get_mcp_state().battle(battle_id).status == "ended"
@@ -0,0 +1,204 @@
+"""
+Tests for push-based MCP state delivery over WebSocket.
+"""
+
+import asyncio
+import contextlib
+import io
+
+import aiohttp
+import pytest
+
+from src.llm.battle_runner import load_fleet_data
+from src.llm.mcp_http_server import MCPHttpServer, run_fleet_battle_with_http
+from src.llm.mcp_server import HttpStateProvider
+from src.llm.mcp_state import (
+    MCPBattleState,
+    MCPCommand,
+    MCPCommandType,
+    MCPStreamClient,
+    get_mcp_state,
+)
+from tests.helpers import free_port
+
+pytestmark = pytest.mark.usefixtures("fresh_mcp_state")
+
+
+@contextlib.asynccontextmanager
+async def _serving():
+    server = MCPHttpServer(host="127.0.0.1", port=free_port())
+    with contextlib.redirect_stdout(io.StringIO()):
+        await server.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.port}"
+    finally:
+        await server.stop()
+
+
+class TestSubscriptions:
+    """State versions and update listeners."""
+
+    def test_versions_and_subscribers(self):
+        store = get_mcp_state().create_battle("subs")
+        seen = []
+        unsubscribe = store.subscribe("alpha", lambda version, state: seen.append((version, state.timestamp)))
+
+        store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=30.0))
+        store.update_state("beta", MCPBattleState(faction="beta", timestamp=30.0))
+        store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=60.0))
+        unsubscribe()
+        store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=90.0))
+
+        assert seen == [(1, 30.0), (2, 60.0)]
+        assert store.get_state_version("alpha") == 3
+        assert store.get_state_version("beta") == 1
+
+
+class TestStream:
+    """The /ws/{faction} channel."""
+
+    def test_push_commands_and_ready(self):
+        async def run():
+            async with _serving() as (server, url):
+                store = server.create_battle("s1")
+                store.set_event_loop(asyncio.get_running_loop())
+                store.register_faction("alpha")
+
+                client = MCPStreamClient(url, "alpha", battle_id="s1")
+                await client.connect()
+                initial = await client.wait_for_state(after_version=-1, timeout=5)
+                assert client.version == 0 and initial["faction"] == "alpha"
+
+                store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=30.0))
+                pushed = await client.wait_for_state(after_version=0, timeout=5)
+                assert pushed["timestamp"] == 30.0 and client.version == 1
+
+                reply = await client.send_commands([
+                    MCPCommand(MCPCommandType.SET_MANEUVER, ship_id="alpha_1", parameters={"maneuver_type": "EVASIVE"}),
+                    MCPCommand(MCPCommandType.SET_RADIATORS, ship_id="alpha_1", parameters={"extend": True}),
+                ])
+                assert reply["type"] == "commands" and reply["accepted"] == 2
+                assert not store.is_ready("alpha")
+                ready = await client.signal_ready()
+                assert ready["type"] == "ready" and ready["battle_id"] == "s1"
+                assert store.is_ready("alpha")
+                assert len(store.get_pending_commands("alpha")) == 2
+                assert store.connected_factions == {"alpha"}
+
+                await client.close()
+                # Closing the stream drops the server's subscription
+                await asyncio.sleep(0.05)
+                assert store._subscribers["alpha"] == []
+
+        asyncio.run(run())
+
+    def test_update_during_initial_push(self):
+        async def run():
+            async with _serving() as (server, url):
+                store = server.create_battle("s2")
+                store.set_event_loop(asyncio.get_running_loop())
+                store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=30.0))
+                encode_state = store.encode_state
+                sent = []
+
+                def publish_while_sending(faction, *args, **kwargs):
+                    # Version 2 arrives after version 1 was encoded for the client
+                    payload = encode_state(faction, *args, **kwargs)
+                    sent.append(payload.version)
+                    if payload.version == 1:
+                        store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=60.0))
+                    return payload
+
+                store.encode_state = publish_while_sending
+                client = MCPStreamClient(url, "alpha", battle_id="s2")
+                await client.connect()
+                try:
+                    pushed = await client.wait_for_state(after_version=1, timeout=5)
+                    assert pushed["timestamp"] == 60.0 and client.version == 2
+                    assert sent == [1, 2]
+                finally:
+                    await client.close()
+
+        asyncio.run(run())
+
+    def test_protocol_errors(self):
+        async def run():
+            async with _serving() as (server, url):
+                async with aiohttp.ClientSession() as session:
+                    with pytest.raises(aiohttp.WSServerHandshakeError):
+                        await session.ws_connect(f"{url}/battles/missing/ws/alpha")
+                    with pytest.raises(aiohttp.WSServerHandshakeError):
+                        await session.ws_connect(f"{url}/ws/gamma")
+
+                    async with session.ws_connect(f"{url}/ws/beta") as ws:
+                        assert (await ws.receive_json())["type"] == "state"
+                        await ws.send_str("not json")
+                        assert (await ws.receive_json()) == {"type": "error", "error": "Invalid JSON"}
+                        await ws.send_json({"type": "launch"})
+                        assert "Unknown message type" in (await ws.receive_json())["error"]
+                        await ws.send_json({"type": "state"})
+                        assert (await ws.receive_json())["type"] == "state"
+
+        asyncio.run(run())
+
+    def test_state_provider_push_mode(self):
+        async def run():
+            async with _serving() as (server, url):
+                shared = get_mcp_state()
+                shared.set_event_loop(asyncio.get_running_loop())
+                shared.update_state("beta", MCPBattleState(faction="beta", timestamp=12.0))
+
+                provider = HttpStateProvider(url, "beta", push=True)
+                try:
+                    assert (await provider.get_state_dict_async())["timestamp"] == 12.0
+                    await provider.send_command_async(MCPCommand(MCPCommandType.SURRENDER))
+                    await provider.signal_ready_async()
+                finally:
+                    await provider.close()
+                return shared
+
+        shared = asyncio.run(run())
+        assert shared.is_ready("beta")
+        assert [c.command_type for c in shared.get_pending_commands("beta")] == [MCPCommandType.SURRENDER]
+
+
+class TestPushedBattle:
+    """A fleet battle driven entirely by pushed state."""
+
+    def test_battle_runs_on_pushed_state(self, make_fleet_runner):
+        runner = make_fleet_runner(1, model="dummy", mcp=True, max_checkpoints=3, seed=2, mcp_battle_id="pushed")
+
+        async def play(client, turns):
+            """Answer each pushed checkpoint state; no polling."""
+            await client.connect()
+            try:
+                seen = 0
+                for _ in range(turns):
+                    state = await client.wait_for_state(after_version=seen, timeout=30)
+                    seen = client.version
+                    ship_id = state["friendly_ships"][0]["ship_id"]
+                    await client.send_commands([
+                        MCPCommand(MCPCommandType.SET_MANEUVER, ship_id=ship_id, parameters={"maneuver_type": "EVASIVE"}),
+                    ])
+                    await client.signal_ready()
+                return seen
+            finally:
+                await client.close()
+
+        async def run():
+            async with _serving() as (server, url):
+                server.create_battle("pushed")
+                clients = [MCPStreamClient(url, f, battle_id="pushed") for f in ("alpha", "beta")]
+                outcome = await asyncio.gather(
+                    run_fleet_battle_with_http(runner, load_fleet_data(), server),
+                    *(play(client, 3) for client in clients),
+                )
+                return outcome, clients
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            (result, *versions), clients = asyncio.run(run())
+
+        assert result.checkpoints_used == 3
+        assert versions == [3, 3]
+        # One pushed state per checkpoint (plus the one sent on connect)
+        assert all(client.states_received <= 4 for client in clients)
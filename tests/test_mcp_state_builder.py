@@ -0,0 +1,93 @@
+"""
+Tests for the incremental MCP state builder (per-battle ship statics,
+damage sections rebuilt after hits, reused per-ship sections).
+"""
+
+import contextlib
+import io
+
+import pytest
+
+from src.llm.mcp_state_codec import diff_state
+
+pytestmark = pytest.mark.usefixtures("fresh_mcp_state")
+
+
+@pytest.fixture
+def runner(make_fleet_runner):
+    return make_fleet_runner(3, mcp=True, distance_km=400, setup=True, seed=3)
+
+
+def _build(runner):
+    return runner.alpha_mcp.build_state_for_mcp(runner.simulation, list(runner.alpha_captains.values()))
+
+
+def _advance(runner, steps=10):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(steps):
+            runner.simulation.step()
+
+
+class TestIncrementalBuilder:
+    """State built across checkpoints of a fleet battle."""
+
+    def test_statics_built_once(self, runner):
+        controller = runner.alpha_mcp
+        first = _build(runner)
+        assert set(controller._ship_statics) == set(runner.simulation.ships)
+
+        controller.fleet_data = {}  # Class specs are not looked up again
+        _advance(runner)
+        second = _build(runner)
+        for before, after in zip(first.friendly_ships + first.enemy_ships, second.friendly_ships + second.enemy_ships):
+            assert after["ship_name"] == before["ship_name"]
+            assert after["max_acceleration_g"] == before["max_acceleration_g"]
+
+    def test_unchanged_sections_reused(self, runner):
+        first = _build(runner)
+        _advance(runner)
+        second = _build(runner)
+
+        for before, after in zip(first.friendly_ships, second.friendly_ships):
+            assert after["armor"] is before["armor"]
+            assert after["weapons"] is before["weapons"]
+            assert after["position_km"] is not before["position_km"]
+        ops = diff_state(first.to_dict(), second.to_dict())
+        assert ops and not any(key in op[1] for op in ops for key in ("armor", "weapons", "ship_name"))
+
+    def test_damage_sections_rebuilt_after_hits(self, runner):
+        controller = runner.alpha_mcp
+        first = _build(runner)
+        friendly_id = first.friendly_ships[0]["ship_id"]
+        enemy_id = first.enemy_ships[0]["ship_id"]
+
+        calls = []
+        for name in ("_build_friendly_damage", "_build_enemy_damage"):
+            build = getattr(controller, name)
+            setattr(controller, name, lambda ship, build=build: calls.append(ship.ship_id) or build(ship))
+        _advance(runner)
+        second = _build(runner)
+        assert calls == []  # No ship took damage
+
+        for ship_id in (friendly_id, enemy_id):
+            ship = runner.simulation.get_ship(ship_id)
+            ship.armor.sections[next(iter(ship.armor.sections))].thickness_cm -= 5.0
+            ship.damage_taken_gj += 2.0
+        third = _build(runner)
+        assert calls == [friendly_id, enemy_id]
+        assert third.friendly_ships[0]["armor"] != second.friendly_ships[0]["armor"]
+        assert third.enemy_ships[0]["armor"] != second.enemy_ships[0]["armor"]
+        assert third.friendly_ships[1]["armor"] is second.friendly_ships[1]["armor"]
+
+    def test_targeted_by(self, runner):
+        sim = runner.simulation
+        friendly = _build(runner).friendly_ships
+        enemies = sim.get_enemy_ships(friendly[0]["ship_id"])
+        for enemy in enemies:
+            enemy.primary_target_id = friendly[1]["ship_id"]
+        enemies[0].primary_target_id = friendly[0]["ship_id"]
+
+        friendly = _build(runner).friendly_ships
+        assert friendly[0]["targeted_by"] == [enemies[0].ship_id]  # Unnamed ships go by their ID
+        assert friendly[1]["targeted_by"] == [e.ship_id for e in enemies[1:]]
+        assert friendly[2]["targeted_by"] == []
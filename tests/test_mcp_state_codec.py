@@ -0,0 +1,191 @@
+"""
+Tests for versioned, delta-encoded and compressed MCP battle state.
+"""
+
+import asyncio
+import contextlib
+import gzip
+import io
+import json
+
+import httpx
+import pytest
+
+from src.llm.mcp_http_server import MCPHttpServer
+from src.llm.mcp_state import (
+    STATE_DELTA_IM,
+    MCPBattleState,
+    MCPHttpClient,
+    MCPStreamClient,
+    get_mcp_state,
+)
+from src.llm.mcp_state_codec import StateEncoder, apply_state_delta, diff_state, encode_json
+from tests.helpers import free_port
+
+pytestmark = pytest.mark.usefixtures("fresh_mcp_state")
+
+
+def _ship(ship_id, x, hull=100.0):
+    return {"ship_id": ship_id, "position": {"x": x, "y": 0.0}, "hull": hull, "weapons": ["spinal", "pd"]}
+
+
+def _state(t, ships, chat=(), projectiles=()):
+    return MCPBattleState(
+        faction="alpha",
+        timestamp=t,
+        friendly_ships=list(ships),
+        projectiles=list(projectiles),
+        chat_history=list(chat),
+    )
+
+
+class TestDelta:
+    """diff_state / apply_state_delta."""
+
+    @pytest.mark.parametrize("old, new", [
+        ({"a": 1, "b": {"c": [1, 2]}}, {"a": 1, "b": {"c": [1, 3]}}),
+        ({"a": 1, "gone": True}, {"a": 2, "new": {"x": None}}),
+        ({"chat": [{"m": "hi"}]}, {"chat": [{"m": "hi"}, {"m": "yo"}, {"m": "!"}]}),
+        ({"p": [1, 2, 3]}, {"p": [3]}),
+        ({"v": 1}, {"v": 1.0}),
+        ({"v": None}, {"v": {"x": 1}}),
+        ([1], {"root": "replaced"}),
+        ({"s": [{"ship_id": "a"}, {"ship_id": "b", "x": 1}]}, {"s": [{"ship_id": "b", "x": 2}]}),
+        ({"s": [{"ship_id": "a"}, {"ship_id": "b"}]}, {"s": [{"ship_id": "a"}, {"ship_id": "c"}, {"ship_id": "d"}]}),
+        ({"s": [{"ship_id": "a"}, {"ship_id": "b"}]}, {"s": [{"ship_id": "b"}, {"ship_id": "a"}, {"ship_id": "c"}]}),
+        ({"s": [{"ship_id": "a"}, {"ship_id": "b"}]}, {"s": [{"ship_id": "b"}, {"ship_id": "a"}]}),
+    ])
+    def test_round_trip(self, old, new):
+        ops = diff_state(old, new)
+        # Ops survive the wire
+        ops = json.loads(json.dumps(ops))
+        result = apply_state_delta(old, ops)
+        assert result == new and type(result) is type(new)
+
+    def test_ops_are_minimal(self):
+        old = _state(30.0, [_ship("a1", 1.0), _ship("a2", 2.0)], chat=[{"m": "hi"}]).to_dict()
+        new = _state(60.0, [_ship("a1", 1.5), _ship("a2", 2.0)], chat=[{"m": "hi"}, {"m": "go"}]).to_dict()
+
+        assert diff_state(old, old) == []
+        assert diff_state(old, new) == [
+            ["s", ["timestamp"], 60.0],
+            ["s", ["friendly_ships", 0, "position", "x"], 1.5],
+            ["a", ["chat_history"], [{"m": "go"}]],
+        ]
+        assert apply_state_delta(old, diff_state(old, new)) == new
+        assert old["friendly_ships"][0]["position"]["x"] == 1.0  # Base untouched
+
+    def test_destroyed_ship_is_deleted_not_resent(self):
+        ships = [_ship(f"a{i}", float(i)) for i in range(4)]
+        old = _state(30.0, ships).to_dict()
+        new = _state(60.0, [ships[0], dict(ships[2], hull=50.0), ships[3]]).to_dict()
+
+        assert diff_state(old, new) == [
+            ["s", ["timestamp"], 60.0],
+            ["d", ["friendly_ships", 1]],
+            ["s", ["friendly_ships", 1, "hull"], 50.0],
+        ]
+        assert apply_state_delta(old, diff_state(old, new)) == new
+
+
+class TestStateEncoder:
+    """Version history and payload cache."""
+
+    def test_cache_and_history(self):
+        encoder = StateEncoder(history=2)
+        calls = []
+
+        class Counting(MCPBattleState):
+            def to_dict(self):
+                calls.append(self.timestamp)
+                return super().to_dict()
+
+        encoder.publish(1, Counting(timestamp=1.0))
+        encoder.publish(2, Counting(timestamp=2.0))
+        full = encoder.encode()
+        assert encoder.encode() is full and not full.is_delta
+        assert json.loads(full.body)["timestamp"] == 2.0
+
+        delta = encoder.encode(since=1)
+        assert delta.is_delta and delta.base_version == 1
+        assert json.loads(delta.body)["ops"] == [["s", ["timestamp"], 2.0]]
+        assert sorted(calls) == [1.0, 2.0]  # Each version converted once
+
+        packed = encoder.encode(since=1, compress=True)
+        assert packed.gzipped and gzip.decompress(packed.body) == delta.body
+
+        encoder.publish(3, Counting(timestamp=3.0))
+        assert not encoder.encode(since=1).is_delta  # Evicted: full state
+        assert encoder.encode(since=2).is_delta
+        assert encoder.encode(since=3).version == 3
+        assert encode_json({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+
+class TestHttpRevalidation:
+    """ETag, delta and gzip negotiation on /state/{faction}."""
+
+    def test_client_tracks_state_with_304_and_deltas(self):
+        ships = [_ship(f"a{i}", float(i)) for i in range(6)]
+        states = [
+            _state(30.0, ships),
+            _state(60.0, [_ship("a0", 9.0)] + ships[1:], chat=[{"m": "hi"}]),
+            _state(90.0, ships[:5], chat=[{"m": "hi"}, {"m": "go"}], projectiles=[{"eta": 3}]),
+        ]
+
+        async def run():
+            server = MCPHttpServer(host="127.0.0.1", port=free_port())
+            with contextlib.redirect_stdout(io.StringIO()):
+                await server.start()
+            url = f"http://127.0.0.1:{server.port}"
+            store = get_mcp_state()
+            client = MCPHttpClient(url, "alpha")
+            statuses = []
+
+            async def on_response(response):
+                statuses.append((response.status_code, response.headers.get("content-encoding")))
+
+            try:
+                (await client._get_client()).event_hooks["response"] = [on_response]
+                for state in states:
+                    store.update_state("alpha", state)
+                    assert await client.get_state_dict() == state.to_dict()
+                    assert await client.get_state_dict() == state.to_dict()
+
+                # A stale or foreign ETag gets the full state
+                async with httpx.AsyncClient() as http:
+                    response = await http.get(
+                        f"{url}/state/alpha",
+                        headers={"If-None-Match": '"other-alpha-1"', "A-IM": STATE_DELTA_IM},
+                    )
+                    assert response.status_code == 200
+                    assert response.headers["ETag"] == store.state_etag("alpha")
+                    plain = await http.get(f"{url}/state/alpha", headers={"Accept-Encoding": "identity"})
+                    assert "content-encoding" not in plain.headers
+                    assert plain.json() == states[-1].to_dict()
+            finally:
+                await client.close()
+                await server.stop()
+            return statuses
+
+        statuses = asyncio.run(run())
+        assert [status for status, _ in statuses] == [200, 304, 226, 304, 226, 304]
+        assert statuses[0][1] == "gzip"
+
+    def test_stream_pushes_shared_encoding(self):
+        async def run():
+            server = MCPHttpServer(host="127.0.0.1", port=free_port())
+            with contextlib.redirect_stdout(io.StringIO()):
+                await server.start()
+            try:
+                get_mcp_state().update_state("alpha", _state(30.0, [_ship("a0", 1.0)]))
+                client = MCPStreamClient(f"http://127.0.0.1:{server.port}", "alpha")
+                await client.connect()
+                try:
+                    return await client.wait_for_state(timeout=5), client.version
+                finally:
+                    await client.close()
+            finally:
+                await server.stop()
+
+        state, version = asyncio.run(run())
+        assert version == 1 and state["friendly_ships"][0]["ship_id"] == "a0"
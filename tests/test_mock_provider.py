@@ -0,0 +1,215 @@
+"""
+Tests for the local mock LLM provider.
+"""
+
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.llm.admiral_tools import ADMIRAL_TOOLS, DISCUSS_WITH_ADMIRAL_TOOL
+from src.llm.client import CaptainClient
+from src.llm.mock_provider import (
+    DEFAULT_TOOL_WEIGHTS,
+    MockLLMProvider,
+    MockProviderConfig,
+    generate_from_schema,
+)
+from src.llm.tools import (
+    PERSONALITY_SELECTION_TOOL,
+    RESPOND_TO_ORDERS_TOOL,
+    TORPEDO_TOOL,
+    get_captain_tools,
+)
+
+
+ALL_TOOLS = (
+    get_captain_tools(has_torpedoes=True)
+    + [TORPEDO_TOOL, PERSONALITY_SELECTION_TOOL, RESPOND_TO_ORDERS_TOOL, DISCUSS_WITH_ADMIRAL_TOOL]
+    + ADMIRAL_TOOLS
+)
+TOOLS_BY_NAME = {tool["function"]["name"]: tool for tool in ALL_TOOLS}
+
+
+def assert_valid(value, schema, path="$"):
+    """Minimal JSON-schema check for the subset used by tool definitions."""
+    if "enum" in schema:
+        assert value in schema["enum"], path
+        return
+    kind = schema.get("type", "object")
+    if kind == "object":
+        assert isinstance(value, dict), path
+        for name in schema.get("required", []):
+            assert name in value, f"{path}.{name} missing"
+        for name, item in value.items():
+            assert name in schema.get("properties", {}), f"{path}.{name} unexpected"
+            assert_valid(item, schema["properties"][name], f"{path}.{name}")
+    elif kind == "string":
+        assert isinstance(value, str), path
+    elif kind in ("number", "integer"):
+        assert isinstance(value, (int, float)) and not isinstance(value, bool), path
+        assert schema.get("minimum", -float("inf")) <= value <= schema.get("maximum", float("inf")), path
+    elif kind == "boolean":
+        assert isinstance(value, bool), path
+    elif kind == "array":
+        assert isinstance(value, list), path
+        for item in value:
+            assert_valid(item, schema.get("items", {}), path + "[]")
+
+
+def _request(tools=None, **extra):
+    payload = {"model": "mock/captain", "messages": [{"role": "user", "content": "orders?"}]}
+    if tools is not None:
+        payload["tools"] = tools
+        payload["tool_choice"] = "auto"
+    payload.update(extra)
+    return payload
+
+
+class TestSchemaGeneration:
+    """Generated arguments match the real tool schemas."""
+
+    @pytest.mark.parametrize("name", sorted(TOOLS_BY_NAME))
+    def test_arguments_validate(self, name):
+        schema = TOOLS_BY_NAME[name]["function"]["parameters"]
+        rng = random.Random(0)
+        for _ in range(50):
+            assert_valid(generate_from_schema(schema, rng), schema)
+
+
+class TestResponses:
+    """Response generation without HTTP."""
+
+    def test_tool_calls_are_schema_valid_and_non_terminal(self):
+        provider = MockLLMProvider(MockProviderConfig(seed=3, latency_median_s=0))
+        try:
+            for _ in range(100):
+                status, body, _, _ = provider.respond(_request(get_captain_tools()))
+                assert status == 200
+                calls = body["choices"][0]["message"]["tool_calls"]
+                assert 1 <= len(calls) <= 3
+                assert len({c["function"]["name"] for c in calls}) == len(calls)
+                for call in calls:
+                    name = call["function"]["name"]
+                    assert DEFAULT_TOOL_WEIGHTS.get(name, 1.0) > 0
+                    assert_valid(
+                        json.loads(call["function"]["arguments"]),
+                        TOOLS_BY_NAME[name]["function"]["parameters"],
+                    )
+        finally:
+            provider.stop()
+
+    def test_single_and_forced_tools(self):
+        provider = MockLLMProvider(MockProviderConfig(seed=1, latency_median_s=0))
+        try:
+            _, body, _, _ = provider.respond(_request([PERSONALITY_SELECTION_TOOL]))
+            names = [c["function"]["name"] for c in body["choices"][0]["message"]["tool_calls"]]
+            assert names == [PERSONALITY_SELECTION_TOOL["function"]["name"]]
+
+            forced = {"type": "function", "function": {"name": "set_radiators"}}
+            _, body, _, _ = provider.respond(_request(get_captain_tools(), tool_choice=forced))
+            names = [c["function"]["name"] for c in body["choices"][0]["message"]["tool_calls"]]
+            assert names == ["set_radiators"]
+        finally:
+            provider.stop()
+
+    def test_plain_completion_and_usage(self):
+        provider = MockLLMProvider(MockProviderConfig(seed=1, completion_tokens=(10, 10)))
+        try:
+            _, body, _, _ = provider.respond(_request())
+            assert body["choices"][0]["message"]["content"]
+            assert "tool_calls" not in body["choices"][0]["message"]
+            usage = body["usage"]
+            assert usage["completion_tokens"] == 10
+            assert usage["total_tokens"] == usage["prompt_tokens"] + 10
+        finally:
+            provider.stop()
+
+    def test_error_injection(self):
+        provider = MockLLMProvider(MockProviderConfig(error_rate=1.0, error_statuses=(429,), retry_after_s=0.25))
+        try:
+            status, _, headers, _ = provider.respond(_request(get_captain_tools()))
+            assert status == 429
+            assert headers["Retry-After"] == "0.25"
+            assert provider.stats.errors == 1
+        finally:
+            provider.stop()
+
+    def test_latency_model(self):
+        config = MockProviderConfig(
+            latency_median_s=0.5, latency_sigma=0.0,
+            latency_per_output_token_s=0.01, completion_tokens=(20, 20),
+        )
+        provider = MockLLMProvider(config)
+        try:
+            _, _, _, delay = provider.respond(_request())
+            assert delay == pytest.approx(0.7)
+        finally:
+            provider.stop()
+
+    def test_seeded_providers_agree(self):
+        bodies = []
+        for _ in range(2):
+            provider = MockLLMProvider(MockProviderConfig(seed=42))
+            try:
+                bodies.append([provider.respond(_request(ADMIRAL_TOOLS))[1] for _ in range(5)])
+            finally:
+                provider.stop()
+        assert bodies[0] == bodies[1]
+
+
+class TestServing:
+    """HTTP serving, in-process and as a subprocess."""
+
+    def test_captain_client_against_provider(self):
+        config = MockProviderConfig(seed=5, latency_median_s=0.01, latency_sigma=0.0)
+        with MockLLMProvider(config) as provider:
+            client = CaptainClient(api_key="mock", base_url=provider.url)
+            sync_calls = client.decide_with_tools([{"role": "user", "content": "go"}], get_captain_tools())
+
+            async def run():
+                try:
+                    return await client.decide_with_tools_async(
+                        [{"role": "user", "content": "go"}], ADMIRAL_TOOLS
+                    )
+                finally:
+                    await client.aclose()
+
+            async_calls = asyncio.run(run())
+            text = client.complete([{"role": "user", "content": "status?"}])
+
+        assert sync_calls and async_calls
+        assert text.content
+        assert provider.stats.requests == 3
+
+    def test_subprocess_mode(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "src.llm.mock_provider", "--port", str(port),
+             "--latency-median", "0", "--seed", "1"],
+            cwd=Path(__file__).parent.parent,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            banner = proc.stdout.readline()
+            assert f":{port}/" in banner
+            response = httpx.post(
+                f"http://127.0.0.1:{port}/v1/chat/completions",
+                json=_request(get_captain_tools()),
+                timeout=5.0,
+            )
+            assert response.status_code == 200
+            assert response.json()["choices"][0]["message"]["tool_calls"]
+        finally:
+            proc.terminate()
+            proc.wait(timeout=5)
@@ -0,0 +1,132 @@
+"""
+Tests for the columnar binary recording format.
+"""
+
+import gzip
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.llm.battle_recorder import BattleRecorder, BattleRecording, create_battle_filename
+from src.llm.recording_codec import (
+    SimTraceColumns,
+    decode_recording,
+    decode_sim_trace,
+    encode_recording,
+    encode_sim_trace,
+    load_recording,
+)
+
+BUNDLED_RECORDING = Path(__file__).parent.parent / "data" / "recordings" / "battle_mcp_vs_grok_20260116_165007.json"
+
+
+def _ship_input(rng, destroyed=False, armor=True):
+    ship = {
+        "position": tuple(rng.uniform(-3e8, 3e8) for _ in range(3)),
+        "velocity": tuple(rng.uniform(-2e4, 2e4) for _ in range(3)),
+        "forward": tuple(rng.uniform(-1, 1) for _ in range(3)),
+        "thrust": rng.random(),
+        "maneuver": rng.choice(["INTERCEPT", "EVASIVE", "MAINTAIN"]),
+        "is_destroyed": destroyed,
+        "hull_pct": rng.uniform(0, 100),
+    }
+    if armor:
+        ship["armor"] = {"nose": round(rng.uniform(0, 150), 1), "tail": round(rng.uniform(0, 40), 1)}
+    return ship
+
+
+def _munition_input(rng, munition_id, target="alpha_1"):
+    return {
+        "id": munition_id,
+        "position": tuple(rng.uniform(-3e8, 3e8) for _ in range(3)),
+        "velocity": tuple(rng.uniform(-2e4, 2e4) for _ in range(3)),
+        "mass_kg": rng.uniform(10, 90),
+        "source_ship_id": "beta_1",
+        "target_ship_id": target,
+        "pd_engaged": rng.random() < 0.5,
+        "pd_ablation_kg": rng.random() * 5,
+        "dv_remaining_kps": rng.uniform(0, 10),
+        "heat_absorbed_j": rng.uniform(0, 1e6),
+        "is_disabled": rng.random() < 0.2,
+    }
+
+
+def _record(recorder, frames=40, seed=3):
+    """Record a battle where ships, slugs and torpedoes come and go."""
+    rng = random.Random(seed)
+    for index in range(frames):
+        ships = {"alpha_1": _ship_input(rng), "beta_1": _ship_input(rng, destroyed=index > 30, armor=index % 7 != 0)}
+        if index >= 10:
+            ships["beta_2"] = _ship_input(rng)  # Joins late
+        slugs = [_munition_input(rng, f"proj_{n}") for n in range(index // 4, index // 4 + 3)]
+        rng.shuffle(slugs)  # Frame order is not creation order
+        torpedoes = [_munition_input(rng, "torp_1", target=None if index % 2 else "alpha_1")] if 5 <= index < 25 else []
+        recorder.record_sim_frame(index * 1.0 + 0.25, ships, slugs, torpedoes)
+
+
+def _recorder(recording_format="json"):
+    recorder = BattleRecorder(recording_format)
+    recorder._is_recording = True
+    recorder._start_trace()
+    recorder.recording = BattleRecording(battle_name="Columnar", winner="alpha")
+    return recorder
+
+
+class TestSimTraceColumns:
+    """Sim trace frames <-> columns."""
+
+    def test_round_trip(self):
+        recorder = _recorder()
+        _record(recorder)
+        frames = json.loads(json.dumps(recorder.recording.sim_trace))
+
+        header, columns = encode_sim_trace(frames)
+        assert [ship_id for ship_id, _ in header["ships"]] == ["alpha_1", "beta_1", "beta_2"]
+        assert header["ships"][2][1] == 30 and len(header["projectiles"]) == 12
+        assert decode_sim_trace(header, columns) == frames
+
+    def test_incremental_matches_batch(self):
+        recorder = _recorder()
+        _record(recorder, frames=12)
+        trace = SimTraceColumns()
+        for frame in recorder.recording.sim_trace[:5]:
+            trace.add_frame(frame)
+        assert decode_sim_trace(*trace.encode()) == recorder.recording.sim_trace[:5]
+        for frame in recorder.recording.sim_trace[5:]:
+            trace.add_frame(frame)
+        assert len(trace) == 12
+        assert decode_sim_trace(*trace.encode()) == recorder.recording.sim_trace
+
+    def test_empty(self):
+        assert decode_sim_trace(*encode_sim_trace([])) == []
+
+
+class TestColumnarRecording:
+    """Container and BattleRecorder integration."""
+
+    def test_recorder_formats_load_identically(self, tmp_path):
+        saved = {}
+        for recording_format in ("json", "columnar"):
+            recorder = _recorder(recording_format)
+            _record(recorder)
+            filename = create_battle_filename("a/model-1", "b/model.2", recording_format=recording_format)
+            saved[recording_format] = recorder.save(str(tmp_path / filename))
+
+        assert saved["columnar"].endswith(".rec.gz")
+        assert load_recording(saved["columnar"]) == load_recording(saved["json"])
+        assert list(load_recording(saved["columnar"])) == list(BattleRecording().to_dict())
+
+    def test_bundled_recording(self):
+        data = BUNDLED_RECORDING.read_bytes()
+        recording = json.loads(data)
+        encoded = encode_recording(recording)
+        assert len(encoded) * 10 < len(data)
+        assert decode_recording(encoded) == recording
+
+    def test_rejects_other_data(self):
+        with pytest.raises(ValueError, match="Not a columnar"):
+            decode_recording(gzip.compress(b"\0" * 64))
+        with pytest.raises(ValueError, match="Unknown recording format"):
+            BattleRecorder("xml")
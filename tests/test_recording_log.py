@@ -0,0 +1,203 @@
+"""
+Tests for the streaming, crash-safe recording log.
+"""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm.battle_recorder import BattleRecorder, EventType, create_battle_filename
+from src.llm.recording_codec import load_recording
+from src.llm.recording_log import RecordingLogWriter, read_recording_log
+
+
+def _frame(index):
+    ship = {
+        "pos": [index * 10.5, -3.0, 0.0], "vel": [10.5, 0.0, 0.0], "fwd": [1.0, 0.0, 0.0],
+        "thrust": 0.5, "maneuver": "INTERCEPT", "destroyed": False, "hull": 100.0, "armor": {"nose": 40.0},
+    }
+    slug = {
+        "id": f"proj_{index // 5}", "pos": [1.0, 2.0, float(index)], "vel": [0.0, 0.0, 1.0], "mass_kg": 40.0,
+        "source": "alpha_1", "target": "beta_1", "pd_engaged": False, "pd_damage_kg": 0.0,
+    }
+    return {"t": float(index), "ships": {"alpha_1": ship}, "projectiles": [slug], "torpedoes": []}
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _inputs(frame):
+    """record_sim_frame() arguments that record the frame."""
+    ships = {
+        ship_id: {
+            "position": s["pos"], "velocity": s["vel"], "forward": s["fwd"], "thrust": s["thrust"],
+            "maneuver": s["maneuver"], "is_destroyed": s["destroyed"], "hull_pct": s["hull"], "armor": s["armor"],
+        }
+        for ship_id, s in frame["ships"].items()
+    }
+    projectiles = [
+        {
+            "id": p["id"], "position": p["pos"], "velocity": p["vel"], "mass_kg": p["mass_kg"],
+            "source_ship_id": p["source"], "target_ship_id": p["target"],
+        }
+        for p in frame["projectiles"]
+    ]
+    return frame["t"], ships, projectiles, []
+
+
+class TestRecordingLogWriter:
+    """Segments written in the background, partial logs readable."""
+
+    def test_background_flush_and_partial_read(self, tmp_path):
+        path = tmp_path / "battle.reclog"
+        writer = RecordingLogWriter(str(path), {"battle_name": "Log", "winner": None}, flush_interval_s=0.02)
+        for index in range(30):
+            writer.add_frame(_frame(index))
+        writer.add_event({"timestamp": 1.0, "event_type": "hit", "ship_id": "beta_1", "data": {}})
+
+        _wait_for(lambda: writer.buffered_frames == 0 and writer.segments_written)
+        # The battle "crashes" here: no close(), no END record
+        partial = read_recording_log(path.read_bytes())
+        assert partial["battle_name"] == "Log" and partial["winner"] is None
+        assert partial["sim_trace"] == [_frame(i) for i in range(30)]
+        assert [e["event_type"] for e in partial["events"]] == ["hit"]
+
+        writer.add_frame(_frame(30))
+        writer.close({"battle_name": "Log", "winner": "alpha"})
+        complete = load_recording(str(path))
+        assert complete["winner"] == "alpha" and len(complete["sim_trace"]) == 31
+
+    def test_torn_last_record_is_ignored(self, tmp_path):
+        path = tmp_path / "battle.reclog"
+        writer = RecordingLogWriter(str(path), {"battle_name": "Torn"}, flush_interval_s=60, fsync=False)
+        writer.add_frame(_frame(0))
+        writer.flush()
+        size = path.stat().st_size
+        writer.add_frame(_frame(1))
+        writer.flush()
+
+        data = path.read_bytes()
+        assert [f["t"] for f in read_recording_log(data)["sim_trace"]] == [0.0, 1.0]
+        for cut in (1, 9, len(data) - size - 1):
+            assert [f["t"] for f in read_recording_log(data[:-cut])["sim_trace"]] == [0.0]
+        corrupt = bytearray(data)
+        corrupt[-3] ^= 0xFF
+        assert [f["t"] for f in read_recording_log(bytes(corrupt))["sim_trace"]] == [0.0]
+        writer.close({})
+
+        with pytest.raises(ValueError, match="Not a battle recording log"):
+            read_recording_log(b"AICREC" + bytes(8))
+
+    def test_buffer_stays_bounded(self, tmp_path):
+        writer = RecordingLogWriter(str(tmp_path / "long.reclog"), {}, flush_interval_s=60, segment_frames=50)
+        for index in range(500):
+            writer.add_frame(_frame(index))
+            if index % 50 == 49:
+                # A full segment is written at once, not after the interval
+                _wait_for(lambda: writer.buffered_frames == 0)
+        assert writer.segments_written == 10
+        writer.close({})
+        assert len(load_recording(str(writer.path))["sim_trace"]) == 500
+
+    def test_write_error_stops_buffering(self, tmp_path):
+        writer = RecordingLogWriter(str(tmp_path / "full.reclog"), {}, flush_interval_s=0.01)
+
+        def fail(kind, payload):
+            raise OSError("No space left on device")
+
+        writer._write_record = fail
+        writer.add_frame(_frame(0))
+        _wait_for(lambda: writer.error is not None)
+        with pytest.raises(OSError, match="No space left"):
+            writer.add_frame(_frame(1))
+        with pytest.raises(OSError, match="No space left"):
+            writer.add_event({"event_type": "hit"})
+        assert writer.buffered_frames == 0
+        with pytest.raises(OSError, match="No space left"):
+            writer.close({})
+
+
+class TestStreamingRecorder:
+    """BattleRecorder with recording_format="stream"."""
+
+    @staticmethod
+    def _battle(recorder, frames=40):
+        captain = SimpleNamespace(
+            name="Captain", model="test/model-1", ship_name="TIS Test",
+            personality=SimpleNamespace(value="balanced"),
+        )
+        battle = SimpleNamespace(initial_distance_km=500.0, time_limit_s=1200.0, max_checkpoints=10)
+        recorder.start_recording(battle, captain, captain)
+        for index in range(frames):
+            recorder.record_sim_frame(*_inputs(_frame(index)))
+            if index % 10 == 0:
+                recorder.record_checkpoint(float(index), index // 10, {}, {}, 100.0)
+        result = SimpleNamespace(
+            winner="alpha", reason="destroyed", outcome=SimpleNamespace(value="alpha_victory"),
+            duration_s=float(frames), checkpoints_used=frames // 10,
+        )
+        recorder.end_recording(result, float(frames))
+
+    def test_matches_json_recording(self, tmp_path):
+        saved = {}
+        for recording_format in ("json", "stream"):
+            recorder = BattleRecorder(recording_format, recording_dir=str(tmp_path / "partial"))
+            self._battle(recorder)
+            if recording_format == "stream":
+                # Nothing kept in memory
+                assert recorder.events == [] and recorder.recording.sim_trace == []
+            filename = create_battle_filename("a", "b", recording_format=recording_format)
+            saved[recording_format] = recorder.save(str(tmp_path / filename))
+
+        assert saved["stream"].endswith(".reclog")
+        assert list(Path(tmp_path / "partial").iterdir()) == []  # Renamed, not copied
+        streamed = load_recording(saved["stream"])
+        recorded = load_recording(saved["json"])
+        assert [e["event_type"] for e in streamed["events"]][-1] == EventType.BATTLE_END
+        assert {**streamed, "recorded_at": None} == {**recorded, "recorded_at": None}
+
+    def test_reused_recorder_finishes_previous_log(self, tmp_path):
+        recorder = BattleRecorder("stream", recording_dir=str(tmp_path))
+        captain = SimpleNamespace(
+            name="Captain", model="test/model-1", ship_name="TIS Test",
+            personality=SimpleNamespace(value="balanced"),
+        )
+        battle = SimpleNamespace(initial_distance_km=500.0, time_limit_s=1200.0, max_checkpoints=10)
+        recorder.start_recording(battle, captain, captain)
+        recorder.record_sim_frame(*_inputs(_frame(0)))
+        first = recorder._log.path
+
+        # Started again without end_recording() or save()
+        other = SimpleNamespace(**{**vars(captain), "model": "test/model-2"})
+        recorder.start_recording(battle, other, other)
+
+        assert not first.exists()
+        recording = load_recording(str(first.with_suffix("")))
+        assert recording["alpha_model"] == "test/model-1" and len(recording["sim_trace"]) == 1
+        assert recorder.recording.alpha_model == "test/model-2"
+        recorder._log.close({})
+
+    def test_crashed_battle_is_loadable(self, tmp_path):
+        recorder = BattleRecorder("stream", recording_dir=str(tmp_path))
+        captain = SimpleNamespace(
+            name="Captain", model="test/model-1", ship_name="TIS Test",
+            personality=SimpleNamespace(value="balanced"),
+        )
+        battle = SimpleNamespace(initial_distance_km=500.0, time_limit_s=1200.0, max_checkpoints=10)
+        recorder.start_recording(battle, captain, captain)
+        for index in range(5):
+            recorder.record_sim_frame(*_inputs(_frame(index)))
+        recorder._log.flush()
+
+        [partial] = tmp_path.glob("*.reclog.partial")
+        recording = load_recording(str(partial))
+        assert recording["alpha_model"] == "test/model-1" and recording["winner"] is None
+        assert len(recording["sim_trace"]) == 5
+        assert [e["event_type"] for e in recording["events"]] == [EventType.BATTLE_START]
+        recorder._log.close({})
@@ -0,0 +1,241 @@
+"""
+Tests for the async LLM request pool.
+
+Runs against a local stub HTTP server; no API calls are made.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.llm.client import CaptainClient
+from src.llm.request_pool import (
+    AsyncRequestPool,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+    TokenBucket,
+)
+
+
+COMPLETION = {
+    "model": "stub/model",
+    "choices": [{
+        "message": {
+            "content": "",
+            "tool_calls": [{
+                "id": "call_1",
+                "function": {"name": "set_maneuver", "arguments": '{"maneuver_type": "BRAKE"}'},
+            }],
+        },
+    }],
+}
+
+
+class StubServer:
+    """
+    Local chat-completions stub that plays back a script of responses.
+
+    Each script entry is (status, delay_s, headers); requests past the end
+    of the script get an immediate 200 completion.
+    """
+
+    def __init__(self, script=()):
+        self.script = list(script)
+        self.requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stub._lock:
+                    index = stub.requests
+                    stub.requests += 1
+                status, delay_s, headers = (
+                    stub.script[index] if index < len(stub.script) else (200, 0.0, {})
+                )
+                time.sleep(delay_s)
+                body = json.dumps(COMPLETION if status == 200 else {"error": status}).encode()
+                try:
+                    self.send_response(status)
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Client cancelled (hedge loser)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}/v1/chat/completions"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+FAST_RETRY = RetryPolicy(max_attempts=3, base_delay_s=0.01, max_delay_s=0.05, jitter=0.0)
+
+
+def _post(pool, url, model="stub/model"):
+    async def run():
+        try:
+            return await pool.post_json(url, {}, {"model": model}, model)
+        finally:
+            await pool.aclose()
+    return asyncio.run(run())
+
+
+class TestRetries:
+    """Backoff and retry behaviour."""
+
+    def test_retries_429_then_succeeds(self):
+        with StubServer([(429, 0.0, {"Retry-After": "0"})]) as stub:
+            pool = AsyncRequestPool(retry=FAST_RETRY)
+            data = _post(pool, stub.url)
+
+        assert data["choices"][0]["message"]["tool_calls"][0]["id"] == "call_1"
+        assert stub.requests == 2
+        assert pool.stats.retries == 1
+
+    def test_gives_up_after_max_attempts(self):
+        with StubServer([(503, 0.0, {})] * 5) as stub:
+            pool = AsyncRequestPool(retry=FAST_RETRY)
+            with pytest.raises(httpx.HTTPStatusError):
+                _post(pool, stub.url)
+
+        assert stub.requests == 3
+        assert pool.stats.attempts == 3
+
+    def test_client_errors_are_not_retried(self):
+        with StubServer([(400, 0.0, {})]) as stub:
+            pool = AsyncRequestPool(retry=FAST_RETRY)
+            with pytest.raises(httpx.HTTPStatusError):
+                _post(pool, stub.url)
+
+        assert stub.requests == 1
+
+    def test_connection_errors_are_retried(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        pool = AsyncRequestPool(retry=FAST_RETRY)
+
+        with pytest.raises(httpx.TransportError):
+            _post(pool, f"http://127.0.0.1:{port}/v1/chat/completions")
+        assert pool.stats.attempts == 3
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(base_delay_s=0.5, max_delay_s=3.0, jitter=0.0)
+        assert [policy.delay_for(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+        assert policy.delay_for(1, retry_after_s=10.0) == 3.0
+
+
+class TestRateLimiting:
+    """Token bucket rate limiting."""
+
+    def test_token_bucket_refills_over_time(self):
+        now = [0.0]
+        bucket = TokenBucket(rate_per_s=2.0, capacity=2, clock=lambda: now[0])
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        now[0] = 0.5
+        assert bucket.try_acquire() == 0.0
+
+    def test_pool_spaces_requests_per_model(self):
+        with StubServer() as stub:
+            pool = AsyncRequestPool(requests_per_minute=1200, burst=1)  # 20/s
+
+            async def run():
+                start = time.monotonic()
+                await asyncio.gather(*(
+                    pool.post_json(stub.url, {}, {}, model)
+                    for model in ["a/slow"] * 4 + ["b/other"]
+                ))
+                await pool.aclose()
+                return time.monotonic() - start
+
+            elapsed = asyncio.run(run())
+
+        # Three waits of 50ms on one model; the other model is not delayed
+        assert elapsed >= 0.14
+        assert pool.stats.rate_limit_wait_s == pytest.approx(0.15, abs=0.03)
+
+
+class TestHedging:
+    """Hedged duplicate requests."""
+
+    def test_latency_percentile(self):
+        tracker = LatencyTracker()
+        for latency in range(1, 101):
+            tracker.record(latency / 100)
+        assert tracker.percentile(0.95) == pytest.approx(0.95)
+        assert LatencyTracker().percentile(0.5) is None
+
+    def test_no_hedge_until_enough_samples(self):
+        pool = AsyncRequestPool(hedge=HedgePolicy(enabled=True, min_samples=5))
+        assert pool.hedge_delay("m") is None
+        for _ in range(5):
+            pool.latency_tracker("m").record(0.2)
+        assert pool.hedge_delay("m") == 0.5  # min_delay_s floor
+
+    def test_slow_request_is_hedged(self):
+        with StubServer([(200, 2.0, {})]) as stub:
+            pool = AsyncRequestPool(
+                hedge=HedgePolicy(enabled=True, min_samples=3, min_delay_s=0.05)
+            )
+            for _ in range(3):
+                pool.latency_tracker("stub/model").record(0.01)
+
+            start = time.monotonic()
+            data = _post(pool, stub.url)
+            elapsed = time.monotonic() - start
+
+        assert data["choices"]
+        assert elapsed < 1.0
+        assert pool.stats.hedges_sent == 1
+        assert pool.stats.hedges_won == 1
+
+
+class TestCaptainClientAgainstStub:
+    """CaptainClient async API end to end."""
+
+    def test_decide_with_tools_async(self):
+        with StubServer([(502, 0.0, {})]) as stub:
+            client = CaptainClient(api_key="test", retry_policy=FAST_RETRY)
+            client.BASE_URL = stub.url
+
+            async def run():
+                try:
+                    return await client.decide_with_tools_async(
+                        [{"role": "user", "content": "orders?"}], []
+                    )
+                finally:
+                    await client.aclose()
+
+            tool_calls = asyncio.run(run())
+
+        assert [tc.name for tc in tool_calls] == ["set_maneuver"]
+        assert tool_calls[0].arguments == {"maneuver_type": "BRAKE"}
+        assert client.pool.stats.retries == 1
@@ -0,0 +1,153 @@
+"""
+Tests for the content-addressed LLM response cache and replay mode.
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from src.llm.client import CaptainClient
+from src.llm.response_cache import CacheMissError, CacheMode, ResponseCache
+
+
+def _payload(content="orders?", **overrides):
+    payload = {
+        "model": "anthropic/claude-3.5-sonnet",
+        "messages": [{"role": "user", "content": content}],
+        "tools": [{"type": "function", "function": {"name": "set_maneuver"}}],
+        "tool_choice": "auto",
+        "temperature": 0.7,
+        "max_tokens": 1024,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _completion(tool_name="set_maneuver"):
+    return {
+        "model": "anthropic/claude-3.5-sonnet",
+        "choices": [{
+            "message": {
+                "content": "",
+                "tool_calls": [{
+                    "id": "call_1",
+                    "function": {"name": tool_name, "arguments": '{"maneuver_type": "BRAKE"}'},
+                }],
+            },
+        }],
+    }
+
+
+class TestCacheKey:
+    """Content addressing."""
+
+    def test_key_ignores_dict_order_and_unkeyed_fields(self):
+        a = _payload()
+        b = dict(reversed(list(_payload(max_tokens=10, tool_choice="none").items())))
+        assert ResponseCache.key_for(a) == ResponseCache.key_for(b)
+
+    def test_key_changes_with_keyed_fields(self):
+        base = ResponseCache.key_for(_payload())
+        assert ResponseCache.key_for(_payload("hold?")) != base
+        assert ResponseCache.key_for(_payload(temperature=0.0)) != base
+        assert ResponseCache.key_for(_payload(model="openai/gpt-4o")) != base
+        assert ResponseCache.key_for(_payload(tools=[])) != base
+
+
+class TestResponseCache:
+    """On-disk store, eviction and replay."""
+
+    def test_round_trip_and_persistence(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        assert cache.lookup(_payload()) is None
+        cache.store(_payload(), _completion())
+
+        assert cache.lookup(_payload()) == _completion()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        reopened = ResponseCache(str(tmp_path))
+        assert reopened.total_bytes == cache.total_bytes > 0
+        assert reopened.lookup(_payload()) == _completion()
+
+    def test_replay_miss_raises(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), mode=CacheMode.REPLAY)
+        with pytest.raises(CacheMissError):
+            cache.lookup(_payload())
+        cache.store(_payload(), _completion())
+        assert cache.total_bytes == 0
+
+    def test_lru_eviction(self, tmp_path):
+        entry_size = len(json.dumps(_completion(), separators=(",", ":")))
+        cache = ResponseCache(str(tmp_path), max_bytes=entry_size * 3)
+
+        for i in range(3):
+            cache.store(_payload(f"q{i}"), _completion())
+        # Age all entries, then use q0 so q1 becomes least recently used
+        for path in tmp_path.glob("??/*.json"):
+            os.utime(path, (time.time() - 100, time.time() - 100))
+        cache.lookup(_payload("q0"))
+
+        cache.store(_payload("q3"), _completion())
+
+        assert cache.total_bytes <= cache.max_bytes
+        assert cache.lookup(_payload("q1")) is None
+        for kept in ("q0", "q2", "q3"):
+            assert cache.lookup(_payload(kept)) is not None
+
+    def test_clear(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        cache.store(_payload(), _completion())
+        cache.clear()
+        assert cache.total_bytes == 0
+        assert cache.lookup(_payload()) is None
+
+
+class TestClientReplay:
+    """CaptainClient record and replay."""
+
+    def _recording_client(self, tmp_path, calls):
+        def handler(request):
+            calls.append(json.loads(request.content))
+            return httpx.Response(200, json=_completion())
+
+        client = CaptainClient(api_key="test", cache=ResponseCache(str(tmp_path)))
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_record_then_replay_offline(self, tmp_path):
+        calls = []
+        messages = [{"role": "user", "content": "orders?"}]
+        recorder = self._recording_client(tmp_path, calls)
+
+        first = recorder.decide_with_tools(messages, [])
+        again = recorder.decide_with_tools(messages, [])
+        assert len(calls) == 1
+        assert first == again
+
+        # Replay needs no API key and never touches the network
+        replay = CaptainClient(cache=ResponseCache(str(tmp_path), mode=CacheMode.REPLAY))
+        replay._client = None
+        assert replay.decide_with_tools(messages, []) == first
+
+    def test_replay_miss_is_not_swallowed(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        replay = CaptainClient(cache=ResponseCache(str(tmp_path), mode=CacheMode.REPLAY))
+
+        with pytest.raises(CacheMissError):
+            replay.decide_with_tools([{"role": "user", "content": "new"}], [])
+        with pytest.raises(CacheMissError):
+            asyncio.run(replay.decide_with_tools_async([{"role": "user", "content": "new"}], []))
+
+    def test_async_path_shares_cache(self, tmp_path):
+        calls = []
+        messages = [{"role": "user", "content": "orders?"}]
+        recorder = self._recording_client(tmp_path, calls)
+        recorder.decide_with_tools(messages, [])
+
+        replay = CaptainClient(cache=ResponseCache(str(tmp_path), mode=CacheMode.REPLAY))
+        tool_calls = asyncio.run(replay.decide_with_tools_async(messages, []))
+        assert [tc.name for tc in tool_calls] == ["set_maneuver"]
@@ -0,0 +1,143 @@
+"""
+Tests for the vectorized, cached ASCII tactical map.
+"""
+
+import random
+
+import pytest
+
+from src.llm.mcp_server import SharedStateProvider, generate_battle_plot
+from src.llm.mcp_state import MCPBattleState, MCPSharedState
+from src.llm.tactical_map import (
+    GRID_WIDTH,
+    TacticalMap,
+    TacticalMapCache,
+    get_velocity_arrow,
+)
+
+pytestmark = pytest.mark.usefixtures("fresh_mcp_state")
+
+
+def _ship(ship_id, pos, vel=(0, 0, 0), name=None, hull=None):
+    ship = {
+        "ship_id": ship_id,
+        "ship_name": name or ship_id,
+        "position_km": dict(zip("xyz", pos)),
+        "velocity_vector": dict(zip("xyz", vel)),
+    }
+    if hull is not None:
+        ship["hull_integrity"] = hull
+    return ship
+
+
+def _duel(**extra):
+    return {
+        "timestamp": 120.0,
+        "friendly_ships": [_ship("a1", (0, 0, 0), (2, 0, 0), name="Resolute", hull=87.5)],
+        "enemy_ships": [_ship("b1", (300, 0, 40), (-2, 0, -2), name="Harrier")],
+        **extra,
+    }
+
+
+def _grid_rows(plot):
+    return [line[2:-2] for line in plot.split("\n")[3:23]]
+
+
+class TestTacticalMap:
+    """Geometry and rendering."""
+
+    def test_duel_layout(self):
+        plot = generate_battle_plot(_duel(), "alpha", "xz")
+        lines = plot.split("\n")
+        assert lines[1] == "║  TACTICAL MAP - T=120s  (X/Z plane (Y ignored))              ║"
+
+        rows = _grid_rows(plot)
+        assert len(rows) == 20 and all(len(row) == GRID_WIDTH for row in rows)
+        assert rows[1].index("[B1]") == 53
+        assert rows[8].index("[A1]") == 3
+        assert "║  →[A1] Resolute        (88%)                                 ║" in lines
+        assert "║  ↙[B1] Harrier         (enemy)                               ║" in lines
+        assert "║  [A1] → [B1]: 302.7 km                                       ║" in lines
+        assert "Scale: 1 char ≈ 6.0km" in plot
+
+    def test_arrows_match_scalar_rule(self):
+        rng = random.Random(5)
+        ships = [
+            _ship(f"s{i}", (i, -i, 0), (rng.choice([0.05, -1, 0, 3]), rng.uniform(-3, 3), rng.uniform(-3, 3)))
+            for i in range(40)
+        ]
+        state = {"friendly_ships": ships[:20], "enemy_ships": ships[20:]}
+        tactical = TacticalMap(state, "beta")
+        for p, (h, v) in enumerate([("x", "y"), ("x", "z"), ("y", "z")]):
+            expected = [get_velocity_arrow(s["velocity_vector"][h], s["velocity_vector"][v]) for s in ships]
+            assert tactical.arrows[p].tolist() == expected
+
+    def test_later_markers_overwrite_earlier(self):
+        state = {"friendly_ships": [_ship("a1", (0, 0, 0)), _ship("a2", (0.5, 0, 0))]}
+        rows = _grid_rows(generate_battle_plot(state, "alpha"))
+        assert "[A2]" in rows[10] and "[A1]" not in rows[10]
+
+    def test_tracks(self):
+        state = _duel(
+            torpedoes=[{"source_ship": "b1", "target_ship": "a1", "distance_km": 150}],
+            projectiles=[{"source_ship": "a1", "target_ship": "destroyed", "distance_km": 10}],
+        )
+        tactical = TacticalMap(state, "alpha")
+        plain = tactical.render("xy")
+        assert plain == generate_battle_plot(_duel(), "alpha", "xy")
+
+        plot = tactical.render("xy", tracks=True)
+        row = _grid_rows(plot)[1]
+        # Torpedo halfway between the ships, dotted track back to its target
+        assert abs(row.index("T") - 30) <= 1
+        assert set(row[row.index("[A1]") + 4:row.index("T")]) == {"."}
+        assert "MUNITIONS: 0 slugs (*)  1 torpedoes (T)" in plot
+
+    def test_many_munitions(self):
+        state = _duel(projectiles=[
+            {"source_ship": "b1", "target_ship": "a1", "distance_km": d} for d in range(0, 300, 3)
+        ])
+        row = _grid_rows(TacticalMap(state, "alpha").render("xy", tracks=True))[1]
+        assert row.count("*") > 40 and "." not in row
+
+
+class TestTacticalMapCache:
+    """Rendered maps per state version."""
+
+    def test_renders_once_per_version(self):
+        cache = TacticalMapCache(max_states=2)
+        loads = []
+
+        def load(state):
+            def _load():
+                loads.append(state["timestamp"])
+                return state
+            return _load
+
+        first = _duel()
+        plots = {p: cache.render("v1", "alpha", load(first), projection=p) for p in ("xy", "xz", "yz")}
+        assert plots == {p: generate_battle_plot(first, "alpha", p) for p in plots}
+        assert cache.render("v1", "alpha", load(first), projection="xz") is plots["xz"]
+        assert loads == [120.0]  # Geometry built once for all projections
+
+        second = dict(_duel(), timestamp=150.0)
+        cache.render("v2", "alpha", load(second))
+        cache.render("v3", "alpha", load(second))
+        cache.render("v1", "alpha", load(first))  # Evicted
+        assert loads == [120.0, 150.0, 150.0, 120.0]
+
+        assert cache.render(None, "alpha", load(first)) == plots["xy"]
+        assert len(loads) == 5
+
+    def test_shared_state_provider_key(self):
+        provider = SharedStateProvider("alpha")
+        cache = TacticalMapCache()
+        store = MCPSharedState.get_instance()
+
+        def plot():
+            return cache.render(provider.state_key("alpha"), "alpha", lambda: provider.get_state_dict("alpha"))
+
+        store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=30.0, friendly_ships=[_ship("a1", (0, 0, 0))]))
+        assert "T=30s" in plot() and plot() is plot()
+        store.update_state("alpha", MCPBattleState(faction="alpha", timestamp=60.0, friendly_ships=[_ship("a1", (1, 0, 0))]))
+        assert "T=60s" in plot()
@@ -0,0 +1,134 @@
+"""
+Tests for the shared per-checkpoint tactical picture.
+"""
+
+import contextlib
+import io
+import math
+
+import pytest
+
+from src.llm.tactical_picture import NO_ETA_S, TacticalPicture
+
+
+@pytest.fixture
+def runner(make_fleet_runner):
+    return make_fleet_runner(2, admiral="a/b", distance_km=300, setup=True, seed=1)
+
+
+def _fire_volley(sim, steps=5):
+    """Every ship fires both main weapons at an enemy, then the sim advances."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        for ship_id in list(sim.ships):
+            enemy = sim.get_enemy_ships(ship_id)[0]
+            for slot in ("weapon_0", "weapon_1"):
+                sim.inject_command(ship_id, {"type": "fire_at", "weapon_slot": slot, "target_id": enemy.ship_id})
+        for _ in range(steps):
+            sim.step()
+
+
+class TestGeometry:
+    """Pairwise geometry matches per-pair vector math."""
+
+    def test_pairs_match_reference(self, runner):
+        sim = runner.simulation
+        picture = TacticalPicture(sim)
+
+        for a in sim.ships.values():
+            for b in sim.ships.values():
+                if a is b:
+                    continue
+                rel_pos = b.position - a.position
+                rel_vel = b.velocity - a.velocity
+                distance = rel_pos.magnitude
+                direction = rel_pos.normalized()
+                pair = picture.pair(a.ship_id, b.ship_id)
+
+                assert pair.distance_km == pytest.approx(distance / 1000)
+                assert pair.closing_rate_kps == pytest.approx(-rel_vel.dot(direction) / 1000, abs=1e-9)
+                expected_angle = math.degrees(math.acos(max(-1.0, min(1.0, a.forward.dot(direction)))))
+                assert pair.angle_deg == pytest.approx(expected_angle, abs=1e-6)
+                assert pair.relative_position_km["x"] == pytest.approx(rel_pos.x / 1000)
+
+        ship = next(iter(sim.ships.values()))
+        assert picture.ship_speed_kps(ship.ship_id) == pytest.approx(ship.velocity.magnitude / 1000)
+
+    def test_closest(self, runner):
+        sim = runner.simulation
+        picture = TacticalPicture(sim)
+        alpha = sorted(runner.alpha_captains)[0]
+        enemies = [ship.ship_id for ship in sim.get_enemy_ships(alpha)]
+
+        expected = min(enemies, key=lambda e: (sim.get_ship(e).position - sim.get_ship(alpha).position).magnitude)
+        assert picture.closest(alpha, enemies) == expected
+        assert picture.closest(alpha, []) is None
+
+
+class TestThreats:
+    """Batched projectile threat computation."""
+
+    def test_projectile_threats_match_reference(self, runner):
+        sim = runner.simulation
+        _fire_volley(sim)
+        assert sim.projectiles
+        picture = TacticalPicture(sim)
+
+        assert len(picture.projectiles) == len(sim.projectiles)
+        for flight, threat in zip(sim.projectiles, picture.projectiles):
+            target = sim.get_ship(flight.target_ship_id)
+            to_target = target.position - flight.projectile.position
+            approach = flight.projectile.velocity.dot(to_target.normalized())
+
+            assert threat.source_ship_id == flight.source_ship_id
+            assert threat.distance_m == pytest.approx(to_target.magnitude)
+            if approach > 0:
+                assert threat.eta_seconds == pytest.approx(to_target.magnitude / approach)
+            else:
+                assert threat.eta_seconds == NO_ETA_S
+            # Bearing points from the target back to the projectile
+            assert threat.forward_dot == pytest.approx(-target.forward.dot(to_target.normalized()))
+
+    def test_faction_views(self, runner):
+        sim = runner.simulation
+        _fire_volley(sim)
+        picture = TacticalPicture(sim)
+        alpha_ids = list(runner.alpha_captains)
+
+        incoming = picture.projectiles_targeting(alpha_ids)
+        assert incoming
+        assert all(threat.target_ship_id in alpha_ids for threat in incoming)
+        assert len(incoming) + len(picture.projectiles_targeting(runner.beta_captains)) == len(picture.projectiles)
+
+    def test_captain_sees_incoming_projectiles(self, runner):
+        sim = runner.simulation
+        _fire_volley(sim)
+        ship_id, captain = sorted(runner.alpha_captains.items())[0]
+        status = captain._build_tactical_status(sim.get_ship(ship_id), None, sim)
+
+        assert len(status["incoming_projectiles"]) == len(TacticalPicture(sim).projectiles_targeting([ship_id]))
+
+
+class TestSharing:
+    """One picture per checkpoint, rebuilt only when stale."""
+
+    def test_current_reuses_or_rebuilds(self, runner):
+        sim = runner.simulation
+        picture = TacticalPicture(sim)
+        assert TacticalPicture.current(picture, sim) is picture
+        assert TacticalPicture.current(None, sim) is not picture
+
+        _fire_volley(sim, steps=0)  # Launch without advancing time
+        assert TacticalPicture.current(picture, sim) is not picture
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            sim.step()
+        assert TacticalPicture.current(picture, sim) is not picture
+
+    def test_runner_shares_one_picture(self, runner):
+        runner._share_tactical_picture()
+        holders = [runner.alpha_admiral, runner.beta_admiral]
+        holders += list(runner.alpha_captains.values()) + list(runner.beta_captains.values())
+
+        pictures = {id(holder.tactical_picture) for holder in holders}
+        assert len(pictures) == 1
+        assert holders[0].tactical_picture.sim_time == runner.simulation.current_time
@@ -19,6 +19,7 @@ for various engagement geometries.
 import json
 import math
 import random
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -37,6 +38,9 @@ from targeting import (
     LeadCalculator,
     # Targeting System
     TargetingSystem,
+    # Fleet Targeting Engine
+    FleetTargetingEngine,
+    counter_uniforms,
     # Factory functions
     create_basic_targeting_system,
     create_advanced_targeting_system,
@@ -972,6 +976,100 @@ class TestTargetingSystem:
 # INTEGRATION SCENARIOS
 # =============================================================================
 
+class TestFleetTargetingEngine:
+    """Tests for batched multi-ship targeting updates."""
+
+    def _fleet(self, num_ships=3, seed=7):
+        engine = FleetTargetingEngine(seed=seed)
+        for i in range(num_ships):
+            system = create_basic_targeting_system(tracking_bonus=0.1)
+            for t in range(3):
+                system.acquire_target(f"enemy_{t}")
+            engine.add_ship(f"ship_{i}", system)
+        return engine
+
+    def test_matches_per_solution_update_without_ecm(self):
+        """With no effective ECM the batch update matches update_with_ecm_systems."""
+        engine = self._fleet(num_ships=1)
+        reference = create_basic_targeting_system(tracking_bonus=0.1)
+        for t in range(3):
+            reference.acquire_target(f"enemy_{t}")
+        ecm = {
+            "enemy_0": ECMSystem(ecm_strength=0.1),
+            "enemy_1": ECMSystem(ecm_strength=0.05),
+        }
+
+        for _ in range(8):
+            engine.update(0.5, ecm)
+            reference.update_with_ecm_systems(0.5, ecm)
+
+        batched = engine.get_lock_status_summary()["ship_0"]
+        expected = reference.get_lock_status_summary()
+        for target_id, status in expected.items():
+            for field_name, value in status.items():
+                assert batched[target_id][field_name] == pytest.approx(value)
+
+    def test_full_ecm_breaks_every_lock(self):
+        engine = self._fleet()
+        for system in engine.systems.values():
+            system.computer.tracking_bonus = 0.0
+            for solution in system.solutions.values():
+                solution.locked = True
+                solution.lock_progress = 1.0
+        ecm = {f"enemy_{t}": ECMSystem(ecm_strength=1.0, reacquisition_time_s=4.0) for t in range(3)}
+
+        broken = engine.update(1.0, ecm)
+
+        assert set(broken) == {"ship_0", "ship_1", "ship_2"}
+        for status in engine.get_lock_status_summary().values():
+            for track in status.values():
+                assert track["locked"] is False
+                # Cooldown starts at reacquisition time and ticks once this step
+                assert track["cooldown"] == pytest.approx(3.0)
+
+    def test_range_gate_drops_lock(self):
+        engine = self._fleet(num_ships=1)
+        solution = engine.systems["ship_0"].solutions["enemy_0"]
+        solution.locked = True
+        solution.lock_progress = 1.0
+
+        broken = engine.update(
+            1.0, {}, distances_km={("ship_0", "enemy_0"): 1e6, ("ship_0", "enemy_1"): 100.0}
+        )
+
+        assert broken == {"ship_0": {"enemy_0": True}}
+        assert solution.locked is False
+        assert solution.lock_progress == 0.0
+        assert engine.systems["ship_0"].solutions["enemy_1"].lock_progress > 0.0
+
+    def test_reproducible_regardless_of_registration_order(self):
+        ecm = {f"enemy_{t}": ECMSystem(ecm_strength=0.6) for t in range(3)}
+
+        def run(order):
+            engine = FleetTargetingEngine(seed=11)
+            for i in order:
+                system = create_basic_targeting_system(tracking_bonus=0.1)
+                for t in range(3):
+                    system.acquire_target(f"enemy_{t}")
+                engine.add_ship(f"ship_{i}", system)
+            events = []
+            for tick in range(60):
+                for ship_id, targets in engine.update(1.0, ecm).items():
+                    events.extend((tick, ship_id, t) for t in targets)
+            return sorted(events)
+
+        first = run([0, 1, 2])
+        assert first == run([2, 0, 1])
+        assert first  # 50% effective ECM should break something in 60 s
+
+    def test_counter_uniforms_are_stateless(self):
+        keys = np.arange(1000, dtype=np.uint64)
+        draws = counter_uniforms(3, 10, keys)
+        assert np.array_equal(draws[500:], counter_uniforms(3, 10, keys[500:]))
+        assert 0.0 <= draws.min() and draws.max() < 1.0
+        assert not np.array_equal(draws, counter_uniforms(3, 11, keys))
+
+
 class TestIntegrationScenarios:
     """Integration tests for realistic combat scenarios."""
 
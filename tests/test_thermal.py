@@ -22,6 +22,7 @@ from thermal import (
     HeatSink,
     HeatSource,
     ThermalSystem,
+    ThermalCrossing,
     HEAT_GENERATION_RATES,
     RADIATOR_EXTENSION_ANGLE_DEG,
 )
@@ -288,5 +289,104 @@ class TestThermalScenarios:
         assert destroyer_thermal.radiators.total_dissipation_kw == 0.0
 
 
+class TestClosedFormIntegration:
+    """Tests for exact piecewise thermal integration."""
+
+    def test_integrate_matches_small_steps_when_unsaturated(self, fleet_data):
+        stepped = ThermalSystem.from_ship_data(fleet_data["ships"]["destroyer"])
+        exact = ThermalSystem.from_ship_data(fleet_data["ships"]["destroyer"])
+        for system in (stepped, exact):
+            system.heatsink.current_heat_gj = 200.0
+            system.radiators.extend_all()
+            system.set_source_active("engines", True)
+
+        for _ in range(100):
+            stepped.update(dt_seconds=1.0)
+        exact.integrate(dt_seconds=100.0)
+
+        assert exact.heatsink.current_heat_gj == pytest.approx(
+            stepped.heatsink.current_heat_gj
+        )
+
+    def test_integrate_independent_of_step_size(self, destroyer_thermal, fleet_data):
+        other = ThermalSystem.from_ship_data(fleet_data["ships"]["destroyer"])
+        for system in (destroyer_thermal, other):
+            system.heatsink.current_heat_gj = 5.0
+            system.radiators.extend_all()
+
+        destroyer_thermal.integrate(dt_seconds=600.0)
+        for _ in range(60):
+            other.integrate(dt_seconds=10.0)
+
+        assert destroyer_thermal.heatsink.current_heat_gj == pytest.approx(0.0)
+        assert other.heatsink.current_heat_gj == pytest.approx(0.0)
+
+    def test_integrate_saturates_and_reports_overflow(self):
+        system = ThermalSystem(
+            heatsink=HeatSink(capacity_gj=100.0, current_heat_gj=90.0),
+            radiators=RadiatorArray(),
+            heat_sources=[HeatSource("reactor", 1_000_000.0, active=True)],
+        )
+        # 1 GJ/s with no radiators: 10 s to fill, then 20 GJ overflow
+        result = system.integrate(dt_seconds=30.0)
+
+        assert system.heatsink.current_heat_gj == pytest.approx(100.0)
+        assert result["heat_generated_gj"] == pytest.approx(30.0)
+        assert result["heat_overflow_gj"] == pytest.approx(20.0)
+        assert result["heat_dissipated_gj"] == pytest.approx(0.0)
+
+    def test_rising_crossing_times(self):
+        system = ThermalSystem(
+            heatsink=HeatSink(capacity_gj=100.0, current_heat_gj=50.0),
+            radiators=RadiatorArray(),
+            heat_sources=[HeatSource("reactor", 1_000_000.0, active=True)],
+        )
+        result = system.integrate(dt_seconds=60.0)
+
+        crossings = result["crossings"]
+        assert [c.threshold for c in crossings] == ["overheating", "critical"]
+        assert crossings[0].time_s == pytest.approx(30.0)
+        assert crossings[1].time_s == pytest.approx(45.0)
+        assert all(isinstance(c, ThermalCrossing) and c.rising for c in crossings)
+        assert result["is_critical"] is True
+
+    def test_falling_crossing_times(self, fleet_data):
+        thermal_data = fleet_data["ships"]["destroyer"]["thermal"]
+        radiators = RadiatorArray.from_ship_data(thermal_data)
+        radiators.extend_all()
+        system = ThermalSystem(
+            heatsink=HeatSink(capacity_gj=100.0, current_heat_gj=100.0),
+            radiators=radiators,
+        )
+        rate = radiators.total_dissipation_kw / 1_000_000.0
+        result = system.integrate(dt_seconds=1000.0)
+
+        crossings = result["crossings"]
+        assert [c.threshold for c in crossings] == ["critical", "overheating"]
+        assert crossings[0].time_s == pytest.approx(5.0 / rate)
+        assert crossings[1].time_s == pytest.approx(20.0 / rate)
+        assert not any(c.rising for c in crossings)
+        assert result["is_overheating"] is False
+
+    def test_no_crossing_when_already_above(self):
+        system = ThermalSystem(
+            heatsink=HeatSink(capacity_gj=100.0, current_heat_gj=85.0),
+            radiators=RadiatorArray(),
+            heat_sources=[HeatSource("reactor", 100_000.0, active=True)],
+        )
+        result = system.integrate(dt_seconds=10.0)
+        assert result["crossings"] == []
+
+    def test_time_to_threshold(self):
+        system = ThermalSystem(
+            heatsink=HeatSink(capacity_gj=100.0, current_heat_gj=0.0),
+            radiators=RadiatorArray(),
+            heat_sources=[HeatSource("reactor", 2_000_000.0, active=True)],
+        )
+        assert system.time_to_threshold(system.OVERHEAT_THRESHOLD) == pytest.approx(40.0)
+        system.set_source_active("reactor", False)
+        assert system.time_to_threshold(system.OVERHEAT_THRESHOLD) is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
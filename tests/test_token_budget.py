@@ -0,0 +1,198 @@
+"""
+Tests for prompt token accounting, budget compaction and checkpoint metrics.
+"""
+
+import contextlib
+import io
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from src.llm.battle_runner import load_fleet_data
+from src.llm.captain import LLMCaptain, LLMCaptainConfig
+from src.llm.client import CaptainClient, UsageStats
+from src.llm.mock_provider import MockLLMProvider, MockProviderConfig
+from src.llm.prompts import build_admiral_prompt, build_admiral_prompt_with_report
+from src.llm.token_budget import PromptSection, estimate_tokens, fit_to_budget
+
+
+class TestFitToBudget:
+    """Budget enforcement over compactable sections."""
+
+    def test_estimate_rounds_up(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+    def test_no_budget_keeps_everything(self):
+        sections = [PromptSection("a", ["x" * 400, "x" * 40])]
+        report = fit_to_budget(sections, fixed_tokens=100, budget=None, role="captain")
+        assert report.tokens_before == report.tokens_after == 200
+        assert report.compactions == {}
+        assert not report.over_budget
+
+    def test_compacts_in_order_until_it_fits(self):
+        first = PromptSection("first", ["x" * 400, "x" * 200, ""])
+        second = PromptSection("second", ["y" * 400, "y" * 40])
+        report = fit_to_budget([first, second], fixed_tokens=50, budget=140, role="captain")
+
+        # first fully compacted (100 -> 0) before second is touched (100 -> 10)
+        assert report.compactions == {"first": 2, "second": 1}
+        assert report.section_tokens == {"first": 0, "second": 10}
+        assert report.tokens_before == 250
+        assert report.tokens_after == 60
+
+        first = PromptSection("first", ["x" * 400, "x" * 200, ""])
+        second = PromptSection("second", ["y" * 400, "y" * 40])
+        report = fit_to_budget([first, second], fixed_tokens=50, budget=210, role="captain")
+        assert report.compactions == {"first": 1}
+        assert second.level == 0
+
+    def test_reports_when_budget_cannot_be_met(self):
+        report = fit_to_budget([PromptSection("a", ["x" * 80, "x" * 8])], 100, 50, "admiral")
+        assert report.tokens_after == 102
+        assert report.over_budget
+
+
+class TestCaptainCompaction:
+    """Captain history compaction under a token budget."""
+
+    @staticmethod
+    def _captain(budget):
+        captain = LLMCaptain(
+            LLMCaptainConfig(name="Chen", ship_name="Relentless", prompt_token_budget=budget), Mock()
+        )
+        for i in range(20):
+            captain.decision_history.append({
+                "checkpoint": i + 1, "time": 30.0 * (i + 1),
+                "tool_calls": [
+                    {"name": "set_maneuver", "args": {"maneuver_type": "INTERCEPT" if i % 4 else "EVADE"}},
+                    {"name": "set_weapons_order", "args": {"spinal_mode": "FIRE_WHEN_OPTIMAL"}},
+                ],
+                "commands_count": 2,
+            })
+            captain._record_sent_message(f"Message {i} " + "x" * 80, 30.0 * i)
+            captain._record_received_message(f"Reply {i} " + "y" * 80, 30.0 * i + 1)
+            captain.record_shot("spinal", 150.0, -1.5, "HIT" if i % 3 else "MISS", 4.3)
+        return captain
+
+    @staticmethod
+    def _prepare(captain):
+        sim = Mock(current_time=600.0)
+        sim.get_ship.return_value = Mock(is_destroyed=False)
+        sim.get_enemy_ships.return_value = []
+        with patch.object(LLMCaptain, "_build_ship_status", return_value={"hull_integrity": 80}), \
+                patch.object(LLMCaptain, "_build_tactical_status", return_value={"sim_time": 600}):
+            messages, _ = captain._prepare_decision("alpha_1", sim)
+        return "\n".join(m["content"] for m in messages)
+
+    def test_rolling_summaries_of_older_history(self):
+        captain = self._captain(budget=None)
+        prompt = self._prepare(captain)
+        report = captain.last_prompt_report
+
+        assert report.compactions == {}
+        assert abs(report.tokens_after - estimate_tokens(prompt)) <= 2
+        assert "  Earlier (T+30s to T+450s, 15 decisions): weapons x15, INTERCEPT x11, EVADE x4" in prompt
+        assert "  Earlier (T+0s to T+481s): 17 sent, 17 received" in prompt
+
+    def test_budget_compacts_messages_first(self):
+        full = self._captain(budget=None)
+        self._prepare(full)
+        full_tokens = full.last_prompt_report.tokens_after
+        messages_tokens = full.last_prompt_report.section_tokens["message_history"]
+
+        captain = self._captain(budget=full_tokens - messages_tokens // 2)
+        prompt = self._prepare(captain)
+        report = captain.last_prompt_report
+
+        assert set(report.compactions) == {"message_history"}
+        assert report.tokens_after <= report.budget
+        assert report.tokens_after < full_tokens
+        assert "COMMUNICATION LOG:" in prompt  # Summarized, not dropped
+
+    def test_tight_budget_keeps_only_summaries(self):
+        captain = self._captain(budget=1)
+        prompt = self._prepare(captain)
+        report = captain.last_prompt_report
+
+        assert report.compactions == {"message_history": 2, "decision_history": 2, "shot_history": 1}
+        assert report.over_budget
+        assert "  Earlier (T+30s to T+600s, 20 decisions)" in prompt
+        assert "You fired spinal" not in prompt
+        assert "  100-300km: 13/20 hits (65%)" in prompt
+
+        # The next checkpoint's full window is unaffected by the compacted one
+        captain.config.prompt_token_budget = None
+        prompt = self._prepare(captain)
+        assert "  Earlier (T+30s to T+450s, 15 decisions)" in prompt
+
+
+class TestAdmiralCompaction:
+    """Admiral directive prompt compaction under a token budget."""
+
+    @staticmethod
+    def _kwargs():
+        projectiles = [
+            SimpleNamespace(weapon_type="torpedo", source_ship="A", target_ship="B",
+                            distance_km=100.0 + i, eta_seconds=20.0 + i, damage_gj=5.0)
+            for i in range(10)
+        ]
+        snapshot = SimpleNamespace(
+            timestamp=60.0, friendly_ships=[], enemy_ships=[], projectiles=projectiles,
+            fleet_summary="0 ships",
+        )
+        log = [
+            SimpleNamespace(ship_name=f"Ship {i}", sender_name=f"Captain {i}", content="z" * 60)
+            for i in range(8)
+        ]
+        return dict(
+            admiral_name="Vance", faction="alpha", snapshot_t_minus_15=None,
+            snapshot_t_zero=snapshot, personality=None, fleet_data={}, communications_log=log,
+        )
+
+    def test_unbudgeted_prompt_notes_older_chatter(self):
+        prompt, report = build_admiral_prompt_with_report(**self._kwargs())
+        assert prompt == build_admiral_prompt(**self._kwargs())
+        assert "  (3 earlier messages not shown)" in prompt
+        assert prompt.count("[Ship ") == 5
+        assert report.role == "admiral" and report.compactions == {}
+
+    def test_budget_compacts_chatter_then_projectiles(self):
+        _, full = build_admiral_prompt_with_report(**self._kwargs())
+        budget = full.tokens_after - full.section_tokens["communications_section"] - 10
+        prompt, report = build_admiral_prompt_with_report(**self._kwargs(), token_budget=budget)
+
+        assert report.compactions == {"communications_section": 2, "projectile_info": 1}
+        assert report.tokens_after <= budget
+        assert "  (8 earlier messages not shown)" in prompt
+        assert "  10 in flight, 50.0 GJ total, first impact in 20.0s" in prompt
+
+
+class TestCheckpointMetrics:
+    """Usage accounting in the client and per-checkpoint metrics in results."""
+
+    def test_usage_stats_difference(self):
+        before = UsageStats(calls=2, prompt_tokens=100, latency_s=1.0)
+        after = UsageStats(calls=5, cache_hits=1, prompt_tokens=400, completion_tokens=30, latency_s=2.5)
+        assert after - before == UsageStats(3, 1, 300, 30, 1.5)
+
+    def test_fleet_battle_reports_checkpoint_metrics(self, make_fleet_runner):
+        config = MockProviderConfig(seed=2, latency_median_s=0.0)
+        with MockLLMProvider(config) as provider:
+            runner = make_fleet_runner(
+                1, model="mock/captain", admiral="mock/admiral",
+                client=CaptainClient(api_key="mock", base_url=provider.url),
+                max_checkpoints=2, seed=2, captain_token_budget=1500, admiral_token_budget=2000,
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = runner.run_battle(load_fleet_data())
+
+        metrics = result.checkpoint_metrics
+        assert [m.checkpoint for m in metrics] == list(range(1, result.checkpoints_used + 1))
+        assert sum(m.llm_calls for m in metrics) == provider.stats.requests
+        assert sum(m.prompt_tokens for m in metrics) == provider.stats.prompt_tokens
+        first = metrics[0]
+        assert set(first.estimated_prompt_tokens) == {"captain", "admiral"}
+        assert first.compacted_prompts >= 1
+        assert first.completion_tokens > 0
+        assert 0 < first.llm_latency_s and 0 < first.wall_time_s
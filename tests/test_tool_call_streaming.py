@@ -0,0 +1,166 @@
+"""
+Tests for streamed tool-call parsing and early execution.
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.llm.captain import LLMCaptain, LLMCaptainConfig
+from src.llm.client import CaptainClient, ToolCall, ToolCallStream
+from src.llm.mock_provider import MockLLMProvider, MockProviderConfig
+from src.llm.response_cache import CacheMode, ResponseCache
+from src.llm.tools import get_captain_tools
+
+
+MESSAGES = [{"role": "user", "content": "orders?"}]
+
+
+def _chunk(index, call_id=None, name=None, arguments="", finish_reason=None):
+    part = {"index": index, "function": {"arguments": arguments}}
+    if call_id:
+        part["id"] = call_id
+        part["function"]["name"] = name
+    delta = {"tool_calls": [part]} if finish_reason is None else {}
+    return {"model": "m", "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+
+
+class TestToolCallStream:
+    """Assembly of tool calls from chunks."""
+
+    def test_calls_complete_as_soon_as_arguments_close(self):
+        seen = []
+        stream = ToolCallStream(seen.append)
+
+        stream.feed(_chunk(0, "a", "set_maneuver", '{"maneuver_'))
+        assert seen == []
+        stream.feed(_chunk(0, arguments='type": "EVADE"}'))
+        assert [tc.name for tc in seen] == ["set_maneuver"]
+
+        # Empty arguments only complete when the next call starts
+        stream.feed(_chunk(1, "b", "set_radiators"))
+        stream.feed(_chunk(2, "c", "set_weapons_order", '{"spinal_mode": "HOLD_FIRE"}'))
+        assert [tc.name for tc in seen] == ["set_maneuver", "set_radiators", "set_weapons_order"]
+
+        stream.feed(_chunk(0, finish_reason="tool_calls"))
+        stream.feed({"choices": [], "usage": {"prompt_tokens": 10, "completion_tokens": 5}})
+        assert seen[0].arguments == {"maneuver_type": "EVADE"}
+        assert seen[1].arguments == {}
+        assert stream.tool_calls == seen
+
+        response = stream.response()
+        assert CaptainClient._parse_tool_calls(response) == seen
+        assert response["usage"]["completion_tokens"] == 5
+
+    def test_sse_lines_and_callback_errors(self):
+        def explode(tc):
+            raise RuntimeError("bad order")
+
+        stream = ToolCallStream(explode)
+        stream.feed_line("")
+        stream.feed_line("data: " + json.dumps(_chunk(0, "a", "set_radiators", '{"extend": true}')))
+        stream.feed_line("data: " + json.dumps(_chunk(1, "b", "set_radiators", '{"extend": false}')))
+        stream.feed_line("data: [DONE]")
+
+        assert len(stream.tool_calls) == 2
+        assert isinstance(stream.callback_error, RuntimeError)
+
+
+class TestStreamingClient:
+    """Streaming against the mock provider."""
+
+    CONFIG = dict(seed=7, latency_median_s=0.05, latency_sigma=0.0,
+                  latency_per_output_token_s=0.002, completion_tokens=(100, 100),
+                  tool_calls_per_response=(3, 3))
+
+    def test_streamed_calls_match_plain_response(self):
+        tools = get_captain_tools()
+        with MockLLMProvider(MockProviderConfig(**self.CONFIG)) as provider:
+            plain = CaptainClient(api_key="mock", base_url=provider.url).decide_with_tools(MESSAGES, tools)
+        with MockLLMProvider(MockProviderConfig(**self.CONFIG)) as provider:
+            client = CaptainClient(api_key="mock", base_url=provider.url)
+            seen = []
+            streamed = client.decide_with_tools(MESSAGES, tools, on_tool_call=seen.append)
+
+        assert streamed == plain == seen
+        usage = client.usage
+        assert usage.calls == usage.streamed_calls == 1
+        assert usage.completion_tokens == 100
+        # First call arrives well before the 0.25s response is complete
+        assert usage.first_tool_call_s < usage.latency_s - 0.1
+
+    def test_async_streaming_through_pool(self):
+        with MockLLMProvider(MockProviderConfig(**self.CONFIG)) as provider:
+            client = CaptainClient(api_key="mock", base_url=provider.url)
+            seen = []
+
+            async def run():
+                try:
+                    return await client.decide_with_tools_async(
+                        MESSAGES, get_captain_tools(), on_tool_call=seen.append
+                    )
+                finally:
+                    await client.aclose()
+
+            tool_calls = asyncio.run(run())
+
+        assert len(tool_calls) == 3 and tool_calls == seen
+        assert client.pool.stats.requests == 1
+        assert client.usage.streamed_calls == 1
+
+    def test_callback_errors_propagate(self):
+        with MockLLMProvider(MockProviderConfig(seed=1, latency_median_s=0)) as provider:
+            client = CaptainClient(api_key="mock", base_url=provider.url)
+
+            def explode(tc):
+                raise RuntimeError("bad order")
+
+            with pytest.raises(RuntimeError, match="bad order"):
+                client.decide_with_tools(MESSAGES, get_captain_tools(), on_tool_call=explode)
+
+    def test_streamed_response_replays_from_cache(self, tmp_path):
+        tools = get_captain_tools()
+        with MockLLMProvider(MockProviderConfig(seed=2, latency_median_s=0)) as provider:
+            recorder = CaptainClient(api_key="mock", base_url=provider.url, cache=ResponseCache(str(tmp_path)))
+            streamed = recorder.decide_with_tools(MESSAGES, tools, on_tool_call=lambda tc: None)
+
+        replay = CaptainClient(cache=ResponseCache(str(tmp_path), mode=CacheMode.REPLAY), api_key="x")
+        seen = []
+        assert replay.decide_with_tools(MESSAGES, tools) == streamed
+        assert replay.decide_with_tools(MESSAGES, tools, on_tool_call=seen.append) == streamed
+        assert seen == streamed
+
+
+class TestCaptainStreaming:
+    """Captains execute streamed calls once, as they arrive."""
+
+    def test_calls_execute_during_stream_and_only_once(self):
+        calls = [
+            ToolCall("1", "set_maneuver", {"maneuver_type": "EVADE"}),
+            ToolCall("2", "set_radiators", {"extend": True}),
+            ToolCall("3", "set_maneuver", {"maneuver_type": "BRAKE"}),
+        ]
+        client = Mock()
+        executed_during_stream = []
+
+        def decide(messages, tools, model=None, on_tool_call=None):
+            for tc in calls:
+                on_tool_call(tc)
+                executed_during_stream.append(list(captain_calls))
+            return calls
+
+        client.decide_with_tools.side_effect = decide
+        captain = LLMCaptain(LLMCaptainConfig(name="Chen", ship_name="Relentless", stream_tool_calls=True), client)
+        captain_calls = []
+        captain._execute_tool = lambda tc, sim, ship_id: captain_calls.append(tc.id) or {"id": tc.id}
+        captain._prepare_decision = lambda ship_id, sim: (MESSAGES, [])
+
+        commands = captain.decide("alpha", Mock(current_time=30.0))
+
+        # Each call ran as it streamed in; the duplicate maneuver never ran
+        assert executed_during_stream == [["1"], ["1", "2"], ["1", "2"]]
+        assert commands == [{"id": "1"}, {"id": "2"}]
+        assert [tc.id for tc in captain.last_tool_calls] == ["1", "2"]
+        assert len(captain.decision_history[-1]["tool_calls"]) == 3
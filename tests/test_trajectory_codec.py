@@ -0,0 +1,131 @@
+"""
+Tests for the keyframe plus ballistic-delta trajectory encoding.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from src.llm.battle_recorder import BattleRecorder, BattleRecording
+from src.llm.recording_codec import load_recording
+from src.llm.trajectory_codec import TrajectoryCodec, decode_trajectories, encode_trajectories
+
+BUNDLED_RECORDING = Path(__file__).parent.parent / "data" / "recordings" / "battle_mcp_vs_grok_20260116_165007.json"
+
+
+def _entities(frame):
+    return list(frame["ships"].values()) + frame["projectiles"] + frame["torpedoes"]
+
+
+def _max_errors(frames, decoded):
+    """Largest position and velocity error, after checking all other fields match."""
+    pos_error = vel_error = 0.0
+    for frame, other in zip(frames, decoded):
+        assert other["t"] == frame["t"] and list(other["ships"]) == list(frame["ships"])
+        for entity, decoded_entity in zip(_entities(frame), _entities(other)):
+            assert list(decoded_entity) == list(entity)
+            assert {k: v for k, v in decoded_entity.items() if k not in ("pos", "vel")} == \
+                {k: v for k, v in entity.items() if k not in ("pos", "vel")}
+            pos_error = max([pos_error] + [abs(a - b) for a, b in zip(entity["pos"], decoded_entity["pos"])])
+            vel_error = max([vel_error] + [abs(a - b) for a, b in zip(entity["vel"], decoded_entity["vel"])])
+    return pos_error, vel_error
+
+
+def _ballistic_inputs(index):
+    """record_sim_frame() arguments: a ship burning, then coasting, and slugs in flight."""
+    # Integrated like the simulation: v += a * dt, then p += v * dt
+    burn = min(index, 20)
+    ship = {
+        "position": (100.0 + 12.5 * burn * (burn + 1) + 500.0 * (index - burn), -40.0, 3.0),
+        "velocity": (25.0 * burn, 0.0, 0.0),
+        "forward": (1.0, 0.0, 0.0),
+        "thrust": 1.0 if index < 20 else 0.0,
+        "maneuver": "INTERCEPT" if index < 20 else "MAINTAIN",
+        "is_destroyed": False,
+        "hull_pct": 100.0,
+        "armor": {"nose": 40.0} if index % 25 else {},
+    }
+    slugs = [
+        {
+            "id": f"proj_{n}", "position": (6000.0 * (index - n), 17.3 * (index - n), 0.0),
+            "velocity": (6000.0, 17.3, 0.0), "mass_kg": 40.0, "source_ship_id": "alpha_1",
+            "target_ship_id": "beta_1", "pd_engaged": index - n > 3,
+        }
+        for n in range(0, index, 3) if index - n <= 8
+    ]
+    return index * 1.0, {"alpha_1": ship}, slugs, []
+
+
+class TestTrajectoryCodec:
+    """Encoding and decoding sim traces."""
+
+    def test_bundled_recording_within_bounds(self):
+        frames = json.loads(BUNDLED_RECORDING.read_bytes())["sim_trace"]
+        original = copy.deepcopy(frames)
+        codec = TrajectoryCodec(position_error_m=1.0, velocity_error_mps=0.1)
+
+        encoded = json.loads(json.dumps(encode_trajectories(frames, codec)))
+        assert frames == original  # Input not modified
+        size = len(json.dumps(frames, separators=(",", ":")))
+        assert len(json.dumps(encoded, separators=(",", ":"))) * 3 < size
+
+        pos_error, vel_error = _max_errors(frames, decode_trajectories(encoded, codec))
+        assert pos_error <= 1.0 + 1e-6 and vel_error <= 0.1 + 1e-6
+
+    def test_keyframes(self):
+        recorder = BattleRecorder()
+        recorder._is_recording = True
+        for index in range(60):
+            recorder.record_sim_frame(*_ballistic_inputs(index))
+        frames = recorder.recording.sim_trace
+        del frames[33]["ships"]["alpha_1"]["armor"]
+        encoded = encode_trajectories(frames, TrajectoryCodec(keyframe_interval=10))
+
+        ship_keyframes = [i for i, frame in enumerate(encoded) if "pos" in frame["ships"]["alpha_1"]]
+        # Every 10 frames, and whenever the entry's fields change (frames 33 and 34)
+        assert ship_keyframes == [0, 10, 20, 30, 33, 34, 44, 54]
+        assert encoded[42]["ships"]["alpha_1"] == {}  # Coasting exactly as predicted
+        assert encoded[25]["ships"]["alpha_1"] == {"armor": {}}
+        assert encoded[7]["projectiles"][1] == {"id": "proj_3", "pd_engaged": True}
+
+        pos_error, vel_error = _max_errors(frames, decode_trajectories(encoded, TrajectoryCodec(keyframe_interval=10)))
+        assert pos_error <= 1.0 and vel_error <= 0.1
+
+    def test_settings(self):
+        codec = TrajectoryCodec(position_error_m=2.5, velocity_error_mps=0.25, keyframe_interval=30)
+        assert TrajectoryCodec.from_dict(json.loads(json.dumps(codec.to_dict()))) == codec
+        with pytest.raises(ValueError, match="Unsupported trajectory codec version"):
+            TrajectoryCodec.from_dict(dict(codec.to_dict(), version=99))
+        with pytest.raises(ValueError, match="must be positive"):
+            TrajectoryCodec(position_error_m=0)
+
+
+class TestTrajectoryRecording:
+    """BattleRecorder with a trajectory codec."""
+
+    def test_recorder_round_trip(self, tmp_path):
+        loaded = {}
+        for name, codec in (("plain", None), ("encoded", TrajectoryCodec())):
+            recorder = BattleRecorder(trajectory_codec=codec)
+            recorder._is_recording = True
+            recorder._start_trace()
+            recorder.recording = BattleRecording(battle_name="Trajectories")
+            for index in range(60):
+                recorder.record_sim_frame(*_ballistic_inputs(index))
+            path = recorder.save(str(tmp_path / f"{name}.json"))
+            if codec is not None:
+                raw = json.loads(Path(path).read_text())
+                assert raw["trajectory_codec"] == codec.to_dict()
+                assert "pos" not in raw["sim_trace"][5]["ships"]["alpha_1"]
+            loaded[name] = load_recording(path)
+
+        assert loaded["encoded"]["trajectory_codec"] == {}
+        assert {**loaded["encoded"], "sim_trace": []} == {**loaded["plain"], "sim_trace": []}
+        pos_error, vel_error = _max_errors(loaded["plain"]["sim_trace"], loaded["encoded"]["sim_trace"])
+        assert pos_error <= 1.0 and vel_error <= 0.1
+
+    def test_json_only(self):
+        with pytest.raises(ValueError, match="only supported for json"):
+            BattleRecorder("columnar", trajectory_codec=TrajectoryCodec())
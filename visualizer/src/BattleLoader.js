@@ -1,4 +1,5 @@
 import { getModulesForShipType } from './shipModules.js';
+import { decodeSimTrace } from './TrajectoryCodec.js';
 
 /**
  * BattleLoader - Loads and parses battle recording JSON files
@@ -52,8 +53,8 @@ export class BattleLoader {
       timeLimitS: data.time_limit_s
     };
 
-    // Parse sim trace
-    this.simTrace = data.sim_trace || [];
+    // Parse sim trace (keyframe + delta encoded if trajectory_codec is set)
+    this.simTrace = decodeSimTrace(data);
     this.duration = this.simTrace.length > 0
       ? this.simTrace[this.simTrace.length - 1].t
       : data.duration_s || 0;
@@ -0,0 +1,121 @@
+/**
+ * TrajectoryCodec - Decodes sim traces recorded as keyframes plus
+ * deviations from ballistic prediction (src/llm/trajectory_codec.py)
+ *
+ * Entries without "pos" are delta entries: only changed fields, plus
+ * "dp"/"dv" steps away from the predicted position/velocity. The float
+ * operations match the Python decoder, so both decode the same states.
+ */
+
+const MOTION = new Set(['pos', 'vel']);
+const DELTAS = new Set(['dp', 'dv']);
+
+class Track {
+  constructor(t, entity) {
+    this.reset(t, entity);
+  }
+
+  reset(t, entity) {
+    this.t = t;
+    this.pos = entity.pos.slice();
+    this.vel = entity.vel.slice();
+    this.prevT = null;
+    this.prevVel = null;
+    this.fields = {};
+    for (const [key, value] of Object.entries(entity)) {
+      if (!MOTION.has(key)) this.fields[key] = value;
+    }
+  }
+
+  advance(t, pos, vel) {
+    this.prevT = this.t;
+    this.prevVel = this.vel;
+    this.t = t;
+    this.pos = pos;
+    this.vel = vel;
+  }
+
+  predictVelocity(t) {
+    if (this.prevVel === null || this.t === this.prevT) return this.vel.slice();
+    const dt = t - this.t;
+    const span = this.t - this.prevT;
+    return this.vel.map((v1, i) => v1 + (v1 - this.prevVel[i]) / span * dt);
+  }
+
+  predictPosition(t, vel) {
+    const dt = t - this.t;
+    return this.pos.map((p1, i) => p1 + vel[i] * dt);
+  }
+}
+
+function dequantize(predicted, steps, step) {
+  if (!steps) return predicted;
+  return predicted.map((p, i) => p + steps[i] * step);
+}
+
+export class TrajectoryDecoder {
+  /**
+   * @param {Object} settings - Recording's trajectory_codec field
+   */
+  constructor(settings) {
+    if (settings.version > 1) {
+      throw new Error(`Unsupported trajectory codec version: ${settings.version}`);
+    }
+    this.posStep = 2 * settings.position_error_m;
+    this.velStep = 2 * settings.velocity_error_mps;
+    this.tracks = new Map();
+  }
+
+  /**
+   * Decode one frame (frames must be decoded in order)
+   * @param {Object} frame - Encoded frame
+   * @returns {Object} Frame with full entity states
+   */
+  decodeFrame(frame) {
+    const decoded = { ...frame };
+    if (frame.ships) {
+      decoded.ships = {};
+      for (const [shipId, entry] of Object.entries(frame.ships)) {
+        decoded.ships[shipId] = this.decodeEntity(`ships/${shipId}`, frame.t, entry);
+      }
+    }
+    for (const key of ['projectiles', 'torpedoes']) {
+      if (frame[key]) {
+        decoded[key] = frame[key].map(entry => this.decodeEntity(`${key}/${entry.id}`, frame.t, entry));
+      }
+    }
+    return decoded;
+  }
+
+  decodeEntity(trackKey, t, entry) {
+    let track = this.tracks.get(trackKey);
+    if (entry.pos) {
+      if (track) {
+        track.reset(t, entry);
+      } else {
+        this.tracks.set(trackKey, new Track(t, entry));
+      }
+      return entry;
+    }
+
+    const vel = dequantize(track.predictVelocity(t), entry.dv, this.velStep);
+    const pos = dequantize(track.predictPosition(t, vel), entry.dp, this.posStep);
+    track.advance(t, pos, vel);
+    for (const [key, value] of Object.entries(entry)) {
+      if (!DELTAS.has(key)) track.fields[key] = value;
+    }
+    return { ...track.fields, pos, vel };
+  }
+}
+
+/**
+ * Decode a recording's sim trace if it is trajectory-encoded
+ * @param {Object} data - Raw recording JSON
+ * @returns {Array} Sim trace with full entity states
+ */
+export function decodeSimTrace(data) {
+  const frames = data.sim_trace || [];
+  if (!data.trajectory_codec || !data.trajectory_codec.version) return frames;
+  const decoder = new TrajectoryDecoder(data.trajectory_codec);
+  return frames.map(frame => decoder.decodeFrame(frame));
+}